@@ -5,6 +5,9 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 
+from data_table import paginated_table
+
+
 def show_strategic_investment():
     st.header("🏗️ Analyse des Investissements Stratégiques")
     
@@ -118,14 +121,11 @@ def show_investment_overview():
     ]
     
     # Affichage des données
-    st.dataframe(
-        filtered_df.style.format({
-            'Budget (M€)': '{:.1f}',
-            'ROI Attendu (%)': '{:.1f}',
-            'Délai (ans)': '{:.1f}'
-        }),
-        use_container_width=True
-    )
+    paginated_table(filtered_df, key='projets_investissement', formats={
+        'Budget (M€)': '{:.1f}',
+        'ROI Attendu (%)': '{:.1f}',
+        'Délai (ans)': '{:.1f}'
+    })
     
     # Graphiques de synthèse
     col_chart1, col_chart2 = st.columns(2)
@@ -138,7 +138,7 @@ def show_investment_overview():
             names=budget_by_type.index,
             title="Répartition du Budget par Type d'Investissement"
         )
-        st.plotly_chart(fig_bart, use_container_width=True)
+        st.plotly_chart(fig_budget, use_container_width=True)
     
     with col_chart2:
         # ROI vs Risque
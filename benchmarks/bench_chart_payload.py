@@ -0,0 +1,77 @@
+"""Taille du JSON plotly envoyé au navigateur, avec et sans chart_data.
+
+Séries journalières synthétiques (marche aléatoire avec pics isolés) sur
+--years années et --series séries : figure brute (go.Scatter de tous les
+points) contre figure réduite (LTTB + enveloppe min/max + Scattergl).
+Vérifie aussi que les extrêmes de chaque série restent visibles.
+
+Usage : python benchmarks/bench_chart_payload.py [--years 10] [--series 20] [--budget 1200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import chart_data  # noqa: E402
+
+
+def synthetic_series(years, series, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2015-01-01', periods=int(365.25 * years), freq='D')
+    values = rng.normal(0, 1, (series, len(dates))).cumsum(axis=1)
+    # Pics d'un jour que la réduction ne doit pas effacer
+    spikes = rng.integers(0, len(dates), (series, 3))
+    for i, cols in enumerate(spikes):
+        values[i, cols] += rng.choice([-1, 1], 3) * 50
+    return dates, values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--years', type=float, default=10)
+    parser.add_argument('--series', type=int, default=20)
+    parser.add_argument('--budget', type=int, default=chart_data.POINT_BUDGET)
+    args = parser.parse_args()
+
+    dates, values = synthetic_series(args.years, args.series)
+
+    start = time.perf_counter()
+    raw = go.Figure([go.Scatter(x=dates, y=v, name=f'S{i}') for i, v in enumerate(values)])
+    raw_json = raw.to_json()
+    raw_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reduced = go.Figure()
+    for i, v in enumerate(values):
+        chart_data.add_series(reduced, dates, v, name=f'S{i}', point_budget=args.budget,
+                              line=dict(color='steelblue'))
+    reduced_json = reduced.to_json()
+    reduced_time = time.perf_counter() - start
+
+    # Les extrêmes de chaque série doivent figurer dans ses traces (courbe ou enveloppe)
+    lost = 0
+    for i, v in enumerate(values):
+        shown = np.concatenate([np.asarray(t.y, dtype=float) for t in reduced.data
+                                if t.legendgroup == f'S{i}'])
+        lost += (shown.max() < v.max()) + (shown.min() > v.min())
+
+    points = values.size
+    print(f"{args.series} séries x {len(dates):,} jours = {points:,} points")
+    print(f"brut    : {len(raw_json) / 1e6:8.2f} Mo JSON  {raw_time * 1000:7.0f} ms")
+    print(f"réduit  : {len(reduced_json) / 1e6:8.2f} Mo JSON  {reduced_time * 1000:7.0f} ms  "
+          f"(traces {', '.join(sorted({type(t).__name__ for t in reduced.data}))})")
+    print(f"facteur : {len(raw_json) / len(reduced_json):.1f}x  extrêmes perdus : {lost}")
+    if lost:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Banc d'essai des connecteurs REST contre un serveur HTTP local simulé.
+
+Usage : python benchmarks/bench_connectors.py [--rows 200000] [--page-size 1000]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connectors import BiConnector, CrmConnector, RestConnector  # noqa: E402
+
+
+def make_handler(total_rows, fail_every=0):
+    state = {'calls': 0}
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _rows(self, start, size):
+            stop = min(start + size, total_rows)
+            return [
+                {'id': i, 'article': f'ART-{i % 500:04d}', 'quantite': i % 37, 'montant': round(i * 1.17, 2)}
+                for i in range(start, stop)
+            ]
+
+        def do_GET(self):
+            state['calls'] += 1
+            if fail_every and state['calls'] % fail_every == 0:
+                self._send(503, {'error': 'indisponible'})
+                return
+            url = urlparse(self.path)
+            q = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path == '/page':
+                size = int(q.get('per_page', 100))
+                start = (int(q.get('page', 1)) - 1) * size
+                self._send(200, {'items': self._rows(start, size)})
+            elif url.path == '/offset':
+                size = int(q.get('top', 100))
+                self._send(200, {'value': self._rows(int(q.get('skip', 0)), size)})
+            elif url.path == '/cursor':
+                size = int(q.get('limit', 100))
+                start = int(q.get('after', 0))
+                nxt = start + size
+                self._send(200, {'results': self._rows(start, size),
+                                 'next': str(nxt) if nxt < total_rows else None})
+            else:
+                self._send(200, {'status': 'ok'})
+
+    return StubHandler
+
+
+def run(connector, path, total_rows):
+    start = time.perf_counter()
+    n = sum(len(batch) for batch in connector.iter_batches(path, batch_rows=50_000))
+    elapsed = time.perf_counter() - start
+    assert n == total_rows, (n, total_rows)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--fail-every', type=int, default=7,
+                        help="renvoyer un 503 toutes les N requêtes (0 = jamais)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.rows, args.fail_every))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+
+    cases = [
+        ('page', RestConnector, '/page'),
+        ('offset', BiConnector, '/offset'),
+        ('cursor', CrmConnector, '/cursor'),
+    ]
+    try:
+        for name, cls, path in cases:
+            with cls(base, page_size=args.page_size, backoff_factor=0.01) as connector:
+                elapsed = run(connector, path, args.rows)
+            print(f"{name:<8} {args.rows:>9,} lignes  {elapsed:7.2f}s  {args.rows / elapsed:>12,.0f} lignes/s")
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
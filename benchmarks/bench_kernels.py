@@ -0,0 +1,230 @@
+"""Micro-benchmarks des moteurs de calcul (budget_engines) avec baseline et seuil.
+
+Chaque noyau est mesuré à trois tailles (small, medium, large) : nombre
+d'appels calibré par timeit (≥ 0,2 s par série), --repeat séries. La
+comparaison porte sur le meilleur temps par appel, le moins sensible à la
+charge de la machine (la médiane est conservée pour information). Les
+entrées sont générées avec une graine fixe, hors de la mesure.
+
+Chaque run est ajouté à benchmarks/results/kernels.jsonl (historique local,
+une ligne JSON par run) puis comparé à la baseline
+benchmarks/baselines/kernels.json : le code de sortie vaut 1 si un noyau est
+plus lent que sa baseline de plus de --threshold (25 % par défaut). Un noyau
+en dépassement est remesuré (--retries) avant d'être déclaré en régression,
+pour ne pas échouer sur un pic de charge passager.
+
+Usage : python benchmarks/bench_kernels.py [--kernels npv irr] [--sizes small medium]
+                                           [--threshold 0.25] [--save-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import budget_engines as engines  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'kernels.json')
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'results', 'kernels.jsonl')
+
+SIZES = ['small', 'medium', 'large']
+
+
+# ---------------------------------------------------------------- Noyaux
+# Chaque fabrique reçoit la taille et retourne l'appel à mesurer (entrées prêtes)
+
+def _npv(n):
+    rng = np.random.default_rng(0)
+    flux = rng.uniform(10, 100, (n, 10))
+    taux = rng.uniform(0.05, 0.2, n)
+    return lambda: engines.npv(300.0, flux, taux)
+
+
+def _irr(n):
+    rng = np.random.default_rng(0)
+    flux = rng.uniform(10, 100, (n, 10))
+    return lambda: engines.irr(300.0, flux)
+
+
+def _monte_carlo(n):
+    flux = [60, 65, 70, 75, 80]
+    return lambda: engines.monte_carlo_npv(200.0, flux, 0.12, n_simulations=n, seed=0)
+
+
+def _production_lp(n):
+    rng = np.random.default_rng(0)
+    resources = max(n // 4, 2)
+    marges = rng.uniform(10, 100, n)
+    consommations = rng.uniform(0.5, 5, (resources, n))
+    capacites = rng.uniform(500, 5000, resources)
+    demandes = rng.uniform(50, 500, n)
+    return lambda: engines.production_lp(marges, consommations, capacites, demandes)
+
+
+def _stock_simulation(n):
+    return lambda: engines.stock_simulation(1000, 300, 280, jours=n)
+
+
+def _inventory_policy(n):
+    rng = np.random.default_rng(0)
+    demande = rng.lognormal(8, 1, n)
+    cout = rng.uniform(5, 200, n)
+    stock = rng.integers(0, 2000, n)
+    niveau = rng.choice([90, 95, 99], n)
+    return lambda: engines.inventory_policy(demande, cout, 0.25, 200.0, demande / 360,
+                                            demande / 360 * 0.2, 10, stock, niveau)
+
+
+def _abc(n):
+    values = np.random.default_rng(0).lognormal(8, 1.5, n)
+    return lambda: engines.abc_classification(values)
+
+
+def _trend_forecast(n):
+    rng = np.random.default_rng(0)
+    histories = 100 + np.arange(36) * 2 + rng.normal(0, 10, (n, 36))
+    return lambda: engines.trend_forecast_batch(histories, horizon=12)
+
+
+def _cash_budget(n):
+    rng = np.random.default_rng(0)
+    ca = rng.uniform(50, 150, n)
+    delai = rng.choice([0, 30, 60, 90], n)
+    return lambda: engines.cash_budget(ca, 60.0, 25.0, 15.0, 50.0, 50.0, 100.0,
+                                       delai_encaissement=delai)
+
+
+# nom : (fabrique, {taille: paramètre})
+KERNELS = {
+    'npv': (_npv, {'small': 10, 'medium': 10_000, 'large': 1_000_000}),
+    'irr': (_irr, {'small': 10, 'medium': 1_000, 'large': 100_000}),
+    'monte_carlo_npv': (_monte_carlo, {'small': 1_000, 'medium': 100_000, 'large': 1_000_000}),
+    'production_lp': (_production_lp, {'small': 2, 'medium': 40, 'large': 400}),
+    'stock_simulation': (_stock_simulation, {'small': 30, 'medium': 3_650, 'large': 365_000}),
+    'inventory_policy': (_inventory_policy, {'small': 10, 'medium': 10_000, 'large': 1_000_000}),
+    'abc_classification': (_abc, {'small': 10, 'medium': 10_000, 'large': 1_000_000}),
+    'trend_forecast': (_trend_forecast, {'small': 1, 'medium': 1_000, 'large': 100_000}),
+    'cash_budget': (_cash_budget, {'small': 1, 'medium': 1_000, 'large': 100_000}),
+}
+
+
+# ---------------------------------------------------------------- Mesure
+
+def time_call(func, repeat):
+    """Temps par appel (s) : médiane et minimum de `repeat` séries calibrées"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    # autorange vise 0,2 s par série
+    runs = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {'median_s': statistics.median(runs), 'min_s': min(runs), 'number': number}
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': f'{platform.system()} {platform.machine()} {platform.node()}',
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Lignes de comparaison et liste des régressions"""
+    lines, regressions = [], []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            lines.append(f"{key:<32} {result['min_s'] * 1e6:>12.1f} µs   (pas de baseline)")
+            continue
+        ratio = result['min_s'] / reference['min_s']
+        status = 'RÉGRESSION' if ratio > 1 + threshold else ''
+        if status:
+            regressions.append(key)
+        lines.append(f"{key:<32} {result['min_s'] * 1e6:>12.1f} µs   "
+                     f"baseline {reference['min_s'] * 1e6:>12.1f} µs   {ratio:>5.2f}x {status}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kernels', nargs='*', default=list(KERNELS))
+    parser.add_argument('--sizes', nargs='*', default=SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="ralentissement toléré par rapport à la baseline (0.25 = +25 %%)")
+    parser.add_argument('--retries', type=int, default=2,
+                        help="nouvelles mesures d'un noyau en dépassement avant d'échouer")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="enregistrer ce run comme nouvelle baseline")
+    args = parser.parse_args()
+
+    unknown = set(args.kernels) - set(KERNELS) or set(args.sizes) - set(SIZES)
+    if unknown:
+        parser.error(f"inconnu : {', '.join(sorted(unknown))}")
+
+    baseline, baseline_machine = {}, None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            stored = json.load(f)
+        baseline, baseline_machine = stored['results'], stored['environment']['machine']
+
+    def measure(name, size):
+        factory, sizes = KERNELS[name]
+        return {'n': sizes[size], **time_call(factory(sizes[size]), args.repeat)}
+
+    results = {}
+    for name in args.kernels:
+        for size in args.sizes:
+            key = f'{name}/{size}'
+            results[key] = measure(name, size)
+            for _ in range(args.retries if key in baseline and not args.save_baseline else 0):
+                if results[key]['min_s'] <= baseline[key]['min_s'] * (1 + args.threshold):
+                    break
+                retry = measure(name, size)
+                if retry['min_s'] < results[key]['min_s']:
+                    results[key] = retry
+
+    run = {'environment': environment(), 'threshold': args.threshold, 'results': results}
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + '\n')
+
+    if baseline_machine and baseline_machine != run['environment']['machine']:
+        print(f"Attention : baseline mesurée sur {baseline_machine}")
+    lines, regressions = compare(results, baseline, args.threshold)
+    print('\n'.join(lines))
+
+    if args.save_baseline:
+        # Une baseline partielle complète la précédente sans effacer les autres noyaux
+        run['results'] = {**baseline, **results}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline enregistrée : {os.path.relpath(args.baseline, ROOT)}")
+    elif regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de +{args.threshold:.0%} : "
+              f"{', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Stabilité mémoire sur de longues séries de reruns (serveur Streamlit longue durée).
+
+Deux scénarios, mémoire résidente (RSS) échantillonnée au fil des itérations :
+  - « figures » : --reruns rendus matplotlib distincts par figure_service
+    (aucun hit de cache : chaque itération crée, rend et libère une figure) ;
+  - « pages »   : --reruns reruns AppTest en parcourant les pages du script.
+Après une phase de chauffe (premier quart), la RSS doit rester plate : le test
+échoue (code de sortie 1) si elle croît de plus de --tolerance Mo.
+
+Usage : python benchmarks/bench_memory.py [figures pages] [--reruns 1000] [--tolerance 25]
+"""
+import argparse
+import gc
+import logging
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_mb():
+    """Mémoire résidente courante du processus (Mo)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except OSError:
+        import resource
+        # Hors Linux : pic de RSS, suffisant pour détecter une croissance continue
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def draw_costs(fig, q_etoile, consommation_annuelle, cout_lancement, cout_stockage_annuel):
+    import numpy as np
+
+    q_values = np.linspace(q_etoile * 0.5, q_etoile * 2, 100)
+    ax = fig.subplots()
+    ax.plot(q_values, consommation_annuelle / q_values * cout_lancement, linestyle='--')
+    ax.plot(q_values, q_values / 2 * cout_stockage_annuel, linestyle='--')
+    ax.axvline(q_etoile, color='red', linestyle=':')
+    ax.set_title('Optimisation du Lot Économique')
+
+
+def draw_stock(fig, mois, stocks_fin, stock_securite):
+    ax = fig.subplots()
+    ax.plot(range(len(mois)), stocks_fin, marker='o')
+    ax.axhline(y=stock_securite, color='red', linestyle='--')
+    ax.set_xticks(range(len(mois)))
+    ax.set_xticklabels(mois)
+
+
+def figure_iterations(reruns):
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    from figure_service import FigureService
+
+    service = FigureService(max_bytes=8 * 1024 * 1024, persist=False)
+    for i in range(reruns):
+        service.render(draw_costs, (500.0 + i, 10000, 50, 2))
+        service.render(draw_stock, (['Janvier', 'Février', 'Mars'], list(np.arange(3) * i), 500))
+        yield i
+    if plt.get_fignums():
+        raise AssertionError(f"figures pyplot non fermées : {plt.get_fignums()}")
+
+
+def page_iterations(reruns, script):
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest, local_script_runner
+
+    cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: cache
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+    at.run()
+    pages = list(at.sidebar.radio[0].options)
+    for i in range(reruns):
+        at.sidebar.radio[0].set_value(pages[i % len(pages)]).run()
+        if at.exception:
+            raise AssertionError(f"{pages[i % len(pages)]} : {at.exception[0].message}")
+        yield i
+
+
+def measure(name, iterations, reruns, tolerance):
+    samples = []
+    step = max(reruns // 40, 1)
+    start = time.perf_counter()
+    for i in iterations:
+        if i % step == 0 or i == reruns - 1:
+            gc.collect()
+            samples.append(rss_mb())
+    elapsed = time.perf_counter() - start
+
+    # Premier quart ignoré (imports, caches et pools qui se remplissent)
+    warm = samples[len(samples) // 4:]
+    half = len(warm) // 2
+    growth = statistics.median(warm[half:]) - statistics.median(warm[:half])
+    ok = growth <= tolerance
+    print(f"{name:<8} {reruns} itérations en {elapsed:.0f} s  RSS {samples[0]:.0f} -> "
+          f"{samples[-1]:.0f} Mo  croissance après chauffe {growth:+.1f} Mo  "
+          f"{'OK' if ok else 'ÉCHEC'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scenarios', nargs='*', default=['figures', 'pages'],
+                        help="figures et/ou pages")
+    parser.add_argument('--reruns', type=int, default=1000)
+    parser.add_argument('--tolerance', type=float, default=25.0, help="croissance tolérée (Mo)")
+    parser.add_argument('--script', default='controleDeGestion.py')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    results = []
+    for scenario in args.scenarios:
+        if scenario == 'figures':
+            iterations = figure_iterations(args.reruns)
+        elif scenario == 'pages':
+            iterations = page_iterations(args.reruns, args.script)
+        else:
+            parser.error(f"scénario inconnu : {scenario}")
+        results.append(measure(scenario, iterations, args.reruns, args.tolerance))
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
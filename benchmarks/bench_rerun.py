@@ -0,0 +1,75 @@
+"""Latence de rerun par page (Streamlit AppTest, sans navigateur).
+
+Chaque page est sélectionnée dans la navigation latérale puis relancée
+--reruns fois. Deux mesures par page :
+  - « sans cache » : st.cache_data / st.cache_resource vidés avant chaque rerun
+    (équivalent à l'application avant la passe de cache) ;
+  - « avec cache » : caches conservés d'un rerun à l'autre.
+
+Usage : python benchmarks/bench_rerun.py [controleDeGestion.py] [--reruns 20] [--pages "💸 Budget de Trésorerie"]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import streamlit as st
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+# AppTest recompile le script à chaque run ; le serveur garde le bytecode en
+# cache. Un cache partagé rend la mesure représentative du rerun réel.
+_SCRIPT_CACHE = ScriptCache()
+local_script_runner.ScriptCache = lambda: _SCRIPT_CACHE
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rerun_latencies(script, page, reruns, cold):
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+    at.run()
+    at.sidebar.radio[0].set_value(page).run()
+    latencies = []
+    for _ in range(reruns):
+        if cold:
+            st.cache_data.clear()
+            st.cache_resource.clear()
+        start = time.perf_counter()
+        at.run()
+        latencies.append((time.perf_counter() - start) * 1000)
+    errors = [e.message for e in at.exception]
+    return np.array(latencies), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scripts', nargs='*', default=['controleDeGestion.py', 'projet_gestion.py'])
+    parser.add_argument('--reruns', type=int, default=20)
+    parser.add_argument('--pages', nargs='*', default=None,
+                        help="pages à mesurer (par défaut toutes celles de la navigation)")
+    args = parser.parse_args()
+
+    # Les avertissements de dépréciation noieraient le tableau de résultats
+    logging.disable(logging.WARNING)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    for script in args.scripts:
+        at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+        at.run()
+        pages = args.pages or list(at.sidebar.radio[0].options)
+        print(f"\n{script}")
+        print(f"{'page':<40} {'sans cache p50':>15} {'avec cache p50':>15} {'gain':>7}")
+        for page in pages:
+            cold, errors = rerun_latencies(script, page, args.reruns, cold=True)
+            warm, _ = rerun_latencies(script, page, args.reruns, cold=False)
+            p50_cold, p50_warm = np.percentile(cold, 50), np.percentile(warm, 50)
+            note = f"  ({len(errors)} exception(s))" if errors else ''
+            print(f"{page:<40} {p50_cold:>12.1f} ms {p50_warm:>12.1f} ms "
+                  f"{p50_cold / p50_warm:>6.2f}x{note}")
+
+
+if __name__ == '__main__':
+    main()
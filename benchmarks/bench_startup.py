@@ -0,0 +1,69 @@
+"""Démarrage à froid et surcoût par rerun d'une application Streamlit.
+
+Chaque mesure « à froid » est faite dans un processus neuf : premier rendu de
+la page d'accueil (compilation du script, imports, exécution). Le surcoût par
+rerun est ensuite mesuré sur la même session, bytecode en cache comme sur le
+serveur.
+
+Usage : python benchmarks/bench_startup.py [projet_gestion.py] [--runs 5] [--reruns 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, local_script_runner
+cache = ScriptCache()
+local_script_runner.ScriptCache = lambda: cache
+
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+
+reruns = []
+for _ in range(int(sys.argv[2])):
+    start = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - start)
+print(json.dumps({'first': first, 'reruns': reruns,
+                  'errors': [e.message for e in at.exception]}))
+'''
+
+
+def measure(script, reruns):
+    out = subprocess.run([sys.executable, '-c', CHILD, script, str(reruns)], cwd=ROOT,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('script', nargs='?', default='projet_gestion.py')
+    parser.add_argument('--runs', type=int, default=5, help="processus neufs mesurés")
+    parser.add_argument('--reruns', type=int, default=20)
+    args = parser.parse_args()
+
+    script = os.path.abspath(os.path.join(ROOT, args.script))
+    results = [measure(script, args.reruns) for _ in range(args.runs)]
+    first = [r['first'] * 1000 for r in results]
+    reruns = [t * 1000 for r in results for t in r['reruns']]
+    print(f"{args.script}")
+    print(f"premier rendu (à froid) : médiane {statistics.median(first):.0f} ms  "
+          f"min {min(first):.0f} ms  max {max(first):.0f} ms")
+    print(f"rerun accueil           : médiane {statistics.median(reruns):.1f} ms")
+    if results[-1]['errors']:
+        print(f"exceptions : {results[-1]['errors']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Rendu d'un grand tableau : Styler sur le jeu complet contre data_table paginé.
+
+Chaque variante est exécutée dans AppTest (sans navigateur) sur un relevé de
+flux synthétique ; on mesure la durée du run et la taille du message envoyé
+au navigateur. La variante paginée est mesurée triée sur le montant.
+
+Usage : python benchmarks/bench_table.py [--rows 10000 100000] [--runs 3]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def styler_page(rows):
+    import numpy as np
+    import pandas as pd
+    import streamlit as st
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=rows, freq='h'),
+        'Catégorie': rng.choice(['Ventes', 'Achats', 'Personnel', 'Financement'], rows),
+        'Montant (K€)': rng.normal(0, 100, rows),
+        'Solde (K€)': rng.normal(0, 100, rows).cumsum(),
+    })
+    # Au-delà de 262 144 cellules, Styler refuse le rendu par défaut
+    pd.set_option('styler.render.max_elements', df.size)
+    st.dataframe(df.style.format({'Montant (K€)': '{:,.0f}', 'Solde (K€)': '{:,.1f}'}),
+                 use_container_width=True)
+
+
+def paginated_page(rows):
+    import numpy as np
+    import pandas as pd
+    import streamlit as st
+
+    from data_table import paginated_table
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=rows, freq='h'),
+        'Catégorie': rng.choice(['Ventes', 'Achats', 'Personnel', 'Financement'], rows),
+        'Montant (K€)': rng.normal(0, 100, rows),
+        'Solde (K€)': rng.normal(0, 100, rows).cumsum(),
+    })
+    st.session_state.setdefault('bench_sort', 'Montant (K€)')
+    paginated_table(df, key='bench', formats={'Montant (K€)': '{:,.0f}', 'Solde (K€)': '{:,.1f}'})
+
+
+def measure(page, rows, runs):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(page, args=(rows,), default_timeout=600)
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        durations.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    payload = sum(df.proto.ByteSize() for df in at.dataframe)
+    return statistics.median(durations) * 1000, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='*', default=[10_000, 100_000])
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sys.path.insert(0, ROOT)
+    print(f"{'lignes':>10} {'variante':<10} {'run p50':>10} {'envoyé':>10}")
+    for rows in args.rows:
+        for name, page in (('Styler', styler_page), ('paginé', paginated_page)):
+            ms, payload = measure(page, rows, args.runs)
+            print(f"{rows:>10,} {name:<10} {ms:>7.0f} ms {payload / 1e3:>9,.1f} Ko")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""Profil des imports au démarrage, comparé à une baseline propre à la machine.
+
+Chaque point d'entrée est importé dans un processus neuf avec
+`python -X importtime` ; le temps propre (self) de chaque module est agrégé par
+paquet de premier niveau (pandas, plotly, scipy...) pour le classement.
+
+Comme pour bench_kernels.py, la comparaison porte sur le meilleur des --runs
+imports à froid, rapporté à la baseline benchmarks/baselines/imports.json :
+le code de sortie vaut 1 si un point d'entrée est plus lent de plus de
+--threshold (25 % par défaut) après --retries nouvelles mesures. Les temps
+absolus dépendent trop de la machine pour servir de seuil : la baseline se
+régénère avec --save-baseline. Chaque run est ajouté à
+benchmarks/results/imports.jsonl.
+
+Usage : python benchmarks/import_profile.py [projet_gestion app] [--top 15]
+                                            [--threshold 0.25] [--runs 3] [--save-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'imports.json')
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'results', 'imports.jsonl')
+
+ENTRY_POINTS = ['projet_gestion', 'controleDeGestion', 'budget_vente', 'app', 'budget_api',
+                'budget_batch']
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def import_times(module):
+    """(temps total en ms, {paquet: temps propre en ms}) pour un import à froid"""
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                         cwd=ROOT, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"import {module} a échoué :\n{out.stderr[-2000:]}")
+    packages = defaultdict(float)
+    total = 0.0
+    for line in out.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        packages[name.split('.')[0]] += int(self_us) / 1000
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, packages
+
+
+def profile(module, runs):
+    """Meilleur et médian des imports à froid (ms) et classement médian des paquets"""
+    measures = [import_times(module) for _ in range(runs)]
+    totals = [t for t, _ in measures]
+    packages = defaultdict(list)
+    for _, per_package in measures:
+        for name, ms in per_package.items():
+            packages[name].append(ms)
+    ranking = sorted(((statistics.median(v), k) for k, v in packages.items()), reverse=True)
+    return {'min_ms': min(totals), 'median_ms': statistics.median(totals)}, ranking
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()} {platform.node()}',
+        'cpus': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=ENTRY_POINTS)
+    parser.add_argument('--runs', type=int, default=3, help="processus neufs par point d'entrée")
+    parser.add_argument('--top', type=int, default=10, help="paquets les plus coûteux affichés")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="ralentissement toléré par rapport à la baseline (0.25 = +25 %%)")
+    parser.add_argument('--retries', type=int, default=2,
+                        help="nouvelles mesures d'un point d'entrée en dépassement avant d'échouer")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="enregistrer ce run comme nouvelle baseline")
+    args = parser.parse_args()
+
+    baseline, baseline_machine = {}, None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            stored = json.load(f)
+        baseline, baseline_machine = stored['results'], stored['environment']['machine']
+
+    results, regressions = {}, []
+    for module in args.modules:
+        result, ranking = profile(module, args.runs)
+        reference = None if args.save_baseline else baseline.get(module)
+        for _ in range(args.retries if reference else 0):
+            if result['min_ms'] <= reference['min_ms'] * (1 + args.threshold):
+                break
+            retry, retry_ranking = profile(module, args.runs)
+            if retry['min_ms'] < result['min_ms']:
+                result, ranking = retry, retry_ranking
+        results[module] = result
+
+        line = f"\n{module} : {result['min_ms']:.0f} ms (médiane {result['median_ms']:.0f} ms)"
+        if reference:
+            ratio = result['min_ms'] / reference['min_ms']
+            status = ' RÉGRESSION' if ratio > 1 + args.threshold else ''
+            line += f"   baseline {reference['min_ms']:.0f} ms   {ratio:.2f}x{status}"
+            if status:
+                regressions.append(module)
+        elif not args.save_baseline:
+            line += "   (pas de baseline)"
+        print(line)
+        for ms, name in ranking[:args.top]:
+            print(f"  {name:<30} {ms:>8.1f} ms")
+
+    run = {'environment': environment(), 'threshold': args.threshold, 'results': results}
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + '\n')
+
+    if baseline_machine and baseline_machine != run['environment']['machine']:
+        print(f"\nAttention : baseline mesurée sur {baseline_machine}")
+    if args.save_baseline:
+        # Une baseline partielle complète la précédente sans effacer les autres points d'entrée
+        run['results'] = {**baseline, **results}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline enregistrée : {os.path.relpath(args.baseline, ROOT)}")
+    elif regressions:
+        print(f"\n{len(regressions)} régression(s) au-delà de +{args.threshold:.0%} : "
+              f"{', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
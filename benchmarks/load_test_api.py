@@ -0,0 +1,104 @@
+"""Test de charge du service REST budgétaire : requêtes/seconde et latence p99.
+
+Usage : python benchmarks/load_test_api.py [--url http://127.0.0.1:8080] [--concurrency 64]
+Sans --url, le service est démarré dans le même processus sur un port libre.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+import aiohttp
+import numpy as np
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from budget_api import create_app  # noqa: E402
+
+
+def make_requests(distinct):
+    """Mélange d'appels ; `distinct` borne le nombre d'entrées différentes (taux de cache)"""
+    def request():
+        seed = random.randrange(distinct)
+        kind = seed % 3
+        if kind == 0:
+            history = ','.join(str(100 + seed % 50 + i * 5) for i in range(12))
+            return 'GET', f'/api/v1/sales/forecast/next-quarter?history={history}', None
+        if kind == 1:
+            return 'PUT', '/api/v1/inventory/levels', {
+                'articles': [{'article': f'A{seed}', 'demande_annuelle': 1000 + seed,
+                              'stock_actuel': 300 + seed % 400}]
+            }
+        return 'POST', '/api/v1/financial/ratios', {
+            'actif_circulant': 500 + seed, 'dettes_court_terme': 300, 'stocks': 200,
+            'creances_clients': 150, 'dettes_fournisseurs': 100, 'chiffre_affaires': 1200,
+            'resultat_net': 80, 'capitaux_propres': 400, 'tresorerie': 50,
+        }
+    return request
+
+
+async def worker(session, base, next_request, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        method, path, body = next_request()
+        start = time.perf_counter()
+        try:
+            async with session.request(method, base + path, json=body) as response:
+                await response.read()
+                if response.status != 200:
+                    errors.append(response.status)
+        except aiohttp.ClientError as exc:
+            errors.append(str(exc))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    runner = None
+    base = args.url
+    if base is None:
+        runner = web.AppRunner(create_app())
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        base = f'http://127.0.0.1:{port}'
+
+    latencies, errors = [], []
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        deadline = time.perf_counter() + args.duration
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(session, base, make_requests(args.distinct), deadline, latencies, errors)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+        async with session.get(base + '/api/v1/stats') as response:
+            stats = await response.json()
+
+    if runner is not None:
+        await runner.cleanup()
+
+    lat = np.array(latencies) * 1000
+    print(f"requêtes     : {len(lat):,} en {elapsed:.1f}s ({len(errors)} erreurs)")
+    print(f"débit        : {len(lat) / elapsed:,.0f} req/s")
+    print(f"latence (ms) : p50 {np.percentile(lat, 50):.2f}  p95 {np.percentile(lat, 95):.2f}  "
+          f"p99 {np.percentile(lat, 99):.2f}")
+    print(f"cache        : {stats['cache']}")
+    print(f"batching     : {stats['batching']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default=None)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--distinct', type=int, default=100_000,
+                        help="nombre d'entrées distinctes générées")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
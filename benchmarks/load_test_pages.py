@@ -0,0 +1,325 @@
+"""Test de charge des pages Streamlit, sans navigateur (AppTest).
+
+Pour chaque application, --sessions sessions simulées tournent en parallèle
+dans le même processus, comme sur un serveur Streamlit (un thread par
+session, caches partagés). Chaque session parcourt toutes les pages de la
+navigation latérale dans un ordre aléatoire et, sur chaque page, agit sur
+--interactions widgets tirés au hasard (bouton, saisie numérique, liste,
+case à cocher, bouton radio) ; chaque rerun est chronométré.
+
+Mémoire : un premier passage en session unique mesure la RSS ajoutée par la
+première visite de chaque page (imports, caches) ; la RSS maximale du
+processus est échantillonnée pendant la charge.
+
+Les latences p95 par page et la mémoire sont comparées à la baseline
+benchmarks/baselines/load_test.json (code de sortie 1 au-delà de --threshold
+et de --min-delta-ms pour la latence, de --memory-threshold Mo pour la
+mémoire, ou si une page lève une exception) ; chaque run est ajouté à
+benchmarks/results/load_test.jsonl.
+
+Usage : python benchmarks/load_test_pages.py [projet_gestion.py app.py] [--sessions 5]
+                                             [--interactions 3] [--save-baseline]
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from unittest.mock import MagicMock
+
+import numpy as np
+from streamlit import config
+from streamlit.components.v2.component_manager import BidiComponentManager
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+
+from bench_kernels import environment
+from bench_memory import rss_mb
+
+# Bytecode partagé entre sessions, comme sur le serveur (voir bench_rerun.py)
+_SCRIPT_CACHE = ScriptCache()
+local_script_runner.ScriptCache = lambda: _SCRIPT_CACHE
+
+
+def share_runtime():
+    """Un runtime unique pour toutes les sessions, comme dans un processus serveur
+
+    AppTest installe un runtime factice au début de chaque run et l'efface à la
+    fin : deux sessions simultanées s'effaceraient mutuellement le leur. Ses
+    affectations sont redirigées vers une sous-classe et le runtime réel est
+    fixé une fois pour toutes ; l'option global.appTest reste active pendant
+    toute la charge pour la même raison.
+    """
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage('/mock/media'))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.bidi_component_registry = BidiComponentManager()
+    runtime.bidi_component_registry.discover_and_register_components(start_file_watching=False)
+    Runtime._instance = runtime
+    app_test.Runtime = type('AppTestRuntime', (Runtime,), {})
+    config.set_option('global.appTest', True)
+    return runtime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'load_test.json')
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'results', 'load_test.jsonl')
+
+SCRIPTS = ['projet_gestion.py', 'controleDeGestion.py', 'budget_vente.py', 'app.py']
+# Application sans navigation latérale (onglets) : une seule « page »
+WHOLE_APP = '(application)'
+
+
+# ---------------------------------------------------------------- Session simulée
+
+def navigation(at):
+    return at.sidebar.radio[0] if len(at.sidebar.radio) else None
+
+
+def pages_of(script):
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+    at.run()
+    nav = navigation(at)
+    return list(nav.options) if nav is not None else [WHOLE_APP]
+
+
+def candidate_actions(at):
+    """Actions possibles sur les widgets de la zone principale : (type, action)"""
+    main = at.main
+    actions = [('bouton', button.click) for button in main.button]
+    actions += [('saisie', number.increment) for number in main.number_input]
+    for select in list(main.selectbox) + list(main.radio):
+        if len(select.options) > 1:
+            following = (select.index + 1) % len(select.options) if select.index is not None else 0
+            actions.append(('liste', lambda s=select, i=following: choose(s, i)))
+    actions += [('case', lambda c=box: c.set_value(not c.value)) for box in main.checkbox]
+    return actions
+
+
+def choose(select, index):
+    """Sélectionner une option d'une liste ou de boutons radio par son rang"""
+    previous = select.value
+    select.set_value(select.options[index])
+    try:
+        select.index
+    except ValueError:
+        # Options affichées via format_func : le libellé n'est pas la valeur
+        select.set_value(previous)
+        raise
+
+
+def run_session(script, pages, interactions, seed, record):
+    """Une session : toutes les pages dans un ordre aléatoire, puis des interactions sur chacune"""
+    rng = random.Random(seed)
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=300)
+    if pages == [WHOLE_APP]:
+        # Sans navigation, le premier chargement tient lieu de visite de la page
+        rerun(at, WHOLE_APP, 'navigation', record)
+    else:
+        at.run()
+    order = list(pages)
+    rng.shuffle(order)
+    for page in order:
+        if page != WHOLE_APP:
+            navigation(at).set_value(page)
+            rerun(at, page, 'navigation', record)
+        actions = candidate_actions(at)
+        for kind, action in rng.sample(actions, min(interactions, len(actions))):
+            try:
+                action()
+            except Exception:
+                # Valeur hors bornes ou widget disparu : interaction sans objet
+                continue
+            rerun(at, page, kind, record)
+            if page != WHOLE_APP and getattr(navigation(at), 'value', None) != page:
+                break
+
+
+def rerun(at, page, action, record):
+    start = time.perf_counter()
+    at.run()
+    record(page, action, (time.perf_counter() - start) * 1000,
+           at.exception[0].message if at.exception else None)
+
+
+# ---------------------------------------------------------------- Mesures
+
+def first_visit_memory(script, pages):
+    """RSS ajoutée par la première visite de chaque page, en session unique (Mo)"""
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=300)
+    at.run()
+    deltas = {}
+    for page in pages:
+        gc.collect()
+        before = rss_mb()
+        if page != WHOLE_APP:
+            navigation(at).set_value(page)
+        at.run()
+        gc.collect()
+        deltas[page] = rss_mb() - before
+    return deltas
+
+
+def load(script, pages, sessions, interactions, seed):
+    """Reruns de `sessions` sessions concurrentes : latences par page et RSS maximale"""
+    samples, lock = [], threading.Lock()
+
+    def record(page, action, ms, error):
+        with lock:
+            samples.append((page, action, ms, error))
+
+    peak = [rss_mb()]
+    done = threading.Event()
+
+    def sample_memory():
+        while not done.wait(0.2):
+            peak[0] = max(peak[0], rss_mb())
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        futures = [pool.submit(run_session, script, pages, interactions, seed + i, record)
+                   for i in range(sessions)]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    return samples, max(peak[0], rss_mb()), elapsed
+
+
+def summarize(script, pages, samples, memory):
+    results = {}
+    for page in pages:
+        page_samples = [s for s in samples if s[0] == page]
+        if not page_samples:
+            continue
+        ms = np.array([s[2] for s in page_samples])
+        errors = [s[3] for s in page_samples if s[3]]
+        results[f'{script}/{page}'] = {
+            'reruns': len(ms),
+            'interactions': sum(s[1] != 'navigation' for s in page_samples),
+            'p50_ms': float(np.percentile(ms, 50)),
+            'p95_ms': float(np.percentile(ms, 95)),
+            'max_ms': float(ms.max()),
+            'errors': len(errors),
+            'first_error': errors[0][:200] if errors else None,
+            'rss_first_visit_mb': memory[page],
+        }
+    return results
+
+
+def compare(results, baseline, threshold, memory_threshold, min_delta_ms):
+    """Lignes de rapport et liste des régressions (latence p95, mémoire, erreurs)
+
+    Une page lente n'est en régression que si son p95 dépasse la baseline à la
+    fois de `threshold` (relatif) et de `min_delta_ms` : sur les pages de
+    quelques dizaines de ms, le bruit de mesure dépasse souvent +50 %.
+    """
+    lines, regressions = [], []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        status = []
+        if result.get('errors'):
+            status.append(f"{result['errors']} ERREUR(S)")
+        if reference is not None:
+            if 'p95_ms' in result and result['p95_ms'] > max(reference['p95_ms'] * (1 + threshold),
+                                                             reference['p95_ms'] + min_delta_ms):
+                status.append(f"p95 {result['p95_ms'] / reference['p95_ms']:.2f}x")
+            memory_key = 'rss_first_visit_mb' if 'p95_ms' in result else 'rss_peak_mb'
+            if result[memory_key] > reference[memory_key] + memory_threshold:
+                status.append(f"mémoire +{result[memory_key] - reference[memory_key]:.0f} Mo")
+        if status:
+            regressions.append(key)
+        if 'p95_ms' in result:
+            lines.append(f"{key:<62} {result['reruns']:>5} {result['p50_ms']:>8.0f} "
+                         f"{result['p95_ms']:>8.0f} {result['rss_first_visit_mb']:>+8.1f}  "
+                         f"{', '.join(status) or ('' if reference else '(pas de baseline)')}")
+        else:
+            lines.append(f"{key:<62} RSS max {result['rss_peak_mb']:.0f} Mo, "
+                         f"{result['reruns_per_s']:.1f} reruns/s  {', '.join(status)}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scripts', nargs='*', default=SCRIPTS)
+    parser.add_argument('--sessions', type=int, default=5, help="sessions simulées simultanées")
+    parser.add_argument('--interactions', type=int, default=3, help="widgets actionnés par page")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help="hausse tolérée du p95 par rapport à la baseline (0.5 = +50 %%)")
+    parser.add_argument('--min-delta-ms', type=float, default=100.0,
+                        help="hausse absolue minimale du p95 pour une régression (ms)")
+    parser.add_argument('--memory-threshold', type=float, default=30.0,
+                        help="hausse tolérée de la mémoire (Mo)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="enregistrer ce run comme nouvelle baseline")
+    args = parser.parse_args()
+
+    unknown = [s for s in args.scripts if not os.path.exists(os.path.join(ROOT, s))]
+    if unknown:
+        parser.error(f"script introuvable : {', '.join(unknown)}")
+
+    # Les erreurs de page sont comptées dans le rapport : inutile de les journaliser
+    logging.disable(logging.ERROR)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    share_runtime()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    for script in args.scripts:
+        pages = pages_of(script)
+        memory = first_visit_memory(script, pages)
+        samples, peak, elapsed = load(script, pages, args.sessions, args.interactions, args.seed)
+        results.update(summarize(script, pages, samples, memory))
+        results[f'{script}/*'] = {'rss_peak_mb': peak, 'reruns_per_s': len(samples) / elapsed,
+                                  'errors': sum(1 for s in samples if s[3])}
+
+    run = {'environment': environment(), 'sessions': args.sessions,
+           'interactions': args.interactions, 'seed': args.seed, 'results': results}
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + '\n')
+
+    print(f"{'page':<62} {'runs':>5} {'p50 ms':>8} {'p95 ms':>8} {'ΔRSS Mo':>8}")
+    lines, regressions = compare(results, baseline, args.threshold, args.memory_threshold,
+                                   args.min_delta_ms)
+    print('\n'.join(lines))
+    for key, result in results.items():
+        if result.get('first_error'):
+            print(f"  {key} : {result['first_error']}")
+
+    if args.save_baseline:
+        run['results'] = {**baseline, **results}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write('\n')
+        print(f"Baseline enregistrée : {os.path.relpath(args.baseline, ROOT)}")
+    elif regressions:
+        print(f"\n{len(regressions)} régression(s) : {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
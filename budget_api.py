@@ -0,0 +1,466 @@
+"""Service REST local exposant les moteurs budgétaires (sans Streamlit).
+
+Lancement : python budget_api.py --port 8080
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+from aiohttp import web
+
+import budget_engines as engines
+
+API_VERSION = '1.0'
+
+PERIODES = {'next-month': 1, 'next-quarter': 3, 'next-semester': 6, 'next-year': 12}
+MAX_HORIZON = 120
+
+
+class ResponseCache:
+    """Cache LRU des réponses, indexé par l'empreinte SHA-256 de l'entrée"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(route, payload):
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+        return ResponseCache.key_bytes(route, canonical.encode())
+
+    @staticmethod
+    def key_bytes(route, raw):
+        return hashlib.sha256(route.encode() + b'|' + raw).hexdigest()
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class MicroBatcher:
+    """Regroupe les requêtes concurrentes d'un endpoint en un seul calcul vectorisé"""
+
+    def __init__(self, batch_func, max_batch=512, max_wait=0.002):
+        self.batch_func = batch_func
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = None
+        self.worker = None
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item):
+        if self.worker is None:
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            self.items += len(batch)
+            try:
+                results = self.batch_func([item for item, _ in batch])
+            except Exception:
+                # Un élément invalide ne doit pas faire échouer ses voisins :
+                # le lot est recalculé élément par élément
+                for item, future in batch:
+                    self._resolve(future, item)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _resolve(self, future, item):
+        try:
+            result = self.batch_func([item])[0]
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def close(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+
+# ---------------------------------------------------------------- Calculs par lot
+
+INVENTORY_DEFAULTS = {
+    'demande_annuelle': 10000, 'cout_unitaire': 50.0, 'taux_possession': 0.25,
+    'cout_commande': 200.0, 'demande_jour': 25.0, 'ecart_type': 5.0, 'delai': 10,
+    'stock_actuel': 500, 'niveau_service': 95,
+}
+
+RATIO_FIELDS = ['actif_circulant', 'dettes_court_terme', 'stocks', 'creances_clients',
+                'dettes_fournisseurs', 'chiffre_affaires', 'resultat_net',
+                'capitaux_propres', 'tresorerie']
+
+
+def inventory_batch(items):
+    """Politique de stock pour une liste d'articles, en un seul passage numpy"""
+    columns = {
+        field: np.array([item.get(field, default) for item in items], dtype=float)
+        for field, default in INVENTORY_DEFAULTS.items()
+    }
+    policy = engines.inventory_policy(**columns)
+    return [
+        {'article': item.get('article'), **{k: engines.to_builtin(v[i]) for k, v in policy.items()}}
+        for i, item in enumerate(items)
+    ]
+
+
+def ratios_batch(items):
+    columns = {field: np.array([item.get(field, 0.0) for item in items], dtype=float)
+               for field in RATIO_FIELDS}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = engines.financial_ratios(**columns)
+    return [{k: engines.to_builtin(v[i]) for k, v in ratios.items()} for i in range(len(items))]
+
+
+def forecast_batch(items):
+    """Prévisions par moindres carrés ; les historiques de même longueur sont vectorisés"""
+    results = [None] * len(items)
+    groups = {}
+    for i, (history, horizon) in enumerate(items):
+        groups.setdefault((len(history), horizon), []).append(i)
+    for (_, horizon), indices in groups.items():
+        batch = engines.trend_forecast_batch([items[i][0] for i in indices], horizon)
+        periods = batch.pop('periods').tolist()
+        for row, i in enumerate(indices):
+            results[i] = {'periods': periods,
+                          **{key: value[row].tolist() for key, value in batch.items()}}
+    return results
+
+
+# ---------------------------------------------------------------- Application
+
+def envelope(data, started):
+    return {
+        'status': 'success',
+        'data': data,
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'version': API_VERSION,
+            'calculation_time': f'{(time.perf_counter() - started) * 1000:.1f}ms',
+        },
+    }
+
+
+def error(message, status=400):
+    return web.json_response({'status': 'error', 'message': message}, status=status)
+
+
+def bad_request(message):
+    return web.HTTPBadRequest(text=json.dumps({'status': 'error', 'message': message}),
+                              content_type='application/json')
+
+
+async def read_json(request):
+    """Corps JSON de la requête, qui doit être un objet"""
+    if not request.can_read_body:
+        return {}
+    try:
+        payload = await request.json()
+    except json.JSONDecodeError as exc:
+        raise bad_request(str(exc))
+    if not isinstance(payload, dict):
+        raise bad_request("Le corps de la requête doit être un objet JSON")
+    return payload
+
+
+def is_number(value):
+    """Nombre JSON fini ; les booléens sont refusés"""
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            and math.isfinite(value))
+
+
+def number(payload, field, default, minimum=None):
+    """Champ numérique du corps, borné par `minimum` si fourni"""
+    value = payload.get(field, default)
+    if not is_number(value):
+        raise bad_request(f"Le champ {field} doit être un nombre")
+    if minimum is not None and value < minimum:
+        raise bad_request(f"Le champ {field} doit être supérieur ou égal à {minimum}")
+    return float(value)
+
+
+def parse_horizon(value):
+    """Nombre de mois (entier JSON ou chaîne de chiffres) compris entre 1 et MAX_HORIZON"""
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise bad_request("L'horizon doit être un entier")
+    if not 1 <= value <= MAX_HORIZON:
+        raise bad_request(f"L'horizon doit être compris entre 1 et {MAX_HORIZON}")
+    return value
+
+
+def parse_history(values):
+    if not isinstance(values, list) or not all(is_number(v) for v in values):
+        raise bad_request("L'historique doit être une liste de nombres")
+    history = [float(v) for v in values]
+    if len(history) < 3:
+        raise bad_request("Au moins 3 périodes historiques sont nécessaires")
+    return history
+
+
+async def cached(request, payload, compute):
+    """Servir depuis le cache si la même entrée a déjà été calculée"""
+    cache = request.app['cache']
+    key = ResponseCache.key(request.path, payload)
+    body = cache.get(key)
+    if body is None:
+        started = time.perf_counter()
+        data = await compute()
+        body = json.dumps(envelope(engines.to_builtin(data), started))
+        cache.put(key, body)
+    return web.Response(text=body, content_type='application/json',
+                        headers={'X-Cache-Key': key[:16]})
+
+
+async def sales_forecast(request):
+    period = request.match_info['period']
+    horizon = PERIODES.get(period)
+    if horizon is None:
+        if not period.isdigit():
+            return error(f"Période inconnue : {period}")
+        horizon = parse_horizon(period)
+    history = request.query.get('history')
+    try:
+        history = ([float(v) for v in history.split(',')] if history
+                   else engines.VENTES_HISTORIQUES)
+    except ValueError:
+        return error("Paramètre history invalide")
+    history = parse_history(history)
+
+    async def compute():
+        result = await request.app['forecast_batcher'].submit((history, horizon))
+        return {'period': period, 'method': 'moindres_carres', **result,
+                'total': float(np.sum(result['forecast']))}
+
+    return await cached(request, {'history': history, 'horizon': horizon}, compute)
+
+
+async def budget_calculate(request):
+    payload = await read_json(request)
+    history = parse_history(payload.get('historique', engines.VENTES_HISTORIQUES))
+    horizon = parse_horizon(payload.get('horizon', 12))
+    # Toutes les entrées sont contrôlées avant de rejoindre le lot partagé
+    params = {field: number(payload, field, default, minimum) for field, default, minimum in (
+        ('stock_initial', 0, 0), ('stock_cible', 0, 0), ('prix_unitaire', 1.0, 0),
+        ('achats_ht_mensuel', 60.0, None), ('charges_personnel', 25.0, None),
+        ('charges_externes', 15.0, None), ('investissements', 50.0, None),
+        ('tresorerie_initiale', 50.0, None), ('credit_disponible', 100.0, 0),
+        ('taux_tva', 0.20, 0), ('delai_encaissement', 30, 0),
+    )}
+
+    async def compute():
+        forecast = await request.app['forecast_batcher'].submit((history, horizon))
+        ventes = float(np.sum(forecast['forecast']))
+        production = engines.production_need(ventes, params['stock_initial'],
+                                             params['stock_cible'])
+        tresorerie = engines.cash_budget(
+            ca_ht_mensuel=ventes / horizon * params['prix_unitaire'],
+            achats_ht_mensuel=params['achats_ht_mensuel'],
+            charges_personnel=params['charges_personnel'],
+            charges_externes=params['charges_externes'],
+            investissements=params['investissements'],
+            tresorerie_initiale=params['tresorerie_initiale'],
+            credit_disponible=params['credit_disponible'],
+            taux_tva=params['taux_tva'],
+            delai_encaissement=params['delai_encaissement'],
+            mois=horizon,
+        )
+        return {
+            'ventes': forecast,
+            'production_necessaire': float(production),
+            'tresorerie': {
+                'encaissements': tresorerie['encaissements'][0],
+                'decaissements': tresorerie['decaissements'][0],
+                'tresorerie_cumulee': tresorerie['tresorerie'][0],
+                'decouvert_excessif': bool(tresorerie['decouvert_excessif'].any()),
+            },
+        }
+
+    return await cached(request, {'historique': history, 'horizon': horizon, **params}, compute)
+
+
+async def inventory_levels(request):
+    payload = await read_json(request)
+    items = payload.get('articles', [payload] if payload else [INVENTORY_DEFAULTS])
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return error("Le champ articles doit être une liste d'objets")
+    for item in items:
+        for field, default in INVENTORY_DEFAULTS.items():
+            number(item, field, default, minimum=0)
+
+    async def compute():
+        batcher = request.app['inventory_batcher']
+        return {'articles': await asyncio.gather(*(batcher.submit(item) for item in items))}
+
+    return await cached(request, items, compute)
+
+
+async def financial_ratios(request):
+    payload = await read_json(request)
+    missing = [f for f in RATIO_FIELDS[:-1] if f not in payload]
+    if missing:
+        return error(f"Champs manquants : {', '.join(missing)}")
+    for field in RATIO_FIELDS:
+        number(payload, field, 0.0)
+
+    async def compute():
+        return await request.app['ratios_batcher'].submit(payload)
+
+    return await cached(request, payload, compute)
+
+
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+
+
+def scenarios_from_arrow(raw):
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(raw).read_all()
+    return {name: table.column(name).to_numpy() for name in table.column_names}
+
+
+def scenarios_to_arrow(columns):
+    import pyarrow as pa
+
+    table = pa.table({name: np.asarray(values) for name, values in columns.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def run_scenarios(columns, mois):
+    """Évaluation vectorisée ; l'identifiant de scénario éventuel est renvoyé tel quel"""
+    ids = columns.pop('scenario', None)
+    results = engines.evaluate_scenarios(columns, mois=mois)
+    if ids is not None:
+        results = {'scenario': np.asarray(ids), **results}
+    return results
+
+
+async def budget_scenarios(request):
+    """Lot de scénarios en colonnes (JSON compact ou Arrow IPC), résultats en colonnes"""
+    raw = await request.read()
+    arrow = request.content_type == ARROW_STREAM
+    mois = parse_horizon(request.query.get('mois', 12))
+    cache = request.app['cache']
+    key = ResponseCache.key_bytes(f'{request.path}?mois={mois}', raw)
+    body = cache.get(key)
+    if body is not None:
+        return web.Response(body=body, content_type=ARROW_STREAM if arrow else 'application/json')
+
+    started = time.perf_counter()
+    try:
+        if arrow:
+            columns = scenarios_from_arrow(raw)
+        else:
+            payload = json.loads(raw or b'{}')
+            if not isinstance(payload, dict):
+                return error("Le corps de la requête doit être un objet JSON")
+            columns = payload.get('columns', {})
+            mois = parse_horizon(payload.get('mois', mois))
+        if not isinstance(columns, dict):
+            return error("Le champ columns doit associer un nom de colonne à une liste")
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(None, run_scenarios, dict(columns), mois)
+    except ImportError:
+        return error("Format Arrow indisponible : pyarrow n'est pas installé", status=415)
+    except (ValueError, TypeError) as exc:
+        return error(str(exc))
+
+    if arrow:
+        body = scenarios_to_arrow(results)
+    else:
+        n = len(next(iter(results.values())))
+        body = json.dumps(envelope(
+            {'n': n, 'columns': engines.to_builtin(results)}, started
+        )).encode()
+    cache.put(key, body)
+    return web.Response(body=body, content_type=ARROW_STREAM if arrow else 'application/json')
+
+
+async def stats(request):
+    app = request.app
+    cache = app['cache']
+    return web.json_response({
+        'cache': {'entries': len(cache.entries), 'hits': cache.hits, 'misses': cache.misses},
+        'batching': {
+            name: {'batches': app[name].batches, 'items': app[name].items}
+            for name in ('forecast_batcher', 'inventory_batcher', 'ratios_batcher')
+        },
+    })
+
+
+async def on_cleanup(app):
+    for name in ('forecast_batcher', 'inventory_batcher', 'ratios_batcher'):
+        await app[name].close()
+
+
+def create_app(cache_size=10000, max_batch=512, max_wait=0.002):
+    app = web.Application(client_max_size=256 * 1024 ** 2)
+    app['cache'] = ResponseCache(cache_size)
+    app['forecast_batcher'] = MicroBatcher(forecast_batch, max_batch, max_wait)
+    app['inventory_batcher'] = MicroBatcher(inventory_batch, max_batch, max_wait)
+    app['ratios_batcher'] = MicroBatcher(ratios_batch, max_batch, max_wait)
+    app.router.add_post('/api/v1/budget/calculate', budget_calculate)
+    app.router.add_post('/api/v1/budget/scenarios', budget_scenarios)
+    app.router.add_get('/api/v1/sales/forecast/{period}', sales_forecast)
+    app.router.add_put('/api/v1/inventory/levels', inventory_levels)
+    app.router.add_post('/api/v1/inventory/optimization', inventory_levels)
+    app.router.add_post('/api/v1/financial/ratios', financial_ratios)
+    app.router.add_get('/api/v1/stats', stats)
+    app.on_cleanup.append(on_cleanup)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service REST des moteurs budgétaires")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-size', type=int, default=10000)
+    args = parser.parse_args()
+    web.run_app(create_app(args.cache_size), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
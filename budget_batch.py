@@ -0,0 +1,270 @@
+"""Traitement budgétaire par lot, sans Streamlit (exécution planifiée de nuit).
+
+Chaque ligne du fichier d'entrée décrit une unité d'activité : colonne `unite`,
+historique des ventes mensuelles dans les colonnes `ventes_1` ... `ventes_n`
+et, au besoin, les paramètres de SCENARIO_DEFAULTS / UNIT_DEFAULTS. Un relevé
+de trésorerie (colonnes Encaissements / Décaissements, comme
+budget_tresorerie.csv) est aussi accepté et consolidé tel quel.
+
+Exemples :
+    python budget_batch.py unites.parquet -o resultats/
+    python budget_batch.py budget_tresorerie.csv -o resultats/ --format xlsx
+    python budget_batch.py unites_*.csv -o resultats/ --workers 4
+
+Les sorties sont nommées d'après le fichier d'entrée (unites_synthese.parquet...) ;
+l'extension y est ajoutée lorsque deux entrées partagent le même nom
+(budget.csv et budget.xlsx donnent budget_csv_... et budget_xlsx_...).
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import budget_engines as engines
+
+# Paramètres d'exploitation propres au lot (en plus de SCENARIO_DEFAULTS)
+UNIT_DEFAULTS = {
+    'horizon': 12,
+    'prix_unitaire': 1.0,
+    'stock_initial': 0.0,
+    'stock_cible': 0.0,
+    'cout_unitaire': 50.0,
+    'taux_possession': 0.25,
+    'cout_commande': 200.0,
+    'delai': 10,
+    'niveau_service': 95,
+}
+
+READERS = {
+    '.csv': pd.read_csv,
+    '.xlsx': pd.read_excel,
+    '.xls': pd.read_excel,
+    '.parquet': pd.read_parquet,
+}
+
+
+def load_table(path):
+    """Lire un fichier CSV, Excel ou Parquet selon son extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Format non supporté : {path}")
+    return READERS[ext](path)
+
+
+def write_table(df, path_without_ext, fmt):
+    path = f'{path_without_ext}.{fmt}'
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+    elif fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    elif fmt == 'xlsx':
+        df.to_excel(path, index=False)
+    else:
+        raise ValueError(f"Format de sortie non supporté : {fmt}")
+    return path
+
+
+def is_treasury_statement(df):
+    return {'Encaissements', 'Décaissements'} <= set(df.columns)
+
+
+def consolidate_treasury(df, tresorerie_initiale=0.0):
+    """Relevé mensuel de trésorerie : solde et trésorerie cumulée"""
+    out = df.copy()
+    out['Solde Mensuel'] = out['Encaissements'] - out['Décaissements']
+    out['Trésorerie Cumulée'] = tresorerie_initiale + out['Solde Mensuel'].cumsum()
+    return out
+
+
+def run_units(units):
+    """Ventes → production → stocks → trésorerie → investissement pour un lot d'unités.
+
+    Les unités sont regroupées par horizon : chacune garde le sien, et les lignes
+    de sortie suivent l'ordre d'entrée.
+    """
+    if units.empty:
+        # Aucune unité : sorties vides, avec les colonnes du calcul d'une unité par défaut
+        synthese, detail = run_horizon(pd.DataFrame(index=[0]), UNIT_DEFAULTS['horizon'])
+        return synthese.iloc[:0], detail.iloc[:0]
+    if 'horizon' not in units:
+        return run_horizon(units, UNIT_DEFAULTS['horizon'])
+    horizons = units['horizon'].fillna(UNIT_DEFAULTS['horizon']).to_numpy(dtype=int)
+    if (horizons < 1).any():
+        raise ValueError("L'horizon de chaque unité doit être d'au moins 1 mois")
+    if (horizons == horizons[0]).all():
+        return run_horizon(units, int(horizons[0]))
+
+    syntheses, details = [], []
+    for horizon in np.unique(horizons):
+        positions = np.flatnonzero(horizons == horizon)
+        synthese, detail = run_horizon(units.iloc[positions], int(horizon))
+        syntheses.append(synthese.set_axis(positions))
+        details.append(detail.set_axis(np.repeat(positions, horizon)))
+    return (pd.concat(syntheses).sort_index().reset_index(drop=True),
+            pd.concat(details).sort_index(kind='stable').reset_index(drop=True))
+
+
+def run_horizon(units, horizon):
+    """Chaîne budgétaire d'unités partageant le même horizon (en mois)"""
+    n = len(units)
+
+    def col(name, default):
+        if name in units:
+            return units[name].fillna(default).to_numpy(dtype=float)
+        return np.full(n, float(default))
+
+    # 1. Ventes : tendance par moindres carrés sur l'historique, sinon scénario de croissance
+    history_cols = sorted((c for c in units.columns if c.startswith('ventes_')),
+                          key=lambda c: int(c.split('_')[1]))
+    if len(history_cols) >= 3:
+        history = units[history_cols].to_numpy(dtype=float)
+        forecast = engines.trend_forecast_batch(history, horizon)['forecast']
+        ventes_mensuelles = forecast
+    else:
+        ca = engines.sales_scenario(
+            col('ca_annee_precedente', engines.SCENARIO_DEFAULTS['ca_annee_precedente']),
+            col('croissance', engines.SCENARIO_DEFAULTS['croissance']),
+            col('budget_marketing', engines.SCENARIO_DEFAULTS['budget_marketing']),
+        )
+        ventes_mensuelles = np.repeat((ca / 12)[:, None], horizon, axis=1)
+    ventes = ventes_mensuelles.sum(axis=1)
+
+    # 2. Production
+    production = engines.production_need(ventes, col('stock_initial', 0), col('stock_cible', 0))
+
+    # 3. Stocks
+    demande_annuelle = np.maximum(production, 1e-9) * 12 / horizon
+    politique = engines.inventory_policy(
+        demande_annuelle=demande_annuelle,
+        cout_unitaire=col('cout_unitaire', UNIT_DEFAULTS['cout_unitaire']),
+        taux_possession=col('taux_possession', UNIT_DEFAULTS['taux_possession']),
+        cout_commande=col('cout_commande', UNIT_DEFAULTS['cout_commande']),
+        demande_jour=demande_annuelle / 360,
+        ecart_type=ventes_mensuelles.std(axis=1) / np.sqrt(30),
+        delai=col('delai', UNIT_DEFAULTS['delai']),
+        stock_actuel=col('stock_initial', 0),
+        niveau_service=col('niveau_service', UNIT_DEFAULTS['niveau_service']),
+    )
+
+    # 4. Trésorerie (CA mensuel moyen valorisé au prix unitaire)
+    defaults = engines.SCENARIO_DEFAULTS
+    tresorerie = engines.cash_budget(
+        ventes / horizon * col('prix_unitaire', UNIT_DEFAULTS['prix_unitaire']),
+        col('achats_ht_mensuel', defaults['achats_ht_mensuel']),
+        col('charges_personnel', defaults['charges_personnel']),
+        col('charges_externes', defaults['charges_externes']),
+        col('investissements', defaults['investissements']),
+        col('tresorerie_initiale', defaults['tresorerie_initiale']),
+        col('credit_disponible', defaults['credit_disponible']),
+        taux_tva=col('taux_tva', defaults['taux_tva']),
+        delai_encaissement=col('delai_encaissement', defaults['delai_encaissement']),
+        mois=horizon,
+    )
+
+    # 5. Investissement
+    duree = col('duree', defaults['duree']).astype(int)
+    annees = np.arange(1, max(int(duree.max()), 1) + 1)
+    flux = col('flux_annuel', defaults['flux_annuel'])[:, None] * (annees <= duree[:, None])
+    investissement = col('investissement', defaults['investissement'])
+
+    unite = units['unite'].to_numpy() if 'unite' in units else np.arange(n)
+    synthese = pd.DataFrame({
+        'unite': unite,
+        'ventes_prevues': ventes,
+        'production': production,
+        'eoq': politique['eoq'],
+        'stock_securite': politique['stock_securite'],
+        'point_commande': politique['point_commande'],
+        'tresorerie_min': tresorerie['tresorerie'].min(axis=1),
+        'tresorerie_finale': tresorerie['tresorerie'][:, -1],
+        'mois_decouvert': tresorerie['decouvert_excessif'].sum(axis=1),
+        'van': engines.npv(investissement, flux, col('taux_actualisation', defaults['taux_actualisation'])),
+        'tri': engines.irr(investissement, flux),
+    })
+
+    mois = np.arange(1, horizon + 1)
+    detail = pd.DataFrame({
+        'unite': np.repeat(unite, horizon),
+        'mois': np.tile(mois, n),
+        'ventes': ventes_mensuelles.ravel(),
+        'encaissements': tresorerie['encaissements'].ravel(),
+        'decaissements': tresorerie['decaissements'].ravel(),
+        'tresorerie': tresorerie['tresorerie'].ravel(),
+    })
+    return synthese, detail
+
+
+def run_file(path, chunk_rows, pool=None):
+    """Traiter un fichier d'entrée par blocs de `chunk_rows` unités, répartis sur `pool` si fourni"""
+    df = load_table(path)
+    if is_treasury_statement(df):
+        return 'tresorerie', [consolidate_treasury(df)]
+    # Fichier sans unité (en-tête seul) : un bloc vide, pour des sorties vides mais complètes
+    chunks = [df.iloc[i:i + chunk_rows] for i in range(0, len(df), chunk_rows)] or [df]
+    parts = list((pool.map if pool is not None else map)(run_units, chunks))
+    return 'unites', parts
+
+
+def output_bases(paths, output):
+    """Nom de base des sorties de chaque entrée, sans collision entre entrées"""
+    stems = [os.path.splitext(os.path.basename(p)) for p in paths]
+    counts = Counter(stem for stem, _ in stems)
+    bases = [stem if counts[stem] == 1 else f"{stem}_{ext.lstrip('.').lower()}"
+             for stem, ext in stems]
+    duplicates = sorted(base for base, count in Counter(bases).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"plusieurs entrées produiraient les mêmes sorties : {', '.join(duplicates)}")
+    return [os.path.join(output, base) for base in bases]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('inputs', nargs='+', help="fichiers CSV/Excel/Parquet (motifs glob acceptés)")
+    parser.add_argument('-o', '--output', default='resultats', help="répertoire de sortie")
+    parser.add_argument('--format', choices=['csv', 'parquet', 'xlsx'], default='parquet')
+    parser.add_argument('--workers', type=int, default=1,
+                        help="nombre de processus (les blocs d'unités sont répartis entre eux)")
+    parser.add_argument('--chunk-rows', type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    paths = sorted({p for pattern in args.inputs for p in (glob.glob(pattern) or [pattern])})
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        parser.error(f"fichier(s) introuvable(s) : {', '.join(missing)}")
+    try:
+        bases = output_bases(paths, args.output)
+    except ValueError as exc:
+        parser.error(str(exc))
+    os.makedirs(args.output, exist_ok=True)
+
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    try:
+        for path, base in zip(paths, bases):
+            kind, parts = run_file(path, args.chunk_rows, pool)
+            if kind == 'tresorerie':
+                written = [write_table(parts[0], f'{base}_tresorerie', args.format)]
+            else:
+                synthese = pd.concat([p[0] for p in parts], ignore_index=True)
+                detail = pd.concat([p[1] for p in parts], ignore_index=True)
+                written = [write_table(synthese, f'{base}_synthese', args.format),
+                           write_table(detail, f'{base}_detail', args.format)]
+            print(f"{path} -> {', '.join(written)}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"{len(paths)} fichier(s) traité(s) en {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,395 @@
+"""Moteurs de calcul budgétaire, indépendants de l'interface Streamlit.
+
+Les formules reprennent celles des pages de l'application (moindres carrés,
+programmation linéaire, Wilson, VAN, budget de trésorerie) ; chaque fonction
+accepte des scalaires ou des tableaux numpy pour pouvoir évaluer de nombreux
+scénarios en un seul appel.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+MOIS = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
+
+# Historique de référence de la page "Budget des Ventes"
+VENTES_HISTORIQUES = [120, 135, 115, 145, 160, 155, 140, 165, 180, 175, 160, 185]
+
+DELAIS_ENCAISSEMENT = {'0 jour': 0, '30 jours': 30, '60 jours': 60, '90 jours': 90}
+
+
+# ---------------------------------------------------------------- Ventes
+
+def trend_forecast_batch(histories, horizon=6, confidence=0.95):
+    """Moindres carrés vectorisés : une ligne de `histories` par série"""
+    y = np.atleast_2d(np.asarray(histories, dtype=float))
+    n = y.shape[1]
+    x = np.arange(1, n + 1, dtype=float)
+    x_mean = x.mean()
+    y_mean = y.mean(axis=1)
+    a = ((x - x_mean) * (y - y_mean[:, None])).sum(axis=1) / ((x - x_mean) ** 2).sum()
+    b = y_mean - a * x_mean
+    residuals = y - (a[:, None] * x + b[:, None])
+    ss_res = (residuals ** 2).sum(axis=1)
+    ss_tot = ((y - y_mean[:, None]) ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r_squared = np.where(ss_tot > 0, 1 - ss_res / ss_tot, 1.0)
+    sigma = np.sqrt(ss_res / (n - 2)) if n > 2 else np.zeros(len(y))
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    x_future = np.arange(n + 1, n + 1 + horizon, dtype=float)
+    forecast = a[:, None] * x_future + b[:, None]
+    return {
+        'a': a,
+        'b': b,
+        'r_squared': r_squared,
+        'periods': x_future.astype(int),
+        'forecast': forecast,
+        'lower': forecast - z * sigma[:, None],
+        'upper': forecast + z * sigma[:, None],
+    }
+
+
+def trend_forecast(history, horizon=6, confidence=0.95):
+    """Droite des moindres carrés y = ax + b et prévisions sur l'horizon"""
+    result = trend_forecast_batch([history], horizon, confidence)
+    return {
+        key: (value.tolist() if key == 'periods' else
+              value[0].tolist() if value.ndim > 1 else float(value[0]))
+        for key, value in result.items()
+    }
+
+
+def sales_scenario(ca_annee_precedente, croissance, budget_marketing, multiplicateur=2.0):
+    """CA projeté d'un scénario de ventes (croissance en %, marketing en k€)"""
+    ca_projete = np.asarray(ca_annee_precedente) * (1 + np.asarray(croissance) / 100)
+    return ca_projete + np.asarray(budget_marketing) * multiplicateur
+
+
+# ---------------------------------------------------------------- Production
+
+def production_need(sales_forecast, initial_stock, target_stock):
+    """Production = Ventes prévues + Stock cible - Stock initial"""
+    return np.asarray(sales_forecast) + np.asarray(target_stock) - np.asarray(initial_stock)
+
+
+def production_lp(marges, consommations, capacites, demandes):
+    """Programme de production maximisant la marge sous contraintes de ressources.
+
+    `consommations` est une matrice ressources x produits ; retourne
+    (quantités, marge totale) ou None si le problème est infaisable.
+    """
+    from scipy.optimize import linprog
+
+    marges = np.asarray(marges, dtype=float)
+    n_produits = len(marges)
+    A = np.vstack([np.asarray(consommations, dtype=float), np.eye(n_produits)])
+    b = np.concatenate([np.asarray(capacites, dtype=float), np.asarray(demandes, dtype=float)])
+    result = linprog(-marges, A_ub=A, b_ub=b, bounds=[(0, None)] * n_produits, method='highs')
+    if not result.success:
+        return None
+    return result.x, -result.fun
+
+
+def stock_simulation(stock_initial, production_jour, ventes_jour, jours=30, facteur_weekend=0.3):
+    """Simulation journalière du stock (pas de production le week-end)"""
+    jour = np.arange(1, jours + 1)
+    weekend = np.isin(jour % 7, [0, 6])
+    production = np.where(weekend, 0, production_jour)
+    ventes = np.where(weekend, ventes_jour * facteur_weekend, ventes_jour)
+    stock = stock_initial + np.cumsum(production - ventes)
+    return pd.DataFrame({'Jour': jour, 'Stock': stock, 'Production': production, 'Ventes': ventes})
+
+
+# ---------------------------------------------------------------- Stocks
+
+def eoq(consommation_annuelle, cout_lancement, cout_possession_annuel, cout_penurie=None):
+    """Lot économique de Wilson, avec facteur de pénurie optionnel"""
+    q = np.sqrt(2 * np.asarray(consommation_annuelle, dtype=float) * cout_lancement
+                / np.asarray(cout_possession_annuel, dtype=float))
+    if cout_penurie is not None:
+        q = q * np.sqrt((cout_penurie + cout_possession_annuel) / np.asarray(cout_penurie, dtype=float))
+    return q
+
+
+def z_score(service_level):
+    """Coefficient de la loi normale pour un niveau de service (en % ou fraction)"""
+    levels = np.asarray(service_level, dtype=float)
+    levels = np.where(levels > 1, levels / 100, levels)
+    inv = NormalDist().inv_cdf
+    unique, inverse = np.unique(levels, return_inverse=True)
+    return np.array([inv(p) for p in unique])[inverse].reshape(levels.shape)
+
+
+def safety_stock(demand_std, lead_time, service_level=95):
+    return z_score(service_level) * np.asarray(demand_std) * np.sqrt(lead_time)
+
+
+def inventory_policy(demande_annuelle, cout_unitaire, taux_possession, cout_commande,
+                     demande_jour, ecart_type, delai, stock_actuel, niveau_service=95):
+    """Politique de stock vectorisée : EOQ, stock de sécurité, point de commande, couverture"""
+    demande_annuelle = np.asarray(demande_annuelle, dtype=float)
+    q = eoq(demande_annuelle, cout_commande, np.asarray(cout_unitaire) * taux_possession)
+    ss = safety_stock(ecart_type, delai, niveau_service)
+    reorder_point = np.asarray(demande_jour) * delai + ss
+    stock_actuel = np.asarray(stock_actuel, dtype=float)
+    return {
+        'eoq': q,
+        'commandes_par_an': demande_annuelle / q,
+        'stock_securite': ss,
+        'point_commande': reorder_point,
+        'couverture_jours': stock_actuel / np.asarray(demande_jour, dtype=float),
+        'risque_rupture': stock_actuel < reorder_point,
+    }
+
+
+def supply_budget(stock_initial, stock_securite, delai_livraison, lot_commande, consommation):
+    """Budget d'approvisionnement mensuel (commande d'un lot sous le stock de sécurité)"""
+    n = len(consommation)
+    commandes = [0] * n
+    livraisons = [0] * n
+    stocks_fin = []
+    stock_courant = stock_initial
+    for i in range(n):
+        if i >= delai_livraison:
+            livraisons[i] = commandes[i - delai_livraison]
+        stock_courant += livraisons[i] - consommation[i]
+        stocks_fin.append(stock_courant)
+        if stock_courant < stock_securite:
+            commandes[i] = lot_commande
+    return pd.DataFrame({
+        'Consommation': consommation,
+        'Commandes': commandes,
+        'Livraisons': livraisons,
+        'Stock Final': stocks_fin,
+    })
+
+
+def abc_classification(values, seuils=(0.80, 0.95)):
+    """Classe A/B/C selon la part cumulée de la valeur (tri décroissant)"""
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(-values, kind='stable')
+    cumulative = np.cumsum(values[order]) / values.sum()
+    classes_sorted = np.where(cumulative <= seuils[0], 'A',
+                              np.where(cumulative <= seuils[1], 'B', 'C'))
+    classes = np.empty(len(values), dtype=object)
+    classes[order] = classes_sorted
+    return classes
+
+
+# ---------------------------------------------------------------- Investissement
+
+def npv(investissement, flux, taux):
+    """VAN : flux (..., années) actualisés au taux, moins l'investissement initial"""
+    flux = np.asarray(flux, dtype=float)
+    taux = np.asarray(taux, dtype=float)
+    annees = np.arange(1, flux.shape[-1] + 1)
+    facteurs = (1 + taux[..., None]) ** -annees
+    return (flux * facteurs).sum(axis=-1) - np.asarray(investissement, dtype=float)
+
+
+def irr(investissement, flux, tol=1e-7, max_iter=100):
+    """TRI par dichotomie vectorisée sur [-99 %, 1000 %]"""
+    flux = np.atleast_2d(np.asarray(flux, dtype=float))
+    investissement = np.broadcast_to(np.asarray(investissement, dtype=float), flux.shape[:-1])
+    low = np.full(flux.shape[:-1], -0.99)
+    high = np.full(flux.shape[:-1], 10.0)
+    for _ in range(max_iter):
+        mid = (low + high) / 2
+        positive = npv(investissement, flux, mid) > 0
+        low = np.where(positive, mid, low)
+        high = np.where(positive, high, mid)
+        if np.max(high - low) < tol:
+            break
+    return (low + high) / 2
+
+
+def payback(investissement, flux):
+    """Délai de récupération simple (investissement / flux moyen), comme dans les pages"""
+    moyenne = np.mean(np.asarray(flux, dtype=float), axis=-1)
+    return np.where(moyenne > 0, np.asarray(investissement) / np.where(moyenne > 0, moyenne, 1), np.inf)
+
+
+def monte_carlo_npv(investissement, flux, taux, n_simulations=10000, volatilite=0.15, seed=None):
+    """Distribution de VAN avec des flux bruités N(1, volatilité), tirée en une passe"""
+    rng = np.random.default_rng(seed)
+    flux = np.asarray(flux, dtype=float)
+    chocs = rng.normal(1, volatilite, size=(n_simulations, flux.shape[-1]))
+    return npv(investissement, flux * chocs, np.full(n_simulations, taux))
+
+
+# ---------------------------------------------------------------- Trésorerie
+
+def cash_budget(ca_ht_mensuel, achats_ht_mensuel, charges_personnel, charges_externes,
+                investissements, tresorerie_initiale, credit_disponible,
+                taux_tva=0.20, delai_encaissement=30, mois=12):
+    """Budget de trésorerie mensuel, vectorisé sur les scénarios.
+
+    Chaque paramètre peut être un tableau (un élément par scénario) ; le délai
+    d'encaissement est en jours (0, 30, 60 ou 90). Retourne les matrices
+    scénarios x mois des encaissements, décaissements et trésorerie cumulée,
+    ainsi qu'un masque des découverts dépassant la ligne de crédit.
+    """
+    params = np.broadcast_arrays(*[np.atleast_1d(np.asarray(p, dtype=float)) for p in (
+        ca_ht_mensuel, achats_ht_mensuel, charges_personnel, charges_externes,
+        investissements, tresorerie_initiale, credit_disponible, taux_tva, delai_encaissement)])
+    ca, achats, personnel, externes, invest, tresorerie, credit, tva, delai = params
+
+    ca_ttc = ca * (1 + tva)
+    achats_ttc = achats * (1 + tva)
+    tva_a_payer = (ca - achats) * tva
+
+    # Échéancier des encaissements clients selon le délai
+    m = np.arange(mois)
+    part = np.where(delai[:, None] == 0, 1.0,
+                    np.where(delai[:, None] == 30, 0.7 + 0.3 * (m > 0),
+                             0.5 + 0.3 * (m > 0) + 0.2 * (m > 1)))
+    encaissements = ca_ttc[:, None] * part
+
+    decaissements = np.broadcast_to(
+        (achats_ttc + personnel + externes + tva_a_payer)[:, None], encaissements.shape
+    ) + np.where(m < 3, invest[:, None] / 3, 0.0)
+
+    soldes = encaissements - decaissements
+    cumul = np.empty_like(soldes)
+    decouvert_excessif = np.zeros_like(soldes, dtype=bool)
+    courant = tresorerie.copy()
+    for i in range(mois):
+        courant = courant + soldes[:, i]
+        couvert = (courant < 0) & (-courant <= credit)
+        decouvert_excessif[:, i] = (courant < 0) & ~couvert
+        courant = np.where(couvert, 0.0, courant)
+        cumul[:, i] = courant
+    return {
+        'encaissements': encaissements,
+        'decaissements': decaissements,
+        'soldes': soldes,
+        'tresorerie': cumul,
+        'decouvert_excessif': decouvert_excessif,
+    }
+
+
+def cash_budget_frame(**params):
+    """Budget de trésorerie d'un scénario unique sous forme de tableau mensuel"""
+    result = cash_budget(**params)
+    n = result['soldes'].shape[1]
+    return pd.DataFrame({
+        'Mois': (MOIS * (n // 12 + 1))[:n],
+        'Encaissements': result['encaissements'][0],
+        'Décaissements': result['decaissements'][0],
+        'Solde Mensuel': result['soldes'][0],
+        'Trésorerie Cumulée': result['tresorerie'][0],
+    })
+
+
+def bfr(stocks_moyen, creances_clients, dettes_fournisseurs):
+    """Besoin en fonds de roulement"""
+    return np.asarray(stocks_moyen) + np.asarray(creances_clients) - np.asarray(dettes_fournisseurs)
+
+
+def financial_ratios(actif_circulant, dettes_court_terme, stocks, creances_clients,
+                     dettes_fournisseurs, chiffre_affaires, resultat_net,
+                     capitaux_propres, tresorerie=0.0, achats=None):
+    """Ratios de liquidité, de rentabilité et de rotation"""
+    ca = np.asarray(chiffre_affaires, dtype=float)
+    achats = ca if achats is None else np.asarray(achats, dtype=float)
+    dettes_ct = np.asarray(dettes_court_terme, dtype=float)
+    return {
+        'liquidite_generale': np.asarray(actif_circulant) / dettes_ct,
+        'liquidite_reduite': (np.asarray(actif_circulant) - stocks) / dettes_ct,
+        'liquidite_immediate': np.asarray(tresorerie) / dettes_ct,
+        'bfr': bfr(stocks, creances_clients, dettes_fournisseurs),
+        'bfr_jours_ca': bfr(stocks, creances_clients, dettes_fournisseurs) / ca * 360,
+        'dso_jours': np.asarray(creances_clients) / ca * 360,
+        'dpo_jours': np.asarray(dettes_fournisseurs) / achats * 360,
+        'rotation_stocks': ca / np.asarray(stocks, dtype=float),
+        'marge_nette': np.asarray(resultat_net) / ca * 100,
+        'roe': np.asarray(resultat_net) / np.asarray(capitaux_propres, dtype=float) * 100,
+    }
+
+
+# ---------------------------------------------------------------- Scénarios
+
+SCENARIO_DEFAULTS = {
+    # Ventes (k€ / an)
+    'ca_annee_precedente': 10000.0,
+    'croissance': 10.0,
+    'budget_marketing': 500.0,
+    # Trésorerie (k€ / mois) ; ca_ht_mensuel par défaut = CA projeté / 12
+    'achats_ht_mensuel': 500.0,
+    'charges_personnel': 200.0,
+    'charges_externes': 100.0,
+    'investissements': 500.0,
+    'tresorerie_initiale': 50.0,
+    'credit_disponible': 100.0,
+    'taux_tva': 0.20,
+    'delai_encaissement': 30,
+    # Investissement (k€)
+    'investissement': 150.0,
+    'flux_annuel': 50.0,
+    'duree': 5,
+    'taux_actualisation': 0.15,
+}
+
+SCENARIO_RESULTS = ['ca_projete', 'tresorerie_min', 'tresorerie_finale', 'mois_decouvert',
+                    'van', 'tri', 'payback']
+
+
+def evaluate_scenarios(columns, mois=12):
+    """Évaluer un lot de scénarios budgétaires donnés en colonnes (un élément par scénario).
+
+    Enchaîne budget des ventes, budget de trésorerie et VAN du projet
+    d'investissement sans boucle Python sur les scénarios ; les colonnes
+    absentes prennent la valeur de SCENARIO_DEFAULTS.
+    """
+    n = max((len(np.atleast_1d(v)) for v in columns.values()), default=1)
+    unknown = set(columns) - set(SCENARIO_DEFAULTS) - {'ca_ht_mensuel', 'scenario'}
+    if unknown:
+        raise ValueError(f"Colonnes inconnues : {', '.join(sorted(unknown))}")
+
+    def col(name):
+        value = columns.get(name, SCENARIO_DEFAULTS.get(name))
+        return np.broadcast_to(np.asarray(value, dtype=float), (n,))
+
+    ca_projete = sales_scenario(col('ca_annee_precedente'), col('croissance'), col('budget_marketing'))
+    ca_mensuel = col('ca_ht_mensuel') if 'ca_ht_mensuel' in columns else ca_projete / 12
+
+    tresorerie = cash_budget(
+        ca_mensuel, col('achats_ht_mensuel'), col('charges_personnel'), col('charges_externes'),
+        col('investissements'), col('tresorerie_initiale'), col('credit_disponible'),
+        taux_tva=col('taux_tva'), delai_encaissement=col('delai_encaissement'), mois=mois,
+    )
+
+    # Flux constants sur la durée de chaque projet, nuls au-delà
+    duree = col('duree').astype(int)
+    annees = np.arange(1, max(int(duree.max()), 1) + 1)
+    flux = col('flux_annuel')[:, None] * (annees <= duree[:, None])
+    investissement = col('investissement')
+
+    return {
+        'ca_projete': ca_projete,
+        'tresorerie_min': tresorerie['tresorerie'].min(axis=1),
+        'tresorerie_finale': tresorerie['tresorerie'][:, -1],
+        'mois_decouvert': tresorerie['decouvert_excessif'].sum(axis=1),
+        'van': npv(investissement, flux, col('taux_actualisation')),
+        'tri': irr(investissement, flux),
+        'payback': np.where(col('flux_annuel') > 0,
+                            investissement / np.where(col('flux_annuel') > 0, col('flux_annuel'), 1),
+                            np.inf),
+    }
+
+
+def to_builtin(value):
+    """Convertir les résultats numpy en types JSON-sérialisables"""
+    if isinstance(value, dict):
+        return {k: to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtin(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return to_builtin(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
@@ -0,0 +1,608 @@
+"""Import par blocs des fichiers budgétaires (CSV, Excel) vers l'entrepôt d'historique.
+
+Un fichier est reconnu d'après son en-tête parmi les modèles de TEMPLATES
+(relevé de trésorerie comme budget_tresorerie.csv, grand livre, lignes de
+ventes), puis lu par blocs de chunk_rows lignes avec des types explicites :
+catégories pour les mois, comptes et libellés, float64 pour les montants. La
+mémoire reste bornée par la taille d'un bloc, quelle que soit celle du fichier.
+
+Le schéma déduit d'un fichier (encodage, séparateur, décimale, correspondance
+des colonnes, format des dates) est mis en cache par modèle et par en-tête :
+les imports suivants du même gabarit ne refont pas la déduction. Chaque bloc
+est validé au fil de la lecture, puis contrôlé par les règles du fait
+(data_quality : montants, plan comptable, dates, équilibre des écritures) ;
+les lignes rejetées sont comptées et échantillonnées. Les écritures d'un
+grand livre sont importées entières : une ligne rejetée écarte toute sa
+pièce (journal, pièce, date), même répartie sur plusieurs blocs. Le bloc est ensuite
+écrit dans une zone de préparation, puis l'ensemble est publié dans
+l'entrepôt en une fois : un import interrompu ou en erreur ne laisse rien.
+Un fichier déjà importé pour la même entité (même empreinte) n'est pas relu, sauf --force.
+Les lignes déjà présentes dans l'entrepôt (réimport, exports qui se
+chevauchent) sont écartées à l'ingestion par leurs empreintes (dedup).
+
+Exemples :
+    python budget_import.py budget_tresorerie.csv --annee 2024
+    python budget_import.py grand_livre_2020_2024.csv --entite FILIALE_SUD --chunk-rows 500000
+    python budget_import.py ventes.xlsx --modele ventes --remplacer
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import unicodedata
+import uuid
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+import data_quality
+from dedup import Deduplicator, row_hashes
+from history_store import HISTORY_ROOT, HistoryStore, check_entity
+
+CACHE_DIR = '.import_cache'
+CHUNK_ROWS = 200_000
+MAX_REJECT_SAMPLES = 200
+
+# Modèles de fichiers : fait de destination, colonnes (nom canonique: type) et colonnes obligatoires
+TEMPLATES = {
+    'releve_tresorerie': {
+        'fait': 'tresorerie',
+        'libelle': "Relevé de trésorerie mensuel (Mois, Encaissements, Décaissements)",
+        'colonnes': {'mois': 'category', 'encaissements': 'float64', 'decaissements': 'float64',
+                     'solde_mensuel': 'float64'},
+        'obligatoires': ['mois', 'encaissements', 'decaissements'],
+    },
+    'grand_livre': {
+        'fait': 'ecritures',
+        'libelle': "Grand livre (date, compte, débit, crédit)",
+        'colonnes': {'date': 'datetime64[ns]', 'journal': 'category', 'compte': 'category',
+                     'libelle': 'category', 'piece': 'string', 'debit': 'float64', 'credit': 'float64'},
+        'obligatoires': ['date', 'compte', 'debit', 'credit'],
+    },
+    'ventes': {
+        'fait': 'ventes',
+        'libelle': "Lignes de ventes (date, article, quantité, montant HT)",
+        'colonnes': {'date': 'datetime64[ns]', 'sku': 'category', 'client_id': 'float64',
+                     'quantite': 'float64', 'prix_unitaire': 'float64', 'montant_ht': 'float64'},
+        'obligatoires': ['date', 'sku', 'quantite', 'montant_ht'],
+    },
+}
+
+MONTHS = {name: i for i, name in enumerate(
+    ['janvier', 'fevrier', 'mars', 'avril', 'mai', 'juin', 'juillet', 'aout',
+     'septembre', 'octobre', 'novembre', 'decembre'], start=1)}
+
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M:%S', '%d-%m-%Y', '%Y%m%d']
+
+
+class BudgetImportError(ValueError):
+    """Fichier illisible ou ne correspondant à aucun modèle"""
+
+
+def normalize(name):
+    """Nom de colonne comparable : minuscules, sans accents ni séparateurs"""
+    text = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+def detect_template(columns):
+    """Modèle dont toutes les colonnes obligatoires figurent dans l'en-tête (None sinon)"""
+    present = {normalize(column) for column in columns}
+    for name, template in TEMPLATES.items():
+        if set(template['obligatoires']) <= present:
+            return name
+    return None
+
+
+def file_fingerprint(path, sample=1 << 20):
+    """Empreinte rapide : taille, premier et dernier Mo du fichier"""
+    size = os.path.getsize(path)
+    digest = hashlib.sha256(str(size).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(sample))
+        if size > sample:
+            f.seek(max(size - sample, sample))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def read_header(path, ext):
+    """Ligne d'en-tête brute du fichier (clé du cache des schémas)"""
+    if ext == '.csv':
+        with open(path, 'rb') as f:
+            return _decode_sample(f.readline())[0].strip()
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        return [str(value) if value is not None else '' for value in next(rows, ())]
+    finally:
+        workbook.close()
+
+
+# ---------------------------------------------------------------- Cache des schémas
+
+class SchemaCache:
+    """Schémas déduits par modèle et par en-tête, et registre des fichiers importés (JSON)"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.path = os.path.join(cache_dir, 'schemas.json')
+        self.cache_dir = cache_dir
+        self.data = {'schemas': {}, 'imports': {}}
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self.data = json.load(f)
+
+    @staticmethod
+    def key(template, header, ext):
+        return hashlib.sha1(json.dumps([template, header, ext]).encode()).hexdigest()[:16]
+
+    def get(self, key):
+        return self.data['schemas'].get(key)
+
+    def put(self, key, schema):
+        self.data['schemas'][key] = schema
+        self.save()
+
+    def imported(self, fingerprint):
+        return self.data['imports'].get(fingerprint)
+
+    def record_import(self, fingerprint, summary):
+        self.data['imports'][fingerprint] = summary
+        self.save()
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+def _decode_sample(raw):
+    for encoding in ('utf-8-sig', 'cp1252'):
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    raise BudgetImportError("Encodage du fichier non reconnu (UTF-8 ou Windows-1252 attendu)")
+
+
+def _date_format(values):
+    """Premier format de DATE_FORMATS qui lit toutes les valeurs de l'échantillon"""
+    values = pd.Series(values).dropna().astype(str).str.strip()
+    values = values[values != '']
+    for fmt in DATE_FORMATS:
+        if pd.to_datetime(values, format=fmt, errors='coerce').notna().all():
+            return fmt
+    return None
+
+
+def infer_csv_schema(path, template=None, sample_bytes=256 * 1024):
+    """Dialecte, colonnes et formats d'un CSV, déduits d'un échantillon du début du fichier"""
+    with open(path, 'rb') as f:
+        raw = f.read(sample_bytes)
+    text, encoding = _decode_sample(raw)
+    lines = text.splitlines()
+    if len(raw) == sample_bytes and len(lines) > 1:
+        # Dernière ligne probablement tronquée par l'échantillonnage
+        lines = lines[:-1]
+    try:
+        dialect = csv.Sniffer().sniff('\n'.join(lines[:50]), delimiters=',;\t|')
+        sep = dialect.delimiter
+    except csv.Error:
+        sep = ','
+    sample = pd.read_csv(io.StringIO('\n'.join(lines)), sep=sep, dtype=str, keep_default_na=False)
+    header = list(sample.columns)
+    template = template or detect_template(header)
+    if template is None:
+        raise BudgetImportError(f"En-tête non reconnu : {', '.join(header)}")
+    columns = {column: normalize(column) for column in header
+               if normalize(column) in TEMPLATES[template]['colonnes']}
+
+    # Décimale « , » et séparateur de milliers (espace, point) des fichiers français
+    numeric = [column for column, name in columns.items()
+               if TEMPLATES[template]['colonnes'][name] == 'float64']
+    values = pd.concat([sample[column] for column in numeric]) if numeric else pd.Series(dtype=str)
+    values = values[values.str.strip() != '']
+    decimal = ',' if values.str.contains(r'^-?[\d . ]*,\d+$').any() else '.'
+    thousands = None
+    if values.str.contains(r'\d[  ]\d{3}').any():
+        thousands = ' '
+    elif decimal == ',' and values.str.contains(r'\d\.\d{3}').any():
+        thousands = '.'
+    date_formats = {column: _date_format(sample[column]) for column, name in columns.items()
+                    if TEMPLATES[template]['colonnes'][name].startswith('datetime')}
+    return {
+        'modele': template, 'format': 'csv', 'en_tete': header, 'encodage': encoding, 'separateur': sep,
+        'decimale': decimal, 'milliers': thousands, 'colonnes': columns, 'formats_date': date_formats,
+        'tolerant': False,
+    }
+
+
+def infer_excel_schema(path, template=None):
+    """Colonnes et formats d'une feuille Excel (première feuille, en-tête en première ligne)"""
+    header = read_header(path, '.xlsx')
+    template = template or detect_template(header)
+    if template is None:
+        raise BudgetImportError(f"En-tête non reconnu : {', '.join(header)}")
+    columns = {column: normalize(column) for column in header
+               if normalize(column) in TEMPLATES[template]['colonnes']}
+    return {'modele': template, 'format': 'xlsx', 'en_tete': header, 'colonnes': columns,
+            'formats_date': {}, 'tolerant': True}
+
+
+# ---------------------------------------------------------------- Lecture par blocs
+
+def _csv_chunks(path, schema, chunk_rows, progress):
+    """Blocs d'un CSV : types explicites, ou lecture texte puis conversion en mode tolérant"""
+    types = TEMPLATES[schema['modele']]['colonnes']
+    dtype = {}
+    for column, name in schema['colonnes'].items():
+        kind = types[name]
+        if kind.startswith('datetime') or schema['tolerant']:
+            dtype[column] = str
+        else:
+            dtype[column] = kind
+    size = os.path.getsize(path) or 1
+    with open(path, 'rb') as raw:
+        reader = pd.read_csv(raw, sep=schema['separateur'], encoding=schema['encodage'],
+                             decimal=schema['decimale'], thousands=schema['milliers'],
+                             usecols=list(schema['colonnes']), dtype=dtype, chunksize=chunk_rows)
+        for chunk in reader:
+            yield chunk.rename(columns=schema['colonnes'])
+            progress(raw.tell() / size)
+
+
+def _excel_chunks(path, schema, chunk_rows, progress):
+    """Blocs d'une feuille Excel lue en flux (openpyxl en lecture seule)"""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        total = max((sheet.max_row or 1) - 1, 1)
+        rows = sheet.iter_rows(values_only=True)
+        header = [str(value) if value is not None else '' for value in next(rows, ())]
+        keep = [i for i, column in enumerate(header) if column in schema['colonnes']]
+        names = [schema['colonnes'][header[i]] for i in keep]
+        buffer, done = [], 0
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in keep])
+            if len(buffer) == chunk_rows:
+                done += len(buffer)
+                yield pd.DataFrame(buffer, columns=names)
+                progress(done / total)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=names)
+            progress(1.0)
+    finally:
+        workbook.close()
+
+
+def coerce_chunk(chunk, schema):
+    """Types du modèle ; valeurs illisibles converties en manquantes (relevées par la validation)"""
+    types = TEMPLATES[schema['modele']]['colonnes']
+    out = pd.DataFrame(index=chunk.index)
+    for name, kind in types.items():
+        if name not in chunk.columns:
+            continue
+        values = chunk[name]
+        if kind == 'float64':
+            if not pd.api.types.is_numeric_dtype(values):
+                text = values.astype(str).str.replace(' ', '').str.replace(' ', '')
+                if schema.get('decimale') == ',':
+                    text = text.str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+                values = text.where(chunk[name].notna())
+            out[name] = pd.to_numeric(values, errors='coerce').astype('float64')
+        elif kind.startswith('datetime'):
+            fmt = schema['formats_date'].get(next((c for c, n in schema['colonnes'].items() if n == name), ''))
+            out[name] = pd.to_datetime(values, format=fmt, errors='coerce')
+        elif kind == 'category':
+            out[name] = values.astype('string').str.strip().astype('category')
+        else:
+            out[name] = values.astype('string').str.strip()
+    return out
+
+
+# ---------------------------------------------------------------- Validation et conversion
+
+def validate_chunk(df, template):
+    """Lecture d'un bloc : masque des lignes lisibles et rejets (ligne du fichier, motif)
+
+    L'index de df porte les numéros de ligne du fichier. Les règles métier
+    (montants, comptes, dates, équilibre) sont appliquées ensuite par
+    data_quality sur les lignes converties au schéma du fait.
+    """
+    spec = TEMPLATES[template]
+    reasons = pd.Series('', index=df.index, dtype=object)
+    for name in spec['obligatoires']:
+        if name in df.columns:
+            missing = df[name].isna()
+            if df[name].dtype == 'category' or str(df[name].dtype) == 'string':
+                missing |= df[name].astype('string').fillna('').eq('')
+            reasons[missing & reasons.eq('')] = f"valeur manquante ou illisible : {name}"
+        else:
+            reasons[reasons.eq('')] = f"colonne absente : {name}"
+    if template == 'releve_tresorerie':
+        month = df['mois'].astype('string').map(normalize, na_action='ignore')
+        unknown = ~month.isin(MONTHS) & ~df['mois'].astype('string').str.match(r'^\d{4}-\d{2}', na=False)
+        reasons[unknown & reasons.eq('')] = "mois non reconnu"
+    valid = reasons.eq('').to_numpy()
+    rejects = pd.DataFrame({'ligne': df.index[~valid], 'motif': reasons.to_numpy()[~valid]})
+    return valid, rejects
+
+
+def to_fact(df, template, annee):
+    """Lignes validées au schéma du fait de destination"""
+    if template == 'releve_tresorerie':
+        text = df['mois'].astype('string')
+        month = text.map(normalize, na_action='ignore').map(MONTHS)
+        dates = pd.to_datetime(pd.DataFrame({'year': annee, 'month': month.fillna(1).astype(int), 'day': 1}))
+        # Mois déjà datés (AAAA-MM) : pris tels quels
+        dated = month.isna()
+        dates[dated] = pd.to_datetime(text[dated].str[:7] + '-01')
+        encaissements = pd.DataFrame({'date': dates, 'categorie': 'Encaissements',
+                                      'libelle': 'Relevé mensuel', 'montant': df['encaissements']})
+        decaissements = pd.DataFrame({'date': dates, 'categorie': 'Décaissements',
+                                      'libelle': 'Relevé mensuel', 'montant': -df['decaissements']})
+        # Index conservé : numéro de ligne du relevé pour les deux flux
+        return pd.concat([encaissements, decaissements])
+    if template == 'grand_livre':
+        out = df.copy()
+        for column in ('journal', 'libelle', 'piece'):
+            out[column] = out[column].astype('string').fillna('') if column in out else ''
+        out['compte'] = out['compte'].astype('string')
+        return out
+    out = df.copy()
+    out['sku'] = out['sku'].astype('string')
+    out['client_id'] = out['client_id'].fillna(0).astype('int64') if 'client_id' in out else 0
+    out['quantite'] = out['quantite'].astype('int64')
+    if 'prix_unitaire' not in out:
+        out['prix_unitaire'] = out['montant_ht'] / out['quantite']
+    return out
+
+
+# Écriture comptable : lignes de même journal, pièce et date
+ENTRY_KEY = ['journal', 'piece', 'date']
+ENTRY_REJECTED = "écriture incomplète : autre ligne de la pièce rejetée"
+
+
+class EntryFilter:
+    """Lignes du grand livre importées par écritures entières
+
+    Une écriture dont une ligne est rejetée est écartée en entier, quel que
+    soit le bloc où se trouvent ses autres lignes : les lignes d'une écriture
+    encore déséquilibrée en fin de bloc sont gardées en attente jusqu'à ce
+    qu'elle s'équilibre, ou jusqu'à la fin du fichier (importées alors avec
+    l'alerte d'équilibre). Une écriture déjà équilibrée est importée : une
+    ligne de la même pièce plus loin dans le fichier est contrôlée seule. Les
+    lignes sans numéro de pièce sont traitées une à une.
+    """
+
+    def __init__(self, tolerance=0.01):
+        self.tolerance = tolerance
+        self.rejected = pd.Index([], dtype='uint64')
+        self.pending = None
+        self.dropped = []
+
+    def add(self, fact, rejected):
+        """Lignes prêtes à importer : fact (lignes valides d'un bloc) et attente, moins les écritures rejetées
+
+        rejected contient les lignes rejetées du bloc (mêmes colonnes que fact).
+        """
+        grouped = rejected['piece'].ne('').to_numpy(dtype=bool)
+        if grouped.any():
+            self.rejected = self.rejected.append(pd.Index(row_hashes(rejected[grouped], ENTRY_KEY))).unique()
+        if self.pending is not None:
+            fact = pd.concat([self.pending, fact])
+        keys = row_hashes(fact, ENTRY_KEY)
+        grouped = fact['piece'].ne('').to_numpy(dtype=bool)
+        dropped = grouped & (self.rejected.get_indexer(keys) >= 0 if len(self.rejected) else False)
+        balance = pd.Series(fact['debit'].to_numpy() - fact['credit'].to_numpy())
+        balance = balance.groupby(keys).transform('sum').abs().to_numpy()
+        waiting = grouped & ~dropped & (balance > self.tolerance)
+        if dropped.any():
+            self.dropped.append(fact.index[dropped])
+        self.pending = fact[waiting]
+        return fact[~dropped & ~waiting]
+
+    def finish(self):
+        """Lignes restées en attente (écritures déséquilibrées) ; lignes écartées (numéros de ligne)"""
+        pending, self.pending = self.pending, None
+        dropped = np.concatenate(self.dropped) if self.dropped else np.empty(0, dtype=np.int64)
+        return pending, dropped
+
+
+def import_file(path, template=None, entite='SIEGE', annee=None, replace=False, root=HISTORY_ROOT,
+                chunk_rows=CHUNK_ROWS, cache_dir=CACHE_DIR, force=False, dedupe=True, progress=None):
+    """Importer un fichier dans l'entrepôt d'historique ; retourne le rapport d'import
+
+    progress(fraction, message) est appelé après chaque bloc ; une exception
+    levée par progress (annulation) interrompt l'import sans rien publier.
+    dedupe=True écarte les lignes déjà présentes dans l'entrepôt (dedup).
+    """
+    progress = progress or (lambda fraction, message: None)
+    entite = check_entity(entite)
+    started = time.perf_counter()
+    cache = SchemaCache(cache_dir)
+    # Un même fichier peut alimenter plusieurs entités ou entrepôts
+    fingerprint = f"{file_fingerprint(path)}:{os.path.abspath(root)}:{entite}"
+    previous = cache.imported(fingerprint)
+    if previous and not force:
+        return {**previous, 'deja_importe': True}
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        infer, chunks = infer_csv_schema, _csv_chunks
+    elif ext in ('.xlsx', '.xlsm'):
+        infer, chunks = infer_excel_schema, _excel_chunks
+    else:
+        raise BudgetImportError(f"Format non supporté : {ext} (CSV ou Excel .xlsx attendu)")
+
+    key = SchemaCache.key(template, read_header(path, ext), ext)
+    schema = cache.get(key)
+    cached = schema is not None
+    if not cached:
+        schema = infer(path, template)
+    template = schema['modele']
+    spec = TEMPLATES[template]
+    annee = annee or date.today().year
+
+    store = HistoryStore(root)
+    while True:
+        staging = HistoryStore(os.path.join(root, f'.import-{uuid.uuid4().hex[:12]}'))
+        report = {
+            'fichier': os.path.basename(path), 'modele': template, 'fait': spec['fait'], 'entite': entite,
+            'lignes_lues': 0, 'lignes_importees': 0, 'lignes_rejetees': 0, 'motifs': {},
+            'avertissements': [], 'doublons': 0, 'schema_en_cache': cached, 'deja_importe': False,
+        }
+        deduplicator = (Deduplicator(spec['fait'], entite, root, staging_root=staging.root, replace=replace)
+                        if dedupe else None)
+        samples = []
+        validator = data_quality.Validator(spec['fait'], max_samples=MAX_REJECT_SAMPLES)
+        entries = (EntryFilter() if template == 'grand_livre' and 'date' in schema['colonnes'].values()
+                   else None)
+
+        def stage(fact):
+            """Contrôler l'équilibre des lignes retenues, écarter les doublons, préparer"""
+            validator.check_balance(fact)
+            fact = fact.reset_index(drop=True)
+            if deduplicator is not None:
+                fact = fact[deduplicator.filter(fact)]
+            report['lignes_importees'] += staging.append(spec['fait'], fact, entite=entite)
+
+        try:
+            read = chunks(path, schema, chunk_rows,
+                          lambda fraction: progress(fraction, f"{report['lignes_lues']:,} lignes lues"))
+            for chunk in read:
+                df = coerce_chunk(chunk, schema)
+                # Numéros de ligne du fichier (en-tête en ligne 1)
+                df.index = pd.RangeIndex(report['lignes_lues'] + 2, report['lignes_lues'] + 2 + len(df))
+                valid, rejects = validate_chunk(df, template)
+                report['lignes_lues'] += len(df)
+                report['lignes_rejetees'] += len(rejects)
+                for reason, count in rejects['motif'].value_counts().items():
+                    report['motifs'][reason] = report['motifs'].get(reason, 0) + int(count)
+                if len(samples) < MAX_REJECT_SAMPLES:
+                    samples.append(rejects.head(MAX_REJECT_SAMPLES - len(samples)))
+                unreadable = df[~valid]
+                df = df[valid]
+                if template == 'releve_tresorerie' and 'solde_mensuel' in df:
+                    gap = (df['encaissements'] - df['decaissements'] - df['solde_mensuel']).abs() > 0.01
+                    if gap.any():
+                        report['avertissements'].append(
+                            f"{int(gap.sum())} solde(s) mensuel(s) différent(s) de encaissements - décaissements")
+                fact = to_fact(df, template, annee)
+                accepted = validator.validate(fact, balance=False)
+                if entries is not None:
+                    rejected = pd.concat([to_fact(unreadable, template, annee), fact[~accepted]])
+                    fact = entries.add(fact[accepted], rejected)
+                else:
+                    fact = fact[accepted]
+                stage(fact)
+            if entries is not None:
+                pending, dropped = entries.finish()
+                if pending is not None and not pending.empty:
+                    stage(pending)
+                if len(dropped):
+                    report['lignes_rejetees'] += len(dropped)
+                    report['motifs'][ENTRY_REJECTED] = len(dropped)
+                    samples.append(pd.DataFrame({'ligne': dropped[:MAX_REJECT_SAMPLES], 'motif': ENTRY_REJECTED}))
+        except ValueError as error:
+            shutil.rmtree(staging.root, ignore_errors=True)
+            if schema['tolerant'] or isinstance(error, BudgetImportError):
+                raise
+            # Valeur illisible avec les types explicites : relecture en mode tolérant, retenu pour ce gabarit
+            schema = {**schema, 'tolerant': True}
+            cache.put(key, schema)
+            continue
+        except BaseException:
+            shutil.rmtree(staging.root, ignore_errors=True)
+            raise
+        break
+
+    quality = validator.finish()
+    report['lignes_rejetees'] += quality['lignes_invalides']
+    for name, count in quality['violations'].items():
+        if not count:
+            continue
+        if quality['niveaux'][name] == 'alerte':
+            report['avertissements'].append(f"{name} : {count:,}")
+        else:
+            report['motifs'][name] = report['motifs'].get(name, 0) + count
+    samples.append(quality['echantillon'].rename(columns={'regle': 'motif'}))
+
+    # Publication : renommage des fichiers préparés, puis fusion des partitions touchées
+    progress(1.0, "Publication dans l'entrepôt")
+    touched = store.merge(staging, spec['fait'], replace=replace)
+    if deduplicator is not None:
+        deduplicator.publish()
+        report['doublons'] = deduplicator.duplicates
+    shutil.rmtree(staging.root, ignore_errors=True)
+    store.compact(spec['fait'], partitions=touched)
+    cache.put(key, schema)
+
+    report['partitions'] = len(touched)
+    report['periodes'] = sorted({periode for periode, _ in touched})
+    report['duree_s'] = round(time.perf_counter() - started, 2)
+    cache.record_import(fingerprint, {k: v for k, v in report.items() if k != 'schema_en_cache'})
+    report['rejets'] = pd.concat(samples, ignore_index=True).sort_values('ligne', ignore_index=True)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('fichiers', nargs='+', help="fichiers CSV ou Excel")
+    parser.add_argument('--modele', choices=list(TEMPLATES), help="modèle (déduit de l'en-tête par défaut)")
+    parser.add_argument('--entite', default='SIEGE')
+    parser.add_argument('--annee', type=int, help="année des relevés mensuels (année en cours par défaut)")
+    parser.add_argument('--remplacer', action='store_true', help="remplacer les partitions importées")
+    parser.add_argument('--root', default=HISTORY_ROOT, help="répertoire de l'entrepôt")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="lignes lues par bloc")
+    parser.add_argument('--force', action='store_true', help="réimporter un fichier déjà importé")
+    parser.add_argument('--garder-doublons', action='store_true',
+                        help="ne pas écarter les lignes déjà présentes dans l'entrepôt")
+    args = parser.parse_args(argv)
+    try:
+        args.entite = check_entity(args.entite)
+    except ValueError as error:
+        parser.error(str(error))
+
+    status = 0
+    for path in args.fichiers:
+        try:
+            report = import_file(path, args.modele, args.entite, args.annee, args.remplacer, args.root,
+                                 args.chunk_rows, force=args.force,
+                                 dedupe=not args.garder_doublons)
+        except (OSError, ValueError) as error:
+            print(f"{path} : échec de l'import ({error})", file=sys.stderr)
+            status = 1
+            continue
+        if report['deja_importe']:
+            print(f"{path} : déjà importé ({report['lignes_importees']:,} lignes), --force pour réimporter")
+            continue
+        print(f"{path} : {report['modele']} -> {report['fait']}, {report['lignes_importees']:,} lignes "
+              f"importées, {report['lignes_rejetees']:,} rejetées, {report['doublons']:,} doublons écartés, "
+              f"{report['partitions']} partitions "
+              f"en {report['duree_s']:.2f}s")
+        for reason, count in report['motifs'].items():
+            print(f"  rejet : {reason} ({count:,})")
+        for warning in report['avertissements']:
+            print(f"  attention : {warning}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,64 +2,14 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
 import math
 import time
-import requests
 import json
 
-def main():
-    # Sidebar navigation améliorée
-    st.sidebar.title("🏢 Budget Management System")
-    st.sidebar.markdown("---")
-    
-    sections = [
-        "🏠 Accueil & Dashboard",
-        "🔗 Intégrations Systèmes", 
-        "🤖 Automatisation Avancée",
-        "📚 Encyclopédie Budgétaire",
-        "💰 Budget des Ventes IA",
-        "🏭 Production Intelligente",
-        "📦 Optimisation Stocks",
-        "🏗️ Investissement Stratégique",
-        "💸 Trésorerie Prédictive",
-        "📊 Reporting Executive"
-    ]
-    choice = st.sidebar.radio("Navigation Principale:", sections)
-    
-    # Section d'intégration visible partout
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("🔗 Statut des Intégrations")
-    
-    integration_status = {
-        'Système': ['ERP SAP', 'CRM Salesforce', 'Power BI', 'Sage Compta', 'API Métier'],
-        'Statut': ['✅ Connecté', '✅ Connecté', '🟡 Partiel', '🔴 En attente', '✅ Connecté'],
-    }
-    
-    df_status = pd.DataFrame(integration_status)
-    st.sidebar.dataframe(df_status, hide_index=True, use_container_width=True)
+from lazy_imports import lazy_import
 
-    if choice == "🏠 Accueil & Dashboard":
-        show_advanced_dashboard()
-    elif choice == "🔗 Intégrations Systèmes":
-        show_system_integrations()
-    elif choice == "🤖 Automatisation Avancée":
-        show_automation_features()
-    elif choice == "📚 Encyclopédie Budgétaire":
-        show_budget_encyclopedia()
-    elif choice == "💰 Budget des Ventes IA":
-        show_ai_sales_budget()
-    elif choice == "🏭 Production Intelligente":
-        show_smart_production()
-    elif choice == "📦 Optimisation Stocks":
-        show_stock_optimization()
-    elif choice == "🏗️ Investissement Stratégique":
-        show_strategic_investment()
-    elif choice == "💸 Trésorerie Prédictive":
-        show_predictive_cashflow()
-    elif choice == "📊 Reporting Executive":
-        show_executive_reporting()
+# Chargé seulement lors d'un appel au service REST
+requests = lazy_import('requests')
 
 def show_advanced_dashboard():
     st.title("🏢 Tableau de Bord Intelligent")
@@ -415,34 +365,57 @@ def show_api_integration():
     
     # Test d'API interactif
     st.subheader("🧪 Testeur d'API Interactif")
+    st.caption("Démarrer le service local : `python budget_api.py --port 8080`")
     
+    api_base = st.text_input("URL du service:", "http://127.0.0.1:8080")
     api_endpoint = st.selectbox("Endpoint à tester:", [
         "/api/v1/sales/forecast/next-quarter",
         "/api/v1/inventory/optimization",
         "/api/v1/financial/ratios"
     ])
     
-    if st.button("🔍 Tester l'API"):
+    payloads = {
+        "/api/v1/inventory/optimization": {
+            "articles": [{"article": "A001", "demande_annuelle": 10000, "cout_unitaire": 50.0,
+                          "taux_possession": 0.25, "cout_commande": 200.0, "demande_jour": 25,
+                          "ecart_type": 5, "delai": 10, "stock_actuel": 500, "niveau_service": 95}]
+        },
+        "/api/v1/financial/ratios": {
+            "actif_circulant": 500, "dettes_court_terme": 300, "stocks": 200,
+            "creances_clients": 150, "dettes_fournisseurs": 100, "chiffre_affaires": 1200,
+            "resultat_net": 80, "capitaux_propres": 400, "tresorerie": 50
+        }
+    }
+    payload = payloads.get(api_endpoint)
+    payload_valid = True
+    if payload is not None:
+        try:
+            payload = json.loads(st.text_area("Payload (JSON):", json.dumps(payload, indent=2)))
+        except json.JSONDecodeError as exc:
+            payload_valid = False
+            st.error(f"❌ Payload JSON invalide : {exc}")
+    
+    if st.button("🔍 Tester l'API", disabled=not payload_valid):
         with st.spinner("Appel API en cours..."):
-            time.sleep(2)
-            
-            # Simulation réponse API
-            mock_response = {
-                "status": "success",
-                "data": {
-                    "forecast": 1250000,
-                    "confidence_interval": [1180000, 1320000],
-                    "calculation_details": {
-                        "method": "moindres_carres",
-                        "r_squared": 0.94,
-                        "seasonal_adjustment": 1.15
-                    }
-                }
-            }
-            
-            st.json(mock_response)
-            
-            st.success("✅ API fonctionnelle - Latence: 156ms")
+            start = time.perf_counter()
+            try:
+                if payload is None:
+                    response = requests.get(api_base + api_endpoint, timeout=10)
+                else:
+                    response = requests.post(api_base + api_endpoint, json=payload, timeout=10)
+            except requests.RequestException as exc:
+                st.error(f"❌ Service injoignable : {exc}")
+            else:
+                latency = (time.perf_counter() - start) * 1000
+                # Les erreurs internes du service sont renvoyées en texte brut
+                if response.headers.get('Content-Type', '').startswith('application/json'):
+                    st.json(response.json())
+                else:
+                    st.code(response.text)
+                if response.ok:
+                    st.success(f"✅ API fonctionnelle - Latence: {latency:.0f}ms")
+                else:
+                    st.error(f"❌ HTTP {response.status_code} - Latence: {latency:.0f}ms")
 
 def show_automation_features():
     st.title("🤖 Automatisation Avancée des Processus")
@@ -880,1946 +853,258 @@ def show_production_budget_theory():
         """)
 
 # Les autres fonctions show_* suivent le même pattern avec explications théoriques détaillées
-def show_budget_ventes():
-    st.markdown('<div class="main-header">💰 Budget des Ventes</div>', unsafe_allow_html=True)
+def show_plus_loin():
+    st.markdown('<div class="main-header">🚀 Aller Plus Loin</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## 🎯 Implémentation dans Votre Entreprise
+    
+    Cette application vous a présenté les concepts fondamentaux. Voici comment 
+    les mettre en œuvre concrètement dans votre organisation.
+    """)
     
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Méthodologie", "📈 Prévisions", "⚙️ Optimisation", "🎯 Simulation"])
+    tab1, tab2, tab3, tab4 = st.tabs(["🏢 Implémentation", "👥 Formation", "🤖 Automatisation", "🛠️ Personnalisation"])
     
     with tab1:
-        st.markdown('<div class="section-header">📋 Méthodes de Prévision des Ventes</div>', unsafe_allow_html=True)
+        st.markdown('<div class="section-header">🏢 Implémentez ces Outils dans Votre Entreprise</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("""
-            ### 🎯 Trois Approches Complémentaires
-            
-            1. **Études de Marché**
-               - Analyse de la demande
-               - Concurrence
-               - Conjoncture économique
-            
-            2. **Fichiers Clients**
-               - Historique des ventes
-               - Cartographie de la demande
-               - Comportement d'achat
-            
-            3. **Techniques d'Ajustement**
-               - Série chronologique
-               - Méthode des moindres carrés
-               - Coefficients saisonniers
+            ### 📋 Plan d'Implémentation par Étapes
+            
+            **Phase 1 : Diagnostic (1-2 mois)**
+            - Audit des processus existants
+            - Identification des besoins
+            - Formation de l'équipe projet
+            
+            **Phase 2 : Prototype (2-3 mois)**
+            - Mise en place des premiers tableaux de bord
+            - Tests sur un département pilote
+            - Ajustements et améliorations
+            
+            **Phase 3 : Déploiement (3-6 mois)**
+            - Extension à toute l'entreprise
+            - Formation des utilisateurs
+            - Mesure des résultats
+            
+            **Phase 4 : Optimisation (continue)**
+            - Amélioration continue
+            - Intégration de nouvelles données
+            - Adaptation aux changements
             """)
         
         with col2:
             st.markdown("""
-            ### 📊 Méthode des Moindres Carrés
+            ### 🎯 Facteurs Clés de Succès
+            
+            **Engagement de la Direction** :
+            - Implication active du comité de direction
+            - Allocation des ressources nécessaires
+            - Communication régulière
             
-            **Objectif** : Trouver la droite y = ax + b qui minimise les écarts
+            **Adaptation à la Culture d'Entreprise** :
+            - Respect des spécificités métier
+            - Implication des équipes opérationnelles
+            - Processus progressif et pédagogique
             
-            **Formules** :
-            - a = Σ(xy) - n·x̄·ȳ / Σ(x²) - n·x̄²
-            - b = ȳ - a·x̄
+            **Outils Appropriés** :
+            - Solutions adaptées à la taille de l'entreprise
+            - Interface utilisateur intuitive
+            - Intégration avec les systèmes existants
             
-            **Application** : Prévision des ventes futures basée sur l'historique
+            **Mesure des Résultats** :
+            - Indicateurs de performance clairs
+            - Revue régulière des objectifs
+            - Célébration des succès
             """)
             
-            # Exemple visuel
-            x = np.array([1, 2, 3, 4, 5])
-            y = np.array([2, 4, 5, 4, 5])
+            # Calculateur de ROI
+            st.subheader("📊 Calculateur de ROI Potentiel")
             
-            a, b = np.polyfit(x, y, 1)
-            y_pred = a * x + b
+            investissement_initial = st.number_input("Investissement initial (k€):", value=50)
+            gains_annuels = st.number_input("Gains annuels estimés (k€):", value=100)
+            duree_amortissement = st.number_input("Durée d'amortissement (ans):", value=3)
             
-            fig, ax = plt.subplots()
-            ax.scatter(x, y, color='blue', label='Données réelles')
-            ax.plot(x, y_pred, color='red', label=f'Droite: y = {a:.2f}x + {b:.2f}')
-            ax.set_xlabel('Période')
-            ax.set_ylabel('Ventes')
-            ax.legend()
-            ax.set_title('Ajustement Linéaire - Moindres Carrés')
-            st.pyplot(fig)
+            if st.button("Calculer ROI"):
+                roi_annuel = (gains_annuels / investissement_initial) * 100
+                periode_retour = investissement_initial / gains_annuels
+                
+                st.metric("ROI Annuel", f"{roi_annuel:.1f}%")
+                st.metric("Période de retour", f"{periode_retour:.1f} ans")
+                
+                if roi_annuel > 100:
+                    st.success("✅ Investissement très rentable")
+                elif roi_annuel > 50:
+                    st.success("✅ Investissement rentable")
+                else:
+                    st.info("💡 Investissement à étudier attentivement")
     
     with tab2:
-        st.markdown('<div class="section-header">📈 Outil de Prévision des Ventes</div>', unsafe_allow_html=True)
+        st.markdown('<div class="section-header">👥 Formez Vos Équipes aux Concepts Présentés</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader("Données Historiques")
+            st.markdown("""
+            ### 🎓 Programme de Formation Complet
+            
+            **Formation Direction Générale** (2 jours)
+            - Principes du contrôle de gestion
+            - Lecture des tableaux de bord
+            - Prise de décision stratégique
             
-            # Entrée des données
-            periods = st.number_input("Nombre de périodes historiques:", min_value=3, max_value=12, value=6)
+            **Formation Managers Opérationnels** (3 jours)
+            - Élaboration des budgets
+            - Analyse des écarts
+            - Gestion des performances
             
-            st.write("Saisissez les ventes historiques :")
-            ventes_historiques = []
-            for i in range(int(periods)):
-                vente = st.number_input(f"Période {i+1} (ventes):", value=100*(i+1))
-                ventes_historiques.append(vente)
+            **Formation Contrôleurs de Gestion** (5 jours)
+            - Techniques avancées d'analyse
+            - Outils de reporting
+            - Optimisation des processus
             
-            # Calcul des prévisions
-            if len(ventes_historiques) >= 3:
-                x = np.arange(1, len(ventes_historiques) + 1)
-                y = np.array(ventes_historiques)
-                
-                a, b = np.polyfit(x, y, 1)
-                
-                st.markdown(f"""
-                <div class="info-box">
-                **Équation de prévision** : y = {a:.2f}x + {b:.2f}
-                </div>
-                """, unsafe_allow_html=True)
+            **Formation Tout Collaborateur** (1 jour)
+            - Compréhension des enjeux
+            - Contribution aux objectifs
+            - Culture de la performance
+            """)
         
         with col2:
-            st.subheader("Prévisions Futures")
+            st.markdown("""
+            ### 📚 Méthodes Pédagogiques
             
-            if len(ventes_historiques) >= 3:
-                periode_future = st.number_input("Période à prévoir:", min_value=1, value=len(ventes_historiques)+1)
-                prevision = a * periode_future + b
-                
-                st.metric(f"Prévision période {periode_future}", f"{prevision:.0f} unités")
-                
-                # Graphique des prévisions
-                x_future = np.arange(1, periode_future + 1)
-                y_future = a * x_future + b
+            **Apprentissage Théorique** :
+            - Concepts fondamentaux
+            - Études de cas
+            - Bonnes pratiques
+            
+            **Application Pratique** :
+            - Exercices sur données réelles
+            - Simulations interactives
+            - Ateliers en groupe
+            
+            **Suivi et Évaluation** :
+            - Quiz de validation
+            - Projets concrets
+            - Mesure des acquis
+            
+            **Ressources Complémentaires** :
+            - Documentation complète
+            - Templates réutilisables
+            - Support en ligne
+            """)
+            
+            # Planificateur de formation
+            st.subheader("📅 Planificateur de Formation")
+            
+            nb_participants = st.number_input("Nombre de participants:", value=20)
+            duree_formation = st.selectbox("Durée de la formation:", 
+                                         ["1 jour", "2 jours", "3 jours", "5 jours"])
+            niveau = st.selectbox("Niveau des participants:", 
+                                ["Débutant", "Intermédiaire", "Avancé"])
+            
+            if st.button("Estimer le Plan de Formation"):
+                if duree_formation == "1 jour":
+                    cout_estime = nb_participants * 500
+                    sessions = 1
+                elif duree_formation == "2 jours":
+                    cout_estime = nb_participants * 900
+                    sessions = 2
+                elif duree_formation == "3 jours":
+                    cout_estime = nb_participants * 1200
+                    sessions = 3
+                else:
+                    cout_estime = nb_participants * 1800
+                    sessions = 5
                 
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(x=x, y=y, mode='markers', name='Historique', 
-                                       marker=dict(size=10, color='blue')))
-                fig.add_trace(go.Scatter(x=x_future, y=y_future, mode='lines', name='Prévision',
-                                       line=dict(color='red', dash='dash')))
-                fig.update_layout(title='Prévisions des Ventes', xaxis_title='Période', yaxis_title='Ventes')
-                st.plotly_chart(fig, use_container_width=True)
+                st.metric("Coût estimé de la formation", f"{cout_estime:,.0f} €")
+                st.metric("Nombre de sessions recommandées", sessions)
     
     with tab3:
-        st.markdown('<div class="section-header">⚙️ Optimisation des Ressources Commerciales</div>', unsafe_allow_html=True)
+        st.markdown('<div class="section-header">🤖 Automatisez la Collecte et l\'Analyse des Données</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader("Allocation du Budget Commercial")
+            st.markdown("""
+            ### 🔄 Flux de Données Automatisé
             
-            budget_total = st.number_input("Budget commercial total (k€):", value=500)
+            **Sources de Données** :
+            - ERP (SAP, Oracle, Sage)
+            - Logiciels de paie
+            - Systèmes de vente
+            - Applications métier
+            - Bases de données externes
             
-            st.write("**Répartition par canal**:")
-            digital = st.slider("Digital (%)", 0, 100, 40)
-            evenements = st.slider("Événements (%)", 0, 100, 25)
-            pub_traditionnelle = st.slider("Publicité traditionnelle (%)", 0, 100, 20)
-            relations_presse = st.slider("Relations presse (%)", 0, 100, 15)
+            **Processus d'Automatisation** :
+            - Extraction quotidienne des données
+            - Nettoyage et validation
+            - Consolidation et agrégation
+            - Génération des rapports
+            - Alertes automatiques
             
-            # Vérification que la somme fait 100%
-            total = digital + evenements + pub_traditionnelle + relations_presse
-            if total != 100:
-                st.warning(f"La somme des pourcentages est de {total}%. Ajustez pour atteindre 100%.")
+            **Outils Recommandés** :
+            - Power BI / Tableau
+            - Python / R
+            - APIs REST
+            - ETL (Extract Transform Load)
+            - Cloud computing
+            """)
         
         with col2:
-            st.subheader("Rentabilité par Canal")
-            
-            if total == 100:
-                # Calcul des budgets par canal
-                budget_digital = budget_total * digital / 100
-                budget_evenements = budget_total * evenements / 100
-                budget_pub = budget_total * pub_traditionnelle / 100
-                budget_rp = budget_total * relations_presse / 100
-                
-                # Efficacité supposée par canal (ROI)
-                roi_digital = 3.5  # Pour 1€ investi, retour de 3.5€
-                roi_evenements = 2.0
-                roi_pub = 1.5
-                roi_rp = 2.5
-                
-                # Calcul des retours
-                retour_digital = budget_digital * roi_digital
-                retour_evenements = budget_evenements * roi_evenements
-                retour_pub = budget_pub * roi_pub
-                retour_rp = budget_rp * roi_rp
-                
-                data = {
-                    'Canal': ['Digital', 'Événements', 'Publicité', 'Relations Presse'],
-                    'Budget (k€)': [budget_digital, budget_evenements, budget_pub, budget_rp],
-                    'ROI': [roi_digital, roi_evenements, roi_pub, roi_rp],
-                    'Retour estimé (k€)': [retour_digital, retour_evenements, retour_pub, retour_rp]
-                }
-                
-                df_optimisation = pd.DataFrame(data)
-                
-                fig = px.bar(df_optimisation, x='Canal', y=['Budget (k€)', 'Retour estimé (k€)'],
-                            title='Optimisation du Budget Commercial',
-                            barmode='group')
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.metric("Retour total estimé", f"{sum(df_optimisation['Retour estimé (k€)']):.0f} k€")
-                st.metric("ROI moyen", f"{(sum(df_optimisation['Retour estimé (k€)']) / budget_total):.2f}")
-    
-    with tab4:
-        st.markdown('<div class="section-header">🎯 Simulation Complète du Budget des Ventes</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Scénarios de Vente")
+            st.markdown("""
+            ### 📊 Dashboard en Temps Réel
             
-            scenario = st.selectbox("Choisissez un scénario:", 
-                                  ["Optimiste", "Réaliste", "Pessimiste"])
+            **Avantages de l'Automatisation** :
+            - Gain de temps considérable
+            - Réduction des erreurs
+            - Information en temps réel
+            - Décision plus rapide
+            - Meilleure réactivité
             
-            if scenario == "Optimiste":
-                croissance = 15
-                part_marche = 8
-            elif scenario == "Réaliste":
-                croissance = 10
-                part_marche = 5
-            else:  # Pessimiste
-                croissance = 5
-                part_marche = 3
+            **Fonctionnalités Avancées** :
+            - Alertes prédictives
+            - Analyse de scénarios
+            - Reporting personnalisé
+            - Mobile friendly
+            - Export multi-formats
+            """)
             
-            ca_annee_precedente = st.number_input("CA année précédente (k€):", value=10000)
-            budget_marketing = st.number_input("Budget marketing (k€):", value=500)
+            # Configuration d'alerte
+            st.subheader("⚡ Configuration d'Alerte Automatique")
             
-        with col2:
-            st.subheader("Résultats de la Simulation")
-            
-            # Calculs basés sur le scénario
-            ca_projete = ca_annee_precedente * (1 + croissance/100)
-            impact_marketing = budget_marketing * 2  # Multiplicateur simplifié
-            ca_final = ca_projete + impact_marketing
-            
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Croissance marché", f"{croissance}%")
-            col2.metric("Part de marché", f"{part_marche}%")
-            col3.metric("CA projeté", f"{ca_final:,.0f} k€")
-            
-            # Graphique d'évolution
-            mois = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
-            if scenario == "Optimiste":
-                evolution = [800, 850, 900, 950, 1000, 1050, 1100, 1150, 1200, 1250, 1300, 1350]
-            elif scenario == "Réaliste":
-                evolution = [800, 820, 840, 860, 880, 900, 920, 940, 960, 980, 1000, 1020]
-            else:
-                evolution = [800, 810, 820, 830, 840, 850, 860, 870, 880, 890, 900, 910]
+            kpi_alerte = st.selectbox("KPI à surveiller:", 
+                                    ["Chiffre d'affaires", "Marge", "Trésorerie", "Stocks"])
+            seuil_alerte = st.number_input("Seuil d'alerte:", value=100000)
+            frequence_controle = st.selectbox("Fréquence de contrôle:", 
+                                            ["Quotidien", "Hebdomadaire", "Mensuel"])
             
-            fig = px.line(x=mois, y=evolution, title=f'Évolution du CA - Scénario {scenario}',
-                         labels={'x': 'Mois', 'y': 'Chiffre d\'affaires (k€)'})
-            st.plotly_chart(fig, use_container_width=True)
-
-def show_budget_production():
-    st.markdown('<div class="main-header">🏭 Budget de Production</div>', unsafe_allow_html=True)
-    
-    tab1, tab2, tab3 = st.tabs(["📊 Programmation Linéaire", "⚙️ Optimisation Ressources", "🔧 Simulation Production"])
+            if st.button("Créer l'Alerte"):
+                st.success(f"✅ Alerte configurée : {kpi_alerte} > {seuil_alerte:,.0f} € - Contrôle {frequence_controle.lower()}")
+                st.info("💡 Cette alerte sera envoyée automatiquement par email aux responsables concernés")
     
-    with tab1:
-        st.markdown('<div class="section-header">📊 Optimisation par Programmation Linéaire</div>', unsafe_allow_html=True)
+    with tab4:
+        st.markdown('<div class="section-header">🛠️ Créez Votre Propre Système de Pilotage sur Mesure</div>', unsafe_allow_html=True)
         
         st.markdown("""
-        ### 🎯 Maximisation de la Marge sur Coûts Variables
-        
-        **Fonction économique** : Z = Marge₁·x + Marge₂·y → **Max**
+        ## 🎨 Personnalisation Avancée
         
-        **Sous contraintes** :
-        - Capacité de production
-        - Contraintes commerciales
-        - Ressources limitées
+        Adaptez ces outils aux spécificités de votre entreprise pour créer 
+        un système de pilotage unique et parfaitement adapté.
         """)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.subheader("Données des Produits")
-            
-            st.write("**Produit A**")
-            marge_a = st.number_input("Marge unitaire Produit A (€):", value=55.0)
-            temps_usinage_a = st.number_input("Temps usinage A (h):", value=1.0)
-            temps_montage_a = st.number_input("Temps montage A (h):", value=1.2)
-            aluminium_a = st.number_input("Aluminium A (kg):", value=0.6)
-            demande_a = st.number_input("Demande max Produit A:", value=10000)
-            
-            st.write("**Produit B**")
-            marge_b = st.number_input("Marge unitaire Produit B (€):", value=90.0)
-            temps_usinage_b = st.number_input("Temps usinage B (h):", value=1.5)
-            temps_montage_b = st.number_input("Temps montage B (h):", value=1.0)
-            aluminium_b = st.number_input("Aluminium B (kg):", value=0.8)
-            demande_b = st.number_input("Demande max Produit B:", value=8000)
-        
-        with col2:
-            st.subheader("Contraintes de Production")
+            st.markdown("""
+            ### 📋 Modules Personnalisables
             
-            capacite_usinage = st.number_input("Capacité usinage (h):", value=13000)
-            capacite_montage = st.number_input("Capacité montage (h):", value=10000)
-            stock_aluminium = st.number_input("Stock aluminium (kg):", value=12000)
-            
-            if st.button("Calculer la Production Optimale"):
-                # Résolution du problème d'optimisation
-                c = [-marge_a, -marge_b]  # Negative pour maximisation
-                
-                # Contraintes
-                A = [
-                    [temps_usinage_a, temps_usinage_b],      # Usinage
-                    [temps_montage_a, temps_montage_b],      # Montage
-                    [aluminium_a, aluminium_b],              # Aluminium
-                    [1, 0],                                  # Demande A
-                    [0, 1]                                   # Demande B
-                ]
-                
-                b = [capacite_usinage, capacite_montage, stock_aluminium, demande_a, demande_b]
-                
-                bounds = [(0, None), (0, None)]
-                
-                result = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method='highs')
-                
-                if result.success:
-                    prod_a = result.x[0]
-                    prod_b = result.x[1]
-                    marge_totale = -result.fun
-                    
-                    st.success("✅ Solution optimale trouvée !")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    col1.metric("Production A", f"{prod_a:.0f} unités")
-                    col2.metric("Production B", f"{prod_b:.0f} unités")
-                    col3.metric("Marge Totale", f"{marge_totale:,.0f} €")
-                    
-                    # Graphique des contraintes
-                    x = np.linspace(0, max(demande_a, demande_b), 100)
-                    
-                    # Contrainte usinage
-                    y_usinage = (capacite_usinage - temps_usinage_a * x) / temps_usinage_b
-                    # Contrainte montage
-                    y_montage = (capacite_montage - temps_montage_a * x) / temps_montage_b
-                    # Contrainte aluminium
-                    y_alu = (stock_aluminium - aluminium_a * x) / aluminium_b
-                    
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    
-                    ax.plot(x, y_usinage, label='Usinage', color='red')
-                    ax.plot(x, y_montage, label='Montage', color='blue')
-                    ax.plot(x, y_alu, label='Aluminium', color='green')
-                    ax.axvline(demande_a, color='orange', label='Demande A')
-                    ax.axhline(demande_b, color='purple', label='Demande B')
-                    
-                    # Zone réalisable
-                    y_min = np.minimum.reduce([y_usinage, y_montage, y_alu, np.full_like(x, demande_b)])
-                    ax.fill_between(x, 0, y_min, where=(x <= demande_a), alpha=0.3, color='gray', label='Zone réalisable')
-                    
-                    # Point optimal
-                    ax.plot(prod_a, prod_b, 'ro', markersize=10, label='Solution optimale')
-                    
-                    ax.set_xlim(0, demande_a * 1.1)
-                    ax.set_ylim(0, demande_b * 1.1)
-                    ax.set_xlabel('Production A')
-                    ax.set_ylabel('Production B')
-                    ax.legend()
-                    ax.set_title('Espace des Solutions - Programmation Linéaire')
-                    ax.grid(True, alpha=0.3)
-                    
-                    st.pyplot(fig)
-    
-    with tab2:
-        st.markdown('<div class="section-header">⚙️ Optimisation des Ressources de Production</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Ressources Disponibles")
-            
-            ouvriers = st.number_input("Nombre d'ouvriers:", value=50)
-            heures_travail = st.number_input("Heures travaillées/semaine:", value=35)
-            machines = st.number_input("Nombre de machines:", value=20)
-            rendement_machine = st.slider("Rendement machines (%)", 50, 100, 85)
-            
-            st.subheader("Coûts de Production")
-            cout_horaire = st.number_input("Coût horaire main d'œuvre (€):", value=25.0)
-            cout_machine = st.number_input("Coût machine/heure (€):", value=15.0)
-            cout_matiere = st.number_input("Coût matière/unité (€):", value=10.0)
-        
-        with col2:
-            st.subheader("Optimisation de la Capacité")
-            
-            # Calcul de la capacité
-            heures_disponibles = ouvriers * heures_travail * 4  # Par mois
-            capacite_theorique = machines * heures_disponibles * rendement_machine / 100
-            
-            # Calcul des coûts
-            cout_main_oeuvre = heures_disponibles * cout_horaire
-            cout_machines = capacite_theorique * cout_machine
-            cout_fixe = cout_main_oeuvre + cout_machines
-            
-            production_souhaitee = st.number_input("Production souhaitée (unités/mois):", value=10000)
-            
-            if production_souhaitee > 0:
-                cout_variable = production_souhaitee * cout_matiere
-                cout_total = cout_fixe + cout_variable
-                cout_unitaire = cout_total / production_souhaitee
-                
-                st.metric("Capacité théorique mensuelle", f"{capacite_theorique:.0f} unités")
-                st.metric("Coût total de production", f"{cout_total:,.0f} €")
-                st.metric("Coût unitaire", f"{cout_unitaire:.2f} €")
-                
-                # Analyse de rentabilité
-                prix_vente = st.number_input("Prix de vente unitaire (€):", value=25.0)
-                if prix_vente > 0:
-                    marge_unitaire = prix_vente - cout_unitaire
-                    marge_totale = marge_unitaire * production_souhaitee
-                    
-                    st.metric("Marge unitaire", f"{marge_unitaire:.2f} €")
-                    st.metric("Marge totale mensuelle", f"{marge_totale:,.0f} €")
-                    
-                    if marge_unitaire < 0:
-                        st.error("⚠️ Production non rentable au prix de vente actuel")
-    
-    with tab3:
-        st.markdown('<div class="section-header">🔧 Simulation de Plan de Production</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Paramètres de Simulation")
-            
-            stock_initial = st.number_input("Stock initial:", value=1000)
-            production_jour = st.number_input("Production par jour:", value=300)
-            jours_ouvres = st.number_input("Jours ouvrés/mois:", value=22)
-            ventes_jour = st.number_input("Ventes moyennes/jour:", value=280)
-            stock_securite = st.number_input("Stock de sécurité:", value=500)
-            
-            simulation_mois = st.slider("Mois de simulation:", 1, 12, 1)
-        
-        with col2:
-            st.subheader("Résultats de la Simulation")
-            
-            # Simulation sur 30 jours
-            jours = list(range(1, 31))
-            stock = stock_initial
-            stocks = []
-            productions = []
-            ventes = []
-            
-            for jour in jours:
-                # Production les jours ouvrés seulement
-                production = production_jour if (jour % 7) not in [0, 6] else 0
-                vente = ventes_jour if (jour % 7) not in [0, 6] else ventes_jour * 0.3  # Réduction week-end
-                
-                stock += production - vente
-                stocks.append(stock)
-                productions.append(production)
-                ventes.append(vente)
-            
-            df_simulation = pd.DataFrame({
-                'Jour': jours,
-                'Stock': stocks,
-                'Production': productions,
-                'Ventes': ventes
-            })
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=jours, y=stocks, name='Stock', line=dict(color='blue')))
-            fig.add_trace(go.Scatter(x=jours, y=productions, name='Production', line=dict(color='green')))
-            fig.add_trace(go.Scatter(x=jours, y=ventes, name='Ventes', line=dict(color='red')))
-            fig.add_hline(y=stock_securite, line_dash="dash", line_color="orange", name="Stock sécurité")
-            
-            fig.update_layout(title='Simulation de Production Mensuelle',
-                             xaxis_title='Jours',
-                             yaxis_title='Unités')
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Alertes
-            stock_final = stocks[-1]
-            if stock_final < stock_securite:
-                st.error(f"⚠️ Stock final ({stock_final}) inférieur au stock de sécurité ({stock_securite})")
-            else:
-                st.success(f"✅ Stock final ({stock_final}) conforme")
-
-def show_gestion_stocks():
-    st.markdown('<div class="main-header">📦 Gestion des Stocks et Approvisionnements</div>', unsafe_allow_html=True)
-    
-    tab1, tab2, tab3 = st.tabs(["📊 Coûts des Stocks", "📈 Modèle de Wilson", "🔄 Budget Approvisionnements"])
-    
-    with tab1:
-        st.markdown('<div class="section-header">📊 Analyse des Coûts de Stockage</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Paramètres de Coût")
-            
-            valeur_locaux = st.number_input("Valeur des locaux (€):", value=200000)
-            frais_gardiennage = st.number_input("Frais gardiennage (€):", value=25000)
-            primes_assurance = st.number_input("Primes assurance (€):", value=5000)
-            cout_financement = st.number_input("Coût financement (€):", value=2500)
-            
-            stock_debut = st.number_input("Stock début période (€):", value=1000000)
-            stock_fin = st.number_input("Stock fin période (€):", value=1300000)
-            
-            if st.button("Calculer Coût de Possession"):
-                cout_stockage_annuel = valeur_locaux + frais_gardiennage + primes_assurance + cout_financement
-                stock_moyen = (stock_debut + stock_fin) / 2
-                taux_possession = (cout_stockage_annuel / stock_moyen) * 100
-                
-                st.markdown(f"""
-                <div class="info-box">
-                **Résultats** :
-                - Coût stockage annuel : {cout_stockage_annuel:,.0f} €
-                - Stock moyen : {stock_moyen:,.0f} €
-                - **Taux de possession : {taux_possession:.2f}%**
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.info("💡 Pour 100€ de stock, le coût de possession est de {:.2f}€".format(taux_possession))
-    
-    with tab2:
-        st.markdown('<div class="section-header">📈 Modèle de Wilson - Lot Économique</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Paramètres du Modèle")
-            
-            consommation_annuelle = st.number_input("Consommation annuelle (unités):", value=320000)
-            cout_lancement = st.number_input("Coût de lancement (€/commande):", value=560)
-            cout_stockage_unitaire = st.number_input("Coût stockage unitaire (€/mois):", value=0.90)
-            cout_penurie = st.number_input("Coût pénurie (€/unité):", value=67.0, help="Optionnel pour modèle avec pénurie")
-            
-            avec_penurie = st.checkbox("Inclure le coût de pénurie")
-        
-        with col2:
-            if st.button("Calculer Lot Économique"):
-                # Coût de stockage annuel
-                cout_stockage_annuel = cout_stockage_unitaire * 12
-                
-                if not avec_penurie:
-                    # Modèle Wilson classique
-                    q_etoile = np.sqrt((2 * consommation_annuelle * cout_lancement) / cout_stockage_annuel)
-                    n_commandes = consommation_annuelle / q_etoile
-                    periode_eco = 360 / n_commandes
-                    
-                    st.success("🎯 Résultats du modèle Wilson classique")
-                    
-                else:
-                    # Modèle avec pénurie
-                    facteur_penurie = np.sqrt((cout_penurie + cout_stockage_annuel) / cout_penurie)
-                    q_etoile_base = np.sqrt((2 * consommation_annuelle * cout_lancement) / cout_stockage_annuel)
-                    q_etoile = q_etoile_base * facteur_penurie
-                    n_commandes = consommation_annuelle / q_etoile
-                    periode_eco = 360 / n_commandes
-                    
-                    st.success("🎯 Résultats du modèle Wilson avec pénurie")
-                
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Lot économique", f"{q_etoile:.0f} unités")
-                col2.metric("Nombre commandes", f"{n_commandes:.1f}")
-                col3.metric("Période économique", f"{periode_eco:.1f} jours")
-                
-                # Graphique des coûts
-                q_values = np.linspace(q_etoile * 0.5, q_etoile * 2, 100)
-                couts_lancement = (consommation_annuelle / q_values) * cout_lancement
-                couts_possession = (q_values / 2) * cout_stockage_annuel
-                couts_totaux = couts_lancement + couts_possession
-                
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.plot(q_values, couts_lancement, label='Coût de lancement', linestyle='--')
-                ax.plot(q_values, couts_possession, label='Coût de possession', linestyle='--')
-                ax.plot(q_values, couts_totaux, label='Coût total', linewidth=2)
-                ax.axvline(q_etoile, color='red', linestyle=':', label=f'Lot optimal = {q_etoile:.0f}')
-                ax.set_xlabel('Quantité commandée')
-                ax.set_ylabel('Coût (€)')
-                ax.legend()
-                ax.set_title('Optimisation du Lot Économique')
-                ax.grid(True, alpha=0.3)
-                
-                st.pyplot(fig)
-    
-    with tab3:
-        st.markdown('<div class="section-header">🔄 Budget des Approvisionnements</div>', unsafe_allow_html=True)
-        
-        st.markdown("""
-        ### 📋 Planification des Commandes
-        
-        Ce module vous aide à établir un budget d'approvisionnement sur 6 mois
-        en tenant compte des délais de livraison et des stocks de sécurité.
-        """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Paramètres de Base")
-            
-            stock_initial = st.number_input("Stock initial (unités):", value=1000)
-            stock_securite = st.number_input("Stock de sécurité (unités):", value=500)
-            delai_livraison = st.number_input("Délai de livraison (semaines):", value=2)
-            lot_commande = st.number_input("Lot de commande (unités):", value=2000)
-            
-            st.subheader("Prévisions de Consommation")
-            mois = ['Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin']
-            consommation = []
-            for i, mois_nom in enumerate(mois):
-                conso = st.number_input(f"Consommation {mois_nom}:", value=1500 + i*100, key=f"conso_{i}")
-                consommation.append(conso)
-        
-        with col2:
-            st.subheader("Budget d'Approvisionnement")
-            
-            # Simulation du budget
-            stock_courant = stock_initial
-            commandes = [0] * 6
-            livraisons = [0] * 6
-            stocks_fin = []
-            
-            for i in range(6):
-                # Livraison des commandes passées
-                if i >= delai_livraison:
-                    livraisons[i] = commandes[i - delai_livraison]
-                
-                stock_courant += livraisons[i] - consommation[i]
-                stocks_fin.append(stock_courant)
-                
-                # Décision de commande
-                if stock_courant < stock_securite:
-                    commandes[i] = lot_commande
-            
-            df_budget = pd.DataFrame({
-                'Mois': mois,
-                'Consommation': consommation,
-                'Commandes': commandes,
-                'Livraisons': livraisons,
-                'Stock Final': stocks_fin
-            })
-            
-            st.dataframe(df_budget.style.format({
-                'Consommation': '{:,.0f}',
-                'Commandes': '{:,.0f}',
-                'Livraisons': '{:,.0f}',
-                'Stock Final': '{:,.0f}'
-            }))
-            
-            # Graphique
-            fig, ax = plt.subplots(figsize=(10, 6))
-            x = range(len(mois))
-            ax.plot(x, stocks_fin, marker='o', label='Stock final', linewidth=2)
-            ax.axhline(y=stock_securite, color='red', linestyle='--', label='Stock de sécurité')
-            ax.set_xticks(x)
-            ax.set_xticklabels(mois)
-            ax.set_xlabel('Mois')
-            ax.set_ylabel('Unités')
-            ax.legend()
-            ax.set_title('Évolution du Stock')
-            ax.grid(True, alpha=0.3)
-            st.pyplot(fig)
-            
-            # Analyse
-            stock_min = min(stocks_fin)
-            if stock_min < stock_securite:
-                st.error(f"⚠️ Stock minimum ({stock_min}) inférieur au stock de sécurité")
-            else:
-                st.success("✅ Niveaux de stock conformes aux objectifs")
-
-def show_budget_investissement():
-    st.markdown('<div class="main-header">🏗️ Budget d\'Investissement</div>', unsafe_allow_html=True)
-    
-    tab1, tab2, tab3 = st.tabs(["📊 Méthodes d'Évaluation", "💰 Calcul VAN", "📈 Comparaison Projets"])
-    
-    with tab1:
-        st.markdown('<div class="section-header">📊 Méthodes d\'Évaluation des Investissements</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🕒 Délai de Récupération (Payback)
-            
-            **Avantages** :
-            - Simple à calculer
-            - Prise en compte du risque
-            - Favorise la liquidité
-            
-            **Inconvénients** :
-            - Ignore les flux après récupération
-            - Ne tient pas compte de la valeur temps
-            """)
-            
-            st.markdown("""
-            ### 📈 Taux de Rentabilité Comptable
-            
-            **Formule** :
-            TRC = (Bénéfice annuel moyen / Investissement initial) × 100
-            
-            **Limites** :
-            - Basé sur des données comptables
-            - Ignore l'actualisation
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 💰 Valeur Actuelle Nette (VAN)
-            
-            **Formule** :
-            VAN = Σ(Flux actualisés) - Investissement initial
-            
-            **Avantages** :
-            - Prise en compte valeur temps
-            - Mesure la création de valeur
-            - Cohérente avec l'objectif richesse
-            
-            **Règle de décision** :
-            - VAN > 0 : Projet acceptable
-            - VAN maximale : Meilleur projet
-            """)
-            
-            st.markdown("""
-            ### 📊 Comparaison des Méthodes
-            
-            | Méthode | Horizon | Valeur temps | Risque |
-            |---------|---------|--------------|--------|
-            | Payback | Court | Non | Implicite |
-            | TRC | Moyen | Non | Non |
-            | VAN | Long | Oui | Via taux |
-            """)
-    
-    with tab2:
-        st.markdown('<div class="section-header">💰 Calcul de la Valeur Actuelle Nette</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Paramètres de l'Investissement")
-            
-            investissement_initial = st.number_input("Investissement initial (€):", value=150000)
-            taux_actualisation = st.number_input("Taux d'actualisation (%):", value=15.0) / 100
-            duree_projet = st.number_input("Durée du projet (années):", value=5)
-            
-            st.subheader("Flux de Trésorerie Annuels")
-            flux_tresorerie = []
-            for i in range(duree_projet):
-                flux = st.number_input(f"Flux année {i+1} (€):", value=50000)
-                flux_tresorerie.append(flux)
-        
-        with col2:
-            if st.button("Calculer la VAN"):
-                # Calcul des flux actualisés
-                flux_actualises = []
-                for i, flux in enumerate(flux_tresorerie):
-                    flux_act = flux / ((1 + taux_actualisation) ** (i + 1))
-                    flux_actualises.append(flux_act)
-                
-                van = sum(flux_actualises) - investissement_initial
-                
-                st.metric("Valeur Actuelle Nette (VAN)", f"{van:,.2f} €")
-                
-                # Tableau des flux
-                df_flux = pd.DataFrame({
-                    'Année': range(1, duree_projet + 1),
-                    'Flux': flux_tresorerie,
-                    'Flux Actualisé': flux_actualises
-                })
-                
-                st.dataframe(df_flux.style.format({
-                    'Flux': '{:,.0f} €',
-                    'Flux Actualisé': '{:,.0f} €'
-                }))
-                
-                # Graphique
-                fig, ax = plt.subplots(figsize=(10, 6))
-                years = range(1, duree_projet + 1)
-                ax.bar(years, flux_tresorerie, alpha=0.7, label='Flux nominaux')
-                ax.bar(years, flux_actualises, alpha=0.7, label='Flux actualisés')
-                ax.axhline(y=0, color='black', linestyle='-', alpha=0.3)
-                ax.set_xlabel('Année')
-                ax.set_ylabel('Montant (€)')
-                ax.legend()
-                ax.set_title('Flux de Trésorerie - Nominaux vs Actualisés')
-                ax.grid(True, alpha=0.3)
-                
-                st.pyplot(fig)
-                
-                # Interprétation
-                if van > 0:
-                    st.success("✅ Projet rentable - VAN positive")
-                else:
-                    st.error("❌ Projet non rentable - VAN négative")
-    
-    with tab3:
-        st.markdown('<div class="section-header">📈 Comparaison de Plusieurs Projets d\'Investissement</div>', unsafe_allow_html=True)
-        
-        st.markdown("""
-        ### 🎯 Analyse Multi-Critères
-        
-        Comparez plusieurs projets d'investissement selon différents critères pour 
-        prendre la décision la plus éclairée.
-        """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Projet A - Expansion Commerciale")
-            invest_a = st.number_input("Investissement Projet A (k€):", value=200)
-            flux_a = []
-            for i in range(5):
-                flux = st.number_input(f"Flux A année {i+1} (k€):", value=60, key=f"flux_a_{i}")
-                flux_a.append(flux)
-        
-        with col2:
-            st.subheader("Projet B - Modernisation Usine")
-            invest_b = st.number_input("Investissement Projet B (k€):", value=300)
-            flux_b = []
-            for i in range(5):
-                flux = st.number_input(f"Flux B année {i+1} (k€):", value=80, key=f"flux_b_{i}")
-                flux_b.append(flux)
-        
-        taux_actualisation = st.slider("Taux d'actualisation (%):", 5.0, 20.0, 12.0) / 100
-        
-        if st.button("Comparer les Projets"):
-            # Calcul VAN Projet A
-            van_a = -invest_a
-            for i, flux in enumerate(flux_a):
-                van_a += flux / ((1 + taux_actualisation) ** (i + 1))
-            
-            # Calcul VAN Projet B
-            van_b = -invest_b
-            for i, flux in enumerate(flux_b):
-                van_b += flux / ((1 + taux_actualisation) ** (i + 1))
-            
-            # Calcul autres indicateurs
-            payback_a = invest_a / np.mean(flux_a) if np.mean(flux_a) > 0 else float('inf')
-            payback_b = invest_b / np.mean(flux_b) if np.mean(flux_b) > 0 else float('inf')
-            
-            trc_a = (np.mean(flux_a) / invest_a) * 100
-            trc_b = (np.mean(flux_b) / invest_b) * 100
-            
-            # Tableau comparatif
-            data_comparaison = {
-                'Critère': ['VAN (k€)', 'Payback (ans)', 'TRC (%)', 'Investissement (k€)'],
-                'Projet A': [van_a, payback_a, trc_a, invest_a],
-                'Projet B': [van_b, payback_b, trc_b, invest_b]
-            }
-            
-            df_comparaison = pd.DataFrame(data_comparaison)
-            st.dataframe(df_comparaison.style.format({
-                'Projet A': '{:,.1f}',
-                'Projet B': '{:,.1f}'
-            }))
-            
-            # Graphique comparatif
-            criteres = ['VAN', 'TRC', 'Payback']
-            valeurs_a = [van_a, trc_a, payback_a]
-            valeurs_b = [van_b, trc_b, payback_b]
-            
-            fig, ax = plt.subplots(figsize=(10, 6))
-            x = np.arange(len(criteres))
-            width = 0.35
-            
-            ax.bar(x - width/2, valeurs_a, width, label='Projet A')
-            ax.bar(x + width/2, valeurs_b, width, label='Projet B')
-            
-            ax.set_xlabel('Critères')
-            ax.set_ylabel('Valeurs')
-            ax.set_title('Comparaison des Projets d\'Investissement')
-            ax.set_xticks(x)
-            ax.set_xticklabels(criteres)
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            st.pyplot(fig)
-            
-            # Recommandation
-            if van_a > van_b and van_a > 0:
-                st.success("🎯 RECOMMANDATION : Choisir le Projet A")
-            elif van_b > van_a and van_b > 0:
-                st.success("🎯 RECOMMANDATION : Choisir le Projet B")
-            else:
-                st.warning("⚠️ Aucun projet n'est rentable au taux d'actualisation choisi")
-
-def show_budget_tresorerie():
-    st.markdown('<div class="main-header">💸 Budget de Trésorerie</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    ### 🎯 Objectif du Budget de Trésorerie
-    
-    Le budget de trésorerie est **l'aboutissement** de toute la démarche budgétaire.
-    Il traduit en flux monétaires l'ensemble des budgets précédents et permet de :
-    """)
-    
-    st.markdown("""
-    - ✅ **Vérifier l'équilibre financier** à court terme
-    - 📊 **Anticiper les besoins** de financement
-    - 💰 **Optimiser la gestion** de la trésorerie
-    - 🚨 **Prévenir les risques** de liquidité
-    """)
-    
-    tab1, tab2, tab3 = st.tabs(["📊 Construction", "🔄 Simulation", "📈 Analyse"])
-    
-    with tab1:
-        st.markdown('<div class="section-header">📊 Processus de Construction</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 📥 Budget des Encaissements
-            
-            **Sources** :
-            - Ventes au comptant
-            - Encaissements clients (décalés)
-            - Autres produits
-            - Subventions
-            - Produits financiers
-            
-            **Décalages typiques** :
-            - 30-50% au comptant
-            - 40-60% à 30 jours
-            - 10-20% à 60 jours
-            """)
-            
-            st.markdown("""
-            ### 📤 Budget des Décaissements
-            
-            **Postes principaux** :
-            - Achats fournisseurs
-            - Charges de personnel
-            - Charges externes
-            - Investissements
-            - Remboursements d'emprunts
-            - Impôts et taxes
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 📋 Budget de TVA
-            
-            **Calcul** :
-            ```
-            TVA à payer = TVA collectée - TVA déductible
-            ```
-            
-            **Périodicité** :
-            - Déclaration mensuelle ou trimestrielle
-            - Paiement le mois suivant
-            """)
-            
-            st.markdown("""
-            ### ⚖️ Budget Récapitulatif
-            
-            **Solde = Encaissements - Décaissements**
-            
-            **Ajustements nécessaires** :
-            - Financement des besoins (emprunts)
-            - Placement des excédents
-            - Lignes de crédit
-            """)
-            
-            st.markdown("""
-            ### 📈 Indicateurs de Suivi
-            
-            - **Point mort** : Niveau d'activité pour équilibrer la trésorerie
-            - **Besoin en fonds de roulement (BFR)**
-            - **Trésorerie nette**
-            - **Ratio de liquidité**
-            """)
-    
-    with tab2:
-        st.markdown('<div class="section-header">🔄 Simulation de Budget de Trésorerie</div>', unsafe_allow_html=True)
-        
-        # Paramètres de base
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.subheader("Encaissements")
-            ca_ht_mensuel = st.number_input("CA HT mensuel moyen (k€):", value=100.0)
-            taux_tva = st.number_input("Taux TVA (%):", value=20.0) / 100
-            delai_encaisse_client = st.select_slider("Délai encaissement clients:", 
-                                                   options=['0 jour', '30 jours', '60 jours', '90 jours'], 
-                                                   value='30 jours')
-            
-        with col2:
-            st.subheader("Décaissements")
-            achats_ht_mensuel = st.number_input("Achats HT mensuel (k€):", value=60.0)
-            charges_personnel = st.number_input("Charges personnel (k€):", value=25.0)
-            charges_externes = st.number_input("Charges externes (k€):", value=15.0)
-            investissements = st.number_input("Investissements (k€):", value=50.0)
-            
-        with col3:
-            st.subheader("Paramètres Financiers")
-            tresorerie_initial = st.number_input("Trésorerie initiale (k€):", value=50.0)
-            credit_disponible = st.number_input("Ligne de crédit disponible (k€):", value=100.0)
-            taux_interet = st.number_input("Taux d'intérêt crédit (%):", value=4.0) / 100
-        
-        if st.button("Générer le Budget de Trésorerie sur 12 mois"):
-            # Calculs de base
-            mois = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
-            ca_ttc_mensuel = ca_ht_mensuel * (1 + taux_tva)
-            achats_ttc_mensuel = achats_ht_mensuel * (1 + taux_tva)
-            tva_a_payer = (ca_ht_mensuel - achats_ht_mensuel) * taux_tva
-            
-            # Simulation des flux avec décalages
-            encaissements = []
-            decaissements = []
-            tresorerie_cumulee = [tresorerie_initial]
-            
-            for i in range(12):
-                # Encaissements avec décalage
-                if delai_encaisse_client == '0 jour':
-                    encaiss_mois = ca_ttc_mensuel
-                elif delai_encaisse_client == '30 jours':
-                    encaiss_mois = ca_ttc_mensuel * 0.7  # 70% à 30 jours
-                    if i > 0:
-                        encaiss_mois += ca_ttc_mensuel * 0.3  # 30% à 60 jours
-                else:
-                    encaiss_mois = ca_ttc_mensuel * 0.5  # 50% à 30 jours
-                    if i > 0:
-                        encaiss_mois += ca_ttc_mensuel * 0.3  # 30% à 60 jours
-                    if i > 1:
-                        encaiss_mois += ca_ttc_mensuel * 0.2  # 20% à 90 jours
-                
-                encaissements.append(encaiss_mois)
-                
-                # Décaissements
-                decaiss_mois = (achats_ttc_mensuel + charges_personnel + 
-                               charges_externes + tva_a_payer)
-                
-                # Investissements répartis
-                if i < 3:  # Investissements sur les 3 premiers mois
-                    decaiss_mois += investissements / 3
-                
-                decaissements.append(decaiss_mois)
-                
-                # Calcul trésorerie cumulée
-                solde_mois = encaiss_mois - decaiss_mois
-                nouvelle_tresorerie = tresorerie_cumulee[-1] + solde_mois
-                
-                # Gestion du découvert
-                if nouvelle_tresorerie < 0:
-                    if abs(nouvelle_tresorerie) <= credit_disponible:
-                        nouvelle_tresorerie = 0  # Utilisation du crédit
-                    else:
-                        st.warning(f"Découvert excessif en {mois[i]} : {nouvelle_tresorerie:.1f} k€")
-                
-                tresorerie_cumulee.append(nouvelle_tresorerie)
-            
-            # Création du tableau de bord
-            df_tresorerie = pd.DataFrame({
-                'Mois': mois,
-                'Encaissements': encaissements,
-                'Décaissements': decaissements,
-                'Solde Mensuel': [e - d for e, d in zip(encaissements, decaissements)],
-                'Trésorerie Cumulée': tresorerie_cumulee[1:]
-            })
-            
-            # Affichage des résultats
-            st.subheader("Budget de Trésorerie Prévisionnel sur 12 mois")
-            st.dataframe(df_tresorerie.style.format({
-                'Encaissements': '{:,.1f} k€',
-                'Décaissements': '{:,.1f} k€',
-                'Solde Mensuel': '{:,.1f} k€',
-                'Trésorerie Cumulée': '{:,.1f} k€'
-            }))
-            
-            # Graphiques
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-            
-            # Graphique des flux
-            ax1.bar(df_tresorerie['Mois'], df_tresorerie['Encaissements'], 
-                   label='Encaissements', alpha=0.7, color='green')
-            ax1.bar(df_tresorerie['Mois'], df_tresorerie['Décaissements'], 
-                   label='Décaissements', alpha=0.7, color='red')
-            ax1.set_ylabel('Montant (k€)')
-            ax1.legend()
-            ax1.set_title('Flux de Trésorerie Mensuels')
-            ax1.tick_params(axis='x', rotation=45)
-            ax1.grid(True, alpha=0.3)
-            
-            # Graphique de la trésorerie cumulée
-            ax2.plot(df_tresorerie['Mois'], df_tresorerie['Trésorerie Cumulée'], 
-                    marker='o', linewidth=2, color='blue')
-            ax2.axhline(y=0, color='red', linestyle='--', alpha=0.5, label='Équilibre')
-            ax2.set_ylabel('Trésorerie Cumulée (k€)')
-            ax2.set_title('Évolution de la Trésorerie')
-            ax2.tick_params(axis='x', rotation=45)
-            ax2.grid(True, alpha=0.3)
-            ax2.legend()
-            
-            # Zones de couleur pour trésorerie positive/négative
-            ax2.fill_between(df_tresorerie['Mois'], df_tresorerie['Trésorerie Cumulée'], 
-                            where=(df_tresorerie['Trésorerie Cumulée'] >= 0), 
-                            interpolate=True, alpha=0.3, color='green')
-            ax2.fill_between(df_tresorerie['Mois'], df_tresorerie['Trésorerie Cumulée'], 
-                            where=(df_tresorerie['Trésorerie Cumulée'] < 0), 
-                            interpolate=True, alpha=0.3, color='red')
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            
-            # Analyse et recommandations
-            tresorerie_min = min(df_tresorerie['Trésorerie Cumulée'])
-            tresorerie_max = max(df_tresorerie['Trésorerie Cumulée'])
-            tresorerie_finale = df_tresorerie['Trésorerie Cumulée'].iloc[-1]
-            
-            st.subheader("📊 Analyse de la Trésorerie")
-            
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Trésorerie minimum", f"{tresorerie_min:.1f} k€")
-            col2.metric("Trésorerie maximum", f"{tresorerie_max:.1f} k€")
-            col3.metric("Trésorerie finale", f"{tresorerie_finale:.1f} k€")
-            
-            # Recommandations
-            if tresorerie_min >= 0:
-                st.success("✅ Trésorerie toujours positive - Situation saine")
-            elif tresorerie_min >= -credit_disponible:
-                st.warning("⚠️ Découvert occasionnel - Surveiller la trésorerie")
-                st.info("💡 Recommandation : Optimiser les délais de paiement clients")
-            else:
-                st.error("🚨 Découvert excessif - Risque de liquidité")
-                st.info("💡 Actions urgentes : Renégocier les délais fournisseurs, rechercher un financement")
-    
-    with tab3:
-        st.markdown('<div class="section-header">📈 Analyse et Optimisation de la Trésorerie</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("Calcul du Besoin en Fonds de Roulement (BFR)")
-            
-            stocks_moyen = st.number_input("Stock moyen (k€):", value=200.0)
-            creances_clients = st.number_input("Créances clients (k€):", value=150.0)
-            dettes_fournisseurs = st.number_input("Dettes fournisseurs (k€):", value=100.0)
-            
-            bfr = stocks_moyen + creances_clients - dettes_fournisseurs
-            
-            st.metric("Besoin en Fonds de Roulement", f"{bfr:.1f} k€")
-            
-            if bfr > 0:
-                st.info("💡 BFR positif : Besoin de financement du cycle d'exploitation")
-            else:
-                st.info("💡 BFR négatif : Ressource dégagée par le cycle d'exploitation")
-        
-        with col2:
-            st.subheader("Optimisation de la Trésorerie")
-            
-            st.markdown("""
-            **Stratégies d'amélioration** :
-            
-            ### 📥 Accélérer les encaissements
-            - Escompte pour paiement anticipé
-            - Affacturage
-            - Relance client proactive
-            
-            ### 📤 Maîtriser les décaissements
-            - Négociation délais fournisseurs
-            - Optimisation des commandes
-            - Rationalisation des dépenses
-            
-            ### 💰 Optimisation du BFR
-            - Réduction du stock
-            - Amélioration de la rotation
-            - Négociation commerciale
-            """)
-
-def show_processus_complet():
-    st.markdown('<div class="main-header">🔄 Processus Budgétaire Complet</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    ### 🌟 Vision d'Ensemble du Pilotage Intégré
-    
-    Ce schéma représente le **cycle complet** du contrôle de gestion, démontrant 
-    l'intégration de tous les budgets dans un système de pilotage cohérent.
-    """)
-    
-    # Schéma interactif du processus complet
-    st.markdown("""
-    ```mermaid
-    graph TD
-        A[Stratégie 3-5 ans] --> B[Plan Opérationnel];
-        B --> C[Budget des Ventes];
-        B --> D[Budget de Production];
-        B --> E[Budget Approvisionnements];
-        C --> F[Budget de Trésorerie];
-        D --> F;
-        E --> F;
-        F --> G[Compte de Résultat<br>Prévisionnel];
-        F --> H[Bilan Prévisionnel];
-        G --> I[Contrôle des Écarts];
-        H --> I;
-        I --> J[Actions Correctives];
-        J --> A;
-        
-        style A fill:#1f77b4,color:white
-        style F fill:#2ca02c,color:white
-        style I fill:#d62728,color:white
-        style J fill:#ff7f0e,color:white
-    ```
-    """)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        ### 📋 Checklist du Processus Budgétaire
-        
-        - [ ] **Étape 1** : Définition des objectifs stratégiques
-        - [ ] **Étape 2** : Élaboration du plan opérationnel
-        - [ ] **Étape 3** : Budget des ventes (chiffrage)
-        - [ ] **Étape 4** : Budget de production (optimisation)
-        - [ ] **Étape 5** : Budget des approvisionnements (stocks)
-        - [ ] **Étape 6** : Budget d'investissement (rentabilité)
-        - [ ] **Étape 7** : Budget de trésorerie (synthèse)
-        - [ ] **Étape 8** : Documents de synthèse prévisionnels
-        - [ ] **Étape 9** : Mise en œuvre et contrôle
-        - [ ] **Étape 10** : Analyse des écarts et corrections
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 🎯 Bénéfices du Système Intégré
-        
-        **Pour la Direction** :
-        - Vision globale et cohérente
-        - Prise de décision éclairée
-        - Allocation optimale des ressources
-        
-        **Pour les Opérationnels** :
-        - Objectifs clairs et mesurables
-        - Autonomie dans un cadre défini
-        - Feedback régulier sur la performance
-        
-        **Pour l'Entreprise** :
-        - Amélioration continue
-        - Adaptation rapide aux changements
-        - Création de valeur durable
-        """)
-    
-    # Résumé des outils vus dans l'application
-    st.markdown('<div class="section-header">🛠️ Boîte à Outils Complète</div>', unsafe_allow_html=True)
-    
-    tools_data = {
-        'Module': ['Contrôle de Gestion', 'Budget Ventes', 'Budget Production', 
-                  'Gestion Stocks', 'Budget Investissement', 'Budget Trésorerie'],
-        'Outils': ['Tableaux de bord, KPI', 'Prévisions, Moindres carrés', 
-                  'Programmation linéaire', 'Modèle de Wilson', 'VAN, TRI, Payback', 
-                  'Flux, Solde, Financement'],
-        'Objectif': ['Pilotage performance', 'Anticipation demande', 
-                    'Optimisation ressources', 'Minimisation coûts', 
-                    'Maximisation valeur', 'Équilibre financier']
-    }
-    
-    df_tools = pd.DataFrame(tools_data)
-    st.dataframe(df_tools, use_container_width=True)
-    
-    # Timeline du processus
-    st.markdown('<div class="section-header">⏱️ Calendrier Budgétaire Type</div>', unsafe_allow_html=True)
-    
-    timeline_data = {
-        'Période': ['Septembre', 'Octobre', 'Novembre', 'Décembre', 'Janvier', 'Février'],
-        'Activité': [
-            'Lancement process - Objectifs stratégiques',
-            'Budgets opérationnels - Ventes/Production',
-            'Budgets support - Approvisionnements/Investissements',
-            'Synthèse - Trésorerie et documents prévisionnels',
-            'Validation direction - Présentation CA',
-            'Mise en œuvre - Début exercice'
-        ]
-    }
-    
-    df_timeline = pd.DataFrame(timeline_data)
-    st.dataframe(df_timeline, use_container_width=True)
-
-def show_plan_implementation():
-    st.markdown('<div class="main-header">📅 Plan d\'Implémentation Détaillé</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    ## 🎯 Feuille de Route pour la Mise en Œuvre
-    
-    Ce plan détaillé vous guide pas à pas dans l'implémentation d'un système de contrôle de gestion 
-    performant dans votre entreprise.
-    """)
-    
-    # Timeline interactive
-    st.markdown('<div class="section-header">⏱️ Feuille de Route Chronologique</div>', unsafe_allow_html=True)
-    
-    # Création d'une timeline visuelle
-    phases = [
-        {"période": "1-2 semaines", "titre": "🚀 Phase Immédiate", "couleur": "#ff6b6b"},
-        {"période": "1-3 mois", "titre": "📈 Court Terme", "couleur": "#4ecdc4"},
-        {"période": "3-6 mois", "titre": "⚙️ Moyen Terme", "couleur": "#45b7d1"},
-        {"période": "6-12 mois", "titre": "🏆 Long Terme", "couleur": "#96ceb4"}
-    ]
-    
-    # Affichage des phases
-    cols = st.columns(4)
-    for i, phase in enumerate(phases):
-        with cols[i]:
-            st.markdown(f"""
-            <div style="background-color: {phase['couleur']}; padding: 20px; border-radius: 10px; color: white; text-align: center;">
-                <h3>{phase['période']}</h3>
-                <h4>{phase['titre']}</h4>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Détail de chaque phase
-    tab1, tab2, tab3, tab4 = st.tabs(["🚀 Immédiat (1-2 sem)", "📈 Court terme (1-3 mois)", "⚙️ Moyen terme (3-6 mois)", "🏆 Long terme (6-12 mois)"])
-    
-    with tab1:
-        st.markdown('<div class="subsection-header">🚀 Actions Immédiates (1-2 semaines)</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🎯 Identifier un Projet Pilote
-            
-            **Critères de sélection** :
-            - 📊 Département avec données disponibles
-            - 👥 Équipe motivée et coopérative
-            - 🎯 Problème business clair
-            - 📈 Potentiel de ROI rapide
-            
-            **Exemples de projets pilotes** :
-            - Optimisation du budget commercial
-            - Gestion des stocks d'un produit phare
-            - Contrôle des coûts de production
-            - Analyse de rentabilité par client
-            """)
-            
-            # Outil de sélection de projet pilote
-            st.subheader("🔍 Sélectionneur de Projet Pilote")
-            
-            criteres = {
-                "Disponibilité des données": st.slider("Disponibilité données (1-5)", 1, 5, 3),
-                "Motivation de l'équipe": st.slider("Motivation équipe (1-5)", 1, 5, 4),
-                "Clarté du problème": st.slider("Clarté problème (1-5)", 1, 5, 3),
-                "Potentiel ROI": st.slider("Potentiel ROI (1-5)", 1, 5, 4),
-                "Complexité technique": st.slider("Complexité technique (1-5)", 1, 5, 2)
-            }
-            
-            score_total = sum(criteres.values())
-            
-            if score_total >= 20:
-                st.success("✅ Excellent candidat pour projet pilote")
-            elif score_total >= 15:
-                st.warning("⚠️ Candidat acceptable, nécessite quelques ajustements")
-            else:
-                st.error("❌ Projet à reconsidérer ou préparer davantage")
-        
-        with col2:
-            st.markdown("""
-            ### 👥 Former une Équipe Dédiée
-            
-            **Composition idéale** :
-            - 🎯 **Sponsor executive** : Direction générale
-            - 📊 **Chef de projet** : Contrôleur de gestion
-            - 🔧 **Expert métier** : Responsable du département
-            - 💻 **Support technique** : IT/Data analyst
-            - 👥 **Utilisateurs clés** : Équipe opérationnelle
-            
-            **Rôles et responsabilités** :
-            - **Sponsor** : Validation budget, levée des obstacles
-            - **Chef de projet** : Coordination, planning, reporting
-            - **Expert métier** : Définition des besoins, tests
-            - **Support technique** : Intégration, automatisation
-            - **Utilisateurs** : Feedback, adoption
-            """)
-            
-            st.markdown("""
-            ### 🎯 Définir les Objectifs Spécifiques
-            
-            **Méthode SMART** :
-            - **Spécifique** : Clair et précis
-            - **Mesurable** : Chiffré et quantifiable
-            - **Atteignable** : Réaliste et faisable
-            - **Relevant** : Aligné sur la stratégie
-            - **Temporel** : Délai défini
-            
-            **Exemples d'objectifs** :
-            - Réduction de 15% des stocks d'ici 3 mois
-            - Augmentation de 10% de la marge d'ici 6 mois
-            - Réduction de 20% du BFR d'ici 1 an
-            """)
-    
-    with tab2:
-        st.markdown('<div class="subsection-header">📈 Actions Court Terme (1-3 mois)</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🛠️ Mettre en Place les Premiers Outils
-            
-            **Priorité 1 : Tableaux de bord simples**
-            - 📊 3-5 KPI essentiels
-            - 📈 Visualisations basiques
-            - 🔄 Mise à jour manuelle initiale
-            
-            **Outils recommandés** :
-            - Excel/Google Sheets pour débuter
-            - Power BI/Tableau pour la visualisation
-            - Templates prédéfinis pour gagner du temps
-            
-            **Étapes concrètes** :
-            1. Identifier les données sources
-            2. Créer le premier tableau de bord
-            3. Tester avec l'équipe pilote
-            4. Itérer et améliorer
-            """)
-            
-            # Calculateur d'effort
-            st.subheader("⏱️ Estimateur d'Effort - Mise en Place")
-            
-            complexite = st.select_slider("Complexité du projet:", 
-                                        ["Simple", "Moyen", "Complexe"])
-            equipe = st.number_input("Nombre de personnes dédiées:", 1, 10, 2)
-            
-            if complexite == "Simple":
-                effort = "2-3 semaines"
-            elif complexite == "Moyen":
-                effort = "4-6 semaines"
-            else:
-                effort = "8-10 semaines"
-                
-            st.info(f"💡 Effort estimé : {effort} avec {equipe} personne(s)")
-        
-        with col2:
-            st.markdown("""
-            ### 👨‍🏫 Former les Utilisateurs Clés
-            
-            **Formations prioritaires** :
-            - 🎓 **Session dirigeants** : 2 heures
-            - 📚 **Formation utilisateurs** : 1 journée
-            - 🔧 **Atelier technique** : 1/2 journée
-            - 📖 **Documentation utilisateur** : Guide pratique
-            
-            **Méthodes pédagogiques** :
-            - Présentation des concepts
-            - Démonstration live
-            - Exercices pratiques
-            - Études de cas réels
-            - Support continu
-            """)
-            
-            st.markdown("""
-            ### 📊 Mesurer les Premiers Résultats
-            
-            **Indicateurs de succès initiaux** :
-            - ✅ Adoption par l'équipe (> 80%)
-            - ⏱️ Gain de temps sur le reporting (> 30%)
-            - 🎯 Exactitude des données (> 95%)
-            - 💬 Satisfaction utilisateurs
-            
-            **Revues régulières** :
-            - Point hebdomadaire avec l'équipe projet
-            - Revue mensuelle avec la direction
-            - Ajustements basés sur le feedback
-            """)
-            
-            # Suivi des premiers résultats
-            st.subheader("📈 Tableau de Bord Initial")
-            
-            metriques_initiales = {
-                "Taux d'adoption": st.slider("Taux d'adoption (%)", 0, 100, 75),
-                "Gain de temps": st.slider("Gain de temps (%)", 0, 100, 40),
-                "Satisfaction": st.slider("Satisfaction (1-5)", 1, 5, 4),
-                "Exactitude données": st.slider("Exactitude données (%)", 0, 100, 90)
-            }
-            
-            score_global = sum(metriques_initiales.values()) / 4
-            
-            if score_global >= 80:
-                st.success("✅ Excellents résultats initiaux")
-            elif score_global >= 60:
-                st.warning("⚠️ Résultats corrects, améliorations possibles")
-            else:
-                st.error("❌ Nécessite des ajustements importants")
-    
-    with tab3:
-        st.markdown('<div class="subsection-header">⚙️ Actions Moyen Terme (3-6 mois)</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🌐 Étendre à d'Autres Départements
-            
-            **Stratégie d'expansion** :
-            1. **Capitaliser sur les succès** du pilote
-            2. **Identifier les départements** prioritaires
-            3. **Adapter les outils** aux besoins spécifiques
-            4. **Former les nouveaux utilisateurs**
-            
-            **Départements typiques** :
-            - 📈 Commercial et marketing
-            - 🏭 Production et logistique
-            - 💰 Finance et comptabilité
-            - 📦 Achats et approvisionnements
-            - 👥 Ressources humaines
-            
-            **Plan de déploiement** :
-            - 1 département par mois maximum
-            - Recueil systématique du feedback
-            - Amélioration continue des processus
-            """)
-            
-            # Planificateur d'expansion
-            st.subheader("🗓️ Planificateur d'Expansion")
-            
-            departements = st.multiselect(
-                "Départements à inclure:",
-                ["Commercial", "Production", "Finance", "Achats", "RH", "Logistique", "R&D"],
-                default=["Commercial", "Production"]
-            )
-            
-            if departements:
-                st.info(f"📅 Plan recommandé : {len(departements)} départements sur {len(departements)} mois")
-        
-        with col2:
-            st.markdown("""
-            ### 🤖 Automatiser les Processus
-            
-            **Processus à automatiser en priorité** :
-            - 📥 Collecte des données
-            - 📊 Génération des rapports
-            - 📧 Envoi des alertes
-            - 🔄 Consolidation des informations
-            
-            **Technologies recommandées** :
-            - APIs pour l'intégration des données
-            - ETL pour la transformation
-            - Outils BI pour la visualisation
-            - Scripts Python/R pour l'analyse
-            
-            **Bénéfices attendus** :
-            - Réduction de 70% du temps de reporting
-            - Élimination des erreurs manuelles
-            - Information en temps réel
-            - Scalabilité du système
-            """)
-            
-            st.markdown("""
-            ### 🎯 Optimiser le Système
-            
-            **Axes d'optimisation** :
-            - **Performance** : Temps de réponse, charge
-            - **Utilisabilité** : Interface, ergonomie
-            - **Fonctionnalités** : Nouvelles features
-            - **Intégration** : Connexions systèmes
-            
-            **Méthodologie** :
-            - Mesure continue des performances
-            - Enquêtes de satisfaction utilisateurs
-            - Benchmark des meilleures pratiques
-            - Veille technologique
-            """)
-            
-            # Calculateur de ROI automatisation
-            st.subheader("💰 Calculateur ROI Automatisation")
-            
-            temps_manuel = st.number_input("Temps manuel actuel (h/mois):", value=40)
-            cout_horaire = st.number_input("Coût horaire (€):", value=50)
-            investissement_auto = st.number_input("Investissement automatisation (€):", value=10000)
-            
-            gain_annuel = temps_manuel * cout_horaire * 12 * 0.7  # 70% de gain
-            roi_mois = investissement_auto / (gain_annuel / 12) if gain_annuel > 0 else float('inf')
-            
-            st.metric("Gain annuel estimé", f"{gain_annuel:,.0f} €")
-            st.metric("ROI (mois)", f"{roi_mois:.1f} mois")
-    
-    with tab4:
-        st.markdown('<div class="subsection-header">🏆 Actions Long Terme (6-12 mois)</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🔄 Intégration Complète
-            
-            **Niveau d'intégration cible** :
-            - 🤝 **Systèmes connectés** : ERP, CRM, RH
-            - 📊 **Data warehouse unique** : Source de vérité
-            - 👥 **Tous départements** : Couverture complète
-            - 🌐 **Accessibilité totale** : Cloud, mobile
-            
-            **Architecture cible** :
-            - Centralisation des données
-            - Standardisation des processus
-            - Uniformisation des rapports
-            - Gouvernance des données
-            
-            **Indicateurs de maturité** :
-            - Taux d'adoption > 90%
-            - Couverture fonctionnelle > 80%
-            - Satisfaction utilisateurs > 4/5
-            - ROI démontré et mesuré
-            """)
-            
-            # Évaluateur de maturité
-            st.subheader("📊 Évaluateur de Maturité")
-            
-            criteres_maturite = {
-                "Intégration systèmes": st.slider("Intégration systèmes (%)", 0, 100, 60),
-                "Couverture départements": st.slider("Couverture départements (%)", 0, 100, 70),
-                "Automatisation processus": st.slider("Automatisation (%)", 0, 100, 50),
-                "Culture data": st.slider("Culture data (1-5)", 1, 5, 3)
-            }
-            
-            score_maturite = sum(criteres_maturite.values()) / 4
-            
-            if score_maturite >= 80:
-                st.success("✅ Niveau de maturité avancé")
-            elif score_maturite >= 60:
-                st.warning("⚠️ Niveau de maturité intermédiaire")
-            else:
-                st.info("💡 Niveau de maturité débutant")
-        
-        with col2:
-            st.markdown("""
-            ### 🌱 Culture de la Performance
-            
-            **Éléments clés de la culture** :
-            - 🎯 **Orientation résultats** : Focus sur les outcomes
-            - 📊 **Décision data-driven** : Basée sur les données
-            - 🔄 **Amélioration continue** : Mindset croissance
-            - 👥 **Responsabilisation** : Autonomie des équipes
-            
-            **Actions de transformation culturelle** :
-            - Formation continue aux outils et méthodes
-            - Reconnaissance des performances
-            - Partage des meilleures pratiques
-            - Leadership par l'exemple
-            
-            **Indicateurs culturels** :
-            - Utilisation proactive des données
-            - Prise de décision fact-based
-            - Initiative d'amélioration
-            - Collaboration inter-départements
-            """)
-            
-            st.markdown("""
-            ### 💡 Innovation Continue
-            
-            **Domaines d'innovation** :
-            - 🧠 **Intelligence Artificielle** : Prédiction, optimisation
-            - 📱 **Expérience utilisateur** : Interfaces avancées
-            - 🔮 **Analytics prédictif** : Anticipation des tendances
-            - 🤖 **Automatisation avancée** : Processus intelligents
-            
-            **Processus d'innovation** :
-            - Veille technologique continue
-            - Expérimentation de nouvelles solutions
-            - Mesure de l'impact des innovations
-            - Capitalisation sur les succès
-            
-            **Vision long terme** :
-            - Système auto-apprenant
-            - Décision assistée par IA
-            - Optimisation en temps réel
-            - Valeur business maximisée
-            """)
-            
-            # Roadmap d'innovation
-            st.subheader("🔮 Roadmap d'Innovation")
-            
-            innovations = st.multiselect(
-                "Domaines d'innovation prioritaires:",
-                ["IA Prédictive", "Analytics Avancé", "Automatisation Intelligente", 
-                 "Mobile First", "Temps Réel", "Personnalisation", "Collaboration"],
-                default=["IA Prédictive", "Analytics Avancé"]
-            )
-            
-            if innovations:
-                st.success(f"🎯 Roadmap définie : {', '.join(innovations)}")
-    
-    # Section de suivi et engagement
-    st.markdown("---")
-    st.markdown('<div class="section-header">📋 Engagement et Suivi</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        ### 📝 Contrat d'Engagement
-        
-        **Engagement de la Direction** :
-        - ✅ Allocation des ressources nécessaires
-        - ✅ Participation aux revues régulières
-        - ✅ Soutien aux changements organisationnels
-        - ✅ Communication de l'importance du projet
-        
-        **Engagement des Équipes** :
-        - ✅ Participation active aux formations
-        - ✅ Utilisation quotidienne des outils
-        - ✅ Feedback constructif et régulier
-        - ✅ Adoption des nouvelles pratiques
-        """)
-    
-    with col2:
-        st.markdown("""
-        ### 🔄 Mécanismes de Suivi
-        
-        **Indicateurs de Progrès** :
-        - 📊 Avancement vs planning
-        - 💰 Budget vs dépenses réelles
-        - 👥 Adoption et satisfaction
-        - 🎯 Atteinte des objectifs business
-        
-        **Revues Régulières** :
-        - Point hebdomadaire équipe projet
-        - Revue mensuelle comité de pilotage
-        - Bilan trimestriel direction générale
-        - Audit annuel des résultats
-        """)
-    
-    # Call to action final
-    st.markdown("---")
-    st.markdown("""
-    <div style="background-color: #e8f5e8; padding: 20px; border-radius: 10px; text-align: center;">
-        <h2>🚀 Prêt à Démarrer ?</h2>
-        <p><strong>Le meilleur moment pour commencer était hier. Le deuxième meilleur moment, c'est maintenant.</strong></p>
-        <p>Commencez par identifier votre projet pilote dès aujourd'hui !</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-def show_plus_loin():
-    st.markdown('<div class="main-header">🚀 Aller Plus Loin</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    ## 🎯 Implémentation dans Votre Entreprise
-    
-    Cette application vous a présenté les concepts fondamentaux. Voici comment 
-    les mettre en œuvre concrètement dans votre organisation.
-    """)
-    
-    tab1, tab2, tab3, tab4 = st.tabs(["🏢 Implémentation", "👥 Formation", "🤖 Automatisation", "🛠️ Personnalisation"])
-    
-    with tab1:
-        st.markdown('<div class="section-header">🏢 Implémentez ces Outils dans Votre Entreprise</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 📋 Plan d'Implémentation par Étapes
-            
-            **Phase 1 : Diagnostic (1-2 mois)**
-            - Audit des processus existants
-            - Identification des besoins
-            - Formation de l'équipe projet
-            
-            **Phase 2 : Prototype (2-3 mois)**
-            - Mise en place des premiers tableaux de bord
-            - Tests sur un département pilote
-            - Ajustements et améliorations
-            
-            **Phase 3 : Déploiement (3-6 mois)**
-            - Extension à toute l'entreprise
-            - Formation des utilisateurs
-            - Mesure des résultats
-            
-            **Phase 4 : Optimisation (continue)**
-            - Amélioration continue
-            - Intégration de nouvelles données
-            - Adaptation aux changements
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 🎯 Facteurs Clés de Succès
-            
-            **Engagement de la Direction** :
-            - Implication active du comité de direction
-            - Allocation des ressources nécessaires
-            - Communication régulière
-            
-            **Adaptation à la Culture d'Entreprise** :
-            - Respect des spécificités métier
-            - Implication des équipes opérationnelles
-            - Processus progressif et pédagogique
-            
-            **Outils Appropriés** :
-            - Solutions adaptées à la taille de l'entreprise
-            - Interface utilisateur intuitive
-            - Intégration avec les systèmes existants
-            
-            **Mesure des Résultats** :
-            - Indicateurs de performance clairs
-            - Revue régulière des objectifs
-            - Célébration des succès
-            """)
-            
-            # Calculateur de ROI
-            st.subheader("📊 Calculateur de ROI Potentiel")
-            
-            investissement_initial = st.number_input("Investissement initial (k€):", value=50)
-            gains_annuels = st.number_input("Gains annuels estimés (k€):", value=100)
-            duree_amortissement = st.number_input("Durée d'amortissement (ans):", value=3)
-            
-            if st.button("Calculer ROI"):
-                roi_annuel = (gains_annuels / investissement_initial) * 100
-                periode_retour = investissement_initial / gains_annuels
-                
-                st.metric("ROI Annuel", f"{roi_annuel:.1f}%")
-                st.metric("Période de retour", f"{periode_retour:.1f} ans")
-                
-                if roi_annuel > 100:
-                    st.success("✅ Investissement très rentable")
-                elif roi_annuel > 50:
-                    st.success("✅ Investissement rentable")
-                else:
-                    st.info("💡 Investissement à étudier attentivement")
-    
-    with tab2:
-        st.markdown('<div class="section-header">👥 Formez Vos Équipes aux Concepts Présentés</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🎓 Programme de Formation Complet
-            
-            **Formation Direction Générale** (2 jours)
-            - Principes du contrôle de gestion
-            - Lecture des tableaux de bord
-            - Prise de décision stratégique
-            
-            **Formation Managers Opérationnels** (3 jours)
-            - Élaboration des budgets
-            - Analyse des écarts
-            - Gestion des performances
-            
-            **Formation Contrôleurs de Gestion** (5 jours)
-            - Techniques avancées d'analyse
-            - Outils de reporting
-            - Optimisation des processus
-            
-            **Formation Tout Collaborateur** (1 jour)
-            - Compréhension des enjeux
-            - Contribution aux objectifs
-            - Culture de la performance
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 📚 Méthodes Pédagogiques
-            
-            **Apprentissage Théorique** :
-            - Concepts fondamentaux
-            - Études de cas
-            - Bonnes pratiques
-            
-            **Application Pratique** :
-            - Exercices sur données réelles
-            - Simulations interactives
-            - Ateliers en groupe
-            
-            **Suivi et Évaluation** :
-            - Quiz de validation
-            - Projets concrets
-            - Mesure des acquis
-            
-            **Ressources Complémentaires** :
-            - Documentation complète
-            - Templates réutilisables
-            - Support en ligne
-            """)
-            
-            # Planificateur de formation
-            st.subheader("📅 Planificateur de Formation")
-            
-            nb_participants = st.number_input("Nombre de participants:", value=20)
-            duree_formation = st.selectbox("Durée de la formation:", 
-                                         ["1 jour", "2 jours", "3 jours", "5 jours"])
-            niveau = st.selectbox("Niveau des participants:", 
-                                ["Débutant", "Intermédiaire", "Avancé"])
-            
-            if st.button("Estimer le Plan de Formation"):
-                if duree_formation == "1 jour":
-                    cout_estime = nb_participants * 500
-                    sessions = 1
-                elif duree_formation == "2 jours":
-                    cout_estime = nb_participants * 900
-                    sessions = 2
-                elif duree_formation == "3 jours":
-                    cout_estime = nb_participants * 1200
-                    sessions = 3
-                else:
-                    cout_estime = nb_participants * 1800
-                    sessions = 5
-                
-                st.metric("Coût estimé de la formation", f"{cout_estime:,.0f} €")
-                st.metric("Nombre de sessions recommandées", sessions)
-    
-    with tab3:
-        st.markdown('<div class="section-header">🤖 Automatisez la Collecte et l\'Analyse des Données</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 🔄 Flux de Données Automatisé
-            
-            **Sources de Données** :
-            - ERP (SAP, Oracle, Sage)
-            - Logiciels de paie
-            - Systèmes de vente
-            - Applications métier
-            - Bases de données externes
-            
-            **Processus d'Automatisation** :
-            - Extraction quotidienne des données
-            - Nettoyage et validation
-            - Consolidation et agrégation
-            - Génération des rapports
-            - Alertes automatiques
-            
-            **Outils Recommandés** :
-            - Power BI / Tableau
-            - Python / R
-            - APIs REST
-            - ETL (Extract Transform Load)
-            - Cloud computing
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 📊 Dashboard en Temps Réel
-            
-            **Avantages de l'Automatisation** :
-            - Gain de temps considérable
-            - Réduction des erreurs
-            - Information en temps réel
-            - Décision plus rapide
-            - Meilleure réactivité
-            
-            **Fonctionnalités Avancées** :
-            - Alertes prédictives
-            - Analyse de scénarios
-            - Reporting personnalisé
-            - Mobile friendly
-            - Export multi-formats
-            """)
-            
-            # Configuration d'alerte
-            st.subheader("⚡ Configuration d'Alerte Automatique")
-            
-            kpi_alerte = st.selectbox("KPI à surveiller:", 
-                                    ["Chiffre d'affaires", "Marge", "Trésorerie", "Stocks"])
-            seuil_alerte = st.number_input("Seuil d'alerte:", value=100000)
-            frequence_controle = st.selectbox("Fréquence de contrôle:", 
-                                            ["Quotidien", "Hebdomadaire", "Mensuel"])
-            
-            if st.button("Créer l'Alerte"):
-                st.success(f"✅ Alerte configurée : {kpi_alerte} > {seuil_alerte:,.0f} € - Contrôle {frequence_controle.lower()}")
-                st.info("💡 Cette alerte sera envoyée automatiquement par email aux responsables concernés")
-    
-    with tab4:
-        st.markdown('<div class="section-header">🛠️ Créez Votre Propre Système de Pilotage sur Mesure</div>', unsafe_allow_html=True)
-        
-        st.markdown("""
-        ## 🎨 Personnalisation Avancée
-        
-        Adaptez ces outils aux spécificités de votre entreprise pour créer 
-        un système de pilotage unique et parfaitement adapté.
-        """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 📋 Modules Personnalisables
-            
-            **Indicateurs sur Mesure** :
-            - KPI spécifiques à votre secteur
-            - Métriques uniques à votre entreprise
-            - Objectifs personnalisés
+            **Indicateurs sur Mesure** :
+            - KPI spécifiques à votre secteur
+            - Métriques uniques à votre entreprise
+            - Objectifs personnalisés
             
             **Workflows Adaptés** :
             - Processus d'approbation spécifiques
@@ -3057,6 +1342,29 @@ def show_controle_gestion():
                 with col3:
                     st.number_input("EBITDA (%)", min_value=0.0, value=18.7, step=0.1)
 
+@st.cache_data
+def sales_history():
+    """Historique des ventes (données d'exemple) et son graphique"""
+    historical_data = {
+        'Période': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+        'Ventes (k€)': [120, 135, 115, 145, 160, 155, 140, 165, 180, 175, 160, 185]
+    }
+    
+    df_historical = pd.DataFrame(historical_data)
+    fig = px.line(df_historical, x='Période', y='Ventes (k€)', 
+                 title='Évolution Historique des Ventes',
+                 markers=True)
+    return df_historical, fig
+
+@st.cache_data(max_entries=24)
+def least_squares_forecast(periods):
+    """Prévisions y = 5.82x + 124.36 sur les périodes suivant l'historique"""
+    forecast_data = []
+    for i in range(13, 13 + periods):
+        forecast = 5.82 * i + 124.36
+        forecast_data.append({'Période': i, 'Prévision (k€)': round(forecast, 2)})
+    return pd.DataFrame(forecast_data)
+
 def show_budget_ventes():
     st.title("💰 Budget des Ventes")
     
@@ -3072,19 +1380,8 @@ def show_budget_ventes():
     with tab1:
         st.subheader("Données Historiques des Ventes")
         
-        # Sample historical data
-        historical_data = {
-            'Période': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-            'Ventes (k€)': [120, 135, 115, 145, 160, 155, 140, 165, 180, 175, 160, 185]
-        }
-        
-        df_historical = pd.DataFrame(historical_data)
+        df_historical, fig = sales_history()
         st.dataframe(df_historical, use_container_width=True)
-        
-        # Chart
-        fig = px.line(df_historical, x='Période', y='Ventes (k€)', 
-                     title='Évolution Historique des Ventes',
-                     markers=True)
         st.plotly_chart(fig, use_container_width=True)
     
     with tab2:
@@ -3119,12 +1416,7 @@ def show_budget_ventes():
         
         # Forecast calculation
         if st.button("Calculer les prévisions"):
-            forecast_data = []
-            for i in range(13, 13 + periods):
-                forecast = 5.82 * i + 124.36
-                forecast_data.append({'Période': i, 'Prévision (k€)': round(forecast, 2)})
-            
-            df_forecast = pd.DataFrame(forecast_data)
+            df_forecast = least_squares_forecast(periods)
             st.dataframe(df_forecast, use_container_width=True)
     
     with tab3:
@@ -3186,6 +1478,20 @@ def show_budget_production():
         total_production_cost = production_needed * cost_per_unit
         st.metric("Coût Total de Production", f"{total_production_cost:,.0f} €")
 
+@st.cache_data
+def abc_analysis():
+    """Analyse ABC des articles (données d'exemple) et répartition de la valeur"""
+    abc_data = {
+        'Article': ['A001', 'A002', 'A003', 'A004', 'A005', 'A006', 'A007'],
+        'Valeur Stock (k€)': [45, 38, 22, 15, 8, 5, 2],
+        'Classe ABC': ['A', 'A', 'B', 'B', 'C', 'C', 'C']
+    }
+    
+    df_abc = pd.DataFrame(abc_data)
+    fig = px.pie(df_abc, values='Valeur Stock (k€)', names='Classe ABC',
+                title='Répartition ABC de la Valeur du Stock')
+    return df_abc, fig
+
 def show_gestion_stocks():
     st.title("📦 Gestion des Stocks")
     
@@ -3221,19 +1527,8 @@ def show_gestion_stocks():
     with tab2:
         st.subheader("Analyse ABC des Articles")
         
-        # Sample ABC analysis data
-        abc_data = {
-            'Article': ['A001', 'A002', 'A003', 'A004', 'A005', 'A006', 'A007'],
-            'Valeur Stock (k€)': [45, 38, 22, 15, 8, 5, 2],
-            'Classe ABC': ['A', 'A', 'B', 'B', 'C', 'C', 'C']
-        }
-        
-        df_abc = pd.DataFrame(abc_data)
+        df_abc, fig = abc_analysis()
         st.dataframe(df_abc, use_container_width=True)
-        
-        # ABC chart
-        fig = px.pie(df_abc, values='Valeur Stock (k€)', names='Classe ABC',
-                    title='Répartition ABC de la Valeur du Stock')
         st.plotly_chart(fig, use_container_width=True)
 
 # Continuer avec les autres fonctions...
@@ -3269,28 +1564,11 @@ def show_budget_investissement():
         else:
             st.warning("⚠️ Investissement à reconsidérer")
 
-def show_budget_tresorerie():
-    st.title("💸 Budget de Trésorerie")
-    
-    st.markdown("""
-    ## Prévision de Trésorerie
-    """)
-    
-    # Cash flow simulation
+@st.cache_data(max_entries=128)
+def cash_flow_projection(initial_cash, monthly_income, monthly_expenses, exceptional_expense):
+    """Trésorerie mensuelle cumulée (dépense exceptionnelle en juin) et son graphique"""
     months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Encaissements")
-        initial_cash = st.number_input("Trésorerie Initiale (k€)", value=50.0)
-        monthly_income = st.number_input("Encaissements Mensuels Moyens (k€)", value=80.0)
-    
-    with col2:
-        st.subheader("Décaissements")
-        monthly_expenses = st.number_input("Décaissements Mensuels Moyens (k€)", value=75.0)
-        exceptional_expense = st.number_input("Dépense Exceptionnelle (k€, mois 6)", value=30.0)
-    
     # Calculate cash flow
     cash_flow = [initial_cash]
     for i in range(12):
@@ -3307,12 +1585,35 @@ def show_budget_tresorerie():
     }
     df_cash = pd.DataFrame(cash_data)
     
-    st.dataframe(df_cash, use_container_width=True)
-    
     # Cash flow chart
     fig = px.line(df_cash, x='Mois', y='Trésorerie (k€)', 
                  title='Évolution Prévisionnelle de la Trésorerie',
                  markers=True)
+    return df_cash, fig
+
+def show_budget_tresorerie():
+    st.title("💸 Budget de Trésorerie")
+    
+    st.markdown("""
+    ## Prévision de Trésorerie
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Encaissements")
+        initial_cash = st.number_input("Trésorerie Initiale (k€)", value=50.0)
+        monthly_income = st.number_input("Encaissements Mensuels Moyens (k€)", value=80.0)
+    
+    with col2:
+        st.subheader("Décaissements")
+        monthly_expenses = st.number_input("Décaissements Mensuels Moyens (k€)", value=75.0)
+        exceptional_expense = st.number_input("Dépense Exceptionnelle (k€, mois 6)", value=30.0)
+    
+    df_cash, fig = cash_flow_projection(initial_cash, monthly_income, monthly_expenses,
+                                        exceptional_expense)
+    
+    st.dataframe(df_cash, use_container_width=True)
     st.plotly_chart(fig, use_container_width=True)
 
 def show_processus_complet():
@@ -0,0 +1,115 @@
+"""Préparation des séries volumineuses pour les graphiques plotly.
+
+Au-delà d'un budget de points (de l'ordre de la largeur du graphique en
+pixels), une série est réduite par Largest-Triangle-Three-Buckets, qui garde
+la forme visuelle de la courbe. Une enveloppe min/max par intervalle, calculée
+sur la série complète, est tracée derrière la courbe réduite pour qu'aucun pic
+ne disparaisse. Quand la figure reste dense (nombreuses séries), les
+courbes suivantes passent en WebGL (Scattergl).
+"""
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# De l'ordre d'un point par pixel d'un graphique pleine largeur
+POINT_BUDGET = 800
+# Points déjà tracés dans la figure au-delà desquels le SVG devient lent
+WEBGL_THRESHOLD = 5000
+
+
+def _numeric_x(x):
+    """Abscisses numériques pour le calcul des aires (dates en ns, libellés en rangs)"""
+    index = pd.Index(x)
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(float)
+    if pd.api.types.is_numeric_dtype(index.dtype):
+        return index.to_numpy(dtype=float)
+    return np.arange(len(index), dtype=float)
+
+
+def lttb_indices(x, y, n_out):
+    """Indices des points retenus par Largest-Triangle-Three-Buckets"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    xn = _numeric_x(x)
+
+    # Premier et dernier points conservés, n_out - 2 intervalles entre les deux ;
+    # le dernier point forme à lui seul l'intervalle qui suit le dernier candidat
+    bounds = np.append(np.linspace(1, n - 1, n_out - 1).astype(int), n)
+    sizes = np.diff(bounds)
+    avg_x = np.add.reduceat(xn, bounds[:-1]) / sizes
+    avg_y = np.add.reduceat(y, bounds[:-1]) / sizes
+    xs, ys = xn.tolist(), y.tolist()
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = bounds[i], bounds[i + 1]
+        ax, ay = xs[a], ys[a]
+        dx, dy = avg_x[i + 1] - ax, avg_y[i + 1] - ay
+        # Aire (doublée) du triangle (point retenu, candidat, moyenne de l'intervalle suivant)
+        if stop - start > 32:
+            area = np.abs(dx * (y[start:stop] - ay) - dy * (xn[start:stop] - ax))
+            a = start + int(area.argmax())
+        else:
+            # Intervalles courts : la boucle Python évite le surcoût des appels numpy
+            a = max(range(start, stop), key=lambda j: abs(dx * (ys[j] - ay) - dy * (xs[j] - ax)))
+        keep[i + 1] = a
+    return keep
+
+
+def lttb(x, y, n_out):
+    """Série réduite à n_out points par LTTB"""
+    keep = lttb_indices(x, y, n_out)
+    return np.asarray(x)[keep], np.asarray(y)[keep]
+
+
+def minmax_envelope(x, y, n_buckets):
+    """Abscisse de début, minimum et maximum de chaque intervalle de la série complète"""
+    y = np.asarray(y, dtype=float)
+    edges = np.unique(np.linspace(0, len(y), n_buckets + 1).astype(int)[:-1])
+    return (np.asarray(x)[edges],
+            np.fmin.reduceat(y, edges),
+            np.fmax.reduceat(y, edges))
+
+
+def _trace_class(fig, n_points):
+    drawn = sum(len(trace.x) for trace in fig.data if trace.x is not None)
+    return go.Scattergl if drawn + n_points > WEBGL_THRESHOLD else go.Scatter
+
+
+def add_series(fig, x, y, name=None, point_budget=POINT_BUDGET, envelope=True, **trace_kwargs):
+    """Ajouter une courbe au graphique, réduite au budget de points si nécessaire"""
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    if point_budget and len(y) > point_budget:
+        if envelope:
+            # Enveloppe à demi-résolution : le polygone compte autant de points que la courbe
+            xb, low, high = minmax_envelope(x, y, point_budget // 4)
+            color = (trace_kwargs.get('line') or {}).get('color', 'gray')
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([xb, xb[::-1]]), y=np.concatenate([high, low[::-1]]),
+                fill='toself', fillcolor=color, opacity=0.2, line=dict(width=0),
+                hoverinfo='skip', showlegend=False, legendgroup=name, name=f'{name} min/max'
+            ))
+        x, y = lttb(x, y, point_budget)
+    fig.add_trace(_trace_class(fig, len(y))(x=x, y=y, name=name, legendgroup=name, **trace_kwargs))
+    return fig
+
+
+def add_band(fig, x, lower, upper, name=None, point_budget=POINT_BUDGET, **trace_kwargs):
+    """Ajouter une bande (intervalle de confiance) ; réduite, elle garde les extrêmes"""
+    x = np.asarray(x)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    if point_budget and len(x) > point_budget:
+        x, lower, _ = minmax_envelope(x, lower, point_budget // 4)
+        _, _, upper = minmax_envelope(np.arange(len(upper)), upper, point_budget // 4)
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([x, x[::-1]]), y=np.concatenate([upper, lower[::-1]]),
+        fill='toself', name=name, **trace_kwargs
+    ))
+    return fig
@@ -0,0 +1,275 @@
+import random
+import threading
+import time
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ConnectorError(Exception):
+    """Erreur définitive lors d'un appel à un système source"""
+
+
+class RateLimiter:
+    """Limiteur de débit à seau de jetons, partagé entre threads"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, rate))
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Bloquer jusqu'à obtention d'un jeton"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RestConnector:
+    """Connecteur REST générique : pool de connexions, retries, pagination paresseuse"""
+
+    system_name = "API REST"
+    # Pagination : 'page' (numéro de page), 'offset' ou 'cursor' (lien suivant)
+    pagination = "page"
+    page_param = "page"
+    size_param = "per_page"
+    offset_param = "offset"
+    cursor_param = "cursor"
+    records_key = "items"
+    next_key = "next"
+    first_page = 1
+
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url, token=None, page_size=500, max_retries=5,
+                 backoff_factor=0.5, max_backoff=30.0, rate_limit=None,
+                 timeout=30, pool_size=10, headers=None, metrics=None, logs=None):
+        self.base_url = base_url.rstrip('/')
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.metrics = metrics
+        self.logs = logs
+
+        # Une session unique réutilise les connexions TCP/TLS du pool
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept': 'application/json'})
+        if token:
+            self.session.headers['Authorization'] = f'Bearer {token}'
+        if headers:
+            self.session.headers.update(headers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _url(self, path):
+        if path.startswith('http://') or path.startswith('https://'):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _backoff(self, attempt, response=None):
+        """Délai exponentiel avec gigue, en respectant Retry-After si fourni"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.max_backoff)
+                except ValueError:
+                    pass
+        delay = self.backoff_factor * (2 ** attempt)
+        return min(delay, self.max_backoff) * (0.5 + random.random() / 2)
+
+    def request(self, method, path, **kwargs):
+        """Appel HTTP avec retries sur erreurs réseau et statuts transitoires"""
+        kwargs.setdefault('timeout', self.timeout)
+        url = self._url(path)
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.max_retries:
+                    self._log(method, 'error', str(exc))
+                    raise ConnectorError(f"{self.system_name}: {exc}") from exc
+                self._log(method, 'warning', f"Nouvelle tentative {attempt + 1}: {type(exc).__name__}")
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if response.status_code in self.retry_statuses and attempt < self.max_retries:
+                self._log(method, 'warning', f"Nouvelle tentative {attempt + 1}: HTTP {response.status_code}")
+                time.sleep(self._backoff(attempt, response))
+                continue
+            if response.status_code >= 400:
+                self._log(method, 'error', f"HTTP {response.status_code} sur {url}")
+                raise ConnectorError(
+                    f"{self.system_name}: HTTP {response.status_code} sur {url}"
+                )
+            return response
+
+    def _log(self, action, status, details):
+        if self.logs is not None:
+            self.logs.append(self.system_name, action, status, details)
+
+    def get_json(self, path, params=None):
+        return self.request('GET', path, params=params).json()
+
+    def probe(self, path='', **kwargs):
+        """Tester la connexion ; retourne (succès, latence en ms).
+
+        Les arguments nommés (``auth=(utilisateur, mot_de_passe)``...) sont passés à la seule
+        requête de test : la session, partagée, n'est jamais modifiée.
+        """
+        start = time.perf_counter()
+        try:
+            response = self.request('GET', path, **kwargs)
+            ok, nbytes = True, len(response.content)
+        except ConnectorError:
+            ok, nbytes = False, 0
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._log('Test connexion', 'success' if ok else 'error', f"{latency_ms:.0f} ms")
+        if self.metrics is not None:
+            self.metrics.record(self.system_name, 'probe', latency_ms, ok=ok, nbytes=nbytes)
+        return ok, latency_ms
+
+    def fetch_page(self, path, params=None):
+        """Récupérer une page (payload JSON, records), mesurée si un store est branché"""
+        if self.metrics is None:
+            payload = self.get_json(path, params=params)
+            return payload, self.extract_records(payload)
+        with self.metrics.timer(self.system_name, 'page') as measure:
+            response = self.request('GET', path, params=params)
+            payload = response.json()
+            records = self.extract_records(payload)
+            measure['bytes'] = len(response.content)
+            measure['rows'] = len(records)
+        return payload, records
+
+    def extract_records(self, payload):
+        if isinstance(payload, list):
+            return payload
+        return payload.get(self.records_key) or []
+
+    def iter_pages(self, path, params=None):
+        """Générateur paresseux : une page de records à la fois"""
+        params = dict(params or {})
+        params[self.size_param] = self.page_size
+
+        if self.pagination == 'cursor':
+            url = path
+            while url:
+                payload, records = self.fetch_page(url, params=params)
+                if records:
+                    yield records
+                next_ref = payload.get(self.next_key) if isinstance(payload, dict) else None
+                if not next_ref:
+                    return
+                # Le curseur est soit une URL complète, soit un jeton opaque
+                if next_ref.startswith('http') or next_ref.startswith('/'):
+                    url, params = next_ref, None
+                else:
+                    params = {**(params or {}), self.cursor_param: next_ref}
+            return
+
+        position = self.first_page if self.pagination == 'page' else 0
+        while True:
+            if self.pagination == 'page':
+                params[self.page_param] = position
+            else:
+                params[self.offset_param] = position
+            _, records = self.fetch_page(path, params=params)
+            if not records:
+                return
+            yield records
+            if len(records) < self.page_size:
+                return
+            position += 1 if self.pagination == 'page' else len(records)
+
+    def iter_records(self, path, params=None):
+        for page in self.iter_pages(path, params):
+            yield from page
+
+    def iter_batches(self, path, params=None, batch_rows=50_000, columns=None):
+        """Accumuler les pages en lots colonnes (DataFrame) de taille bornée"""
+        buffer = {}
+        n_rows = 0
+        for page in self.iter_pages(path, params):
+            if not buffer:
+                keys = columns or list(page[0].keys())
+                buffer = {key: [] for key in keys}
+            for key, values in buffer.items():
+                values.extend(record.get(key) for record in page)
+            n_rows += len(page)
+            if n_rows >= batch_rows:
+                yield pd.DataFrame(buffer)
+                buffer = {key: [] for key in buffer}
+                n_rows = 0
+        if n_rows:
+            yield pd.DataFrame(buffer)
+
+    def fetch_dataframe(self, path, params=None, columns=None):
+        batches = list(self.iter_batches(path, params, columns=columns))
+        if not batches:
+            return pd.DataFrame(columns=columns or [])
+        return pd.concat(batches, ignore_index=True)
+
+
+class SageX3Connector(RestConnector):
+    """API REST Sage X3 (pagination par lien suivant)"""
+
+    system_name = "Sage X3"
+    pagination = "cursor"
+    size_param = "count"
+    records_key = "$resources"
+    next_key = "$next"
+
+
+class CrmConnector(RestConnector):
+    """API CRM (Salesforce, HubSpot) paginée par curseur"""
+
+    system_name = "CRM"
+    pagination = "cursor"
+    size_param = "limit"
+    cursor_param = "after"
+    records_key = "results"
+    next_key = "next"
+
+
+class BiConnector(RestConnector):
+    """API BI (Power BI, Tableau) paginée par offset"""
+
+    system_name = "BI"
+    pagination = "offset"
+    size_param = "top"
+    offset_param = "skip"
+    records_key = "value"
+
+
+CONNECTOR_TYPES = {
+    'Sage': SageX3Connector,
+    'CRM': CrmConnector,
+    'BI': BiConnector,
+    'Autre': RestConnector,
+}
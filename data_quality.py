@@ -0,0 +1,371 @@
+"""Contrôle qualité des données importées : règles déclaratives évaluées par blocs.
+
+Les règles de chaque fait (RULES) sont de simples dictionnaires :
+
+    {'nom': "compte hors plan comptable", 'controle': 'reference',
+     'colonnes': ['compte'], 'referentiel': 'plan_comptable', 'prefixe': True}
+
+Contrôles disponibles : non_nul, plage (min/max), reference (valeurs d'un
+référentiel, par préfixe pour les comptes), dates (bornes et cohérence avec
+la période de partition) et equilibre (débit = crédit par écriture). Chaque
+contrôle est une opération vectorisée sur les colonnes d'un bloc ; sur une
+colonne catégorielle, il est évalué une fois par modalité puis propagé par
+les codes. L'équilibre des écritures est cumulé d'un bloc à l'autre : seules
+les écritures encore ouvertes sont conservées entre deux blocs.
+
+Une violation de niveau « rejet » (par défaut) rend la ligne invalide ; une
+« alerte » est seulement signalée. Les violations sont comptées par règle et
+un échantillon borné en garde les références de ligne (numéro de ligne du
+fichier à l'import, rang dans la tranche pour l'entrepôt).
+
+Exemples :
+    python data_quality.py ecritures
+    python data_quality.py ecritures --debut 2024-01 --fin 2025-01 --entite SIEGE
+    python data_quality.py ecritures --plan-comptable plan_comptable.csv
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from history_store import CASH_CATEGORIES, HISTORY_ROOT, HistoryStore
+
+MAX_SAMPLES = 20  # lignes d'exemple conservées par règle
+CHUNK_ROWS = 500_000
+
+# Comptes du plan comptable général utilisés par les budgets (racines : les sous-comptes sont acceptés)
+PLAN_COMPTABLE = {
+    '101': "Capital", '106': "Réserves", '120': "Résultat de l'exercice", '164': "Emprunts",
+    '211': "Terrains", '213': "Constructions", '215': "Installations techniques", '218': "Autres immobilisations",
+    '281': "Amortissements des immobilisations", '31': "Matières premières", '35': "Stocks de produits",
+    '37': "Stocks de marchandises", '401': "Fournisseurs", '404': "Fournisseurs d'immobilisations",
+    '411': "Clients", '416': "Clients douteux", '421': "Personnel - rémunérations dues",
+    '431': "Sécurité sociale", '437': "Autres organismes sociaux", '445': "État - TVA",
+    '455': "Associés - comptes courants", '467': "Autres débiteurs et créditeurs", '512': "Banques",
+    '530': "Caisse", '580': "Virements internes", '601': "Achats de matières premières",
+    '602': "Achats d'autres approvisionnements", '603': "Variation des stocks", '604': "Achats de prestations",
+    '606': "Achats non stockés", '607': "Achats de marchandises", '611': "Sous-traitance", '613': "Locations",
+    '615': "Entretien et réparations", '616': "Assurances", '621': "Personnel extérieur",
+    '622': "Honoraires", '623': "Publicité", '625': "Déplacements", '626': "Frais postaux et télécommunications",
+    '627': "Services bancaires", '631': "Impôts sur rémunérations", '635': "Autres impôts et taxes",
+    '641': "Rémunérations du personnel", '645': "Charges sociales", '661': "Charges d'intérêts",
+    '665': "Escomptes accordés", '671': "Charges exceptionnelles", '681': "Dotations aux amortissements",
+    '701': "Ventes de produits finis", '706': "Prestations de services", '707': "Ventes de marchandises",
+    '708': "Produits des activités annexes", '761': "Produits financiers", '765': "Escomptes obtenus",
+    '771': "Produits exceptionnels", '781': "Reprises sur amortissements",
+}
+
+REFERENTIELS = {
+    'plan_comptable': set(PLAN_COMPTABLE),
+    'categories_tresorerie': {*CASH_CATEGORIES.values(), 'Autres', 'Encaissements', 'Décaissements'},
+    'mouvements_stock': {'entree', 'sortie'},
+}
+
+DATE_MIN = '2000-01-01'
+
+RULES = {
+    'ecritures': [
+        {'nom': "champ obligatoire manquant", 'controle': 'non_nul', 'colonnes': ['date', 'compte', 'debit', 'credit']},
+        {'nom': "montant négatif", 'controle': 'plage', 'colonnes': ['debit', 'credit'], 'min': 0},
+        {'nom': "compte hors plan comptable", 'controle': 'reference', 'colonnes': ['compte'],
+         'referentiel': 'plan_comptable', 'prefixe': True},
+        {'nom': "date incohérente", 'controle': 'dates', 'colonnes': ['date'], 'min': DATE_MIN, 'futur_jours': 366},
+        {'nom': "écriture déséquilibrée", 'controle': 'equilibre', 'cle': ['journal', 'piece', 'date'],
+         'debit': 'debit', 'credit': 'credit', 'tolerance': 0.01, 'niveau': 'alerte'},
+    ],
+    'ventes': [
+        {'nom': "champ obligatoire manquant", 'controle': 'non_nul', 'colonnes': ['date', 'sku', 'quantite', 'montant_ht']},
+        {'nom': "quantité nulle ou négative", 'controle': 'plage', 'colonnes': ['quantite'], 'min': 1},
+        {'nom': "prix négatif", 'controle': 'plage', 'colonnes': ['prix_unitaire'], 'min': 0},
+        {'nom': "date incohérente", 'controle': 'dates', 'colonnes': ['date'], 'min': DATE_MIN, 'futur_jours': 366},
+    ],
+    'mouvements_stock': [
+        {'nom': "champ obligatoire manquant", 'controle': 'non_nul', 'colonnes': ['date', 'sku', 'quantite']},
+        {'nom': "type de mouvement inconnu", 'controle': 'reference', 'colonnes': ['mouvement'],
+         'referentiel': 'mouvements_stock'},
+        {'nom': "date incohérente", 'controle': 'dates', 'colonnes': ['date'], 'min': DATE_MIN, 'futur_jours': 366},
+    ],
+    'tresorerie': [
+        {'nom': "champ obligatoire manquant", 'controle': 'non_nul', 'colonnes': ['date', 'categorie', 'montant']},
+        {'nom': "catégorie de trésorerie inconnue", 'controle': 'reference', 'colonnes': ['categorie'],
+         'referentiel': 'categories_tresorerie', 'niveau': 'alerte'},
+        {'nom': "date incohérente", 'controle': 'dates', 'colonnes': ['date'], 'min': DATE_MIN, 'futur_jours': 366},
+    ],
+}
+
+
+def _per_value(values, predicate):
+    """predicate(valeurs) -> booléens ; une seule évaluation par modalité d'une colonne catégorielle
+
+    Les valeurs manquantes donnent False.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        result = np.asarray(predicate(pd.Series(values.cat.categories.astype(str))), dtype=bool)
+        # Code -1 (manquant) : dernier élément ajouté, False
+        return np.append(result, False)[values.cat.codes.to_numpy()]
+    present = values.notna().to_numpy()
+    result = np.zeros(len(values), dtype=bool)
+    result[present] = np.asarray(predicate(values[present].astype(str)), dtype=bool)
+    return result
+
+
+def _missing(values):
+    missing = values.isna().to_numpy(copy=True)
+    if not (pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values)):
+        missing |= _per_value(values, lambda text: text.str.strip().eq(''))
+    return missing
+
+
+def check_not_null(df, rule, referentiels):
+    for column in rule['colonnes']:
+        yield column, _missing(df[column]) if column in df else np.ones(len(df), dtype=bool)
+
+
+def check_range(df, rule, referentiels):
+    for column in rule['colonnes']:
+        if column not in df:
+            continue
+        values = df[column].to_numpy(dtype='float64', na_value=np.nan)
+        mask = np.zeros(len(df), dtype=bool)
+        if 'min' in rule:
+            mask |= values < rule['min']
+        if 'max' in rule:
+            mask |= values > rule['max']
+        yield column, mask
+
+
+def check_reference(df, rule, referentiels):
+    reference = referentiels[rule['referentiel']]
+    if rule.get('prefixe'):
+        lengths = {}
+        for code in reference:
+            lengths.setdefault(len(code), set()).add(code)
+
+        def known(text):
+            text = text.str.strip()
+            found = np.zeros(len(text), dtype=bool)
+            for length, codes in lengths.items():
+                found |= text.str[:length].isin(codes).to_numpy()
+            return found
+    else:
+        def known(text):
+            return text.isin(reference).to_numpy()
+
+    for column in rule['colonnes']:
+        if column not in df:
+            continue
+        values = df[column]
+        # Valeurs manquantes : relevées par non_nul
+        yield column, ~_per_value(values, known) & ~_missing(values)
+
+
+def check_dates(df, rule, referentiels):
+    today = pd.Timestamp.today().normalize()
+    for column in rule['colonnes']:
+        if column not in df:
+            continue
+        dates = df[column].to_numpy(dtype='datetime64[ns]')
+        mask = dates < np.datetime64(pd.Timestamp(rule.get('min', DATE_MIN)))
+        if 'futur_jours' in rule:
+            mask |= dates > np.datetime64(today + pd.Timedelta(days=rule['futur_jours']))
+        # Date hors de la période de sa partition (lecture de l'entrepôt)
+        if 'periode' in df:
+            periodes = df['periode']
+            if isinstance(periodes.dtype, pd.CategoricalDtype):
+                months = pd.to_datetime(periodes.cat.categories.astype(str) + '-01').to_numpy()
+                expected = np.append(months.astype('datetime64[M]'), np.datetime64('NaT', 'M'))[
+                    periodes.cat.codes.to_numpy()]
+            else:
+                expected = pd.to_datetime(periodes.astype(str) + '-01', errors='coerce').to_numpy() \
+                    .astype('datetime64[M]')
+            mask |= (dates.astype('datetime64[M]') != expected) & ~np.isnat(dates)
+        yield column, mask
+
+
+CHECKS = {
+    'non_nul': check_not_null,
+    'plage': check_range,
+    'reference': check_reference,
+    'dates': check_dates,
+}
+
+
+def _label(value):
+    return f'{value:%Y-%m-%d}' if isinstance(value, pd.Timestamp) else str(value)
+
+
+class Validator:
+    """Application des règles d'un fait à une suite de blocs ; bilan par finish()"""
+
+    def __init__(self, fact, rules=None, referentiels=None, max_samples=MAX_SAMPLES):
+        self.rules = rules if rules is not None else RULES[fact]
+        self.referentiels = {**REFERENTIELS, **(referentiels or {})}
+        self.max_samples = max_samples
+        self.counts = {rule['nom']: 0 for rule in self.rules}
+        self.samples = {rule['nom']: [] for rule in self.rules}
+        self.open_entries = {}
+        self.rows = 0
+        self.invalid = 0
+        self.started = time.perf_counter()
+
+    def validate(self, df, balance=True):
+        """Contrôler un bloc ; retourne le masque des lignes sans violation de niveau « rejet »
+
+        L'index de df sert de référence de ligne dans les violations. L'équilibre
+        porte sur les seules lignes retenues ; balance=False le laisse à
+        check_balance(), appelé sur les lignes effectivement importées.
+        """
+        rejected = np.zeros(len(df), dtype=bool)
+        for rule in self.rules:
+            if rule['controle'] == 'equilibre':
+                continue
+            for column, mask in CHECKS[rule['controle']](df, rule, self.referentiels):
+                count = int(mask.sum())
+                if not count:
+                    continue
+                self.counts[rule['nom']] += count
+                self._sample(rule['nom'], column, df, mask)
+                if rule.get('niveau', 'rejet') == 'rejet':
+                    rejected |= mask
+        self.rows += len(df)
+        self.invalid += int(rejected.sum())
+        if balance:
+            self.check_balance(df[~rejected])
+        return ~rejected
+
+    def check_balance(self, df):
+        """Cumuler l'équilibre débit = crédit des écritures sur les lignes de df"""
+        for rule in self.rules:
+            if rule['controle'] == 'equilibre':
+                self._accumulate_balance(df, rule)
+
+    def _sample(self, name, column, df, mask):
+        room = self.max_samples - sum(len(sample) for sample in self.samples[name])
+        if room <= 0:
+            return
+        positions = np.flatnonzero(mask)[:room]
+        values = df[column].iloc[positions] if column in df else pd.Series(None, index=df.index[positions])
+        self.samples[name].append(pd.DataFrame({
+            'ligne': df.index[positions], 'regle': name, 'colonne': column,
+            'valeur': values.astype(str).to_numpy(),
+        }))
+
+    def _accumulate_balance(self, df, rule):
+        """Soldes débit - crédit par écriture, cumulés avec les écritures restées ouvertes"""
+        keys = [key for key in rule['cle'] if key in df]
+        balance = pd.DataFrame({
+            'solde': df[rule['debit']].to_numpy(dtype='float64', na_value=0.0)
+            - df[rule['credit']].to_numpy(dtype='float64', na_value=0.0),
+            'ligne': df.index.to_numpy(),
+        })
+        by = [df[key].reset_index(drop=True) for key in keys]
+        grouped = balance.groupby(by, observed=True, sort=False, dropna=False).agg(
+            solde=('solde', 'sum'), ligne=('ligne', 'min')).reset_index()
+        # Clés catégorielles converties sur le seul résultat groupé (catégories différentes d'un bloc à l'autre)
+        for key in keys:
+            if isinstance(grouped[key].dtype, pd.CategoricalDtype):
+                grouped[key] = grouped[key].astype(object)
+        previous = self.open_entries.get(rule['nom'])
+        if previous is not None and not previous.empty:
+            grouped = pd.concat([previous, grouped], ignore_index=True).groupby(
+                keys, sort=False, dropna=False).agg(solde=('solde', 'sum'), ligne=('ligne', 'min')).reset_index()
+        tolerance = rule.get('tolerance', 0.01)
+        self.open_entries[rule['nom']] = grouped[grouped['solde'].abs() > tolerance].reset_index(drop=True)
+
+    def finish(self):
+        """Bilan : lignes contrôlées, violations par règle et échantillon des lignes en cause"""
+        for rule in self.rules:
+            if rule['controle'] != 'equilibre':
+                continue
+            unbalanced = self.open_entries.pop(rule['nom'], pd.DataFrame(columns=['solde', 'ligne']))
+            self.counts[rule['nom']] = len(unbalanced)
+            keys = [key for key in rule['cle'] if key in unbalanced]
+            head = unbalanced.head(self.max_samples)
+            if not head.empty:
+                self.samples[rule['nom']].append(pd.DataFrame({
+                    'ligne': head['ligne'].to_numpy(), 'regle': rule['nom'], 'colonne': ', '.join(keys),
+                    'valeur': [f"{' / '.join(_label(row[key]) for key in keys)} : solde {row['solde']:,.2f}"
+                               for _, row in head.iterrows()],
+                }))
+        samples = [sample for parts in self.samples.values() for sample in parts]
+        return {
+            'lignes': self.rows,
+            'lignes_invalides': self.invalid,
+            'violations': self.counts,
+            'niveaux': {rule['nom']: rule.get('niveau', 'rejet') for rule in self.rules},
+            'echantillon': (pd.concat(samples, ignore_index=True) if samples
+                            else pd.DataFrame(columns=['ligne', 'regle', 'colonne', 'valeur'])),
+            'duree_s': round(time.perf_counter() - self.started, 2),
+        }
+
+
+def validate_frame(df, fact, rules=None, referentiels=None):
+    """Contrôler un DataFrame d'un bloc ; retourne (masque des lignes valides, bilan)"""
+    validator = Validator(fact, rules, referentiels)
+    valid = validator.validate(df)
+    return valid, validator.finish()
+
+
+def validate_store(fact, start=None, end=None, entites=None, root=HISTORY_ROOT, referentiels=None,
+                   chunk_rows=CHUNK_ROWS, progress=None):
+    """Contrôler une tranche d'un fait de l'entrepôt, par blocs de chunk_rows lignes
+
+    progress(fraction, message) est appelé après chaque bloc. Les références de
+    ligne sont les rangs dans la tranche parcourue.
+    """
+    store = HistoryStore(root)
+    parts = store.partitions(fact)
+    if start is not None:
+        parts = parts[parts['periode'] >= f'{pd.Timestamp(start):%Y-%m}']
+    if end is not None:
+        parts = parts[parts['periode'] <= f'{pd.Timestamp(end):%Y-%m}']
+    if entites is not None:
+        parts = parts[parts['entite'].isin([str(code) for code in entites])]
+    total = max(int(parts['lignes'].sum()), 1)
+
+    validator = Validator(fact, referentiels=referentiels)
+    for chunk in store.iter_chunks(fact, start=start, end=end, entites=entites, chunk_rows=chunk_rows):
+        chunk.index = pd.RangeIndex(validator.rows, validator.rows + len(chunk))
+        validator.validate(chunk)
+        if progress is not None:
+            progress(validator.rows / total, f"{validator.rows:,} lignes contrôlées")
+    return validator.finish()
+
+
+def load_chart_of_accounts(path):
+    """Référentiel des comptes depuis un CSV (colonne « compte », séparateur détecté)"""
+    chart = pd.read_csv(path, sep=None, engine='python', dtype=str)
+    column = next((name for name in chart.columns if name.strip().lower() == 'compte'), chart.columns[0])
+    return set(chart[column].dropna().str.strip())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('fait', choices=list(RULES))
+    parser.add_argument('--debut', help="première période (AAAA-MM)")
+    parser.add_argument('--fin', help="fin de la tranche, exclue (AAAA-MM)")
+    parser.add_argument('--entite', action='append', help="entité à contrôler (répétable)")
+    parser.add_argument('--root', default=HISTORY_ROOT, help="répertoire de l'entrepôt")
+    parser.add_argument('--plan-comptable', help="CSV du plan comptable (colonne compte)")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="lignes contrôlées par bloc")
+    args = parser.parse_args(argv)
+
+    referentiels = {'plan_comptable': load_chart_of_accounts(args.plan_comptable)} if args.plan_comptable else None
+    report = validate_store(args.fait, args.debut, args.fin, args.entite, args.root, referentiels,
+                            args.chunk_rows)
+    print(f"{args.fait} : {report['lignes']:,} lignes contrôlées en {report['duree_s']:.2f}s, "
+          f"{report['lignes_invalides']:,} invalides")
+    for name, count in report['violations'].items():
+        level = "alerte" if report['niveaux'][name] == 'alerte' else "rejet"
+        print(f"  {name:<36} {count:>12,}  ({level})")
+    if not report['echantillon'].empty:
+        print(report['echantillon'].to_string(index=False, max_rows=40))
+    return 1 if report['lignes_invalides'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Tableaux paginés côté serveur.
+
+st.dataframe(df.style.format(...)) fait générer par pandas le rendu de chaque
+cellule du jeu complet, puis l'envoie entièrement au navigateur. Ici le tri et
+la pagination sont faits sur le serveur, sur toutes les lignes, et seule la
+page visible est envoyée ; le formatage des nombres passe par
+st.column_config et s'applique dans le navigateur.
+"""
+import math
+import re
+
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 500]
+INITIAL_ORDER = "(ordre initial)"
+
+_STYLER_FORMAT = re.compile(r'\{:(,?)(\.\d+)?([dfe%])?\}')
+
+
+def printf_format(fmt):
+    """Format Styler ('{:,.1f} k€') converti au format printf de column_config ('%,.1f k€')"""
+    match = _STYLER_FORMAT.search(fmt)
+    if match is None:
+        return fmt
+    if match.group(3) == '%':
+        return 'percent'
+    spec = f"%{match.group(1)}{match.group(2) or ''}{match.group(3) or 'f'}"
+    return fmt[:match.start()] + spec + fmt[match.end():]
+
+
+def column_formats(formats):
+    """column_config équivalent à un dictionnaire de formats Styler {colonne: format}"""
+    return {column: st.column_config.NumberColumn(format=printf_format(fmt))
+            for column, fmt in formats.items()}
+
+
+@st.cache_data(max_entries=32)
+def sort_order(df, column, ascending):
+    """Positions des lignes triées sur une colonne (tri stable, valeurs manquantes en fin)"""
+    return (df[column].reset_index(drop=True)
+            .sort_values(ascending=ascending, kind='stable', na_position='last')
+            .index.to_numpy())
+
+
+def paginated_table(df, key, formats=None, column_config=None, page_size=50, hide_index=None):
+    """Afficher df page par page (tri et pagination sur le serveur) ; retourne la page affichée"""
+    config = {**column_formats(formats or {}), **(column_config or {})}
+    total = len(df)
+    if total <= page_size:
+        # Jeu court : tout envoyer, le tri se fait dans le navigateur
+        st.dataframe(df, column_config=config, use_container_width=True, hide_index=hide_index)
+        return df
+
+    col_sort, col_order, col_size, col_page = st.columns([3, 2, 2, 2])
+    with col_sort:
+        sort_by = st.selectbox("Trier par", [INITIAL_ORDER] + list(df.columns), key=f'{key}_sort')
+    with col_order:
+        descending = st.toggle("Décroissant", key=f'{key}_desc')
+    with col_size:
+        sizes = sorted(set(PAGE_SIZES) | {page_size})
+        size = st.selectbox("Lignes par page", sizes, index=sizes.index(page_size),
+                            key=f'{key}_size')
+    n_pages = max(math.ceil(total / size), 1)
+    # Un filtre plus restrictif peut rendre la page mémorisée hors limites
+    if st.session_state.get(f'{key}_page', 1) > n_pages:
+        st.session_state[f'{key}_page'] = n_pages
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1,
+                               key=f'{key}_page')
+
+    start = (page - 1) * size
+    stop = min(start + size, total)
+    if sort_by == INITIAL_ORDER:
+        window = df.iloc[start:stop]
+    else:
+        window = df.iloc[sort_order(df, sort_by, not descending)[start:stop]]
+    st.dataframe(window, column_config=config, use_container_width=True, hide_index=hide_index)
+    st.caption(f"Lignes {start + 1:,} à {stop:,} sur {total:,} (page {page:,} / {n_pages:,})")
+    return window
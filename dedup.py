@@ -0,0 +1,336 @@
+"""Dédoublonnage des lignes ingérées dans l'entrepôt d'historique.
+
+Les synchronisations et réimports renvoient des enregistrements déjà reçus
+(fenêtres qui se chevauchent, fichier réimporté avec quelques lignes en
+plus). Chaque ligne reçoit une empreinte stable de 64 bits calculée sur les
+colonnes clés du fait (DEDUP_KEYS), par le hachage vectorisé de pandas
+(SipHash) sur des valeurs normalisées : dates en nanosecondes, montants en
+centimes, textes tels quels (catégories ou chaînes donnent la même empreinte).
+
+Des lignes identiques dans une même source sont légitimes (deux ventes
+identiques le même jour) : la k-ième occurrence d'une même clé reçoit une
+empreinte distincte. Réimporter une source ne retient donc que ce qu'elle
+contient de plus que les imports précédents.
+
+Les empreintes déjà ingérées sont conservées par (fait, entité, période) :
+
+    <racine>/.empreintes/<fait>/entite=<code>/periode=AAAA-MM/part-<horodatage>.npy
+
+Un bloc n'est comparé qu'aux périodes qu'il touche (cache borné en lignes),
+par tables de hachage : O(n) par bloc, mémoire bornée par l'index des
+périodes touchées. La table des empreintes ingérées d'une période est
+construite une fois par import ; les rangs d'occurrence déjà attribués par
+l'import sont tenus dans un dictionnaire par période, mis à jour sur place
+avec les seules clés du bloc. Les empreintes d'un import sont écrites dans
+la zone de préparation de l'import, puis publiées avec ses données.
+
+Exemples :
+    python dedup.py info
+    python dedup.py rebuild ecritures --entite SIEGE
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from history_store import (FACTS, HISTORY_ROOT, HistoryStore, check_inside, check_partition_value,
+                           period_label)
+
+INDEX_DIR = '.empreintes'
+RANKS_DIR = '.rangs'  # rangs d'occurrence d'un import évincés du cache (zone de préparation)
+CACHE_ROWS = 10_000_000  # empreintes gardées en mémoire pendant un import
+
+# Colonnes qui identifient un enregistrement de chaque fait
+DEDUP_KEYS = {
+    'ecritures': ['date', 'journal', 'compte', 'piece', 'libelle', 'debit', 'credit'],
+    'ventes': ['date', 'sku', 'client_id', 'quantite', 'montant_ht'],
+    'mouvements_stock': ['date', 'sku', 'mouvement', 'quantite'],
+    'tresorerie': ['date', 'categorie', 'libelle', 'montant'],
+}
+
+# Multiplicateur de Fibonacci (2^64 / nombre d'or) : rangs d'occurrence dispersés sur 64 bits
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def row_hashes(df, keys):
+    """Empreinte 64 bits des colonnes clés de chaque ligne (vectorisé)"""
+    canonical = {}
+    for key in keys:
+        values = df[key]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            canonical[key] = values.to_numpy(dtype='datetime64[ns]').view('int64')
+        elif pd.api.types.is_numeric_dtype(values):
+            # Centimes : 12.5 et 12.50 (ou 3 et 3.0) donnent la même empreinte
+            amounts = np.round(values.to_numpy(dtype='float64', na_value=np.nan) * 100)
+            canonical[key] = np.where(np.isnan(amounts), np.iinfo(np.int64).min, amounts).astype('int64')
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            # Hachage des seules modalités ; valeur manquante comptée comme texte vide
+            if values.hasnans:
+                if '' not in values.cat.categories:
+                    values = values.cat.add_categories([''])
+                values = values.fillna('')
+            canonical[key] = values.reset_index(drop=True)
+        else:
+            canonical[key] = values.astype('string').fillna('').to_numpy(dtype=object)
+    return pd.util.hash_pandas_object(pd.DataFrame(canonical), index=False).to_numpy()
+
+
+def _mix(hashes, occurrence):
+    """Empreinte de la k-ième occurrence d'une clé (k = 0 : empreinte de la clé)"""
+    return hashes ^ (occurrence.astype(np.uint64) * _GOLDEN)
+
+
+def _contains(index, values):
+    return index.get_indexer(values) >= 0 if len(index) else np.zeros(len(values), dtype=bool)
+
+
+def _distinct(values):
+    """Valeurs distinctes triées (tri puis masque : plus rapide que np.unique sur des uint64)"""
+    values = np.sort(values)
+    return values[np.concatenate(([True], values[1:] != values[:-1]))] if len(values) else values
+
+
+def fingerprints(hashes, ranks=None):
+    """Empreintes d'un bloc : rang d'occurrence de chaque clé, à la suite des blocs précédents
+
+    ranks (dict clé -> rang de sa prochaine occurrence) porte les rangs déjà
+    attribués par les blocs précédents de la même source ; il est mis à jour
+    en ne consultant que les clés distinctes du bloc.
+    """
+    codes, keys = pd.factorize(hashes)
+    duplicated = len(keys) < len(hashes)
+    occurrence = pd.Series(codes).groupby(codes, sort=False).cumcount().to_numpy() if duplicated \
+        else np.zeros(len(hashes), dtype=np.int64)
+    if ranks is not None:
+        keys = keys.tolist()
+        offset = np.fromiter((ranks.get(key, 0) for key in keys), dtype=np.int64, count=len(keys))
+        counts = np.bincount(codes, minlength=len(keys)) if duplicated else 1
+        ranks.update(zip(keys, (offset + counts).tolist()))
+        occurrence = occurrence + offset[codes]
+    return _mix(hashes, occurrence)
+
+
+class FingerprintIndex:
+    """Empreintes ingérées d'un fait pour une entité, en fichiers .npy par période"""
+
+    def __init__(self, root, fact, entite):
+        if fact not in DEDUP_KEYS:
+            raise ValueError(f"Fait inconnu : {fact} (choix : {', '.join(DEDUP_KEYS)})")
+        self.root = root
+        self.fact = fact
+        self.entite = check_partition_value(entite)
+        self.base = check_inside(root, os.path.join(root, INDEX_DIR, fact, f'entite={self.entite}'))
+
+    def _dir(self, periode):
+        """Répertoire d'une période ; valeur contrôlée avant toute écriture ou suppression"""
+        return check_inside(self.root, os.path.join(self.base, f'periode={check_partition_value(periode)}'))
+
+    def _files(self, periode):
+        directory = self._dir(periode)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                      if name.endswith('.npy') and not name.startswith('.'))
+
+    def periods(self):
+        if not os.path.isdir(self.base):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.base) if name.startswith('periode='))
+
+    def load(self, periode):
+        """Empreintes distinctes d'une période (triées)"""
+        files = self._files(periode)
+        if not files:
+            return np.empty(0, dtype=np.uint64)
+        return _distinct(np.concatenate([np.load(path) for path in files]))
+
+    def add(self, periode, values):
+        """Écriture atomique d'un fichier d'empreintes"""
+        directory = self._dir(periode)
+        os.makedirs(directory, exist_ok=True)
+        name = f'part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.npy'
+        tmp = os.path.join(directory, f'.{name}.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, np.asarray(values, dtype=np.uint64))
+        os.replace(tmp, os.path.join(directory, name))
+
+    def replace(self, periode, values):
+        """Remplacer les empreintes d'une période"""
+        old = self._files(periode)
+        self.add(periode, values)
+        for path in old:
+            os.remove(path)
+
+    def merge(self, staging, replace=False):
+        """Déplacer les empreintes d'un index de préparation ; retourne les périodes touchées"""
+        touched = []
+        for periode in staging.periods():
+            if replace:
+                for path in self._files(periode):
+                    os.remove(path)
+            os.makedirs(self._dir(periode), exist_ok=True)
+            for path in staging._files(periode):
+                os.replace(path, os.path.join(self._dir(periode), os.path.basename(path)))
+            touched.append(periode)
+        return touched
+
+    def compact(self, periods=None):
+        """Un seul fichier d'empreintes distinctes par période"""
+        for periode in periods if periods is not None else self.periods():
+            if len(self._files(periode)) > 1:
+                self.replace(periode, self.load(periode))
+
+    def size(self):
+        return sum(np.load(path, mmap_mode='r').shape[0]
+                   for periode in self.periods() for path in self._files(periode))
+
+
+class Deduplicator:
+    """Filtre des lignes déjà ingérées pour un import vers l'entrepôt
+
+    filter(df) retourne le masque des lignes nouvelles d'un bloc et note ses
+    empreintes dans l'index de préparation (staging_root) ; publish() les
+    verse dans l'index de l'entrepôt une fois les données publiées.
+    replace=True (partitions remplacées) : aucune ligne n'est écartée et
+    l'index des périodes touchées est remplacé par celui de l'import.
+    """
+
+    def __init__(self, fact, entite, root=HISTORY_ROOT, staging_root=None, keys=None, replace=False,
+                 cache_rows=CACHE_ROWS):
+        self.keys = list(keys or DEDUP_KEYS[fact])
+        self.index = FingerprintIndex(root, fact, entite)
+        # Sans zone de préparation fournie : répertoire temporaire propre au filtre, supprimé à la fin
+        self.own_staging = staging_root is None
+        self.staging = FingerprintIndex(staging_root or os.path.join(root, f'.dedup-{uuid.uuid4().hex[:12]}'),
+                                        fact, entite)
+        self.replace = replace
+        self.cache_rows = cache_rows
+        self.cache = OrderedDict()
+        self.duplicates = 0
+
+    def _ranks_path(self, periode):
+        return os.path.join(self.staging.base, RANKS_DIR, f'{check_partition_value(periode)}.npz')
+
+    def _cached(self, kind, periode):
+        """État d'une période, gardé en cache LRU borné en lignes
+
+        'entrepot' : empreintes ingérées (pd.Index, table de hachage construite
+        une fois) ; 'import' : rangs des clés déjà reçues de la source (dict,
+        modifié sur place), sauvegardés dans la zone de préparation à l'éviction.
+        """
+        key = (kind, periode)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if kind == 'entrepot':
+            values = pd.Index(self.index.load(periode))
+        elif os.path.exists(self._ranks_path(periode)):
+            with np.load(self._ranks_path(periode)) as saved:
+                values = dict(zip(saved['cles'].tolist(), saved['rangs'].tolist()))
+        else:
+            values = {}
+        self.cache[key] = values
+        self._evict(keep=key)
+        return values
+
+    def _evict(self, keep):
+        while len(self.cache) > 1 and sum(len(values) for values in self.cache.values()) > self.cache_rows:
+            key, values = next(iter(self.cache.items()))
+            if key == keep:
+                break
+            del self.cache[key]
+            if key[0] == 'import':
+                path = self._ranks_path(key[1])
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                np.savez(path, cles=np.fromiter(values.keys(), dtype=np.uint64, count=len(values)),
+                         rangs=np.fromiter(values.values(), dtype=np.int64, count=len(values)))
+
+    def filter(self, df):
+        """Masque des lignes de df absentes de l'entrepôt et des blocs précédents"""
+        keep = np.ones(len(df), dtype=bool)
+        if df.empty:
+            return keep
+        hashes = row_hashes(df, self.keys)
+        # Regroupement sur les mois (entiers) : libellés AAAA-MM calculés pour les seules périodes du bloc
+        codes, months = pd.factorize(pd.to_datetime(df['date']).to_numpy().astype('datetime64[M]'),
+                                     use_na_sentinel=False)
+        labels = period_label(months)
+        for code, positions in pd.Series(codes).groupby(codes, sort=False).indices.items():
+            periode = labels[code]
+            # Toutes les occurrences de la source sont retenues : rangs suivants pour les blocs à venir
+            values = fingerprints(hashes[positions], self._cached('import', periode))
+            if not self.replace:
+                keep[positions] = ~_contains(self._cached('entrepot', periode), values)
+            self.staging.add(periode, values)
+            self._evict(keep=('entrepot', periode))
+        self.duplicates += int((~keep).sum())
+        return keep
+
+    def publish(self):
+        """Verser les empreintes de l'import dans l'index de l'entrepôt ; retourne les périodes touchées"""
+        touched = self.index.merge(self.staging, replace=self.replace)
+        self.index.compact(touched)
+        self.discard()
+        return touched
+
+    def discard(self):
+        """Abandonner les empreintes de l'import (import annulé ou en erreur)"""
+        shutil.rmtree(self.staging.root if self.own_staging else self.staging.base, ignore_errors=True)
+        self.cache.clear()
+
+
+def rebuild_index(fact, entite, root=HISTORY_ROOT, keys=None):
+    """Reconstruire l'index d'une entité depuis les données de l'entrepôt, période par période
+
+    Pour les faits chargés sans dédoublonnage (history_store import, versions antérieures).
+    Retourne le nombre d'empreintes écrites.
+    """
+    keys = list(keys or DEDUP_KEYS[fact])
+    store = HistoryStore(root)
+    index = FingerprintIndex(root, fact, entite)
+    parts = store.partitions(fact)
+    total = 0
+    for periode in sorted(parts.loc[parts['entite'] == str(entite), 'periode']):
+        start = pd.Timestamp(f'{periode}-01')
+        df = store.read(fact, columns=keys, start=start, end=start + pd.offsets.MonthBegin(),
+                        entites=[entite])
+        values = fingerprints(row_hashes(df, keys))
+        index.replace(periode, _distinct(values))
+        total += len(df)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--root', default=HISTORY_ROOT, help="répertoire de l'entrepôt")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('info', help="empreintes indexées par fait et entité")
+    rebuild = commands.add_parser('rebuild', help="reconstruire l'index depuis l'entrepôt")
+    rebuild.add_argument('facts', nargs='*', default=list(DEDUP_KEYS))
+    rebuild.add_argument('--entite', action='append', help="entité (toutes par défaut, répétable)")
+    args = parser.parse_args(argv)
+
+    store = HistoryStore(args.root)
+    started = time.perf_counter()
+    for fact in (args.facts if args.command == 'rebuild' else DEDUP_KEYS):
+        entites = sorted(store.partitions(fact)['entite'].unique()) if fact in FACTS else []
+        for entite in (args.entite or entites) if args.command == 'rebuild' else entites:
+            if args.command == 'rebuild':
+                print(f"{fact:<18} {entite:<12} {rebuild_index(fact, entite, args.root):>12,} lignes indexées")
+            else:
+                index = FingerprintIndex(args.root, fact, entite)
+                print(f"{fact:<18} {entite:<12} {index.size():>12,} empreintes, {len(index.periods())} périodes")
+    print(f"Terminé en {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
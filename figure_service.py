@@ -0,0 +1,117 @@
+"""Rendu des figures matplotlib en images PNG/SVG mises en cache.
+
+Un graphique est décrit par une fonction de tracé `draw(fig, *args, **kwargs)`
+et ses paramètres. La figure est créée hors de pyplot (aucune référence
+globale conservée d'un rerun à l'autre), rendue en octets puis vidée dans un
+bloc finally. Les octets sont gardés dans un LRU mémoire borné, partagé par
+toutes les sessions du processus, et dans le cache disque de result_cache :
+un même graphique avec les mêmes entrées n'est tracé qu'une fois.
+"""
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import streamlit as st
+
+import result_cache
+
+MEMORY_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_DPI = 100
+DEFAULT_FIGSIZE = (10, 6)
+
+
+@contextmanager
+def managed_figure(figsize=DEFAULT_FIGSIZE):
+    """Figure matplotlib hors pyplot, vidée en sortie de bloc (aucune référence globale)"""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    try:
+        yield fig
+    finally:
+        fig.clear()
+
+
+def draw_to_bytes(draw, args=(), kwargs=None, fmt='png', dpi=DEFAULT_DPI, figsize=DEFAULT_FIGSIZE):
+    """Tracer une figure et la rendre en octets ; la figure est toujours libérée"""
+    with managed_figure(figsize) as fig:
+        draw(fig, *args, **(kwargs or {}))
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+        return buffer.getvalue()
+
+
+class FigureService:
+    """Rendus matplotlib mis en cache (mémoire LRU puis disque)"""
+
+    def __init__(self, max_bytes=MEMORY_MAX_BYTES, disk_cache=None, persist=True):
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self.persist = persist
+        self.lock = threading.Lock()
+        self.renders = OrderedDict()
+        self.size = 0
+        self.counters = {'memory_hits': 0, 'disk_hits': 0, 'renders': 0}
+
+    def _disk(self):
+        if not self.persist:
+            return None
+        if self.disk_cache is None:
+            self.disk_cache = result_cache.default_cache()
+        return self.disk_cache
+
+    def _remember(self, key, data):
+        with self.lock:
+            if key in self.renders:
+                return
+            self.renders[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self.renders) > 1:
+                _, evicted = self.renders.popitem(last=False)
+                self.size -= len(evicted)
+
+    def render(self, draw, args=(), kwargs=None, fmt='png', dpi=DEFAULT_DPI, figsize=DEFAULT_FIGSIZE):
+        """Octets de l'image (PNG ou SVG) du graphique draw(fig, *args, **kwargs)"""
+        kwargs = kwargs or {}
+        key = result_cache.make_key(draw, args, {'kwargs': kwargs, 'fmt': fmt, 'dpi': dpi,
+                                                 'figsize': tuple(figsize)})
+        with self.lock:
+            data = self.renders.get(key)
+            if data is not None:
+                self.renders.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return data
+
+        disk = self._disk()
+        found, data = disk.get(key) if disk is not None else (False, None)
+        if found:
+            self.counters['disk_hits'] += 1
+        else:
+            data = draw_to_bytes(draw, args, kwargs, fmt=fmt, dpi=dpi, figsize=figsize)
+            self.counters['renders'] += 1
+            if disk is not None:
+                disk.put(key, data, func=f'figure:{draw.__module__}.{draw.__qualname__}')
+        self._remember(key, data)
+        return data
+
+    def clear(self):
+        with self.lock:
+            self.renders.clear()
+            self.size = 0
+
+    def stats(self):
+        with self.lock:
+            return {**self.counters, 'entries': len(self.renders), 'bytes': self.size}
+
+
+@st.cache_resource
+def get_figure_service():
+    """Service partagé par toutes les sessions du serveur"""
+    return FigureService()
+
+
+def show_figure(draw, *args, fmt='png', figsize=DEFAULT_FIGSIZE, **kwargs):
+    """Afficher dans la page le graphique draw(fig, *args, **kwargs)"""
+    data = get_figure_service().render(draw, args, kwargs, fmt=fmt, figsize=figsize)
+    st.image(data.decode() if fmt == 'svg' else data, use_container_width=True)
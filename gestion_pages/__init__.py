@@ -0,0 +1,60 @@
+"""Pages de l'application projet_gestion.py.
+
+Chaque page vit dans son propre module et n'est importée qu'à la première
+navigation vers elle : le démarrage et chaque rerun n'exécutent que le module
+de la page affichée. L'ordre de PAGES est celui du menu latéral ; les pages
+marquées admin n'y figurent que pour une session administrateur.
+"""
+import importlib
+from collections import namedtuple
+
+from perf_monitor import timed_page
+from profiler import is_admin, profiled
+
+Page = namedtuple('Page', ['label', 'module', 'function', 'admin'], defaults=[False])
+
+PAGES = [
+    Page("🏠 Accueil", 'home', 'show_home'),
+    Page("📈 Contrôle de Gestion", 'controle_gestion', 'show_controle_gestion'),
+    Page("💰 Budget des Ventes", 'budget_ventes', 'show_budget_ventes'),
+    Page("🏭 Budget de Production", 'budget_production', 'show_budget_production'),
+    Page("📦 Gestion des Stocks", 'gestion_stocks', 'show_gestion_stocks'),
+    Page("🏗️ Budget d'Investissement", 'budget_investissement', 'show_budget_investissement'),
+    Page("💸 Budget de Trésorerie", 'budget_tresorerie', 'show_budget_tresorerie'),
+    Page("🔄 Processus Complet", 'processus_complet', 'show_processus_complet'),
+    Page("📅 Plan d'Implémentation", 'plan_implementation', 'show_plan_implementation'),
+    Page("🚀 Aller Plus Loin", 'advanced_features', 'show_advanced_features'),
+    Page("🏠 Tableau de Bord Executive", 'executive_dashboard', 'show_executive_dashboard'),
+    Page("🔗 Centre d'Intégration Systèmes", 'integration_center', 'show_integration_center'),
+    Page("🤖 Automatisation Intelligente", 'intelligent_automation', 'show_intelligent_automation'),
+    Page("📚 Centre de Connaissances", 'knowledge_center', 'show_knowledge_center'),
+    Page("💰 Budget des Ventes IA", 'ai_sales_budget', 'show_ai_sales_budget'),
+    Page("🏭 Production Optimisée", 'optimized_production', 'show_optimized_production'),
+    Page("📦 Gestion Stocks Avancée", 'advanced_stock_management', 'show_advanced_stock_management'),
+    Page("🏗️ Investissement Stratégique", 'strategic_investment', 'show_strategic_investment'),
+    Page("💸 Trésorerie Prédictive", 'predictive_cashflow', 'show_predictive_cashflow'),
+    Page("📊 Reporting Executive", 'executive_reporting', 'show_executive_reporting'),
+    Page("📥 Import de Données", 'data_import', 'show_data_import'),
+    Page("⏱️ Performance", 'performance', 'show_performance', admin=True),
+]
+
+PAGES_BY_LABEL = {page.label: page for page in PAGES}
+
+
+def visible_pages():
+    """Pages du menu de la session (pages d'administration réservées aux administrateurs)"""
+    admin = is_admin()
+    return [page for page in PAGES if admin or not page.admin]
+
+
+def load_page(label):
+    """Fonction d'affichage d'une page, importée à la demande (puis depuis sys.modules)"""
+    page = PAGES_BY_LABEL[label]
+    module = importlib.import_module(f'{__name__}.{page.module}')
+    return getattr(module, page.function)
+
+
+def render_page(label):
+    """Afficher une page ; durée du rendu enregistrée, profil cProfile sur demande"""
+    with timed_page(label), profiled(label):
+        load_page(label)()
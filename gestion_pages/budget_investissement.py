@@ -0,0 +1,34 @@
+"""Page « 🏗️ Budget d'Investissement »."""
+import streamlit as st
+
+def show_budget_investissement():
+    st.title("🏗️ Budget d'Investissement")
+    
+    st.markdown("""
+    ## Planification des Investissements
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Nouvel Investissement")
+        investment_name = st.text_input("Nom de l'investissement", "Nouvelle Machine")
+        investment_amount = st.number_input("Montant de l'investissement (€)", value=50000)
+        lifespan = st.number_input("Durée de vie (années)", value=5)
+        annual_cashflow = st.number_input("Cash-flow Annuel Attendu (€)", value=15000)
+    
+    with col2:
+        st.subheader("Analyse de Rentabilité")
+        
+        # Simple ROI calculation
+        total_return = annual_cashflow * lifespan
+        roi = (total_return - investment_amount) / investment_amount * 100
+        payback_period = investment_amount / annual_cashflow
+        
+        st.metric("Return on Investment (ROI)", f"{roi:.1f}%")
+        st.metric("Délai de Récupération", f"{payback_period:.1f} ans")
+        
+        if roi > 15:
+            st.success("✅ Investissement intéressant")
+        else:
+            st.warning("⚠️ Investissement à reconsidérer")
@@ -0,0 +1,30 @@
+"""Page « 🏭 Budget de Production »."""
+import streamlit as st
+
+def show_budget_production():
+    st.title("🏭 Budget de Production")
+    
+    st.markdown("""
+    ## Budget de Production
+    
+    Le budget de production découle directement du budget des ventes et de la politique de stock.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Données d'Entrée")
+        sales_forecast = st.number_input("Prévision des Ventes (unités)", value=1000)
+        initial_stock = st.number_input("Stock Initial (unités)", value=100)
+        target_stock = st.number_input("Stock Cible Final (unités)", value=120)
+        
+    with col2:
+        st.subheader("Calcul de Production")
+        # Production = Ventes prévues + Stock cible - Stock initial
+        production_needed = sales_forecast + target_stock - initial_stock
+        
+        st.metric("Production Nécessaire", f"{production_needed} unités")
+        
+        cost_per_unit = st.number_input("Coût de Production Unitaire (€)", value=50.0)
+        total_production_cost = production_needed * cost_per_unit
+        st.metric("Coût Total de Production", f"{total_production_cost:,.0f} €")
@@ -0,0 +1,58 @@
+"""Page « 💸 Budget de Trésorerie »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from data_table import paginated_table
+
+@st.cache_data(max_entries=128)
+def cash_flow_projection(initial_cash, monthly_income, monthly_expenses, exceptional_expense):
+    """Trésorerie mensuelle cumulée (dépense exceptionnelle en juin) et son graphique"""
+    months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
+    
+    # Calculate cash flow
+    cash_flow = [initial_cash]
+    for i in range(12):
+        if i == 5:  # June - exceptional expense
+            monthly_cash = cash_flow[i] + monthly_income - monthly_expenses - exceptional_expense
+        else:
+            monthly_cash = cash_flow[i] + monthly_income - monthly_expenses
+        cash_flow.append(monthly_cash)
+    
+    # Create DataFrame for display
+    cash_data = {
+        'Mois': ['Initial'] + months,
+        'Trésorerie (k€)': cash_flow
+    }
+    df_cash = pd.DataFrame(cash_data)
+    
+    # Cash flow chart
+    fig = px.line(df_cash, x='Mois', y='Trésorerie (k€)', 
+                 title='Évolution Prévisionnelle de la Trésorerie',
+                 markers=True)
+    return df_cash, fig
+
+def show_budget_tresorerie():
+    st.title("💸 Budget de Trésorerie")
+    
+    st.markdown("""
+    ## Prévision de Trésorerie
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Encaissements")
+        initial_cash = st.number_input("Trésorerie Initiale (k€)", value=50.0)
+        monthly_income = st.number_input("Encaissements Mensuels Moyens (k€)", value=80.0)
+    
+    with col2:
+        st.subheader("Décaissements")
+        monthly_expenses = st.number_input("Décaissements Mensuels Moyens (k€)", value=75.0)
+        exceptional_expense = st.number_input("Dépense Exceptionnelle (k€, mois 6)", value=30.0)
+    
+    df_cash, fig = cash_flow_projection(initial_cash, monthly_income, monthly_expenses,
+                                        exceptional_expense)
+    
+    paginated_table(df_cash, key='budget_tresorerie', formats={'Trésorerie (k€)': '{:,.1f}'})
+    st.plotly_chart(fig, use_container_width=True)
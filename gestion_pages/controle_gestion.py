@@ -0,0 +1,72 @@
+"""Page « 📈 Contrôle de Gestion »."""
+import streamlit as st
+
+def show_controle_gestion():
+    st.title("📈 Contrôle de Gestion")
+    
+    st.markdown("""
+    ## Le Rôle du Contrôle de Gestion
+    
+    Le contrôle de gestion est un pilier essentiel pour la performance de l'entreprise.
+    """)
+    
+    tab1, tab2, tab3 = st.tabs(["🎯 Mission", "📊 Outils", "🔍 Indicateurs"])
+    
+    with tab1:
+        st.subheader("Mission du Contrôleur de Gestion")
+        st.markdown("""
+        - **Piloter** la performance économique
+        - **Anticiper** les risques et opportunités  
+        - **Éclairer** la prise de décision
+        - **Coordonner** la construction budgétaire
+        - **Analyser** les écarts et proposer des correctifs
+        """)
+    
+    with tab2:
+        st.subheader("Outils du Contrôle de Gestion")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **📈 Outils de Prévision :**
+            - Budget des ventes
+            - Budget de production
+            - Budget de trésorerie
+            
+            **📋 Outils de Suivi :**
+            - Tableaux de bord
+            - Reporting mensuel
+            - Analyse des écarts
+            """)
+        
+        with col2:
+            st.markdown("""
+            **🎯 Outils d'Aide à la Décision :**
+            - Calculs de coûts
+            - Analyse de rentabilité
+            - Simulations business
+            
+            **🔍 Outils d'Analyse :**
+            - Ratios financiers
+            - Benchmarking
+            - Analyse trend
+            """)
+    
+    with tab3:
+        st.subheader("Indicateurs Clés de Performance")
+        
+        kpi_options = st.multiselect(
+            "Sélectionnez les KPI à afficher :",
+            ["Rentabilité", "Productivité", "Liquidité", "Efficacité Commerciale"],
+            default=["Rentabilité", "Productivité"]
+        )
+        
+        if "Rentabilité" in kpi_options:
+            with st.expander("📈 Indicateurs de Rentabilité"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.number_input("Marge commerciale (%)", min_value=0.0, value=32.5, step=0.1)
+                with col2:
+                    st.number_input("ROI (%)", min_value=0.0, value=15.2, step=0.1)
+                with col3:
+                    st.number_input("EBITDA (%)", min_value=0.0, value=18.7, step=0.1)
@@ -0,0 +1,166 @@
+"""Page « 📥 Import de Données »."""
+import os
+import time
+import uuid
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from budget_import import CACHE_DIR, TEMPLATES
+from data_quality import RULES
+from data_table import paginated_table
+from history_store import FACTS, HistoryStore, check_entity
+from job_tasks import import_task, quality_task
+from jobs import show_job, submit_job
+
+UPLOAD_DIR = os.path.join(CACHE_DIR, 'uploads')
+# Au-delà, un téléversement est orphelin (job interrompu avec son processus) : il est supprimé
+UPLOAD_MAX_AGE = 24 * 3600
+
+
+def purge_uploads(max_age=UPLOAD_MAX_AGE):
+    """Supprimer les téléversements plus anciens que max_age secondes"""
+    if not os.path.isdir(UPLOAD_DIR):
+        return
+    limit = time.time() - max_age
+    for entry in os.scandir(UPLOAD_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < limit:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # supprimé entre-temps par la fin de son job
+
+
+def show_data_import():
+    st.title("📥 Import de Données")
+    st.caption("Import par blocs de relevés de trésorerie, grands livres et lignes de ventes "
+               "(CSV ou Excel) dans l'entrepôt d'historique.")
+
+    uploaded = st.file_uploader("Fichier à importer:", type=['csv', 'xlsx'])
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        template = st.selectbox("Modèle:", [None, *TEMPLATES],
+                                format_func=lambda name: "Détection automatique" if name is None
+                                else TEMPLATES[name]['libelle'])
+    with col2:
+        entite = st.text_input("Entité:", value="SIEGE")
+    with col3:
+        annee = st.number_input("Année des relevés mensuels:", min_value=2000, max_value=2100,
+                                value=date.today().year)
+    replace = st.checkbox("Remplacer les périodes importées", value=False)
+    dedupe = st.checkbox("Écarter les lignes déjà présentes dans l'entrepôt", value=True)
+
+    try:
+        entite = check_entity(entite.strip() or "SIEGE")
+    except ValueError as error:
+        st.error(f"❌ {error}")
+        entite = None
+
+    if st.button("📥 Lancer l'import", type="primary", disabled=uploaded is None or entite is None):
+        # Le fichier est écrit sur disque : le processus de calcul le relit par blocs
+        purge_uploads()
+        os.makedirs(UPLOAD_DIR, exist_ok=True)
+        path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex[:8]}-{os.path.basename(uploaded.name)}")
+        with open(path, 'wb') as f:
+            for block in iter(lambda: uploaded.read(1 << 20), b''):
+                f.write(block)
+        submit_job('data_import', import_task, path, template, entite, int(annee),
+                   replace, dedupe, label=f"Import « {uploaded.name} »")
+    show_job('data_import', show_import_report)
+
+    show_store_summary()
+    show_quality_check()
+
+
+def show_import_report(report):
+    """Bilan d'un import : volumes, motifs de rejet et échantillon des lignes rejetées"""
+    if report['deja_importe']:
+        st.info(f"ℹ️ {report['fichier']} a déjà été importé ({report['lignes_importees']:,} lignes) : "
+                "aucune donnée ajoutée.")
+        return
+    st.success(f"✅ {report['fichier']} importé dans « {report['fait']} » ({report['entite']}).")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        st.metric("📄 Lignes lues", f"{report['lignes_lues']:,}")
+    with col2:
+        st.metric("✅ Lignes importées", f"{report['lignes_importees']:,}")
+    with col3:
+        st.metric("❌ Lignes rejetées", f"{report['lignes_rejetees']:,}")
+    with col4:
+        st.metric("♻️ Doublons écartés", f"{report['doublons']:,}")
+    with col5:
+        st.metric("⏱️ Durée", f"{report['duree_s']:.1f} s")
+    if report['periodes']:
+        st.caption(f"Périodes : {report['periodes'][0]} à {report['periodes'][-1]} "
+                   f"({report['partitions']} partitions)"
+                   + (" - schéma lu depuis le cache" if report['schema_en_cache'] else ""))
+    for warning in report['avertissements']:
+        st.warning(f"⚠️ {warning}")
+    if report['lignes_rejetees']:
+        st.subheader("❌ Lignes rejetées")
+        for reason, count in report['motifs'].items():
+            st.write(f"- {reason} : {count:,}")
+        paginated_table(report['rejets'], key='import_rejects', hide_index=True)
+
+
+def show_store_summary():
+    """Volumes de l'entrepôt d'historique par fait"""
+    st.subheader("🗄️ Entrepôt d'historique")
+    store = HistoryStore()
+    for fact in FACTS:
+        parts = store.partitions(fact)
+        if parts.empty:
+            st.write(f"**{fact}** : vide")
+            continue
+        st.write(f"**{fact}** : {parts['lignes'].sum():,} lignes, {len(parts)} partitions "
+                 f"({parts['periode'].min()} à {parts['periode'].max()}, "
+                 f"entités : {', '.join(sorted(parts['entite'].unique()))})")
+
+
+def show_quality_check():
+    """Contrôle qualité d'une tranche de l'entrepôt, en arrière-plan"""
+    st.subheader("🧪 Contrôle qualité")
+    store = HistoryStore()
+    col1, col2 = st.columns(2)
+    with col1:
+        fact = st.selectbox("Fait à contrôler:", list(RULES), key='quality_fact')
+    periods = store.periods(fact)
+    with col2:
+        if periods:
+            first, last = st.select_slider("Périodes:", options=periods, value=(periods[0], periods[-1]),
+                                           key='quality_periods')
+        else:
+            first = last = None
+            st.caption("Aucune donnée pour ce fait.")
+    with st.expander("📋 Règles appliquées"):
+        for rule in RULES[fact]:
+            level = "alerte" if rule.get('niveau') == 'alerte' else "rejet"
+            columns = ', '.join(rule.get('colonnes', rule.get('cle', [])))
+            st.write(f"- **{rule['nom']}** : {rule['controle']} ({columns}) - {level}")
+
+    if st.button("🧪 Lancer le contrôle", disabled=not periods):
+        end = (pd.Period(last, 'M') + 1).to_timestamp()
+        submit_job('data_quality', quality_task, fact, f'{first}-01', end, label=f"Contrôle « {fact} »")
+    show_job('data_quality', show_quality_report)
+
+
+def show_quality_report(report):
+    """Bilan du contrôle qualité : violations par règle et lignes en cause"""
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("📄 Lignes contrôlées", f"{report['lignes']:,}")
+    with col2:
+        st.metric("❌ Lignes invalides", f"{report['lignes_invalides']:,}")
+    with col3:
+        st.metric("⏱️ Durée", f"{report['duree_s']:.1f} s")
+    violations = pd.DataFrame({
+        'Règle': list(report['violations']),
+        'Niveau': [report['niveaux'][name] for name in report['violations']],
+        'Violations': list(report['violations'].values()),
+    })
+    st.dataframe(violations, use_container_width=True, hide_index=True)
+    if report['echantillon'].empty:
+        st.success("✅ Aucune violation.")
+    else:
+        paginated_table(report['echantillon'], key='quality_samples', hide_index=True)
@@ -0,0 +1,77 @@
+"""Page « 🏠 Tableau de Bord Executive »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+def show_executive_dashboard():
+    st.title("🏠 Tableau de Bord Executive")
+    
+    # KPI en temps réel
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📈 CA Cumulé", "2.8M €", "+15.2%", delta_color="inverse")
+        st.progress(0.85)
+    
+    with col2:
+        st.metric("🏭 Taux Rendement", "92.5%", "+3.2%")
+        st.progress(0.92)
+    
+    with col3:
+        st.metric("📦 Rotation Stocks", "8.2", "+1.5")
+        st.progress(0.75)
+    
+    with col4:
+        st.metric("💸 Trésorerie", "856K €", "+5.8%")
+        st.progress(0.68)
+    
+    # Alertes intelligentes
+    st.subheader("🚨 Alertes Intelligentes")
+    
+    alert_col1, alert_col2, alert_col3 = st.columns(3)
+    
+    with alert_col1:
+        with st.container(border=True):
+            st.error("**Dépassement Budget Production**")
+            st.write("Écart: +12.5% vs prévision")
+            st.button("Analyser", key="alert1")
+    
+    with alert_col2:
+        with st.container(border=True):
+            st.warning("**Niveau Stock Critique**")
+            st.write("Article A001: 2 jours restants")
+            st.button("Commander", key="alert2")
+    
+    with alert_col3:
+        with st.container(border=True):
+            st.success("**Opportunité Investissement**")
+            st.write("ROI potentiel: 22.3%")
+            st.button("Étudier", key="alert3")
+    
+    # Graphiques de performance
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Performance mensuelle
+        months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun']
+        revenue = [120, 135, 115, 145, 160, 155]
+        target = [110, 125, 120, 140, 150, 145]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='Réel', x=months, y=revenue))
+        fig.add_trace(go.Scatter(name='Objectif', x=months, y=target, mode='lines+markers'))
+        fig.update_layout(title='Performance Commerciale Mensuelle')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Répartition des coûts
+        costs = {
+            'Catégorie': ['Main d\'œuvre', 'Matériaux', 'Frais fixes', 'R&D', 'Marketing'],
+            'Montant': [450, 320, 180, 120, 90]
+        }
+        df_costs = pd.DataFrame(costs)
+        
+        fig = px.pie(df_costs, values='Montant', names='Catégorie', 
+                    title='Répartition des Coûts')
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,677 @@
+"""Page « 📊 Reporting Executive »."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import time
+import os
+import chart_data
+import report_engine
+from job_tasks import report_task
+from jobs import show_job, submit_job
+
+ANALYSIS_DAYS = {
+    "7 derniers jours": 7,
+    "30 derniers jours": 30,
+    "3 derniers mois": 91,
+    "6 derniers mois": 182,
+    "Année en cours": None,  # depuis le 1er janvier
+}
+
+@st.cache_data(ttl=300)
+def load_treasury_statement():
+    """Relevé de trésorerie de référence (budget_tresorerie.csv), relu au plus toutes les 5 min"""
+    return pd.read_csv('budget_tresorerie.csv') if os.path.exists('budget_tresorerie.csv') else None
+
+def show_executive_reporting():
+    st.title("📊 Reporting Executive")
+    
+    st.markdown("""
+    ## 🎯 Tableaux de Bord Directionnels Intelligents
+    
+    ### 📈 Synthèse Performance Globale avec Insights Automatisés
+    """)
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "🏠 Dashboard Executive", 
+        "📋 Rapports Automatisés", 
+        "📊 Analyse Comparative",
+        "🎯 KPI Personnalisés",
+        "⚙️ Contrôles"
+    ])
+    
+    with tab1:
+        show_executive_summary()
+    
+    with tab2:
+        show_automated_reports()
+    
+    with tab3:
+        show_comparative_analysis()
+    
+    with tab4:
+        show_kpi_dashboard()
+    
+    with tab5:
+        show_reporting_controls()
+
+def show_executive_summary():
+    st.header("🏠 Dashboard Executive")
+    
+    # Sélection de la période
+    col_period1, col_period2, col_period3 = st.columns(3)
+    with col_period1:
+        report_period = st.selectbox("Période", ["Mensuel", "Trimestriel", "Annuel"])
+    with col_period2:
+        comparison_type = st.selectbox("Comparaison", ["Vs Objectifs", "Vs Période Précédente", "Vs Année Précédente"])
+    with col_period3:
+        if st.button("🔄 Actualiser les Données"):
+            st.success("Données actualisées !")
+    
+    # KPI Principaux
+    st.subheader("🎯 Indicateurs de Performance Clés")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📈 Chiffre d'Affaires", "2.8M €", "+15.2%", delta_color="inverse")
+        st.metric("📊 Marge Brute", "32.5%", "+2.1%")
+    
+    with col2:
+        st.metric("🏭 Volume Production", "45.2K unités", "+8.7%")
+        st.metric("⚡ Taux Rendement", "92.5%", "+3.2%")
+    
+    with col3:
+        st.metric("📦 Rotation Stocks", "8.2", "+1.5")
+        st.metric("⏱️ Délai Livraison", "5.2 jours", "-0.8 jours")
+    
+    with col4:
+        st.metric("💸 Trésorerie", "856K €", "+5.8%")
+        st.metric("📉 Endettement Net", "1.8x EBITDA", "-0.3x")
+    
+    # Graphiques de Performance
+    st.subheader("📈 Évolution des Principaux Indicateurs")
+    
+    col_chart1, col_chart2 = st.columns(2)
+    
+    with col_chart1:
+        # Performance Commerciale
+        months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun']
+        actual_revenue = [450, 480, 520, 510, 550, 580]
+        target_revenue = [430, 460, 500, 520, 540, 560]
+    
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=months, y=actual_revenue, name='CA Réel', line=dict(color='blue')))
+        fig.add_trace(go.Scatter(x=months, y=target_revenue, name='Objectif', line=dict(color='red', dash='dash')))
+        fig.update_layout(title='Performance Commerciale vs Objectifs (k€)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col_chart2:
+        # Répartition des Coûts
+        cost_categories = {
+            'Catégorie': ['Main d\'œuvre', 'Matériaux', 'Frais fixes', 'R&D', 'Marketing'],
+            'Pourcentage': [35, 28, 15, 12, 10]
+        }
+    
+        fig = px.pie(cost_categories, values='Pourcentage', names='Catégorie', 
+                    title='Répartition des Coûts')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Points de Vigilance
+    st.subheader("🚨 Points de Vigilance et Alertes")
+    
+    alert_col1, alert_col2, alert_col3 = st.columns(3)
+    
+    with alert_col1:
+        with st.container(border=True):
+            st.error("**Dépassement Budget Production**")
+            st.write("Écart: +12.5% vs prévision")
+            st.progress(75)
+            st.button("Analyser les causes", key="alert_prod")
+    
+    with alert_col2:
+        with st.container(border=True):
+            st.warning("**Niveau Stock Critique**")
+            st.write("2 articles sous seuil sécurité")
+            st.progress(40)
+            st.button("Planifier commande", key="alert_stock")
+    
+    with alert_col3:
+        with st.container(border=True):
+            st.success("**Objectif CA Atteint**")
+            st.write("Dépassement: +3.6% vs objectif")
+            st.progress(100)  # objectif dépassé (103 %) : barre pleine
+            st.button("Voir détail", key="alert_ca")
+    
+    # Insights Automatisés
+    st.subheader("💡 Insights et Recommandations Automatisés")
+    
+    insights = [
+        "🎯 **Opportunité Croissance** : Le segment Premium montre une croissance de 25% - Recommandation: Augmenter l'allocation marketing de 15%",
+        "📊 **Optimisation Coûts** : Les frais généraux ont augmenté de 8% vs budget - Action: Revue des contrats fournisseurs",
+        "🔄 **Amélioration Process** : Le taux de rendement a progressé de 3.2% - Capitaliser sur les bonnes pratiques",
+        "💰 **Optimisation Trésorerie** : Excédent de trésorerie détecté - Opportunité: Investissement court terme"
+    ]
+    
+    for insight in insights:
+        st.info(insight)
+
+def show_automated_reports():
+    st.header("📋 Rapports Automatisés")
+    
+    st.markdown("""
+    ### 🎯 Génération et Personnalisation de Rapports
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📅 Rapports Programmes")
+    
+        scheduled_reports = {
+            'Type Rapport': ['Rapport Mensuel Performance', 'Analyse Budget vs Réel', 'Tableau de Bord Commercial', 'Analyse Trésorerie', 'Rapport Stocks'],
+            'Fréquence': ['Mensuel', 'Hebdomadaire', 'Quotidien', 'Hebdomadaire', 'Mensuel'],
+            'Prochaine Génération': ['01/02/2024', '22/01/2024', '16/01/2024', '19/01/2024', '01/02/2024'],
+            'Statut': ['🟢 Actif', '🟢 Actif', '🟡 Pause', '🟢 Actif', '🟢 Actif']
+        }
+    
+        st.dataframe(pd.DataFrame(scheduled_reports), use_container_width=True)
+    
+        st.subheader("🎨 Personnalisation")
+        report_format = st.selectbox("Format du rapport", ["PDF Professionnel", "PPT Présentation", "Excel Données", "HTML Interactif"])
+        detail_level = st.select_slider("Niveau de détail", ["Synthèse Executive", "Standard", "Détaillé", "Très détaillé"])
+    
+    with col2:
+        st.subheader("🚀 Génération de Rapport")
+    
+        report_type = st.selectbox("Type de rapport à générer:", report_engine.REPORT_TYPES)
+    
+        report_period = st.selectbox("Période du rapport:", [
+            "Mois en cours", "Trimestre en cours", "Année en cours", "Période personnalisée"
+        ])
+    
+        include_comparison = st.checkbox("Inclure analyse comparative", value=True)
+        include_recommendations = st.checkbox("Inclure recommandations", value=True)
+    
+        if st.button("📊 Générer le Rapport", type="primary"):
+            # Génération en arrière-plan : la page reste utilisable pendant l'écriture des fichiers
+            submit_job('executive_report', report_task, report_type, load_treasury_statement(),
+                       label=f"Rapport « {report_type} »")
+        show_job('executive_report', show_generated_report)
+
+def show_generated_report(result):
+    """Synthèse, aperçu et téléchargements d'un rapport généré"""
+    report_type, sheets, files = result['rapport'], result['feuilles'], result['fichiers']
+    st.success("✅ Rapport généré avec succès !")
+    st.dataframe(sheets['Synthèse'], use_container_width=True, hide_index=True)
+
+    # Aperçu du rapport
+    st.subheader("👁️ Aperçu du Rapport Généré")
+
+    with st.container(border=True):
+        st.markdown(f"""
+        **📈 RAPPORT DE PERFORMANCE - {report_type.upper()}**
+
+        **🎯 Synthèse Executive:**
+        - 📈 **CA Cumulé** : 2.8M € (+15.2% vs prévision)
+        - 🏭 **Production** : 45.2K unités (+8.7%)
+        - 💰 **Marge Brute** : 32.5% (+2.1 points)
+        - 📦 **Rotation Stocks** : 8.2 (+1.5)
+        - 💸 **Trésorerie** : 856K € (+5.8%)
+
+        **🚨 Points de Vigilance:**
+        - Dépassement budget production: +12.5%
+        - 2 articles en niveau stock critique
+        - Augmentation frais généraux: +8%
+
+        **📊 Recommandations Stratégiques:**
+        - Optimiser la gamme produits C
+        - Renégocier les conditions fournisseurs
+        - Investir dans la digitalisation des processus
+        - Renforcer le contrôle des coûts
+        """)
+
+    # Options de téléchargement
+    st.subheader("📥 Options de Téléchargement")
+
+    col_dl1, col_dl2, col_dl3 = st.columns(3)
+    with col_dl1:
+        st.download_button(
+            "📥 Télécharger PDF", 
+            data=files['pdf'], 
+            file_name=report_engine.report_filename(report_type, 'pdf'),
+            mime=report_engine.MIME_TYPES['pdf']
+        )
+    with col_dl2:
+        st.download_button(
+            "📊 Télécharger Excel", 
+            data=files['xlsx'],
+            file_name=report_engine.report_filename(report_type, 'xlsx'),
+            mime=report_engine.MIME_TYPES['xlsx']
+        )
+    with col_dl3:
+        if st.button("📧 Envoyer par Email"):
+            st.success("Rapport envoyé avec succès !")
+
+def show_comparative_analysis():
+    st.header("📊 Analyse Comparative")
+    
+    st.markdown("""
+    ### 🎯 Benchmarks et Analyses Comparatives Avancées
+    """)
+    
+    tab_comp1, tab_comp2, tab_comp3 = st.tabs(["📈 Vs Objectifs", "🔄 Vs Historique", "🌍 Vs Concurrents"])
+    
+    with tab_comp1:
+        st.subheader("📈 Performance vs Objectifs")
+    
+        # Données de comparaison
+        kpi_comparison = {
+            'KPI': ['Chiffre d\'Affaires', 'Marge Brute', 'Volume Production', 'Rotation Stocks', 'Taux Service Client'],
+            'Objectif': [2600000, 30.0, 42000, 7.5, 98.0],
+            'Réel': [2800000, 32.5, 45200, 8.2, 98.5],
+            'Écart (%)': ['+7.7%', '+8.3%', '+7.6%', '+9.3%', '+0.5%'],
+            'Statut': ['✅ Dépassé', '✅ Dépassé', '✅ Dépassé', '✅ Dépassé', '✅ Atteint']
+        }
+    
+        df_comparison = pd.DataFrame(kpi_comparison)
+        st.dataframe(df_comparison, use_container_width=True)
+    
+        # Graphique de performance
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='Objectif', x=df_comparison['KPI'], y=df_comparison['Objectif']))
+        fig.add_trace(go.Bar(name='Réel', x=df_comparison['KPI'], y=df_comparison['Réel']))
+        fig.update_layout(title='Performance vs Objectifs', barmode='group')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with tab_comp2:
+        st.subheader("🔄 Évolution vs Période Précédente")
+    
+        col_hist1, col_hist2 = st.columns(2)
+    
+        with col_hist1:
+            comparison_period = st.selectbox("Période de comparaison:", [
+                "Mois précédent", "Trimestre précédent", "Même période année dernière"
+            ])
+    
+            # Métriques de croissance
+            growth_data = {
+                'Indicateur': ['CA', 'Marge', 'Production', 'Productivité', 'Rentabilité'],
+                'Croissance': ['+15.2%', '+8.3%', '+12.7%', '+5.8%', '+9.1%'],
+                'Tendance': ['📈 Hausse', '📈 Hausse', '📈 Hausse', '📈 Hausse', '📈 Hausse']
+            }
+    
+            st.dataframe(pd.DataFrame(growth_data), use_container_width=True)
+    
+        with col_hist2:
+            # Graphique d'évolution
+            periods = ['T-3', 'T-2', 'T-1', 'T0']
+            revenue_evolution = [2200, 2350, 2450, 2800]  # en k€
+    
+            fig = px.line(x=periods, y=revenue_evolution, 
+                         title='Évolution du Chiffre d\'Affaires (k€)',
+                         markers=True)
+            fig.update_traces(line=dict(color='green', width=3))
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with tab_comp3:
+        st.subheader("🌍 Benchmark Sectoriel")
+    
+        st.markdown("""
+        **📊 Comparaison avec les Concurrents et Moyenne Secteur:**
+        """)
+    
+        benchmark_data = {
+            'Indicateur': ['Part de Marché', 'Croissance CA', 'Marge Brute', 'ROI', 'Productivité'],
+            'Notre Entreprise': ['12.5%', '15.2%', '32.5%', '18.5%', '92.5%'],
+            'Concurrent A': ['15.2%', '12.8%', '28.7%', '16.2%', '88.3%'],
+            'Concurrent B': ['10.8%', '8.5%', '30.2%', '15.8%', '90.1%'],
+            'Moyenne Secteur': ['12.8%', '11.2%', '29.8%', '16.5%', '89.7%']
+        }
+    
+        st.dataframe(pd.DataFrame(benchmark_data), use_container_width=True)
+    
+        # Radar chart de comparaison
+        categories = ['Part de Marché', 'Croissance', 'Marge', 'ROI', 'Productivité']
+        our_company = [12.5, 15.2, 32.5, 18.5, 92.5]
+        sector_avg = [12.8, 11.2, 29.8, 16.5, 89.7]
+    
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=our_company,
+            theta=categories,
+            fill='toself',
+            name='Notre Entreprise'
+        ))
+        fig.add_trace(go.Scatterpolar(
+            r=sector_avg,
+            theta=categories,
+            fill='toself',
+            name='Moyenne Secteur'
+        ))
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True)),
+            showlegend=True,
+            title="Positionnement Concurrentiel"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_kpi_dashboard():
+    st.header("🎯 Tableau de Bord des KPI Personnalisés")
+    
+    st.markdown("""
+    ### 📊 Monitoring des Indicateurs Clés en Temps Réel
+    """)
+    
+    # Tuiles KPI et graphiques sont deux fragments : un widget ne réexécute que son groupe
+    show_kpi_tiles()
+    show_custom_charts()
+
+@st.fragment
+def show_kpi_tiles():
+    # Sélection des catégories de KPI
+    kpi_categories = st.multiselect(
+        "Catégories de KPI à afficher:",
+        ["Commercial", "Production", "Financier", "Stocks", "RH", "Qualité", "Innovation"],
+        default=["Commercial", "Production", "Financier"]
+    )
+    
+    # Affichage dynamique des KPI par catégorie
+    if "Commercial" in kpi_categories:
+        with st.expander("📈 KPI COMMERCIAL", expanded=True):
+            col_com1, col_com2, col_com3, col_com4 = st.columns(4)
+    
+            with col_com1:
+                st.metric("CA Cumulé", "2.8M €", "15.2%")
+                st.metric("Panier Moyen", "8,450 €", "3.2%")
+    
+            with col_com2:
+                st.metric("Nouvelles Affaires", "45", "12.5%")
+                st.metric("Taux Conversion", "22.5%", "2.1%")
+    
+            with col_com3:
+                st.metric("Pipeline Actif", "4.2M €", "8.7%")
+                st.metric("Cycle de Vente", "45 jours", "-3 jours")
+    
+            with col_com4:
+                st.metric("Satisfaction Client", "4.2/5", "0.3")
+                st.metric("Taux Fidélisation", "88.5%", "1.8%")
+    
+    if "Production" in kpi_categories:
+        with st.expander("🏭 KPI PRODUCTION", expanded=True):
+            col_prod1, col_prod2, col_prod3, col_prod4 = st.columns(4)
+    
+            with col_prod1:
+                st.metric("Volume Production", "45.2K unités", "8.7%")
+                st.metric("Taux Rendement", "92.5%", "3.2%")
+    
+            with col_prod2:
+                st.metric("TRS", "85.2%", "2.1%")
+                st.metric("Taux Rebut", "1.2%", "-0.3%")
+    
+            with col_prod3:
+                st.metric("Capacité Utilisée", "88.7%", "5.2%")
+                st.metric("Taux Maintenance", "95.8%", "1.5%")
+    
+            with col_prod4:
+                st.metric("Coût Unitaire", "245 €", "-2.8%")
+                st.metric("Productivité", "115.2%", "4.7%")
+    
+    if "Financier" in kpi_categories:
+        with st.expander("💰 KPI FINANCIER", expanded=True):
+            col_fin1, col_fin2, col_fin3, col_fin4 = st.columns(4)
+    
+            with col_fin1:
+                st.metric("Trésorerie", "856K €", "5.8%")
+                st.metric("Marge Brute", "32.5%", "2.1%")
+    
+            with col_fin2:
+                st.metric("BFR", "1.2M €", "-8.5%")
+                st.metric("ROI", "18.5%", "3.2%")
+    
+            with col_fin3:
+                st.metric("Délai Clients", "45 jours", "-2 jours")
+                st.metric("Délai Fournisseurs", "60 jours", "+5 jours")
+    
+            with col_fin4:
+                st.metric("Endettement Net", "1.8x EBITDA", "-0.3x")
+                st.metric("Cash-flow Libre", "450K €", "12.5%")
+
+@st.fragment
+def show_custom_charts():
+    # Tableau de bord personnalisable
+    st.subheader("📊 Tableau de Bord Personnalisable")
+    
+    col_custom1, col_custom2 = st.columns(2)
+    
+    with col_custom1:
+        # Sélection des graphiques
+        selected_charts = st.multiselect(
+            "Graphiques à afficher:",
+            ["Évolution CA", "Performance Production", "Analyse Marges", "Rotation Stocks", "Trésorerie", "Productivité"],
+            default=["Évolution CA", "Performance Production"]
+        )
+    
+    with col_custom2:
+        # Période d'analyse
+        analysis_period = st.selectbox(
+            "Période d'analyse:",
+            list(ANALYSIS_DAYS)
+        )
+    
+    # Génération des graphiques sélectionnés
+    if "Évolution CA" in selected_charts:
+        st.subheader("📈 Évolution du Chiffre d'Affaires")
+    
+        # Données simulées, une valeur par jour de la période choisie
+        n_days = ANALYSIS_DAYS[analysis_period] or pd.Timestamp.today().dayofyear
+        days = pd.date_range(end=pd.Timestamp.today().normalize(), periods=n_days, freq='D')
+        daily_revenue = 100 + np.random.normal(0, 20, n_days)
+        cumulative_revenue = np.cumsum(daily_revenue)
+    
+        # Au-delà du budget de points, les séries sont réduites (LTTB + enveloppe min/max)
+        fig = go.Figure()
+        chart_data.add_series(fig, days, daily_revenue, name='CA Quotidien', line=dict(color='blue'))
+        chart_data.add_series(fig, days, cumulative_revenue, name='CA Cumulé', line=dict(color='green'))
+        fig.update_layout(title=f'Évolution du Chiffre d\'Affaires ({analysis_period.lower()})')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    if "Performance Production" in selected_charts:
+        st.subheader("🏭 Performance de la Production")
+    
+        # Données simulées production
+        teams = ['Équipe A', 'Équipe B', 'Équipe C', 'Équipe D']
+        production = [1250, 1180, 1320, 1270]
+        targets = [1200, 1200, 1200, 1200]
+    
+        fig = go.Figure()
+        fig.add_trace(go.Bar(name='Production', x=teams, y=production))
+        fig.add_trace(go.Scatter(name='Objectif', x=teams, y=targets, mode='markers', 
+                               marker=dict(size=15, color='red')))
+        fig.update_layout(title='Performance des Équipes de Production')
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_reporting_controls():
+    st.header("⚙️ Contrôles et Objectifs")
+    
+    # Progress value handling - fixed
+    progress_value = 103  # Your calculated value
+    
+    if progress_value <= 100:
+        st.progress(progress_value)
+        st.write(f"Progress: {progress_value}%")
+    else:
+        st.progress(100)  # Show full bar
+        st.write(f"Target exceeded: {progress_value}%")
+        st.success("🎯 Target exceeded!")
+
+    # Controls section
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        with st.container(border=True):
+            st.subheader("💰 Contrôles Budget")
+            st.write("• Écarts budget")
+            st.write("• Engagements")
+            st.write("• Prévisions vs réel")
+            st.toggle("Activer", value=True, key="budget_controls")
+    
+    with col2:
+        with st.container(border=True):
+            st.subheader("📦 Contrôles Stock")
+            st.write("• Niveaux stock")
+            st.write("• Rotation")
+            st.write("• Obsolescence")
+            st.write("• Couverture")
+            st.toggle("Activer", value=True, key="stock_controls")
+    
+    with col3:
+        with st.container(border=True):
+            st.subheader("🏭 Contrôles Production")
+            st.write("• Rendements usine")
+            st.write("• Coûts standards")
+            st.write("• Qualité production")
+            st.write("• Capacités utilisées")
+            st.toggle("Activer", value=True, key="production_controls")
+    
+    # Configuration des règles de contrôle
+    st.subheader("⚙️ Configuration des Règles")
+    
+    config_col1, config_col2 = st.columns(2)
+    
+    with config_col1:
+        st.write("**📈 Règles Budget :**")
+        max_variance = st.slider("Écart budget max toléré (%)", 5, 25, 10, key="max_variance")
+        auto_lock_budget = st.checkbox("Verrouillage auto si écart > 15%", value=True, key="auto_lock")
+        
+        st.write("**📦 Règles Stock :**")
+        min_coverage = st.slider("Couverture stock minimum (jours)", 5, 30, 10, key="min_coverage")
+        max_obsolescence = st.slider("Âge max stock (mois)", 6, 24, 12, key="max_obsolescence")
+    
+    with config_col2:
+        st.write("**🏭 Règles Production :**")
+        min_efficiency = st.slider("Rendement minimum accepté (%)", 70, 95, 85, key="min_efficiency")
+        max_downtime = st.slider("Temps d'arrêt max (%)", 1, 15, 5, key="max_downtime")
+        
+        st.write("**🔍 Fréquence des Contrôles :**")
+        control_frequency = st.selectbox("Fréquence d'exécution", [
+            "Temps réel", "Quotidien", "Hebdomadaire", "Mensuel"
+        ], key="control_frequency")
+    
+    if st.button("💾 Appliquer la Configuration", key="apply_config"):
+        st.success("Configuration des contrôles appliquée!")
+        
+        # Simulation d'exécution des contrôles
+        with st.spinner("Exécution des contrôles en cours..."):
+            time.sleep(2)
+            
+            st.subheader("📊 Résultats des Contrôles")
+            control_results = {
+                'Contrôle': ['Budget Production', 'Stock Sécurité', 'Rendement Usine', 'Trésorerie'],
+                'Statut': ['✅ Conforme', '⚠️ Alerte', '✅ Conforme', '✅ Conforme'],
+                'Détails': ['Écart: 8.2%', 'Couverture: 2 jours', 'Rendement: 87%', 'Solde: 125K€'],
+                'Action': ['Surveillance', 'Commander urgence', 'Maintenance préventive', 'Aucune']
+            }
+            
+            st.dataframe(pd.DataFrame(control_results), use_container_width=True)
+
+    # Contrôles avancés avec IA
+    st.subheader("🤖 Contrôles Intelligents par IA")
+    
+    col_ai1, col_ai2 = st.columns(2)
+    
+    with col_ai1:
+        st.markdown("""
+        **🧠 Algorithmes de Contrôle :**
+        - **Détection d'anomalies** : Patterns inhabituels
+        - **Analyse prédictive** : Tendances futures
+        - **Reconnaissance de patterns** : Comportements récurrents
+        - **Classification automatique** : Catégorisation des écarts
+        """)
+        
+        st.markdown("""
+        **🎯 Applications :**
+        ```python
+        # Exemple de détection d'anomalie
+        from sklearn.ensemble import IsolationForest
+        
+        model = IsolationForest(contamination=0.1)
+        anomalies = model.fit_predict(financial_data)
+        alerts = financial_data[anomalies == -1]
+        ```
+        """)
+    
+    with col_ai2:
+        # Configuration des contrôles IA
+        st.subheader("⚙️ Paramètres IA")
+        
+        anomaly_threshold = st.slider("Seuil détection anomalies", 0.7, 1.0, 0.85, key="anomaly_threshold")
+        confidence_level = st.slider("Niveau confiance requis", 0.8, 0.99, 0.95, key="confidence_level")
+        auto_correction = st.checkbox("Correction automatique", value=False, key="auto_correction")
+        
+        if st.button("🔍 Tester les Contrôles IA", key="test_ai"):
+            with st.spinner("Analyse des données en cours..."):
+                time.sleep(3)
+                
+                st.success("✅ Analyse IA terminée !")
+                
+                # Résultats de l'analyse IA
+                ai_results = {
+                    'Type Analyse': ['Anomalies Budget', 'Patterns Stocks', 'Tendances Production', 'Risques Trésorerie'],
+                    'Résultat': ['3 anomalies détectées', 'Pattern saisonnier identifié', 'Tendance baissière', 'Risque faible'],
+                    'Confiance': ['92%', '88%', '85%', '96%'],
+                    'Action Recommandée': ['Révision budget', 'Ajustement stocks', 'Optimisation process', 'Surveillance normale']
+                }
+                
+                st.dataframe(pd.DataFrame(ai_results), use_container_width=True)
+                
+                # Graphique des anomalies détectées
+                st.subheader("📈 Visualisation des Anomalies")
+                
+                # Données simulées
+                days = list(range(1, 31))
+                normal_data = [100 + np.random.normal(0, 10) for _ in days]
+                # Ajout d'anomalies
+                anomaly_indices = [7, 15, 22]
+                for idx in anomaly_indices:
+                    normal_data[idx] += 40  # Valeur anormale
+                
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=days, y=normal_data, mode='lines+markers', 
+                                       name='Données', line=dict(color='blue')))
+                # Marquer les anomalies
+                anomaly_values = [normal_data[i] for i in anomaly_indices]
+                fig.add_trace(go.Scatter(x=[days[i] for i in anomaly_indices], 
+                                       y=anomaly_values, mode='markers',
+                                       name='Anomalies détectées', 
+                                       marker=dict(size=10, color='red', symbol='x')))
+                fig.update_layout(title='Détection Automatique des Anomalies')
+                st.plotly_chart(fig, use_container_width=True)
+
+    # Historique des contrôles
+    st.subheader("📝 Historique des Contrôles")
+    
+    control_history = {
+        'Date': ['15/01/2024 14:30', '15/01/2024 10:15', '14/01/2024 16:45', '14/01/2024 09:00'],
+        'Type Contrôle': ['Budget Production', 'Stock Sécurité', 'Rendement Usine', 'Trésorerie'],
+        'Résultat': ['✅ Conforme', '⚠️ Alerte', '✅ Conforme', '✅ Conforme'],
+        'Détails': ['Écart: 8.2%', 'Stock bas: Article A001', 'Rendement: 92%', 'Solde: 150K€'],
+        'Action': ['Surveillance', 'Commande lancée', 'Aucune', 'Aucune']
+    }
+    
+    st.dataframe(pd.DataFrame(control_history), use_container_width=True)
+    
+    # Statistiques des contrôles
+    st.subheader("📊 Statistiques des Contrôles")
+    
+    col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+    
+    with col_stat1:
+        st.metric("🔍 Contrôles Exécutés", "156")
+    with col_stat2:
+        st.metric("✅ Contrôles Conformes", "142", "91%")
+    with col_stat3:
+        st.metric("⚠️ Alertes Générées", "14", "9%")
+    with col_stat4:
+        st.metric("🚨 Interventions", "3", "2%")
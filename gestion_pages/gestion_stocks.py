@@ -0,0 +1,60 @@
+"""Page « 📦 Gestion des Stocks »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import math
+
+from data_table import paginated_table
+
+@st.cache_data
+def abc_analysis():
+    """Analyse ABC des articles (données d'exemple) et répartition de la valeur"""
+    abc_data = {
+        'Article': ['A001', 'A002', 'A003', 'A004', 'A005', 'A006', 'A007'],
+        'Valeur Stock (k€)': [45, 38, 22, 15, 8, 5, 2],
+        'Classe ABC': ['A', 'A', 'B', 'B', 'C', 'C', 'C']
+    }
+    
+    df_abc = pd.DataFrame(abc_data)
+    fig = px.pie(df_abc, values='Valeur Stock (k€)', names='Classe ABC',
+                title='Répartition ABC de la Valeur du Stock')
+    return df_abc, fig
+
+def show_gestion_stocks():
+    st.title("📦 Gestion des Stocks")
+    
+    st.markdown("""
+    ## Optimisation des Niveaux de Stock
+    """)
+    
+    tab1, tab2 = st.tabs(["📊 Politique de Stock", "📈 Analyse ABC"])
+    
+    with tab1:
+        st.subheader("Politique de Stock")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **Paramètres :**
+            """)
+            consumption = st.number_input("Consommation Annuelle (unités)", value=10000)
+            unit_cost = st.number_input("Coût Unitaire (€)", value=25.0)
+            order_cost = st.number_input("Coût de Commande (€)", value=150.0)
+            holding_rate = st.number_input("Taux de Détention (%)", value=20.0) / 100
+        
+        with col2:
+            # Calcul du lot économique (formule de Wilson)
+            eoq = math.sqrt((2 * consumption * order_cost) / (unit_cost * holding_rate))
+            st.metric("Lot Économique (EOQ)", f"{eoq:.0f} unités")
+            
+            # Nombre de commandes optimal
+            optimal_orders = consumption / eoq
+            st.metric("Nombre de Commandes Optimal", f"{optimal_orders:.1f}")
+    
+    with tab2:
+        st.subheader("Analyse ABC des Articles")
+        
+        df_abc, fig = abc_analysis()
+        paginated_table(df_abc, key='analyse_abc', formats={'Valeur Stock (k€)': '{:,.0f}'})
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,40 @@
+"""Page « 🏠 Accueil »."""
+import streamlit as st
+
+def show_home():
+    st.title("🏠 Système de Gestion Budgétaire")
+    
+    st.markdown("""
+    ## Bienvenue dans votre plateforme de contrôle de gestion
+    
+    Cette application vous accompagne dans l'élaboration et le suivi de tous vos budgets 
+    selon une approche professionnelle et structurée.
+    
+    ### 📋 Modules disponibles :
+    
+    **🎯 Budgets Opérationnels :**
+    - 📈 **Budget des Ventes** : Prévisions et analyse des ventes
+    - 🏭 **Budget de Production** : Planification de la production
+    - 📦 **Gestion des Stocks** : Optimisation des niveaux de stock
+    
+    **💰 Budgets Financiers :**
+    - 🏗️ **Budget d'Investissement** : Planification des immobilisations
+    - 💸 **Budget de Trésorerie** : Gestion des flux de liquidités
+    
+    **🔄 Processus Intégré :**
+    - 🔄 **Processus Complet** : Vue d'ensemble du cycle budgétaire
+    - 📅 **Plan d'Implémentation** : Feuille de route détaillée
+    """)
+    
+    # Quick stats dashboard
+    st.subheader("📊 Tableau de Bord Rapide")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Budget Ventes", "450K €", "+12%")
+    with col2:
+        st.metric("Production", "280K €", "+8%")
+    with col3:
+        st.metric("Trésorerie", "75K €", "-5%")
+    with col4:
+        st.metric("Investissement", "120K €", "+15%")
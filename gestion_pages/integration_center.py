@@ -0,0 +1,623 @@
+"""Page « 🔗 Centre d'Intégration Systèmes »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import time
+from integration_system import get_integration_system
+from log_store import STATUS_LABELS, LogTail
+import result_cache
+
+def show_integration_center():
+    st.title("🔗 Centre d'Intégration Systèmes")
+    
+    # Sous-menu intégration
+    integration_tabs = st.tabs([
+        "🏗️ Architecture", 
+        "🧾 Connecteurs ERP", 
+        "🛒 Connecteurs CRM",
+        "💰 Connecteurs Comptabilité",
+        "📊 Connecteurs BI",
+        "🌐 APIs Personnalisées",
+        "📡 Monitoring Temps Réel"
+    ])
+    
+    with integration_tabs[0]:
+        show_integration_architecture()
+    
+    with integration_tabs[1]:
+        show_erp_connectors()
+    
+    with integration_tabs[2]:
+        show_crm_connectors()
+    
+    with integration_tabs[3]:
+        show_accounting_connectors()
+    
+    with integration_tabs[4]:
+        show_bi_connectors()
+    
+    with integration_tabs[5]:
+        show_custom_apis()
+    
+    with integration_tabs[6]:
+        show_realtime_monitoring()
+
+def show_integration_architecture():
+    st.header("🏗️ Architecture d'Intégration Systèmes")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 🎯 Architecture Microservices Modern
+        
+        **🏗️ Composants Principaux :**
+        
+        ```python
+        class IntegrationArchitecture:
+            ├── 🔌 API Gateway
+            ├── 🗄️ Message Broker (Kafka/RabbitMQ)
+            ├── 💾 Data Lake
+            ├── 🔄 ETL Engine
+            ├── 🛡️ Security Layer
+            ├── 📊 Monitoring
+            └── 🔧 Connectors
+        ```
+        
+        **📊 Flux de Données :**
+        """)
+        
+        # Diagramme de flux
+        flow_data = {
+            'Source': ['ERP SAP', 'CRM Salesforce', 'Comptabilité Sage', 'BI Power BI'],
+            'Destination': ['Data Lake', 'Data Warehouse', 'Application', 'Reporting'],
+            'Fréquence': ['Temps réel', '15 min', 'Quotidien', 'Hebdomadaire'],
+            'Volume': ['2GB/jour', '500MB/jour', '1GB/jour', '200MB/jour']
+        }
+        
+        st.dataframe(pd.DataFrame(flow_data), use_container_width=True)
+    
+    with col2:
+        st.markdown("""
+        ### 📈 Métriques d'Intégration
+        
+        **🔗 Connectivité :**
+        """)
+        st.metric("Systèmes Connectés", "8/12", "2 nouveaux")
+        st.metric("Taux Disponibilité", "99.8%")
+        st.metric("Latence Moyenne", "156ms")
+        
+        st.markdown("""
+        **📊 Données :**
+        """)
+        st.metric("Flux Actifs", "24")
+        st.metric("Volume Quotidien", "3.7 GB")
+        st.metric("Temps Réel", "85%")
+        
+        # Bouton d'action rapide
+        st.markdown("---")
+        if st.button("🔄 Scanner Nouveaux Systèmes"):
+            with st.spinner("Scan en cours..."):
+                time.sleep(2)
+                st.success("3 nouveaux systèmes détectés!")
+
+def show_erp_connectors():
+    st.header("🧾 Connecteurs ERP")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 🔌 Connecteurs ERP Supportés
+        
+        **🏢 SAP ERP :**
+        ```python
+        # Connexion RFC SAP
+        import pyrfc
+        conn = pyrfc.Connection(
+            ashost='sap.company.com',
+            sysnr='00',
+            client='100',
+            user='control_gestion',
+            passwd='***'
+        )
+        
+        # Extraction données stocks
+        result = conn.call('BAPI_MATERIAL_GET_LIST')
+        ```
+        
+        **📊 Oracle E-Business Suite :**
+        ```python
+        # Connexion JDBC
+        jdbc_url = "jdbc:oracle:thin:@server:1521:XE"
+        # Extraction données production
+        ```
+        
+        **💼 Sage X3 :**
+        ```python
+        # API REST Sage
+        response = requests.get(
+            'https://sage-api/items',
+            headers={'Authorization': 'Bearer {token}'}
+        )
+        ```
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 📈 Statut des Connexions ERP
+        """)
+        
+        erp_status = {
+            'Système': ['SAP ECC', 'Oracle EBS', 'Sage X3', 'Microsoft Dynamics'],
+            'Statut': ['✅ Connecté', '🟡 Partiel', '✅ Connecté', '🔴 En attente'],
+            'Dernière Synchro': ['14:25', '13:45', '14:30', 'N/A'],
+            'Données': ['Stocks, Production', 'Ventes, Achats', 'Compta, Stocks', 'Tous modules']
+        }
+        
+        st.dataframe(pd.DataFrame(erp_status), use_container_width=True)
+        
+        # Configuration nouvelle connexion
+        st.markdown("---")
+        st.subheader("➕ Nouvelle Connexion")
+        
+        with st.form("new_erp_connection"):
+            system_name = st.selectbox("Système ERP", ["SAP", "Oracle", "Sage", "Autre"])
+            endpoint = st.text_input("URL du serveur")
+            username = st.text_input("Nom d'utilisateur")
+            password = st.text_input("Mot de passe", type="password")
+            
+            if st.form_submit_button("🔗 Tester la Connexion"):
+                if not endpoint:
+                    st.error("Veuillez renseigner l'URL du serveur")
+                else:
+                    with st.spinner("Test de connexion en cours..."):
+                        ok = get_integration_system().test_connection(
+                            system_name, system_name, endpoint,
+                            auth=(username, password) if password else None
+                        )
+                    if ok:
+                        st.success("Connexion réussie!")
+                    else:
+                        st.error("Échec de la connexion")
+
+        # Extraction ponctuelle : exécutée comme un flux (mesures, journal, data_flows)
+        st.subheader("📥 Extraction de Données")
+
+        with st.form("erp_extraction"):
+            system_name = st.selectbox("Système source", ["SAP", "Oracle", "Sage", "Autre"])
+            endpoint = st.text_input("URL de l'API")
+            resource = st.text_input("Ressource", value="items")
+            token = st.text_input("Jeton d'accès", type="password")
+
+            if st.form_submit_button("📥 Extraire"):
+                if not endpoint:
+                    st.error("Veuillez renseigner l'URL de l'API")
+                else:
+                    with st.spinner("Extraction en cours..."):
+                        try:
+                            data = get_integration_system().extract(
+                                system_name, system_name, endpoint, resource, token=token or None
+                            )
+                        except Exception as exc:
+                            st.error(f"Échec de l'extraction : {exc}")
+                        else:
+                            st.success(f"{len(data):,} lignes extraites")
+                            st.dataframe(data.head(100), use_container_width=True)
+
+def show_crm_connectors():
+    st.header("🛒 Connecteurs CRM")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 🎯 Intégration Données Commerciales
+        
+        **📈 Salesforce :**
+        ```python
+        # API Salesforce REST
+        from simple_salesforce import Salesforce
+        sf = Salesforce(
+            username='user@company.com',
+            password='password',
+            security_token='token'
+        )
+        
+        # Extraction opportunités
+        opportunities = sf.query(
+            "SELECT Id, Name, Amount, StageName FROM Opportunity"
+        )
+        ```
+        
+        **💼 HubSpot :**
+        ```python
+        # API HubSpot
+        import hubspot
+        client = hubspot.Client(api_key='api_key')
+        
+        # Contacts et deals
+        contacts = client.crm.contacts.get_all()
+        deals = client.crm.deals.get_all()
+        ```
+        
+        **🔄 Synchronisation Automatique :**
+        - Pipeline commercial temps réel
+        - Taux de conversion
+        - Cycle de vente moyen
+        - Segmentation clients
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 📊 Métriques CRM
+        """)
+        
+        crm_data = {
+            'KPI': ['Pipeline Actif', 'Taux Conversion', 'Cycle Vente', 'Panier Moyen'],
+            'Valeur': ['4.2M €', '22.5%', '45 jours', '8,450 €'],
+            'Source': ['Salesforce', 'HubSpot', 'Salesforce', 'ERP']
+        }
+        
+        st.dataframe(pd.DataFrame(crm_data), use_container_width=True)
+        
+        # Graphique pipeline
+        stages = ['Prospection', 'Qualification', 'Proposition', 'Négociation', 'Signature']
+        values = [120, 85, 60, 35, 22]
+        
+        fig = px.funnel(x=values, y=stages, title='Pipeline Commercial')
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_accounting_connectors():
+    st.header("💰 Connecteurs Comptabilité")
+    
+    st.markdown("""
+    ### 🧾 Automatisation Comptable Avancée
+    
+    **🔗 Systèmes Supportés :**
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **📊 Cegid :**
+        - Rapprochement automatique
+        - Contrôle TVA intelligent
+        - Clôture assistée
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📈 Quadratus :**
+        - Import FEC automatique
+        - Analyse des écarts
+        - Reporting réglementaire
+        """)
+    
+    with col3:
+        st.markdown("""
+        **💼 QuickBooks :**
+        - Synchronisation bancaire
+        - Facturation électronique
+        - Paie automatisée
+        """)
+    
+    # Démonstration rapprochement automatique
+    st.subheader("🤖 Rapprochement Automatique")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **🧠 Algorithme Intelligent :**
+        ```python
+        def automatic_reconciliation(bank_stmt, accounting_data):
+            matches = []
+            for bank_tx in bank_stmt:
+                best_match = None
+                highest_score = 0
+                
+                for acc_tx in accounting_data:
+                    # Score de similarité
+                    score = calculate_similarity(
+                        bank_tx.description,
+                        acc_tx.description,
+                        bank_tx.amount,
+                        acc_tx.amount
+                    )
+                    
+                    if score > 0.85:  # Seuil de confiance
+                        matches.append((bank_tx, acc_tx, score))
+            
+            return sorted(matches, key=lambda x: x[2], reverse=True)
+        ```
+        """)
+    
+    with col2:
+        # Simulation rapprochement
+        reconciliation_data = {
+            'Type': ['Automatique', 'Semi-auto', 'Manuel'],
+            'Transactions': [845, 23, 5],
+            'Taux Reconnaissance': ['98.7%', '1.2%', '0.1%'],
+            'Gain Temps': ['94%', '3%', '3%']
+        }
+        
+        st.dataframe(pd.DataFrame(reconciliation_data), use_container_width=True)
+        
+        st.metric("⏱️ Temps Économisé", "18h/semaine")
+        st.metric("✅ Exactitude", "99.8%")
+
+def show_bi_connectors():
+    st.header("📊 Connecteurs Business Intelligence")
+    
+    st.markdown("""
+    ### 🎯 Intégration Plateformes BI
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **📈 Power BI :**
+        ```python
+        # API Power BI
+        from powerbi import PowerBIClient
+        
+        client = PowerBIClient(
+            client_id='client_id',
+            client_secret='client_secret',
+            tenant_id='tenant_id'
+        )
+        
+        # Publication automatique de rapports
+        dataset = client.datasets.get_dataset(dataset_id)
+        client.imports.post_import_in_group(
+            group_id, 
+            file_path='budget_report.pbix'
+        )
+        ```
+        
+        **📊 Tableau :**
+        ```python
+        # Tableau Server API
+        import tableauserverclient as TSC
+        
+        tableau_auth = TSC.TableauAuth(
+            username='user', 
+            password='pass', 
+            site_id='site'
+        )
+        server = TSC.Server('https://tableau-server')
+        
+        # Extraction données pour ML
+        with server.auth.sign_in(tableau_auth):
+            all_datasources = list(TSC.Pager(server.datasources))
+        ```
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🔗 Flux de Données BI :**
+        """)
+        
+        bi_flows = {
+            'Source': ['Data Warehouse', 'API Métier', 'ERP', 'CRM'],
+            'Destination': ['Power BI', 'Tableau', 'Qlik', 'Custom Dashboard'],
+            'Fréquence': ['Temps réel', '15 min', 'Quotidien', 'Hebdomadaire'],
+            'Utilisateurs': ['45', '28', '15', '12']
+        }
+        
+        st.dataframe(pd.DataFrame(bi_flows), use_container_width=True)
+        
+        # Métriques d'utilisation
+        st.subheader("📈 Utilisation BI")
+        
+        usage_data = {
+            'Plateforme': ['Power BI', 'Tableau', 'Qlik', 'Custom'],
+            'Rapports Actifs': [45, 28, 15, 12],
+            'Utilisateurs Quotidiens': [85, 42, 23, 8],
+            'Données Traitées (GB)': [12.5, 8.2, 4.5, 2.1]
+        }
+        
+        st.dataframe(pd.DataFrame(usage_data), use_container_width=True)
+
+def show_custom_apis():
+    st.header("🌐 APIs Personnalisées")
+    
+    st.markdown("""
+    ### 🏗️ Architecture API-First
+    
+    **🔌 Endpoints Principaux :**
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **💰 Module Budgétaire :**
+        ```python
+        # API Budget
+        POST /api/v1/budget/calculate-moindres-carres
+        GET  /api/v1/budget/forecast/{period}
+        PUT  /api/v1/budget/actual/{period}
+        POST /api/v1/budget/scenario-analysis
+        ```
+        
+        **🏭 Module Production :**
+        ```python
+        # API Production
+        GET  /api/v1/production/capacity
+        POST /api/v1/production/optimize
+        PUT  /api/v1/production/schedule
+        GET  /api/v1/production/kpi
+        ```
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📦 Module Stocks :**
+        ```python
+        # API Stocks
+        GET  /api/v1/inventory/levels
+        POST /api/v1/inventory/calculate-eoq
+        PUT  /api/v1/inventory/update
+        GET  /api/v1/inventory/abc-analysis
+        ```
+        
+        **💸 Module Trésorerie :**
+        ```python
+        # API Trésorerie
+        POST /api/v1/cashflow/forecast
+        GET  /api/v1/cashflow/position
+        POST /api/v1/cashflow/scenarios
+        ```
+        """)
+    
+    # Testeur d'API interactif
+    st.subheader("🧪 Testeur d'API")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        endpoint = st.selectbox("Endpoint à tester:", [
+            "/api/v1/budget/forecast/next-quarter",
+            "/api/v1/inventory/optimization",
+            "/api/v1/production/capacity-utilization",
+            "/api/v1/cashflow/daily-position"
+        ])
+        
+        payload = st.text_area("Payload (JSON):", '{"period": "2024-Q2", "confidence": 0.95}')
+    
+    with col2:
+        if st.button("🚀 Tester l'API"):
+            with st.spinner("Appel API en cours..."):
+                time.sleep(2)
+                
+                # Simulation réponse
+                mock_response = {
+                    "status": "success",
+                    "data": {
+                        "forecast": 1250000,
+                        "confidence_interval": [1180000, 1320000],
+                        "calculation_time": "156ms",
+                        "method": "moindres_carres_ameliore"
+                    },
+                    "metadata": {
+                        "timestamp": "2024-01-15T14:30:00Z",
+                        "version": "2.1.0"
+                    }
+                }
+                
+                st.json(mock_response)
+                st.success("✅ Appel réussi - Latence: 156ms")
+
+def show_realtime_monitoring():
+    st.header("📡 Monitoring Temps Réel")
+    
+    st.markdown("""
+    ### 📊 Tableau de Bord de Surveillance
+    """)
+    
+    metrics = get_integration_system().metrics
+    window = st.selectbox("Fenêtre d'analyse:", [15, 60, 240, 1440, 10080], index=1,
+                          format_func=lambda m: f"{m // 60} h" if m >= 60 else f"{m} min")
+    summary = metrics.summary(window_minutes=window)
+    
+    if summary.empty:
+        st.info("Aucune mesure enregistrée sur la fenêtre : testez une connexion ou exécutez un flux.")
+    else:
+        total_calls = summary['n'].sum()
+        success_rate = (summary['n'] * summary['success_rate']).sum() / total_calls
+        latency_avg = (summary['n'] * summary['latency_avg']).sum() / total_calls
+        
+        # Métriques en temps réel
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("🔗 Systèmes Actifs", f"{len(summary)}")
+            st.metric("📈 Débit Données", f"{summary['bytes_per_min'].sum() / 1e6:.2f} MB/min")
+        
+        with col2:
+            st.metric("⚡ Latence Moyenne", f"{latency_avg:.0f}ms")
+            st.metric("🔄 Appels / h", f"{total_calls * 60 / window:.0f}")
+        
+        with col3:
+            st.metric("✅ Taux Réussite", f"{success_rate:.1f}%")
+            st.metric("⚠️ Latence p99 max", f"{summary['p99'].max():.0f}ms")
+        
+        with col4:
+            st.metric("📊 Volume Fenêtre", f"{summary['bytes'].sum() / 1e6:.1f} MB")
+            st.metric("🧾 Lignes / min", f"{summary['rows_per_min'].sum():,.0f}")
+        
+        st.subheader("⏱️ Latence par Système")
+        st.dataframe(
+            summary.rename(columns={
+                'system_name': 'Système', 'n': 'Appels', 'success_rate': 'Réussite (%)',
+                'p50': 'p50 (ms)', 'p95': 'p95 (ms)', 'p99': 'p99 (ms)',
+                'bytes_per_min': 'Octets/min', 'rows_per_min': 'Lignes/min'
+            })[['Système', 'Appels', 'Réussite (%)', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)',
+                'Octets/min', 'Lignes/min']].round(1),
+            use_container_width=True
+        )
+    
+    # Cache de calcul partagé (compteurs cumulés de tous les processus)
+    st.subheader("🗄️ Cache de Calcul")
+    cache_stats = result_cache.default_cache().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🎯 Taux de Hit", f"{cache_stats['hit_rate']:.1f}%")
+    with col2:
+        st.metric("✅ Hits / ❌ Misses", f"{cache_stats['hits']:,} / {cache_stats['misses']:,}")
+    with col3:
+        st.metric("📦 Entrées", f"{cache_stats['entries']:,}")
+    with col4:
+        st.metric("💾 Taille", f"{cache_stats['bytes'] / 1e6:.1f} MB",
+                  f"{cache_stats['evictions']:,} évictions", delta_color="off")
+    
+    # Logs en temps réel
+    st.subheader("📝 Logs des Intégrations")
+    
+    # Le curseur en session ne relit que les événements postérieurs au dernier affiché
+    if 'integration_log_tail' not in st.session_state:
+        st.session_state.integration_log_tail = LogTail(get_integration_system().logs)
+    logs = st.session_state.integration_log_tail.poll()
+    
+    if logs.empty:
+        st.info("Aucun événement d'intégration journalisé.")
+    else:
+        logs_data = pd.DataFrame({
+            'Timestamp': logs['ts'].str.slice(11),
+            'Système': logs['system_name'],
+            'Action': logs['action'],
+            'Statut': logs['status'].map(STATUS_LABELS).fillna(logs['status']),
+            'Détails': logs['details']
+        })
+        st.dataframe(logs_data, use_container_width=True, hide_index=True)
+    
+    if summary.empty:
+        return
+    
+    # Graphique de performance
+    st.subheader("📈 Performance des Intégrations")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Taux de réussite par système
+        fig = px.bar(x=summary['system_name'], y=summary['success_rate'], 
+                    title='Taux de Réussite par Système (%)')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Volume de données par système
+        fig = px.pie(values=summary['bytes'], names=summary['system_name'],
+                    title='Répartition Volume Données')
+        st.plotly_chart(fig, use_container_width=True)
+
+    # Évolution sur la fenêtre, bucket par bucket
+    timeline = metrics.timeline(window_minutes=window)
+    fig = px.line(timeline, x='bucket', y='latency_avg', color='system_name', markers=True,
+                  title='Latence Moyenne par Période (ms)',
+                  labels={'bucket': '', 'latency_avg': 'Latence (ms)', 'system_name': 'Système'})
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,1115 @@
+"""Page « 📚 Centre de Connaissances »."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+import math
+import budget_engines as engines
+from data_table import paginated_table
+from perf_monitor import timed
+
+def show_knowledge_center():
+    st.title("📚 Centre de Connaissances du Contrôle de Gestion")
+    
+    st.markdown("""
+    ## 🎯 Encyclopédie Complète des Méthodes et Outils
+    
+    *Base de connaissances théoriques et pratiques pour maîtriser le contrôle de gestion*
+    """)
+    
+    knowledge_tabs = st.tabs([
+        "💰 Budget des Ventes", 
+        "🏭 Production", 
+        "📦 Gestion Stocks",
+        "🏗️ Investissement", 
+        "💸 Trésorerie",
+        "📊 Méthodes Avancées"
+    ])
+    
+    with knowledge_tabs[0]:
+        show_sales_budget_knowledge()
+    
+    with knowledge_tabs[1]:
+        show_production_knowledge()
+    
+    with knowledge_tabs[2]:
+        show_stock_management_knowledge()
+    
+    with knowledge_tabs[3]:
+        show_investment_knowledge()
+    
+    with knowledge_tabs[4]:
+        show_cashflow_knowledge()
+    
+    with knowledge_tabs[5]:
+        show_advanced_methods()
+
+def show_sales_budget_knowledge():
+    st.header("💰 Théorie du Budget des Ventes")
+    
+    st.markdown("""
+    ## 📚 Fondements Théoriques et Méthodologiques
+    
+    ### 🎯 Importance du Budget des Ventes
+    Le budget des ventes est le **point de départ** de toute la construction budgétaire. 
+    Il conditionne l'ensemble des autres budgets de l'entreprise et détermine le niveau d'activité futur.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        ### 📊 Méthode des Moindres Carrés
+        
+        **Principe Mathématique :**
+        La méthode des moindres carrés permet de trouver la droite qui minimise la somme 
+        des carrés des écarts entre les points observés et la droite de régression.
+        """)
+        
+        st.latex(r"y = ax + b")
+        
+        st.markdown("""
+        **Variables :**
+        - $y$ : Variable dépendante (ventes)
+        - $x$ : Variable indépendante (temps)
+        - $a$ : Pente de la droite (tendance)
+        - $b$ : Ordonnée à l'origine
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 📐 Calcul des Coefficients
+        
+        **Pente de la droite (a) :**
+        """)
+        st.latex(r"""
+        a = \frac{\sum_{i=1}^{n}(x_i - \bar{x})(y_i - \bar{y})}{\sum_{i=1}^{n}(x_i - \bar{x})^2}
+        """)
+        
+        st.markdown("""
+        **Ordonnée à l'origine (b) :**
+        """)
+        st.latex(r"b = \bar{y} - a\bar{x}")
+        
+        st.markdown("""
+        **Où :**
+        - $\bar{x}$ : Moyenne des périodes
+        - $\bar{y}$ : Moyenne des ventes
+        - $n$ : Nombre d'observations
+        """)
+    
+    # Calculateur interactif des moindres carrés
+    st.subheader("🧮 Calculateur des Moindres Carrés")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Saisie des données historiques :**")
+        n_periods = st.number_input("Nombre de périodes :", min_value=3, max_value=12, value=6)
+        
+        periods = []
+        sales_data = []
+        
+        for i in range(n_periods):
+            col_per, col_sales = st.columns(2)
+            with col_per:
+                period = st.number_input(f"Période {i+1}", value=i+1, key=f"per_{i}")
+                periods.append(period)
+            with col_sales:
+                sales = st.number_input(f"Ventes {i+1}", value=1000 + i*200, key=f"sales_{i}")
+                sales_data.append(sales)
+    
+    with col2:
+        if st.button("📊 Calculer la Prévision"):
+            with timed("Régression moindres carrés"):
+                # Conversion en arrays numpy
+                x = np.array(periods)
+                y = np.array(sales_data)
+            
+                # Calcul des coefficients
+                x_mean = np.mean(x)
+                y_mean = np.mean(y)
+            
+                numerator = np.sum((x - x_mean) * (y - y_mean))
+                denominator = np.sum((x - x_mean) ** 2)
+            
+                a = numerator / denominator
+                b = y_mean - a * x_mean
+            
+                st.success(f"**Équation trouvée :** y = {a:.2f}x + {b:.2f}")
+            
+                # Calcul R²
+                y_pred = a * x + b
+                ss_res = np.sum((y - y_pred) ** 2)
+                ss_tot = np.sum((y - y_mean) ** 2)
+                r_squared = 1 - (ss_res / ss_tot)
+            
+            # Prévisions
+            next_period = n_periods + 1
+            forecast = a * next_period + b
+            
+            st.metric(f"Prévision Période {next_period}", f"{forecast:,.0f} €")
+            st.metric("Coefficient de détermination R²", f"{r_squared:.3f}")
+            
+            # Graphique
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=x, y=y, mode='markers', name='Données historiques', 
+                                   marker=dict(size=10, color='blue')))
+            fig.add_trace(go.Scatter(x=list(x) + [next_period], 
+                                   y=list(y_pred) + [forecast], 
+                                   mode='lines', name='Droite de régression',
+                                   line=dict(color='red', dash='dash')))
+            fig.update_layout(title='Régression Linéaire - Méthode des Moindres Carrés',
+                            xaxis_title='Périodes',
+                            yaxis_title='Ventes (€)')
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("""
+    ### 📈 Coefficients Saisonniers
+    
+    **Définition :**
+    Les coefficients saisonniers permettent d'ajuster les prévisions de tendance pour tenir compte 
+    des variations périodiques liées aux saisons, mois, ou trimestres.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Calcul du coefficient saisonnier :**
+        """)
+        st.latex(r"""
+        C_s = \frac{\bar{V}_s}{\bar{V}_t}
+        """)
+        
+        st.markdown("""
+        **Où :**
+        - $C_s$ : Coefficient saisonnier pour la saison s
+        - $\bar{V}_s$ : Moyenne des ventes pour la saison s
+        - $\bar{V}_t$ : Moyenne générale des ventes sur toutes les saisons
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Ajustement saisonnier :**
+        """)
+        st.latex(r"""
+        V_{ajustée} = V_{trend} \times C_s
+        """)
+        
+        st.markdown("""
+        **Interprétation :**
+        - $C_s > 1$ : Période de haute saison
+        - $C_s < 1$ : Période de basse saison
+        - $C_s = 1$ : Période neutre
+        """)
+    
+    # Calculateur de coefficients saisonniers
+    st.subheader("🔄 Calculateur de Coefficients Saisonniers")
+    
+    st.write("**Saisie des données trimestrielles :**")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        t1_sales = st.number_input("Trimestre 1", value=120000)
+    with col2:
+        t2_sales = st.number_input("Trimestre 2", value=150000)
+    with col3:
+        t3_sales = st.number_input("Trimestre 3", value=130000)
+    with col4:
+        t4_sales = st.number_input("Trimestre 4", value=180000)
+    
+    if st.button("📐 Calculer les Coefficients"):
+        sales_by_quarter = [t1_sales, t2_sales, t3_sales, t4_sales]
+        total_sales = sum(sales_by_quarter)
+        average_sales = total_sales / 4
+        
+        coefficients = []
+        for quarter_sales in sales_by_quarter:
+            coefficient = quarter_sales / average_sales
+            coefficients.append(coefficient)
+        
+        st.success("**Coefficients saisonniers calculés :**")
+        
+        df_coefficients = pd.DataFrame({
+            'Trimestre': ['T1', 'T2', 'T3', 'T4'],
+            'Ventes': sales_by_quarter,
+            'Coefficient': [f"{c:.3f}" for c in coefficients],
+            'Interprétation': ['Basse saison' if c < 0.95 else 'Haute saison' if c > 1.05 else 'Saison normale' for c in coefficients]
+        })
+        
+        st.dataframe(df_coefficients, use_container_width=True)
+
+def show_production_knowledge():
+    st.header("🏭 Théorie de la Gestion de Production")
+    
+    st.markdown("""
+    ## 📚 Méthodologies et Outils de Planification
+    
+    ### 🎯 Le Plan Directeur de Production (PDP)
+    Le PDP est l'outil central qui permet de transformer les prévisions commerciales 
+    en plan de production détaillé.
+    """)
+    
+    st.latex(r"""
+    \text{Production Nécessaire} = \text{Ventes Prévues} + \text{Stock Final Cible} - \text{Stock Initial}
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        ### 📊 Méthode MRP II
+        
+        **Manufacturing Resource Planning**
+        
+        **Étapes du processus :**
+        1. **Plan des ventes et opérations**
+        2. **Plan directeur de production**
+        3. **Planification des besoins en composants**
+        4. **Ordonnancement atelier**
+        5. **Lancement en fabrication**
+        """)
+        
+        st.markdown("""
+        **Calcul des besoins nets :**
+        """)
+        st.latex(r"""
+        \text{Besoin Net} = \text{Besoin Brut} - \text{Stock Disponible} - \text{Commandes en Cours}
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### ⚙️ Indicateurs de Performance
+        
+        **TRS (Taux de Rendement Synthétique) :**
+        """)
+        st.latex(r"""
+        \text{TRS} = \text{Disponibilité} \times \text{Performance} \times \text{Qualité}
+        """)
+        
+        st.markdown("""
+        **Décomposition :**
+        - **Disponibilité** = Temps utile / Temps d'ouverture
+        - **Performance** = Cadence réelle / Cadence théorique  
+        - **Qualité** = Pièces bonnes / Pièces totales
+        """)
+        
+        st.markdown("""
+        **OEE (Overall Equipment Effectiveness) :**
+        """)
+        st.latex(r"""
+        \text{OEE} = \frac{\text{Temps de Fabrication Net}}{\text{Temps d'Ouverture}} \times 100
+        """)
+    
+    # Calculateur de plan de production
+    st.subheader("🧮 Calculateur de Plan de Production")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Paramètres de base :**")
+        sales_forecast = st.number_input("Prévisions ventes (unités/mois)", value=10000)
+        initial_stock = st.number_input("Stock initial (unités)", value=1500)
+        target_stock = st.number_input("Stock cible final (unités)", value=2000)
+        working_days = st.number_input("Jours ouvrables/mois", value=22)
+    
+    with col2:
+        st.write("**Capacités de production :**")
+        daily_capacity = st.number_input("Capacité journalière (unités/jour)", value=500)
+        efficiency_rate = st.slider("Taux d'efficacité estimé (%)", 70, 100, 85) / 100
+        rejection_rate = st.slider("Taux de rebut estimé (%)", 0, 10, 2) / 100
+    
+    if st.button("📋 Générer le Plan de Production"):
+        # Calculs
+        production_needed = sales_forecast + target_stock - initial_stock
+        adjusted_production = production_needed / (1 - rejection_rate)
+        effective_daily_capacity = daily_capacity * efficiency_rate
+        production_days = adjusted_production / effective_daily_capacity
+        utilization_rate = (production_days / working_days) * 100
+        
+        st.success("**Résultats du calcul :**")
+        
+        results_data = {
+            'Indicateur': [
+                'Production nécessaire (nette)',
+                'Production à lancer (brute)',
+                'Capacité effective journalière',
+                'Jours de production nécessaires',
+                'Taux d\'utilisation des capacités'
+            ],
+            'Valeur': [
+                f"{production_needed:,.0f} unités",
+                f"{adjusted_production:,.0f} unités",
+                f"{effective_daily_capacity:.0f} unités/jour",
+                f"{production_days:.1f} jours",
+                f"{utilization_rate:.1f}%"
+            ]
+        }
+        
+        st.dataframe(pd.DataFrame(results_data), use_container_width=True)
+        
+        # Recommandations
+        if utilization_rate > 100:
+            st.error("""
+            **🚨 CAPACITÉ INSUFFISANTE**
+            - Prévoir des heures supplémentaires
+            - Sous-traiter une partie de la production
+            - Revoir les stocks cibles
+            """)
+        elif utilization_rate > 85:
+            st.warning("""
+            **⚠️ CAPACITÉ TENDUE**
+            - Optimiser les séquences de production
+            - Renforcer la maintenance préventive
+            - Surveiller les indicateurs de performance
+            """)
+        else:
+            st.success("""
+            **✅ CAPACITÉ ADÉQUATE**
+            - Planification optimale possible
+            - Marge de manœuvre disponible
+            - Possibilité d'accepter commandes supplémentaires
+            """)
+    
+    st.markdown("""
+    ### 🔧 Méthode Kanban
+    
+    **Principe du système pull :**
+    La production est déclenchée par la consommation réelle plutôt que par des prévisions.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Calcul du nombre de kanbans :**
+        """)
+        st.latex(r"""
+        N = \frac{D \times (L + S)}{C}
+        """)
+        
+        st.markdown("""
+        **Où :**
+        - $N$ : Nombre de kanbans
+        - $D$ : Demande moyenne par période
+        - $L$ : Délai de réapprovisionnement
+        - $S$ : Stock de sécurité
+        - $C$ : Capacité du conteneur
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Avantages du Kanban :**
+        - Réduction des stocks
+        - Élimination des gaspillages
+        - Amélioration de la flexibilité
+        - Meilleure visibilité des flux
+        """)
+        
+        # Calculateur Kanban
+        st.subheader("🔄 Calculateur Kanban")
+        
+        D = st.number_input("Demande moyenne (unités/jour)", value=100)
+        L = st.number_input("Délai réapprovisionnement (jours)", value=2)
+        S = st.number_input("Stock de sécurité (unités)", value=50)
+        C = st.number_input("Capacité conteneur (unités)", value=25)
+        
+        if st.button("🎯 Calculer Kanbans"):
+            N = (D * (L + S)) / C
+            st.metric("Nombre de kanbans nécessaires", f"{math.ceil(N)}")
+
+def show_stock_management_knowledge():
+    st.header("📦 Théorie de la Gestion des Stocks")
+    
+    st.markdown("""
+    ## 📚 Méthodes et Optimisation des Stocks
+    
+    ### 🎯 Les Trois Fonctions des Stocks
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🛡️ Stock de Sécurité**
+        - Parer aux aléas de la demande
+        - Compenser les retards de livraison
+        - Prévenir les ruptures
+        """)
+        
+        st.latex(r"""
+        SS = z \times \sigma_d \times \sqrt{L}
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🔄 Stock Cyclique**
+        - Faire face à la demande régulière
+        - Optimiser les quantités commandées
+        - Réduire les coûts de possession
+        """)
+        
+        st.latex(r"""
+        Q^* = \sqrt{\frac{2DS}{H}}
+        """)
+    
+    with col3:
+        st.markdown("""
+        **📈 Stock Spéculatif**
+        - Anticiper les hausses de prix
+        - Profiter des promotions
+        - Sécuriser les approvisionnements
+        """)
+    
+    st.markdown("""
+    ### 📊 Formule de Wilson (Lot Économique)
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Équation fondamentale :**
+        """)
+        st.latex(r"""
+        Q^* = \sqrt{\frac{2DS}{H}}
+        """)
+        
+        st.markdown("""
+        **Où :**
+        - $Q^*$ : Quantité économique à commander
+        - $D$ : Demande annuelle
+        - $S$ : Coût de passation de commande
+        - $H$ : Coût de stockage unitaire annuel
+        """)
+        
+        st.markdown("""
+        **Coût total annuel :**
+        """)
+        st.latex(r"""
+        C_T = \frac{D}{Q}S + \frac{Q}{2}H
+        """)
+    
+    with col2:
+        # Calculateur de Wilson
+        st.subheader("🧮 Calculateur du Lot Économique")
+        
+        D = st.number_input("Demande annuelle (unités)", value=10000)
+        S = st.number_input("Coût de commande (€)", value=150.0)
+        H = st.number_input("Coût stockage unitaire annuel (€)", value=2.5)
+        
+        if st.button("📦 Calculer EOQ"):
+            Q_optimal = math.sqrt((2 * D * S) / H)
+            n_orders = D / Q_optimal
+            total_cost = (D / Q_optimal) * S + (Q_optimal / 2) * H
+            
+            st.metric("Lot économique (EOQ)", f"{Q_optimal:.0f} unités")
+            st.metric("Nombre de commandes/an", f"{n_orders:.1f}")
+            st.metric("Coût total annuel", f"{total_cost:,.0f} €")
+            
+            # Graphique des coûts
+            quantities = np.linspace(Q_optimal * 0.5, Q_optimal * 1.5, 50)
+            order_costs = (D / quantities) * S
+            holding_costs = (quantities / 2) * H
+            total_costs = order_costs + holding_costs
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=quantities, y=order_costs, name='Coût de commande'))
+            fig.add_trace(go.Scatter(x=quantities, y=holding_costs, name='Coût de stockage'))
+            fig.add_trace(go.Scatter(x=quantities, y=total_costs, name='Coût total'))
+            fig.add_vline(x=Q_optimal, line_dash="dash", line_color="red", 
+                         annotation_text=f"EOQ = {Q_optimal:.0f}")
+            fig.update_layout(title='Optimisation des Coûts de Stock - Formule de Wilson',
+                            xaxis_title='Quantité commandée',
+                            yaxis_title='Coût (€)')
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("""
+    ### 📈 Méthode ABC - Loi de Pareto
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Classification ABC :**
+        - **Classe A** : 20% des articles → 80% de la valeur
+        - **Classe B** : 30% des articles → 15% de la valeur  
+        - **Classe C** : 50% des articles → 5% de la valeur
+        """)
+        
+        st.markdown("""
+        **Stratégies de gestion :**
+        - **Classe A** : Surveillance rapprochée, stocks faibles
+        - **Classe B** : Gestion standard, stocks modérés
+        - **Classe C** : Gestion simplifiée, stocks importants
+        """)
+    
+    with col2:
+        # Générateur d'analyse ABC
+        st.subheader("📊 Générateur d'Analyse ABC")
+        
+        if st.button("🎯 Générer Analyse ABC Simulée"):
+            # Données simulées
+            n_articles = 50
+            articles = [f"ART{1000+i}" for i in range(n_articles)]
+            valeurs = np.random.lognormal(8, 1.2, n_articles)
+            
+            df_abc = pd.DataFrame({
+                'Article': articles,
+                'Valeur Annuelle (€)': [round(v, 2) for v in valeurs]
+            })
+            
+            with timed("Classification ABC"):
+                # Tri et classification
+                df_abc = df_abc.sort_values('Valeur Annuelle (€)', ascending=False)
+                df_abc['Cumul %'] = (df_abc['Valeur Annuelle (€)'].cumsum() / 
+                                    df_abc['Valeur Annuelle (€)'].sum() * 100).round(2)
+            
+                def classer_abc(cumul):
+                    if cumul <= 80: return 'A'
+                    elif cumul <= 95: return 'B'
+                    else: return 'C'
+            
+                df_abc['Classe'] = df_abc['Cumul %'].apply(classer_abc)
+            
+            # Affichage résultats
+            st.success("**Analyse ABC générée :**")
+            
+            stats_abc = df_abc.groupby('Classe').agg({
+                'Article': 'count',
+                'Valeur Annuelle (€)': 'sum'
+            }).round(2)
+            stats_abc['% Articles'] = (stats_abc['Article'] / n_articles * 100).round(1)
+            stats_abc['% Valeur'] = (stats_abc['Valeur Annuelle (€)'] / stats_abc['Valeur Annuelle (€)'].sum() * 100).round(1)
+            
+            st.dataframe(stats_abc, use_container_width=True)
+            
+            # Graphique Pareto
+            fig = go.Figure()
+            fig.add_trace(go.Bar(x=df_abc['Article'], y=df_abc['Valeur Annuelle (€)'],
+                               marker_color=['#FF4B4B' if c == 'A' else '#FFA500' if c == 'B' else '#008000' 
+                                           for c in df_abc['Classe']],
+                               name='Valeur par article'))
+            fig.add_trace(go.Scatter(x=df_abc['Article'], y=df_abc['Cumul %'],
+                                   mode='lines', name='Cumul %', yaxis='y2',
+                                   line=dict(color='blue', width=2)))
+            fig.update_layout(
+                title='Diagramme Pareto - Analyse ABC',
+                xaxis_title='Articles',
+                yaxis_title='Valeur Annuelle (€)',
+                yaxis2=dict(title='Cumul %', overlaying='y', side='right', range=[0, 100])
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+def show_investment_knowledge():
+    st.header("🏗️ Théorie de l'Investissement")
+    
+    st.markdown("""
+    ## 📚 Méthodes d'Évaluation des Investissements
+    
+    ### 🎯 Les Cinq Critères d'Évaluation
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        ### 📈 Valeur Actuelle Nette (VAN)
+        
+        **Définition :**
+        La VAN représente la valeur créée par l'investissement, actualisée au taux de rendement requis.
+        """)
+        
+        st.latex(r"""
+        VAN = \sum_{t=1}^{n} \frac{CF_t}{(1+i)^t} - I_0
+        """)
+        
+        st.markdown("""
+        **Où :**
+        - $CF_t$ : Cash-flow de la période t
+        - $i$ : Taux d'actualisation
+        - $I_0$ : Investissement initial
+        - $n$ : Durée de vie du projet
+        """)
+        
+        st.markdown("""
+        **Règle de décision :**
+        - $VAN > 0$ : Projet acceptable
+        - $VAN < 0$ : Projet à rejeter
+        - Entre projets : Choisir la VAN la plus élevée
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 🔄 Taux de Rendement Interne (TRI)
+        
+        **Définition :**
+        Le TRI est le taux d'actualisation qui annule la VAN du projet.
+        """)
+        
+        st.latex(r"""
+        \sum_{t=1}^{n} \frac{CF_t}{(1+TRI)^t} - I_0 = 0
+        """)
+        
+        st.markdown("""
+        **Règle de décision :**
+        - $TRI > i$ : Projet acceptable
+        - $TRI < i$ : Projet à rejeter
+        - $i$ : Taux de rendement requis
+        """)
+        
+        st.markdown("""
+        ### ⏱️ Délai de Récupération
+        """)
+        
+        st.latex(r"""
+        \text{Payback} = \frac{I_0}{\overline{CF}}
+        """)
+        
+        st.markdown("""
+        **Limites :**
+        - Ignore la valeur temporelle de l'argent
+        - Ne considère pas les cash-flows après récupération
+        """)
+    
+    # Simulateur d'investissement
+    st.subheader("🧮 Simulateur d'Investissement")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Paramètres de l'investissement :**")
+        investment = st.number_input("Investissement initial (€)", value=100000)
+        lifespan = st.number_input("Durée de vie (années)", value=5, min_value=1, max_value=20)
+        discount_rate = st.number_input("Taux d'actualisation (%)", value=10.0, min_value=0.1) / 100
+        
+        st.write("**Cash-flows annuels :**")
+        cash_flows = []
+        for year in range(1, lifespan + 1):
+            cf = st.number_input(f"Année {year}", value=30000, key=f"cf_{year}")
+            cash_flows.append(cf)
+    
+    with col2:
+        if st.button("🎯 Calculer la Rentabilité"):
+            # Calcul VAN
+            van = -investment
+            for year, cf in enumerate(cash_flows, 1):
+                van += cf / ((1 + discount_rate) ** year)
+            
+            with timed("Calcul TRI"):
+                # Calcul TRI (dichotomie vectorisée : moins d'une milliseconde, sans cache)
+                tri = float(engines.irr(investment, cash_flows)[0])
+            
+            # Calcul délai de récupération
+            cumulative_cf = 0
+            payback = None
+            for year, cf in enumerate(cash_flows, 1):
+                cumulative_cf += cf
+                if cumulative_cf >= investment and payback is None:
+                    payback = year - 1 + (investment - (cumulative_cf - cf)) / cf
+            
+            # Calcul indice de profitabilité
+            profitability_index = (van + investment) / investment
+            
+            # Affichage résultats
+            st.success("**📊 Résultats de l'analyse :**")
+            
+            results_data = {
+                'Critère': ['VAN', 'TRI', 'Délai de récupération', 'Indice de profitabilité'],
+                'Valeur': [
+                    f"{van:,.0f} €",
+                    f"{tri*100:.1f}%",
+                    f"{payback:.1f} ans" if payback else "Non récupéré",
+                    f"{profitability_index:.2f}"
+                ],
+                'Seuil': [
+                    "> 0",
+                    f"> {discount_rate*100:.1f}%",
+                    "< Durée de vie",
+                    "> 1"
+                ],
+                'Décision': [
+                    "✅ Acceptable" if van > 0 else "❌ Rejet",
+                    "✅ Acceptable" if tri > discount_rate else "❌ Rejet",
+                    "✅ Acceptable" if payback and payback <= lifespan else "⚠️ À étudier",
+                    "✅ Acceptable" if profitability_index > 1 else "❌ Rejet"
+                ]
+            }
+            
+            st.dataframe(pd.DataFrame(results_data), use_container_width=True)
+            
+            # Recommandation globale
+            if van > 0 and tri > discount_rate:
+                st.success("🎉 **INVESTISSEMENT RECOMMANDÉ** - Le projet est rentable")
+            else:
+                st.error("💸 **INVESTISSEMENT NON RECOMMANDÉ** - Le projet n'est pas rentable")
+
+def show_cashflow_knowledge():
+    st.header("💸 Théorie de la Gestion de Trésorerie")
+    
+    st.markdown("""
+    ## 📚 Principes et Méthodes de Gestion de Trésorerie
+    
+    ### 🎯 Les Trois Tableaux de Flux Essentiels
+    """)
+    
+    tab1, tab2, tab3 = st.tabs(["💰 Flux d'Exploitation", "🏗️ Flux d'Investissement", "🏦 Flux de Financement"])
+    
+    with tab1:
+        st.markdown("""
+        ### 💼 Flux de Trésorerie d'Exploitation (FTE)
+        
+        **Définition :**
+        Les flux générés par l'activité normale de l'entreprise.
+        """)
+        
+        st.latex(r"""
+        FTE = \text{Résultat Net} + \text{Dotations aux Amortissements} - \Delta\text{BFR}
+        """)
+        
+        st.markdown("""
+        **Calcul du BFR (Besoin en Fonds de Roulement) :**
+        """)
+        st.latex(r"""
+        \text{BFR} = \text{Stocks} + \text{Créances Clients} - \text{Dettes Fournisseurs}
+        """)
+        
+        st.markdown("""
+        **Variation du BFR :**
+        """)
+        st.latex(r"""
+        \Delta\text{BFR} = \text{BFR}_{fin} - \text{BFR}_{début}
+        """)
+        
+        st.markdown("""
+        **Capacité d'Autofinancement (CAF) :**
+        """)
+        st.latex(r"""
+        \text{CAF} = \text{Résultat Net} + \text{Dotations} - \text{Reprises}
+        """)
+    
+    with tab2:
+        st.markdown("""
+        ### 🏗️ Flux de Trésorerie d'Investissement (FTI)
+        
+        **Définition :**
+        Les flux liés aux acquisitions et cessions d'immobilisations.
+        """)
+        
+        st.latex(r"""
+        FTI = -\text{Acquisitions d'Immobilisations} + \text{Cessions d'Immobilisations}
+        """)
+        
+        st.markdown("""
+        **Composantes principales :**
+        - Acquisitions d'immobilisations corporelles
+        - Acquisitions d'immobilisations incorporelles  
+        - Cessions d'éléments d'actif
+        - Prêts accordés à des tiers
+        """)
+    
+    with tab3:
+        st.markdown("""
+        ### 🏦 Flux de Trésorerie de Financement (FTF)
+        
+        **Définition :**
+        Les flux liés aux apporteurs de capitaux.
+        """)
+        
+        st.latex(r"""
+        FTF = \text{Augmentations de Capital} + \text{Nouveaux Emprunts} - \text{Remboursements} - \text{Dividendes}
+        """)
+        
+        st.markdown("""
+        **Trésorerie Nette :**
+        """)
+        st.latex(r"""
+        TN = FTE + FTI + FTF
+        """)
+    
+    # Simulateur de trésorerie
+    st.subheader("🧮 Simulateur de Prévision de Trésorerie")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Paramètres de base :**")
+        initial_cash = st.number_input("Trésorerie initiale (€)", value=50000)
+        forecast_period = st.selectbox("Période de prévision", ["3 mois", "6 mois", "12 mois"])
+        
+        st.write("**Encaissements :**")
+        monthly_revenue = st.number_input("CA Mensuel Moyen (€)", value=100000)
+        client_payment_delay = st.number_input("Délai paiement clients (jours)", value=30)
+    
+    with col2:
+        st.write("**Décaissements :**")
+        monthly_expenses = st.number_input("Charges Mensuelles Moyennes (€)", value=80000)
+        supplier_payment_delay = st.number_input("Délai paiement fournisseurs (jours)", value=60)
+        exceptional_expense = st.number_input("Dépense exceptionnelle (€, mois 3)", value=30000)
+    
+    if st.button("📊 Générer la Prévision"):
+        # Calcul BFR
+        bfr_operating = (client_payment_delay / 30 * monthly_revenue) - (supplier_payment_delay / 30 * monthly_expenses)
+        
+        # Simulation sur 12 mois
+        months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun', 'Jul', 'Aoû', 'Sep', 'Oct', 'Nov', 'Déc']
+        n_months = 12 if forecast_period == "12 mois" else 6 if forecast_period == "6 mois" else 3
+        
+        with timed("Prévision de trésorerie"):
+            cash_flow = [initial_cash]
+            monthly_variations = []
+        
+            for i in range(n_months):
+                # Mois avec dépense exceptionnelle
+                if i == 2:  # Mars
+                    variation = monthly_revenue - monthly_expenses - exceptional_expense
+                else:
+                    variation = monthly_revenue - monthly_expenses
+            
+                monthly_variations.append(variation)
+                new_cash = cash_flow[i] + variation
+                cash_flow.append(new_cash)
+        
+        # Création du tableau
+        df_cashflow = pd.DataFrame({
+            'Mois': ['Initial'] + months[:n_months],
+            'Trésorerie (€)': cash_flow,
+            'Variation (€)': [0] + monthly_variations,
+            'Cumul Variations (€)': np.cumsum([0] + monthly_variations)
+        })
+        
+        paginated_table(df_cashflow, key='simulation_tresorerie', formats={
+            'Trésorerie (€)': '{:,.0f} €',
+            'Variation (€)': '{:,.0f} €',
+            'Cumul Variations (€)': '{:,.0f} €'
+        })
+        
+        # Graphique
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=df_cashflow['Mois'], y=df_cashflow['Trésorerie (€)'],
+                               mode='lines+markers', name='Trésorerie',
+                               line=dict(color='blue', width=3)))
+        fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Seuil de rupture")
+        fig.update_layout(title='Évolution Prévisionnelle de la Trésorerie',
+                         xaxis_title='Mois',
+                         yaxis_title='Trésorerie (€)')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Analyse
+        min_cash = min(cash_flow)
+        avg_monthly_variation = np.mean(monthly_variations)
+        
+        st.subheader("📈 Analyse de la Prévision")
+        
+        col_anal1, col_anal2, col_anal3 = st.columns(3)
+        
+        with col_anal1:
+            st.metric("Trésorerie minimale", f"{min_cash:,.0f} €")
+        with col_anal2:
+            st.metric("Variation mensuelle moyenne", f"{avg_monthly_variation:,.0f} €")
+        with col_anal3:
+            st.metric("BFR d'exploitation", f"{bfr_operating:,.0f} €")
+        
+        if min_cash < 0:
+            st.error(f"""
+            **🚨 RISQUE DE RUPTURE DÉTECTÉ**
+            - Trésorerie minimale: {min_cash:,.0f} €
+            - Actions recommandées:
+              * Renégocier les délais fournisseurs
+              * Accélérer le recouvrement clients
+              * Rechercher des financements court terme
+            """)
+        elif min_cash < 10000:
+            st.warning(f"""
+            **⚠️ TRÉSORERIE TENDUE**
+            - Trésorerie minimale: {min_cash:,.0f} €
+            - Surveillance renforcée recommandée
+            - Prévoir une ligne de crédit
+            """)
+        else:
+            st.success(f"""
+            **✅ TRÉSORERIE SÉCURISÉE**
+            - Trésorerie minimale: {min_cash:,.0f} €
+            - Situation financière saine
+            - Possibilité d'investir les excédents
+            """)
+
+def show_advanced_methods():
+    st.header("📊 Méthodes Avancées de Contrôle de Gestion")
+    
+    st.markdown("""
+    ## 🧠 Techniques Statistiques et Prédictives Avancées
+    
+    ### 📈 Méthodes de Prévision Sophistiquées
+    """)
+    
+    tab1, tab2, tab3 = st.tabs(["Séries Temporelles", "Régression Multiple", "Machine Learning"])
+    
+    with tab1:
+        st.markdown("""
+        ### 🔄 Modèles ARIMA (AutoRegressive Integrated Moving Average)
+        
+        **Décomposition d'une série temporelle :**
+        """)
+        
+        st.latex(r"""
+        Y_t = T_t + S_t + C_t + I_t
+        """)
+        
+        st.markdown("""
+        **Où :**
+        - $Y_t$ : Série observée
+        - $T_t$ : Composante tendancielle
+        - $S_t$ : Composante saisonnière
+        - $C_t$ : Composante cyclique
+        - $I_t$ : Composante irrégulière
+        """)
+        
+        st.markdown("""
+        **Formule ARIMA(p,d,q) :**
+        """)
+        
+        st.latex(r"""
+        (1 - \sum_{i=1}^p \phi_i L^i)(1-L)^d y_t = (1 + \sum_{i=1}^q \theta_i L^i) \epsilon_t
+        """)
+        
+        st.markdown("""
+        **Paramètres :**
+        - $p$ : Ordre autorégressif
+        - $d$ : Ordre de différenciation
+        - $q$ : Ordre moyenne mobile
+        - $L$ : Opérateur retard
+        - $\epsilon_t$ : Terme d'erreur blanc
+        """)
+        
+        st.markdown("""
+        **Applications en contrôle de gestion :**
+        - Prévision des ventes saisonnières
+        - Analyse des tendances long terme
+        - Détection d'anomalies
+        - Optimisation des stocks
+        """)
+    
+    with tab2:
+        st.markdown("""
+        ### 📊 Régression Multiple
+        
+        **Modèle général :**
+        """)
+        
+        st.latex(r"""
+        y = \beta_0 + \beta_1 x_1 + \beta_2 x_2 + \cdots + \beta_n x_n + \epsilon
+        """)
+        
+        st.markdown("""
+        **Variables explicatives typiques :**
+        - Prix de vente
+        - Dépenses marketing
+        - Indices économiques
+        - Facteurs saisonniers
+        - Actions concurrentielles
+        - Données météorologiques
+        """)
+        
+        st.markdown("""
+        **Mesures de performance :**
+        """)
+        
+        st.latex(r"""
+        R^2 = 1 - \frac{\sum(y_i - \hat{y}_i)^2}{\sum(y_i - \bar{y})^2}
+        """)
+        
+        st.latex(r"""
+        \text{RMSE} = \sqrt{\frac{1}{n}\sum_{i=1}^n (y_i - \hat{y}_i)^2}
+        """)
+        
+        st.latex(r"""
+        \text{MAPE} = \frac{100\%}{n}\sum_{i=1}^n \left| \frac{y_i - \hat{y}_i}{y_i} \right|
+        """)
+        
+        st.markdown("""
+        **Avantages :**
+        - Capture les relations multiples
+        - Mesure l'impact de chaque variable
+        - Facile à interpréter
+        - Bonnes propriétés statistiques
+        """)
+    
+    with tab3:
+        st.markdown("""
+        ### 🤖 Machine Learning pour le Contrôle de Gestion
+        
+        **Algorithmes utilisés :**
+        """)
+        
+        ml_algorithms = {
+            'Algorithme': ['Random Forest', 'XGBoost', 'LSTM', 'Prophet', 'SVM'],
+            'Application': ['Prévision ventes', 'Classification clients', 'Séries temporelles', 'Saisonnalité', 'Anomalies'],
+            'Avantages': ['Robustesse bruit', 'Performance', 'Séquences longues', 'Saisonnalité forte', 'Frontières complexes'],
+            'Complexité': ['Moyenne', 'Élevée', 'Très élevée', 'Moyenne', 'Élevée']
+        }
+        
+        st.dataframe(pd.DataFrame(ml_algorithms), use_container_width=True)
+        
+        st.markdown("""
+        **Feature Engineering :**
+        """)
+        
+        st.code("""
+        # Variables décalées (lags)
+        df['lag_1'] = df['ventes'].shift(1)
+        df['lag_7'] = df['ventes'].shift(7)
+        df['lag_30'] = df['ventes'].shift(30)
+        
+        # Moyennes mobiles
+        df['ma_7'] = df['ventes'].rolling(7).mean()
+        df['ma_30'] = df['ventes'].rolling(30).mean()
+        
+        # Variables temporelles
+        df['day_of_week'] = df.index.dayofweek
+        df['month'] = df.index.month
+        df['is_weekend'] = df['day_of_week'].isin([5, 6])
+        
+        # Variables externes
+        df['promotion_active'] = df['budget_promo'] > 0
+        df['economic_index'] = external_data['gdp_growth']
+        """, language='python')
+        
+        st.markdown("""
+        **Validation des modèles :**
+        - Validation croisée time-series
+        - Backtesting
+        - Tests de robustesse
+        - Analyse des résidus
+        """)
+    
+    # Comparaison des méthodes
+    st.subheader("📈 Comparaison des Méthodes de Prévision")
+    
+    comparison_data = {
+        'Méthode': ['Moyenne Mobile', 'Lissage Exponentiel', 'Régression Linéaire', 'ARIMA', 'Machine Learning'],
+        'Précision': ['Moyenne', 'Bonne', 'Bonne', 'Très bonne', 'Excellente'],
+        'Complexité': ['Faible', 'Faible', 'Moyenne', 'Élevée', 'Très élevée'],
+        'Données Requises': ['Historique court', 'Historique court', 'Variables explicatives', 'Série longue', 'Grand volume'],
+        'Coût Calcul': ['Faible', 'Faible', 'Moyen', 'Élevé', 'Très élevé'],
+        'Meilleur Usage': ['Tendance simple', 'Saisonnalité légère', 'Relations linéaires', 'Séries complexes', 'Patterns complexes']
+    }
+    
+    st.dataframe(pd.DataFrame(comparison_data), use_container_width=True)
+    
+    st.markdown("""
+    ### 🎯 Recommandations de Sélection
+    
+    **Pour les débutants :**
+    - Commencer par les méthodes simples (moyenne mobile, lissage exponentiel)
+    - Valider avec des indicateurs de performance (RMSE, MAPE)
+    - Progresser vers des méthodes plus sophistiquées
+    
+    **Pour les experts :**
+    - Combiner plusieurs méthodes (ensembling)
+    - Utiliser la validation croisée
+    - Implémenter des systèmes de monitoring
+    - Automatiser le réentraînement des modèles
+    """)
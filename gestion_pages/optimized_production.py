@@ -0,0 +1,354 @@
+"""Page « 🏭 Production Optimisée »."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import time
+
+def show_optimized_production():
+    st.title("🏭 Production Optimisée")
+    
+    st.markdown("""
+    ## 🧠 Système Intelligent de Planification et Optimisation de la Production
+    
+    ### 🎯 Planification Avancée et Optimisation en Temps Réel
+    """)
+    
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📅 Plan Directeur", 
+        "🔧 Optimisation Charges", 
+        "📈 Performance Temps Réel",
+        "🤖 IA Prévisionnelle"
+    ])
+    
+    with tab1:
+        show_production_master_plan()
+    
+    with tab2:
+        show_capacity_optimization()
+    
+    with tab3:
+        show_realtime_performance()
+    
+    with tab4:
+        show_ai_production_forecasting()
+
+def show_production_master_plan():
+    st.header("📅 Plan Directeur de Production (PDP)")
+    
+    st.markdown("""
+    ### 🎯 Méthode MRP II - Manufacturing Resource Planning
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📊 Données d'Entrée")
+        
+        ventes_prevues = st.number_input("Prévisions ventes mensuelles (unités)", value=10000)
+        stock_initial = st.number_input("Stock initial (unités)", value=1500)
+        stock_cible = st.number_input("Stock cible (unités)", value=2000)
+        delai_fabrication = st.number_input("Délai de fabrication (jours)", value=10)
+        
+        st.subheader("⚙️ Contraintes de Production")
+        capacite_journaliere = st.number_input("Capacité de production journalière (unités)", value=500)
+        jours_ouvres = st.number_input("Jours ouvrés par mois", value=22)
+    
+    with col2:
+        # Calculs automatiques
+        production_necessaire = ventes_prevues + stock_cible - stock_initial
+        jours_production = production_necessaire / capacite_journaliere
+        taux_utilisation = (production_necessaire / (capacite_journaliere * jours_ouvres)) * 100
+        
+        st.metric("📦 Production nécessaire", f"{production_necessaire:,.0f} unités")
+        st.metric("⏱️ Jours de production estimés", f"{jours_production:.1f} jours")
+        st.metric("🏭 Taux d'utilisation capacité", f"{taux_utilisation:.1f}%")
+        
+        # Recommandations
+        if taux_utilisation > 100:
+            st.error("🚨 **CAPACITÉ INSUFFISANTE** - Prévoir heures supplémentaires ou sous-traitance")
+        elif taux_utilisation > 85:
+            st.warning("⚠️ **CAPACITÉ TENDUE** - Surveillance renforcée nécessaire")
+        else:
+            st.success("✅ **CAPACITÉ ADÉQUATE** - Planification optimale possible")
+    
+    # Plan de production détaillé
+    st.subheader("📋 Plan de Production Détaillé")
+    
+    if st.button("📊 Générer le Plan de Production"):
+        # Génération d'un plan simulé
+        semaines = ['Sem 1', 'Sem 2', 'Sem 3', 'Sem 4']
+        production_plan = {
+            'Semaine': semaines,
+            'Production Planifiée': [2500, 2500, 2500, 2500],
+            'Capacité Disponible': [2750, 2750, 2750, 2750],
+            'Taux Utilisation': ['90.9%', '90.9%', '90.9%', '90.9%'],
+            'Stock Fin Semaine': [1800, 1600, 1400, 2000]
+        }
+        
+        df_plan = pd.DataFrame(production_plan)
+        st.dataframe(df_plan, use_container_width=True)
+        
+        # Graphique Gantt simplifié
+        st.subheader("📅 Diagramme de Gantt de Production")
+        
+        tasks = [
+            dict(Task="Préparation", Start='2024-01-01', Finish='2024-01-03'),
+            dict(Task="Fabrication Lot A", Start='2024-01-04', Finish='2024-01-10'),
+            dict(Task="Fabrication Lot B", Start='2024-01-11', Finish='2024-01-17'),
+            dict(Task="Contrôle Qualité", Start='2024-01-18', Finish='2024-01-20'),
+            dict(Task="Expédition", Start='2024-01-21', Finish='2024-01-22')
+        ]
+        
+        # Affichage simplifié du diagramme
+        for task in tasks:
+            col1, col2, col3 = st.columns([2, 3, 1])
+            with col1:
+                st.write(f"**{task['Task']}**")
+            with col2:
+                st.progress(100)
+            with col3:
+                st.write(f"{task['Start']} to {task['Finish']}")
+
+def show_capacity_optimization():
+    st.header("🔧 Optimisation des Charges de Production")
+    
+    st.markdown("""
+    ### 🎯 Répartition Optimale des Ressources
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🏭 Ressources Disponibles")
+        
+        machines = st.number_input("Nombre de machines", value=8, min_value=1)
+        equipes = st.number_input("Nombre d'équipes", value=3, min_value=1)
+        heures_equipe = st.number_input("Heures par équipe/semaine", value=35)
+        
+        st.subheader("📦 Commandes en Cours")
+        commandes_urgentes = st.number_input("Commandes urgentes (unités)", value=500)
+        commandes_normales = st.number_input("Commandes normales (unités)", value=2000)
+    
+    with col2:
+        # Calcul de la capacité
+        capacite_totale = machines * equipes * heures_equipe * 4  # capacité mensuelle
+        besoin_production = (commandes_urgentes * 1.5) + (commandes_normales * 1.0)  # coefficients de difficulté
+        
+        taux_charge = (besoin_production / capacite_totale) * 100
+        
+        st.metric("⚡ Capacité totale disponible", f"{capacite_totale:,.0f} h-machine")
+        st.metric("📦 Besoin de production", f"{besoin_production:,.0f} h-machine")
+        st.metric("📊 Taux de charge global", f"{taux_charge:.1f}%")
+        
+        # Recommandations d'optimisation
+        if taux_charge > 100:
+            st.error("""
+            **🚨 SURCHARGE CRITIQUE**
+            - Activer les heures supplémentaires
+            - Sous-traiter une partie de la production
+            - Renégocier les délais clients
+            """)
+        elif taux_charge > 85:
+            st.warning("""
+            **⚠️ CHARGE ÉLEVÉE**
+            - Optimiser les séquences de production
+            - Rééquilibrer les charges entre équipes
+            - Anticiper les maintenances
+            """)
+        else:
+            st.success("""
+            **✅ CHARGE OPTIMALE**
+            - Capacité bien utilisée
+            - Marge de manœuvre disponible
+            - Possibilité d'accepter nouvelles commandes
+            """)
+    
+    # Optimisation avancée
+    st.subheader("🧮 Optimisation par Algorithmes")
+    
+    if st.button("🎯 Lancer l'Optimisation Automatique"):
+        with st.spinner("Calcul de la solution optimale..."):
+            time.sleep(2)
+            
+            st.success("✅ Solution optimale trouvée!")
+            
+            # Résultats de l'optimisation
+            optimisation_results = {
+                'Paramètre': ['Charge Équipe A', 'Charge Équipe B', 'Charge Équipe C', 'Heures Supp', 'Taux Utilisation Machines'],
+                'Avant Optimisation': ['115%', '92%', '78%', '12h', '88%'],
+                'Après Optimisation': ['95%', '98%', '97%', '8h', '92%'],
+                'Gain': ['-20%', '+6%', '+19%', '-4h', '+4%']
+            }
+            
+            st.dataframe(pd.DataFrame(optimisation_results), use_container_width=True)
+            
+            st.info("""
+            **💡 Recommandations de l'algorithme:**
+            - Réaffecter 15% de la charge de l'équipe A vers l'équipe C
+            - Programmer les maintenances préventives en période creuse
+            - Utiliser la flexibilité inter-équipes
+            """)
+
+def show_realtime_performance():
+    st.header("📈 Performance de Production en Temps Réel")
+    
+    st.markdown("""
+    ### 🎯 Monitoring Live des Indicateurs de Production
+    """)
+    
+    # KPI en temps réel
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("🏭 Production du Jour", "1,245 unités", "8.2%")
+        st.metric("⚡ Cadence Réelle", "52 u/h", "3.5%")
+    
+    with col2:
+        st.metric("✅ Taux Qualité", "98.7%", "0.8%")
+        st.metric("🔄 TRS Global", "85.2%", "2.1%")
+    
+    with col3:
+        st.metric("⏱️ Temps d'Arrêt", "2.3%", "-0.5%")
+        st.metric("🔧 Maintenances", "95.8%", "1.2%")
+    
+    with col4:
+        st.metric("📊 Rendement", "92.5%", "1.8%")
+        st.metric("💸 Coût Unitaire", "245 €", "-2.3%")
+    
+    # Graphiques de performance temps réel
+    st.subheader("📊 Évolution des Performances")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Évolution du TRS
+        heures = [f"{h:02d}:00" for h in range(6, 22)]
+        trs_values = [82 + np.random.normal(0, 3) for _ in heures]
+        
+        fig = px.line(x=heures, y=trs_values, title='TRS en Temps Réel',
+                     labels={'x': 'Heure', 'y': 'TRS (%)'})
+        fig.add_hline(y=85, line_dash="dash", line_color="red", annotation_text="Objectif")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Répartition des arrêts
+        causes_arrets = {
+            'Cause': ['Maintenance', 'Changement série', 'Panne', 'Approvisionnement', 'Formation'],
+            'Durée (min)': [45, 30, 25, 20, 15]
+        }
+        
+        fig = px.pie(causes_arrets, values='Durée (min)', names='Cause',
+                    title='Répartition des Temps d\'Arrêt')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Alertes temps réel
+    st.subheader("🚨 Alertes de Production")
+    
+    alertes = [
+        {"type": "⚠️", "message": "Machine B - Tendance baisse rendement", "priorite": "Moyenne"},
+        {"type": "🔴", "message": "Équipe C - Retard production 15%", "priorite": "Haute"},
+        {"type": "🟢", "message": "Qualité - Objectif dépassé", "priorite": "Basse"},
+        {"type": "⚠️", "message": "Stock matière première critique", "priorite": "Moyenne"}
+    ]
+    
+    for alerte in alertes:
+        with st.container(border=True):
+            col1, col2 = st.columns([1, 4])
+            with col1:
+                st.write(f"**{alerte['type']} {alerte['priorite']}**")
+            with col2:
+                st.write(alerte['message'])
+                if alerte['priorite'] == "Haute":
+                    st.button("Intervenir", key=f"btn_{alerte['message']}")
+
+def show_ai_production_forecasting():
+    st.header("🤖 IA Prédictive pour la Production")
+    
+    st.markdown("""
+    ### 🧠 Système de Prévision et Optimisation par Intelligence Artificielle
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📊 Modèles Prédictifs")
+        
+        st.markdown("""
+        **🎯 Applications de l'IA:**
+        - Prévision des pannes
+        - Optimisation des paramètres
+        - Prévision de la demande
+        - Optimisation des stocks
+        - Planification intelligente
+        """)
+        
+        st.markdown("""
+        **🧠 Algorithmes Utilisés:**
+        - Random Forest
+        - LSTM pour séries temporelles
+        - Reinforcement Learning
+        - Computer Vision pour contrôle qualité
+        """)
+    
+    with col2:
+        st.subheader("📈 Performance des Modèles")
+        
+        model_performance = {
+            'Modèle': ['Prévision Pannes', 'Optimisation Paramètres', 'Contrôle Qualité', 'Prévision Demande'],
+            'Précision': ['94.2%', '91.8%', '96.5%', '92.3%'],
+            'Gain Productivité': ['+12.5%', '+8.7%', '+15.2%', '+9.8%'],
+            'Statut': ['🟢 Production', '🟢 Production', '🟡 Test', '🟢 Production']
+        }
+        
+        st.dataframe(pd.DataFrame(model_performance), use_container_width=True)
+    
+    # Démonstration de l'IA prédictive
+    st.subheader("🔮 Démonstration - Prévision des Pannes")
+    
+    if st.button("🎯 Lancer la Simulation IA"):
+        with st.spinner("Analyse des données et prédiction en cours..."):
+            time.sleep(3)
+            
+            st.success("✅ Analyse IA terminée!")
+            
+            # Résultats de la prédiction
+            col_res1, col_res2, col_res3 = st.columns(3)
+            
+            with col_res1:
+                st.metric("🔧 Prochaine Panne Prévue", "J+4", "92% de confiance")
+                st.metric("📍 Machine à Risque", "Presse HYD-45")
+            
+            with col_res2:
+                st.metric("⏱️ Fenêtre d'Intervention", "48h", "Pour maintenance préventive")
+                st.metric("💰 Économie Potentielle", "12,500 €", "Évitation arrêt production")
+            
+            with col_res3:
+                st.metric("🎯 Composant Critique", "Joint d'étanchéité", "Usure détectée")
+                st.metric("📊 Données Analysées", "2.5M points", "6 mois d'historique")
+            
+            # Recommandations IA
+            st.subheader("💡 Recommandations de l'IA")
+            
+            recommendations = [
+                "🔧 **Programmer maintenance préventive** dans les 48h sur la presse HYD-45",
+                "📦 **Commander pièces de rechange** : Joints d'étanchéité (réf. JNT-4587)",
+                "👨‍🔧 **Former équipe maintenance** sur les signes avant-coureurs",
+                "📊 **Renforcer monitoring** des paramètres hydrauliques",
+                "🔄 **Ajuster planning production** pour anticiper la maintenance"
+            ]
+            
+            for i, rec in enumerate(recommendations, 1):
+                st.write(f"{i}. {rec}")
+            
+            # Plan d'action automatique
+            st.subheader("📅 Plan d'Action Généré")
+            
+            plan_actions = {
+                'Action': ['Commander pièces', 'Programmer maintenance', 'Alerter équipe', 'Ajuster planning'],
+                'Responsable': ['Logistique', 'Planning', 'Maintenance', 'Production'],
+                'Échéance': ['24h', '48h', 'Immédiat', '24h'],
+                'Statut': ['🟡 En cours', '🟢 Planifié', '🔴 En attente', '🟡 En cours']
+            }
+            
+            st.dataframe(pd.DataFrame(plan_actions), use_container_width=True)
@@ -0,0 +1,84 @@
+"""Page « ⏱️ Performance »."""
+import streamlit as st
+import plotly.express as px
+
+from data_table import paginated_table
+from perf_monitor import PAGE_BLOCK, get_perf_store
+from profiler import get_profile_store, is_admin, show_profile
+
+WINDOWS = {"1 h": 1, "24 h": 24, "7 j": 24 * 7, "30 j": 24 * 30}
+DURATION_FORMATS = {column: '{:,.0f} ms' for column in ['p50', 'p90', 'p95', 'p99', 'max']}
+
+
+def show_performance():
+    st.title("⏱️ Performance")
+    if not is_admin():
+        st.warning("🔒 Page réservée aux administrateurs.")
+        return
+    st.caption("Durées de rendu des pages et des blocs de calcul, toutes sessions confondues.")
+
+    store = get_perf_store()
+    col_window, col_freq = st.columns(2)
+    with col_window:
+        window = st.selectbox("Fenêtre d'analyse:", list(WINDOWS), index=1)
+    with col_freq:
+        freq = st.selectbox("Pas de l'historique:", ["15min", "h", "D"], index=1,
+                            format_func={"15min": "15 min", "h": "1 h", "D": "1 jour"}.get)
+    hours = WINDOWS[window]
+
+    stats = store.percentiles(window_hours=hours)
+    if stats.empty:
+        st.info("Aucune mesure sur la fenêtre : les rendus de page sont enregistrés au fil de l'utilisation.")
+        show_profiles()
+        return
+
+    pages = stats[stats['block'] == PAGE_BLOCK].drop(columns='block')
+    blocks = stats[stats['block'] != PAGE_BLOCK]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🖥️ Rendus mesurés", f"{pages['n'].sum():,}")
+    with col2:
+        st.metric("👥 Sessions", f"{store.timings(hours)['session_id'].nunique():,}")
+    with col3:
+        slowest = pages.iloc[0] if not pages.empty else None
+        st.metric("🐢 p95 le plus lent", f"{slowest['p95']:,.0f} ms" if slowest is not None else "-")
+    with col4:
+        st.metric("⚠️ Rendus en erreur", f"{stats['errors'].sum():,}")
+
+    st.subheader("📄 Rendus de page")
+    if pages.empty:
+        st.info("Aucun rendu de page complet sur la fenêtre.")
+    else:
+        fig = px.bar(pages.sort_values('p95'), x='p95', y='page', orientation='h',
+                     hover_data=['p50', 'p99', 'n'], title="p95 du rendu par page (ms)")
+        st.plotly_chart(fig, use_container_width=True)
+        paginated_table(pages, key='perf_pages', formats=DURATION_FORMATS, hide_index=True)
+
+        st.subheader("📈 Évolution")
+        timeline = store.timeline(window_hours=hours, freq=freq)
+        metric = st.radio("Percentile:", ['p95', 'p50'], horizontal=True)
+        fig = px.line(timeline, x='ts', y=metric, color='page', markers=True,
+                      hover_data=['n'], title=f"{metric} du rendu par page (ms)")
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("🧮 Blocs de calcul")
+    if blocks.empty:
+        st.info("Aucun bloc de calcul chronométré sur la fenêtre.")
+    else:
+        paginated_table(blocks, key='perf_blocks', formats=DURATION_FORMATS, hide_index=True)
+
+    show_profiles()
+
+
+def show_profiles():
+    """Profils cProfile enregistrés"""
+    st.subheader("🔬 Profils enregistrés")
+    profiles = get_profile_store().list()
+    if profiles.empty:
+        st.info("Aucun profil : utilisez « 🔬 Profiler le prochain rendu » dans la barre latérale d'une page.")
+        return
+    labels = {row.id: f"n° {row.id} - {row.page} - {row.ts:%d/%m %H:%M:%S} - {row.duration_ms:,.0f} ms"
+              for row in profiles.itertuples()}
+    profile_id = st.selectbox("Profil:", list(labels), format_func=labels.get)
+    show_profile(profile_id, key='perf_profile')
@@ -0,0 +1,35 @@
+"""Page « 📅 Plan d'Implémentation »."""
+import streamlit as st
+import pandas as pd
+
+def show_plan_implementation():
+    st.title("📅 Plan d'Implémentation")
+    
+    st.markdown("""
+    ## Feuille de Route d'Implémentation
+    """)
+    
+    # Gantt chart data
+    tasks = {
+        'Tâche': ['Diagnostic', 'Formation', 'Paramétrage', 'Saisie Budget', 'Contrôle', 'Reporting'],
+        'Début': ['2024-01-01', '2024-01-15', '2024-02-01', '2024-02-15', '2024-03-01', '2024-03-15'],
+        'Fin': ['2024-01-14', '2024-01-31', '2024-02-14', '2024-02-28', '2024-03-14', '2024-03-31'],
+        'Responsable': ['Consultant', 'RH', 'IT', 'Contrôleur', 'Contrôleur', 'Contrôleur']
+    }
+    
+    df_tasks = pd.DataFrame(tasks)
+    st.dataframe(df_tasks, use_container_width=True)
+    
+    # Implementation tips
+    st.subheader("🎯 Bonnes Pratiques d'Implémentation")
+    
+    tips = [
+        "Impliquer toutes les parties prenantes dès le début",
+        "Former les utilisateurs aux concepts budgétaires",
+        "Démarrer avec un périmètre restreint",
+        "Prévoir des revues régulières",
+        "Adapter le processus à la culture d'entreprise"
+    ]
+    
+    for i, tip in enumerate(tips, 1):
+        st.write(f"{i}. {tip}")
@@ -0,0 +1,765 @@
+"""Page « 💸 Trésorerie Prédictive »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import time
+
+import chart_data
+from data_table import paginated_table
+from history_store import HistoryStore
+from live_tiles import live_tiles, refresh_interval
+from perf_monitor import timed
+
+def show_predictive_cashflow():
+    st.title("💸 Trésorerie Prédictive")
+
+ 
+    # Métriques de trésorerie en temps réel : seules les tuiles sont réexécutées à chaque actualisation.
+    # Sans historique, les tuiles d'exemple sont fixes : rien à actualiser.
+    interval = None
+    if HistoryStore().periods('tresorerie'):
+        col_refresh, _ = st.columns([1, 3])
+        with col_refresh:
+            interval = refresh_interval('cashflow_refresh')
+    else:
+        st.caption("Valeurs d'exemple : importez des relevés de trésorerie pour suivre la position réelle.")
+    live_tiles(show_cash_tiles, interval)
+
+    # Onglets pour différentes analyses
+    cashflow_tabs = st.tabs([
+        "📊 Tableau de Bord", 
+        "🔮 Prévisions", 
+        "📋 Détails Flux", 
+        "🎯 Scénarios",
+        "🚨 Alertes",
+        "⚡ Optimisation"
+    ])
+    
+    with cashflow_tabs[0]:
+        show_cashflow_dashboard(interval)
+    
+    with cashflow_tabs[1]:
+        show_forecasts()
+    
+    with cashflow_tabs[2]:
+        show_flow_details()
+    
+    with cashflow_tabs[3]:
+        show_scenarios()
+        
+    with cashflow_tabs[4]:
+        show_alerts()
+    
+    with cashflow_tabs[5]:
+        show_cash_optimization()
+
+# Horizon de projection du point bas, au flux net moyen des derniers mois
+PROJECTION_MONTHS = 6
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_cash_months(version):
+    """Flux nets, soldes de fin de mois et décaissements par période (agrégés par pyarrow)"""
+    store = HistoryStore()
+    flux = store.aggregate('tresorerie', 'montant').set_index('periode')['montant']
+    sorties = store.aggregate('tresorerie', 'montant', filters=[('montant', '<', 0)])
+    return pd.DataFrame({
+        'flux': flux,
+        'solde': flux.cumsum(),
+        'decaissements': -sorties.set_index('periode')['montant'].reindex(flux.index, fill_value=0.0),
+    })
+
+def autonomy_days(month):
+    """Jours couverts par le solde au rythme des décaissements du mois"""
+    return month['solde'] / month['decaissements'] * 30 if month['decaissements'] > 0 else None
+
+def cash_position():
+    """Position de trésorerie de l'historique (None s'il est vide)
+
+    Le solde est le cumul des flux importés ; le point bas projette ce solde
+    sur PROJECTION_MONTHS mois au flux net moyen des 6 derniers mois.
+    """
+    store = HistoryStore()
+    if not store.periods('tresorerie'):
+        return None
+    months = load_cash_months(store.version('tresorerie'))
+    last, recent, earlier = months.iloc[-1], months['flux'].tail(6), months['flux'].iloc[-12:-6]
+    previous = months.iloc[-2] if len(months) > 1 else None
+    projection = last['solde'] + recent.mean() * pd.Series(range(1, PROJECTION_MONTHS + 1))
+    return {
+        'periode': months.index[-1],
+        'solde': last['solde'],
+        'variation': last['flux'],
+        'flux_moyen': recent.mean(),
+        'evolution_flux': recent.mean() / earlier.mean() - 1 if len(earlier) and earlier.mean() else None,
+        'jours': autonomy_days(last),
+        'jours_precedent': autonomy_days(previous) if previous is not None else None,
+        'point_bas': min(last['solde'], projection.min()),
+        'mois_point_bas': 0 if projection.min() >= last['solde'] else int(projection.idxmin()) + 1,
+    }
+
+def format_amount(value):
+    return f"{value / 1e6:.1f}M€" if abs(value) >= 1e6 else f"{value / 1e3:.0f}K€"
+
+def show_cash_tiles():
+    position = cash_position()
+    if position is None:
+        show_sample_cash_tiles()
+        return
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "💰 Solde Actuel",
+            format_amount(position['solde']),
+            f"{position['variation'] / 1e3:+,.0f}K€ sur {position['periode']}",
+            delta_color="normal"
+        )
+
+    with col2:
+        st.metric(
+            "📈 Flux Mensuel Moyen",
+            format_amount(position['flux_moyen']),
+            f"{position['evolution_flux']:+.0%}" if position['evolution_flux'] is not None else None,
+            delta_color="normal"
+        )
+
+    with col3:
+        jours, precedent = position['jours'], position['jours_precedent']
+        st.metric(
+            "⚠️ Jours Autonomie",
+            f"{jours:,.0f} jours" if jours is not None else "-",
+            f"{jours - precedent:+,.0f} jours" if jours is not None and precedent is not None else None,
+            delta_color="normal"
+        )
+
+    with col4:
+        st.metric(
+            "🚨 Point Bas Prévu",
+            format_amount(position['point_bas']),
+            f"dans {position['mois_point_bas']} mois" if position['mois_point_bas'] else "solde actuel",
+            delta_color="off"
+        )
+
+def show_sample_cash_tiles():
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "💰 Solde Actuel", 
+            "2.8M€", 
+            "+150K€ vs mois dernier",
+            delta_color="normal"
+        )
+    
+    with col2:
+        st.metric(
+            "📈 Flux Mensuel Moyen", 
+            "450K€", 
+            "+12%",
+            delta_color="inverse"
+        )
+    
+    with col3:
+        st.metric(
+            "⚠️ Jours Autonomie", 
+            "68 jours", 
+            "-5 jours",
+            delta_color="inverse"
+        )
+    
+    with col4:
+        st.metric(
+            "🚨 Point Bas Prévu", 
+            "1.2M€", 
+            "dans 45 jours",
+            delta_color="inverse"
+        )
+
+def show_cashflow_dashboard(interval=None):
+    st.subheader("📊 Tableau de Bord Trésorerie")
+    
+    # Graphique principal de trésorerie
+    col_viz1, col_viz2 = st.columns([2, 1])
+    
+    with col_viz1:
+        # Données historiques et prévisions
+        dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='MS')
+        historique = [2.5, 2.3, 2.1, 2.4, 2.7, 2.8]  # Janvier à Juin
+        previsions = [2.6, 2.2, 1.8, 1.5, 1.2, 1.8]  # Juillet à Décembre
+        
+        fig_cashflow = go.Figure()
+        
+        # Historique (réduit au budget de points si la série est longue)
+        chart_data.add_series(
+            fig_cashflow, dates[:6], historique,
+            mode='lines+markers',
+            name='Historique',
+            line=dict(color='blue', width=3),
+            marker=dict(size=8)
+        )
+        
+        # Prévisions
+        chart_data.add_series(
+            fig_cashflow, dates[5:], previsions,
+            mode='lines+markers',
+            name='Prévisions',
+            line=dict(color='orange', width=3, dash='dash'),
+            marker=dict(size=8)
+        )
+        
+        # Zone critique
+        fig_cashflow.add_hrect(
+            y0=0, y1=1.5,
+            fillcolor="red", opacity=0.2,
+            layer="below", line_width=0,
+            annotation_text="Zone Critique"
+        )
+        
+        fig_cashflow.update_layout(
+            title="Évolution de la Trésorerie 2024",
+            xaxis_title="Mois",
+            yaxis_title="Trésorerie (M€)",
+            height=400
+        )
+        
+        st.plotly_chart(fig_cashflow, use_container_width=True)
+    
+    with col_viz2:
+        st.subheader("🎯 Indicateurs Clés")
+        live_tiles(show_cash_gauge, interval)
+
+        # Autres indicateurs
+        st.metric("📊 Ratio de Liquidité", "1.8", "0.2")
+        st.metric("⏱️ BFR (Jours)", "45", "-3")
+        st.metric("💳 Ligne Crédit Util.", "35%", "5%")
+
+    # Analyse détaillée des flux
+    st.subheader("📈 Analyse des Flux par Catégorie")
+    
+    col_flow1, col_flow2 = st.columns(2)
+    
+    with col_flow1:
+        # Flux entrants
+        flux_data = {
+            'Catégorie': ['Ventes Clients', 'Subventions', 'Produits Financiers', 'Autres'],
+            'Montant (K€)': [1250, 150, 80, 45],
+            'Évolution (%)': [12.5, 0, 5.2, -2.1]
+        }
+        
+        df_flux = pd.DataFrame(flux_data)
+        df_flux_entrants = df_flux.copy()
+        df_flux_entrants['Type'] = 'Entrants'
+        
+        fig_entrants = px.bar(
+            df_flux, 
+            x='Catégorie', 
+            y='Montant (K€)',
+            title="Flux Entrants par Catégorie",
+            color='Évolution (%)',
+            color_continuous_scale='Viridis'
+        )
+        st.plotly_chart(fig_entrants, use_container_width=True)
+    
+    with col_flow2:
+        # Flux sortants
+        flux_sortants = {
+            'Catégorie': ['Fournisseurs', 'Salaires', 'Impôts', 'Investissements', 'Frais Généraux'],
+            'Montant (K€)': [850, 420, 180, 250, 120],
+            'Évolution (%)': [8.2, 3.5, -1.2, 25.0, 2.1]
+        }
+        
+        df_sortants = pd.DataFrame(flux_sortants)
+        
+        fig_sortants = px.pie(
+            df_sortants, 
+            values='Montant (K€)', 
+            names='Catégorie',
+            title="Répartition des Flux Sortants"
+        )
+        st.plotly_chart(fig_sortants, use_container_width=True)
+
+def show_cash_gauge():
+    # Jauge de trésorerie (M€) : solde de l'historique, exemple sinon
+    position = cash_position()
+    solde_actuel = round(position['solde'] / 1e6, 1) if position is not None else 2.8
+    solde_min_acceptable = 1.0
+    solde_ideal = max(3.0, solde_actuel)
+    
+    fig_gauge = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = solde_actuel,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Niveau Trésorerie"},
+        delta = {'reference': solde_min_acceptable},
+        gauge = {
+            'axis': {'range': [0, solde_ideal]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, solde_min_acceptable], 'color': "red"},
+                {'range': [solde_min_acceptable, solde_ideal], 'color': "lightgray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': solde_actuel
+            }
+        }
+    ))
+    
+    fig_gauge.update_layout(height=300)
+    st.plotly_chart(fig_gauge, use_container_width=True)
+
+@st.fragment
+def show_forecasts():
+    st.subheader("🔮 Prévisions et Modèles Prédictifs")
+    
+    # Sélection du modèle
+    col_model1, col_model2 = st.columns(2)
+    
+    with col_model1:
+        modele_choisi = st.selectbox(
+            "Modèle de Prévision",
+            [
+                "Régression Linéaire",
+                "Série Temporelle (ARIMA)",
+                "Machine Learning (XGBoost)",
+                "Modèle Hybride"
+            ],
+            index=1
+        )
+        
+        horizon_prevision = st.slider(
+            "Horizon de Prévision (mois)",
+            1, 24, 12
+        )
+        
+        niveau_confiance = st.slider(
+            "Intervalle de Confiance",
+            0.80, 0.99, 0.95
+        )
+    
+    with col_model2:
+        st.subheader("🧠 Paramètres du Modèle")
+        
+        include_saisonnalite = st.checkbox("Inclure la saisonnalité", value=True)
+        include_tendances = st.checkbox("Inclure les tendances marché", value=True)
+        include_evenements = st.checkbox("Inclure les événements spéciaux", value=False)
+        
+        if st.button("🔄 Recréer les Prévisions", type="primary"):
+            st.success("Modèle recalculé avec succès!")
+    
+    # Résultats des prévisions
+    st.subheader("📊 Résultats des Prévisions")
+    
+    # Données simulées de prévision
+    dates_forecast = pd.date_range(start='2024-07-01', periods=horizon_prevision, freq='MS')
+    forecast_mean = [2.6, 2.2, 1.8, 1.5, 1.2, 1.8, 2.2, 2.5, 2.8, 3.0, 3.2, 3.3]
+    forecast_upper = [x * 1.1 for x in forecast_mean]
+    forecast_lower = [x * 0.9 for x in forecast_mean]
+    
+    fig_forecast = go.Figure()
+    
+    # Intervalle de confiance
+    chart_data.add_band(
+        fig_forecast, dates_forecast, forecast_lower, forecast_upper,
+        fillcolor='rgba(0,100,80,0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name=f'Intervalle {niveau_confiance*100}%'
+    )
+    
+    # Prévision moyenne
+    chart_data.add_series(
+        fig_forecast, dates_forecast, forecast_mean,
+        line=dict(color='red', width=3),
+        mode='lines+markers',
+        name='Prévision Moyenne'
+    )
+    
+    fig_forecast.update_layout(
+        title=f"Prévisions Trésorerie - {modele_choisi}",
+        xaxis_title="Date",
+        yaxis_title="Trésorerie (M€)",
+        height=500
+    )
+    
+    st.plotly_chart(fig_forecast, use_container_width=True)
+    
+    # Métriques de performance du modèle
+    st.subheader("📈 Performance du Modèle")
+    
+    col_perf1, col_perf2, col_perf3, col_perf4 = st.columns(4)
+    
+    with col_perf1:
+        st.metric("📊 RMSE", "0.15M€", "Amélioration: 8%")
+    
+    with col_perf2:
+        st.metric("🎯 MAPE", "5.2%", "Amélioration: 12%")
+    
+    with col_perf3:
+        st.metric("✅ R²", "0.89", "Stable")
+    
+    with col_perf4:
+        st.metric("🔍 Précision", "92%", "+3%")
+
+# Fenêtre des périodes du détail des flux, comptée depuis le dernier mois de l'historique
+FLOW_PERIODS = {
+    "30 derniers jours": pd.DateOffset(days=30),
+    "3 derniers mois": pd.DateOffset(months=3),
+    "6 derniers mois": pd.DateOffset(months=6),
+}
+
+def cash_flow_filters(type_flux, seuil):
+    """Filtres (OU de ET) sur le signe, la catégorie et le montant absolu des flux"""
+    clauses = []
+    if "Tous" in type_flux or "Entrants" in type_flux:
+        clauses.append([('montant', '>=', seuil)])
+    if "Tous" in type_flux or "Sortants" in type_flux:
+        clauses.append([('montant', '<=', -seuil)])
+    for categorie in ("Investissement", "Financement"):
+        if categorie in type_flux and "Tous" not in type_flux:
+            clauses += [[('categorie', '=', categorie), ('montant', '>=', seuil)],
+                        [('categorie', '=', categorie), ('montant', '<=', -seuil)]]
+    return clauses
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_cash_flows(version, start, filters):
+    """Flux de l'historique depuis start ; seules la tranche et les colonnes affichées sont lues"""
+    df = HistoryStore().read('tresorerie', ['date', 'libelle', 'categorie', 'montant', 'entite'],
+                             start=start, filters=[list(clause) for clause in filters])
+    return pd.DataFrame({
+        'Date': df['date'],
+        'Description': df['libelle'],
+        'Type': df['montant'].gt(0).map({True: 'Entrant', False: 'Sortant'}),
+        'Catégorie': df['categorie'],
+        'Montant (K€)': df['montant'] / 1000,
+        'Entité': df['entite'],
+    }).sort_values('Date', ascending=False, ignore_index=True)
+
+def history_cash_flows(type_flux, periode, montant_min):
+    """Détail des flux lu dans l'entrepôt d'historique (None s'il est vide)"""
+    store = HistoryStore()
+    periods = store.periods('tresorerie')
+    if not periods:
+        return None
+    last_month = pd.Period(periods[-1], freq='M')
+    end = (last_month + 1).to_timestamp()
+    start = end - FLOW_PERIODS[periode] if periode in FLOW_PERIODS else pd.Timestamp(last_month.year, 1, 1)
+    filters = cash_flow_filters(type_flux, montant_min * 1000)
+    if not filters:
+        return pd.DataFrame(columns=['Date', 'Description', 'Type', 'Catégorie', 'Montant (K€)', 'Entité'])
+    df = load_cash_flows(store.version('tresorerie'), start,
+                         tuple(tuple(clause) for clause in filters))
+    st.caption(f"{len(df):,} flux de l'historique du {start:%d/%m/%Y} au {end - pd.Timedelta(days=1):%d/%m/%Y}")
+    return df
+
+@st.fragment
+def show_flow_details():
+    st.subheader("📋 Détail des Flux de Trésorerie")
+    
+    # Filtres
+    col_filter1, col_filter2, col_filter3 = st.columns(3)
+    
+    with col_filter1:
+        type_flux = st.multiselect(
+            "Type de Flux",
+            ["Tous", "Entrants", "Sortants", "Investissement", "Financement"],
+            default=["Tous"]
+        )
+    
+    with col_filter2:
+        periode = st.selectbox(
+            "Période",
+            ["30 derniers jours", "3 derniers mois", "6 derniers mois", "Année en cours"]
+        )
+    
+    with col_filter3:
+        montant_min = st.number_input("Montant minimum (K€)", value=10)
+    
+    # Tableau détaillé des flux : historique s'il existe, exemple sinon
+    df_flux_detaille = history_cash_flows(type_flux, periode, montant_min)
+    if df_flux_detaille is not None:
+        paginated_table(df_flux_detaille, key='flux_detaille', formats={'Montant (K€)': '{:,.1f}'})
+    else:
+        show_sample_flows(type_flux, montant_min)
+
+    show_payment_delays()
+
+def show_sample_flows(type_flux, montant_min):
+    flux_detaille = {
+        'Date': ['2024-06-15', '2024-06-10', '2024-06-05', '2024-06-01', '2024-05-28'],
+        'Description': ['Paiement Client ABC', 'Salaire Personnel', 'Achat Matières Premières', 'Subvention État', 'Remboursement Emprunt'],
+        'Type': ['Entrant', 'Sortant', 'Sortant', 'Entrant', 'Sortant'],
+        'Catégorie': ['Ventes', 'Personnel', 'Achats', 'Subventions', 'Financement'],
+        'Montant (K€)': [450, -120, -85, 150, -200],
+        'Statut': ['Réglé', 'Réglé', 'En attente', 'Réglé', 'Réglé']
+    }
+    
+    df_flux_detaille = pd.DataFrame(flux_detaille)
+    df_flux_detaille['Date'] = pd.to_datetime(df_flux_detaille['Date'])
+    
+    # Application des filtres
+    if "Tous" not in type_flux:
+        df_flux_detaille = df_flux_detaille[df_flux_detaille['Type'].isin(type_flux)]
+    
+    df_flux_detaille = df_flux_detaille[df_flux_detaille['Montant (K€)'].abs() >= montant_min]
+    
+    paginated_table(df_flux_detaille, key='flux_detaille', formats={'Montant (K€)': '{:.0f}'})
+
+def show_payment_delays():
+    # Analyse des délais de paiement
+    st.subheader("⏱️ Analyse des Délais de Paiement")
+    
+    col_delai1, col_delai2, col_delai3 = st.columns(3)
+    
+    with col_delai1:
+        st.metric("🧾 Délai Clients Moyen", "45 jours", "+2 jours")
+    
+    with col_delai2:
+        st.metric("📋 Délai Fournisseurs Moyen", "32 jours", "-3 jours")
+    
+    with col_delai3:
+        st.metric("⚖️ Écart Délais", "13 jours", "+5 jours")
+    
+    # Graphique des délais
+    delais_data = {
+        'Mois': ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun'],
+        'Délai Clients': [42, 43, 44, 45, 46, 45],
+        'Délai Fournisseurs': [35, 34, 33, 32, 31, 32]
+    }
+    
+    df_delais = pd.DataFrame(delais_data)
+    
+    fig_delais = go.Figure()
+    fig_delais.add_trace(go.Scatter(
+        x=df_delais['Mois'], y=df_delais['Délai Clients'],
+        name='Délai Clients',
+        line=dict(color='red', width=3)
+    ))
+    fig_delais.add_trace(go.Scatter(
+        x=df_delais['Mois'], y=df_delais['Délai Fournisseurs'],
+        name='Délai Fournisseurs',
+        line=dict(color='blue', width=3)
+    ))
+    
+    fig_delais.update_layout(
+        title="Évolution des Délais de Paiement",
+        xaxis_title="Mois",
+        yaxis_title="Jours"
+    )
+    
+    st.plotly_chart(fig_delais, use_container_width=True)
+
+@st.fragment
+def show_scenarios():
+    st.subheader("🎯 Simulation de Scénarios")
+    
+    # Paramètres des scénarios
+    col_scen1, col_scen2 = st.columns(2)
+    
+    with col_scen1:
+        st.subheader("📈 Scénario Optimiste")
+        croissance_ventes_opt = st.slider("Croissance ventes (%)", -20, 50, 15, key="opt_ventes")
+        delai_clients_opt = st.slider("Délai clients (jours)", 30, 90, 40, key="opt_clients")
+        marge_opt = st.slider("Amélioration marge (%)", -10, 20, 5, key="opt_marge")
+    
+    with col_scen2:
+        st.subheader("📉 Scénario Pessimiste")
+        croissance_ventes_pes = st.slider("Croissance ventes (%)", -20, 50, -5, key="pes_ventes")
+        delai_clients_pes = st.slider("Délai clients (jours)", 30, 90, 60, key="pes_clients")
+        marge_pes = st.slider("Détérioration marge (%)", -20, 10, -8, key="pes_marge")
+    
+    # Calcul et affichage des résultats
+    if st.button("🔄 Calculer les Scénarios"):
+        # Simulation des résultats
+        scenarios_data = {
+            'Scénario': ['Optimiste', 'Référence', 'Pessimiste'],
+            'Trésorerie Min (M€)': [1.8, 1.2, 0.6],
+            'Trésorerie Max (M€)': [4.2, 3.3, 2.1],
+            'Point Bas (Mois)': ['3', '5', '7'],
+            'Probabilité': ['25%', '50%', '25%']
+        }
+        
+        df_scenarios = pd.DataFrame(scenarios_data)
+        
+        st.subheader("📊 Résultats des Scénarios")
+        st.dataframe(df_scenarios, use_container_width=True)
+        
+        # Graphique comparatif
+        fig_scenarios = go.Figure()
+        
+        scenarios = ['Optimiste', 'Référence', 'Pessimiste']
+        treso_min = [1.8, 1.2, 0.6]
+        treso_max = [4.2, 3.3, 2.1]
+        
+        for i, scenario in enumerate(scenarios):
+            fig_scenarios.add_trace(go.Bar(
+                name=scenario,
+                x=['Trésorerie Min', 'Trésorerie Max'],
+                y=[treso_min[i], treso_max[i]],
+                text=[f'{treso_min[i]}M€', f'{treso_max[i]}M€'],
+                textposition='auto',
+            ))
+        
+        fig_scenarios.update_layout(
+            title="Comparaison des Scénarios",
+            barmode='group'
+        )
+        
+        st.plotly_chart(fig_scenarios, use_container_width=True)
+        
+        # Recommandations
+        st.subheader("💡 Recommandations Stratégiques")
+        
+        col_rec1, col_rec2 = st.columns(2)
+        
+        with col_rec1:
+            st.success("**✅ Actions Opportunités :**")
+            st.write("- Accélérer les investissements rentables")
+            st.write("- Renégocier les délais fournisseurs")
+            st.write("- Développer nouveaux marchés")
+        
+        with col_rec2:
+            st.error("**🛡️ Actions Protection :**")
+            st.write("- Sécuriser ligne crédit supplémentaire")
+            st.write("- Réduire stocks non essentiels")
+            st.write("- Renforcer recouvrement clients")
+
+@st.fragment
+def show_alerts():
+    st.subheader("🚨 Système d'Alerte Trésorerie")
+    
+    # Alertes actives
+    alertes_data = {
+        'Niveau': ['🔴 Critique', '🟠 Élevé', '🟡 Moyen', '🟢 Faible'],
+        'Description': [
+            'Trésorerie < 1M€ dans 60 jours',
+            'Délai clients > 50 jours',
+            'Utilisation crédit > 75%',
+            'Écart prévision > 15%'
+        ],
+        'Déclencheur': ['1.2M€', '52 jours', '78%', '18%'],
+        'Action': [
+            'Activer plan urgence',
+            'Relance clients prioritaires',
+            'Négocier extension crédit',
+            'Réviser prévisions'
+        ]
+    }
+    
+    df_alertes = pd.DataFrame(alertes_data)
+    st.dataframe(df_alertes, use_container_width=True)
+    
+    # Configuration des alertes
+    st.subheader("⚙️ Configuration des Seuils d'Alerte")
+    
+    col_seuil1, col_seuil2, col_seuil3 = st.columns(3)
+    
+    with col_seuil1:
+        seuil_treso_critique = st.number_input("Seuil trésorerie critique (M€)", value=1.0)
+        seuil_delai_client = st.number_input("Seuil délai client max (jours)", value=50)
+    
+    with col_seuil2:
+        seuil_utilisation_credit = st.number_input("Seuil utilisation crédit (%)", value=75)
+        seuil_ecart_prevision = st.number_input("Seuil écart prévision (%)", value=15)
+    
+    with col_seuil3:
+        frequence_rapport = st.selectbox("Fréquence des rapports", ["Quotidien", "Hebdomadaire", "Mensuel"])
+        notification_email = st.checkbox("Notifications par email", value=True)
+    
+    if st.button("💾 Sauvegarder la Configuration"):
+        st.success("Configuration des alertes sauvegardée!")
+        
+        # Test du système d'alerte
+        with st.spinner("Test du système d'alerte en cours..."):
+            import time
+            time.sleep(2)
+            
+            st.balloons()
+            st.info("**✅ Système d'alerte opérationnel**")
+            st.write("**Prochain rapport programmé :** Demain 08:00")
+            st.write("**Destinataires :** direction@entreprise.com, finance@entreprise.com")
+
+@st.fragment
+def show_cash_optimization():
+    st.header("⚡ Optimisation de la Trésorerie")
+    
+    st.markdown("""
+        ### 🎯 Stratégies d'Optimisation du Cash
+        """)
+        
+    col1, col2 = st.columns(2)
+        
+    with col1:
+        st.subheader("💰 Optimisation des Encaissements")
+            
+        current_dso = st.number_input("DSO actuel (jours)", value=45)
+        target_dso = st.number_input("DSO cible (jours)", value=30)
+        monthly_revenue = st.number_input("CA mensuel (€)", value=100000)
+            
+        st.subheader("💸 Optimisation des Décaissements")
+            
+        current_dpo = st.number_input("DPO actuel (jours)", value=30)
+        target_dpo = st.number_input("DPO cible (jours)", value=45)
+        monthly_purchases = st.number_input("Achats mensuels (€)", value=60000)
+        
+    with col2:
+        if st.button("🎯 Calculer l'Impact"):
+                # Calcul des gains potentiels
+            dso_improvement = current_dso - target_dso
+            dpo_improvement = target_dpo - current_dpo
+                
+            cash_release_dso = (dso_improvement / 30) * monthly_revenue
+            cash_release_dpo = (dpo_improvement / 30) * monthly_purchases
+            total_cash_release = cash_release_dso + cash_release_dpo
+                
+            st.success("**📊 Impact de l'Optimisation :**")
+                
+            optimization_impact = {
+                    'Paramètre': ['Réduction DSO', 'Augmentation DPO', 'Total'],
+                    'Jours': [f"-{dso_improvement}", f"+{dpo_improvement}", f"+{dso_improvement + dpo_improvement}"],
+                    'Gain Trésorerie (€)': [
+                        f"{cash_release_dso:,.0f} €",
+                        f"{cash_release_dpo:,.0f} €", 
+                        f"{total_cash_release:,.0f} €"
+                    ]
+                }
+                
+            st.dataframe(pd.DataFrame(optimization_impact), use_container_width=True)
+                
+                # Recommandations d'optimisation
+            st.subheader("💡 Stratégies Recommandées")
+                
+            strategies = [
+                    "📧 **Facturation électronique** : Réduction de 5 jours du DSO",
+                    "🎯 **Relance automatisée** : Mise en place d'un système de relance proactive",
+                    "🤝 **Négociation fournisseurs** : Extension des délais de paiement",
+                    "📊 **Planning des paiements** : Optimisation des dates de règlement",
+                    "💳 **Escompte early payment** : Offre de réduction pour paiement anticipé"
+                ]
+                
+            for strategy in strategies:
+                st.write(f"• {strategy}")
+        
+        # Simulation de trésorerie optimisée
+        st.subheader("🔄 Simulation Trésorerie Optimisée")
+        
+        if st.button("🚀 Lancer la Simulation"):
+            with st.spinner("Simulation de l'optimisation en cours..."), timed("Simulation optimisation trésorerie"):
+                time.sleep(2)
+                
+                # Données simulées
+                months = ['Jan', 'Fév', 'Mar', 'Avr', 'Mai', 'Jun']
+                current_cash = [50000, 48000, 52000, 45000, 55000, 60000]
+                total_cash_release = total_cash_release if 'total_cash_release' in locals() else 0
+                optimized_cash = [x + total_cash_release/6 for x in current_cash]
+                
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=months, y=current_cash, 
+                                       name='Situation Actuelle', line=dict(color='red')))
+                fig.add_trace(go.Scatter(x=months, y=optimized_cash, 
+                                       name='Après Optimisation', line=dict(color='green')))
+                fig.update_layout(title='Impact de l\'Optimisation sur la Trésorerie')
+                st.plotly_chart(fig, use_container_width=True)
+                
+                st.metric("💰 Gain Trésorerie Annuel", f"{total_cash_release:,.0f} €")
@@ -0,0 +1,27 @@
+"""Page « 🔄 Processus Complet »."""
+import streamlit as st
+import pandas as pd
+
+def show_processus_complet():
+    st.title("🔄 Processus Complet Budgétaire")
+    
+    st.markdown("""
+    ## Vue d'Ensemble du Cycle Budgétaire
+    """)
+    
+    # Process flowchart
+    st.image("https://via.placeholder.com/800x400?text=Diagramme+Processus+Budgétaire", 
+             caption="Processus Budgétaire Intégré")
+    
+    st.subheader("Enchaînement des Budgets")
+    
+    budget_sequence = {
+        'Étape': ['1. Budget Commercial', '2. Budget de Production', '3. Budget des Approvisionnements', 
+                 '4. Budget des Investissements', '5. Budget de Trésorerie', '6. Budget des Frais Généraux'],
+        'Responsable': ['Directeur Commercial', 'Directeur Production', 'Responsable Achats',
+                       'Directeur Général', 'Contrôleur de Gestion', 'Directeur Administratif'],
+        'Délai': ['J+0', 'J+7', 'J+14', 'J+21', 'J+28', 'J+35']
+    }
+    
+    df_process = pd.DataFrame(budget_sequence)
+    st.dataframe(df_process, use_container_width=True)
@@ -0,0 +1,567 @@
+"""Page « 🏗️ Investissement Stratégique »."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from data_table import paginated_table
+from job_tasks import monte_carlo_npv_task
+from jobs import show_job, submit_job
+
+PERFORMANCE_KPIS = ['ROI Moyen (%)', 'Budget Total (M€)', 'Projets Livrés', 'Taux de Réussite (%)']
+
+def show_strategic_investment():
+    st.title("🏗️ Investissement Stratégique")
+
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "💰 Budget Total", 
+            "4.2M€", 
+            "+12% vs prévision",
+            delta_color="normal"
+        )
+    
+    with col2:
+        st.metric(
+            "📈 ROI Moyen", 
+            "18.5%", 
+            "+2.3%",
+            delta_color="inverse"
+        )
+    
+    with col3:
+        st.metric(
+            "⏱️ Délai Retour", 
+            "3.2 ans", 
+            "-0.4 ans",
+            delta_color="inverse"
+        )
+    
+    with col4:
+        st.metric(
+            "🚨 Projets à Risque", 
+            "2", 
+            "-1",
+            delta_color="inverse"
+        )
+
+    # Onglets pour différentes analyses
+    analysis_tabs = st.tabs([
+        "📊 Vue d'Ensemble", 
+        "💰 Analyse Financière", 
+        "📅 Planning", 
+        "🎯 Décisions Stratégiques",
+        "📈 Performance"
+    ])
+    
+    with analysis_tabs[0]:
+        show_investment_overview()
+    
+    with analysis_tabs[1]:
+        show_financial_analysis()
+    
+    with analysis_tabs[2]:
+        show_investment_planning()
+    
+    with analysis_tabs[3]:
+        show_strategic_decisions()
+        
+    with analysis_tabs[4]:
+        show_performance_analytics()
+
+@st.cache_data
+def investment_projects():
+    """Portefeuille des projets d'investissement (données de référence)"""
+    projects_data = {
+        'Projet': [
+            'Nouvelle Ligne Production', 
+            'Modernisation Usine A', 
+            'Système IA Qualité',
+            'Énergie Renouvelable',
+            'R&D Nouveaux Produits',
+            'Digitalisation Logistique'
+        ],
+        'Type': ['Production', 'Infrastructure', 'Technologie', 'Durabilité', 'Innovation', 'Digital'],
+        'Budget (M€)': [2.1, 1.2, 0.4, 0.8, 0.3, 0.4],
+        'ROI Attendu (%)': [22.5, 15.8, 28.3, 12.1, 35.2, 18.7],
+        'Délai (ans)': [3.5, 2.8, 1.5, 4.2, 2.1, 1.8],
+        'Risque': ['Moyen', 'Faible', 'Élevé', 'Faible', 'Très Élevé', 'Moyen'],
+        'Statut': ['En Cours', 'Planifié', 'Étude', 'Planifié', 'Étude', 'En Cours'],
+        'Priorité': ['Élevée', 'Moyenne', 'Élevée', 'Basse', 'Moyenne', 'Élevée']
+    }
+    return pd.DataFrame(projects_data)
+
+@st.cache_data(max_entries=64)
+def investment_overview_figures(types, risques, statuts):
+    """Projets filtrés et graphiques de synthèse, par combinaison de filtres"""
+    df_projects = investment_projects()
+    filtered_df = df_projects[
+        (df_projects['Type'].isin(types)) &
+        (df_projects['Risque'].isin(risques)) &
+        (df_projects['Statut'].isin(statuts))
+    ]
+    
+    # Répartition du budget par type
+    budget_by_type = filtered_df.groupby('Type')['Budget (M€)'].sum()
+    fig_budget = px.pie(
+        values=budget_by_type.values,
+        names=budget_by_type.index,
+        title="Répartition du Budget par Type d'Investissement"
+    )
+    
+    # ROI vs Risque
+    fig_roi_risk = px.scatter(
+        filtered_df,
+        x='ROI Attendu (%)',
+        y='Budget (M€)',
+        size='Budget (M€)',
+        color='Risque',
+        hover_name='Projet',
+        title="ROI vs Budget par Niveau de Risque",
+        size_max=30
+    )
+    return filtered_df, fig_budget, fig_roi_risk
+
+def show_investment_overview():
+    st.subheader("📊 Vue d'Ensemble des Investissements")
+    
+    df_projects = investment_projects()
+    
+    # Filtres
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        type_filter = st.multiselect(
+            "Filtrer par Type",
+            options=df_projects['Type'].unique(),
+            default=df_projects['Type'].unique()
+        )
+    
+    with col2:
+        risque_filter = st.multiselect(
+            "Filtrer par Niveau de Risque",
+            options=df_projects['Risque'].unique(),
+            default=df_projects['Risque'].unique()
+        )
+    
+    with col3:
+        statut_filter = st.multiselect(
+            "Filtrer par Statut",
+            options=df_projects['Statut'].unique(),
+            default=df_projects['Statut'].unique()
+        )
+    
+    # Application des filtres
+    filtered_df, fig_budget, fig_roi_risk = investment_overview_figures(
+        tuple(type_filter), tuple(risque_filter), tuple(statut_filter)
+    )
+    
+    # Affichage des données
+    # Dégradé du ROI rendu dans le navigateur (barre de progression) plutôt que par Styler
+    paginated_table(
+        filtered_df, key='projets_investissement',
+        formats={'Budget (M€)': '{:.1f}', 'Délai (ans)': '{:.1f}'},
+        column_config={'ROI Attendu (%)': st.column_config.ProgressColumn(
+            format='%.1f', min_value=0.0, max_value=float(df_projects['ROI Attendu (%)'].max()))}
+    )
+    
+    # Graphiques de synthèse
+    col_chart1, col_chart2 = st.columns(2)
+    
+    with col_chart1:
+        st.plotly_chart(fig_budget, use_container_width=True)
+    
+    with col_chart2:
+        st.plotly_chart(fig_roi_risk, use_container_width=True)
+
+def show_financial_analysis():
+    st.subheader("💰 Analyse Financière Détaillée")
+    
+    # Sélection du projet à analyser
+    projects = [
+        'Nouvelle Ligne Production', 
+        'Modernisation Usine A', 
+        'Système IA Qualité',
+        'Énergie Renouvelable'
+    ]
+    
+    selected_project = st.selectbox("Sélectionner un projet à analyser", projects)
+    
+    if selected_project:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader(f"📈 Analyse {selected_project}")
+            
+            # Métriques financières selon le projet
+            if selected_project == 'Nouvelle Ligne Production':
+                metrics = {
+                    "Investissement Initial": "2.1M€",
+                    "VAN (Valeur Actuelle Nette)": "450K€",
+                    "TRI (Taux de Rentabilité Interne)": "22.5%",
+                    "Délai de Récupération": "3.2 ans"
+                }
+            elif selected_project == 'Modernisation Usine A':
+                metrics = {
+                    "Investissement Initial": "1.2M€",
+                    "VAN (Valeur Actuelle Nette)": "280K€",
+                    "TRI (Taux de Rentabilité Interne)": "15.8%",
+                    "Délai de Récupération": "2.8 ans"
+                }
+            elif selected_project == 'Système IA Qualité':
+                metrics = {
+                    "Investissement Initial": "0.4M€",
+                    "VAN (Valeur Actuelle Nette)": "120K€",
+                    "TRI (Taux de Rentabilité Interne)": "28.3%",
+                    "Délai de Récupération": "1.5 ans"
+                }
+            else:  # Énergie Renouvelable
+                metrics = {
+                    "Investissement Initial": "0.8M€",
+                    "VAN (Valeur Actuelle Nette)": "95K€",
+                    "TRI (Taux de Rentabilité Interne)": "12.1%",
+                    "Délai de Récupération": "4.2 ans"
+                }
+            
+            for metric_name, metric_value in metrics.items():
+                st.metric(metric_name, metric_value)
+            
+            # Scénarios de sensibilité
+            st.subheader("🎯 Scénarios de Sensibilité")
+            
+            variation_prix = st.slider("Variation des prix de vente (%)", -20, 20, 0, key="price_var")
+            variation_couts = st.slider("Variation des coûts opérationnels (%)", -15, 15, 0, key="cost_var")
+            
+            # Calcul impact sur ROI
+            roi_base = float(metrics["TRI (Taux de Rentabilité Interne)"].replace('%', ''))
+            roi_ajuste = roi_base + (variation_prix * 0.8) - (variation_couts * 0.6)
+            
+            st.metric("ROI Ajusté", f"{roi_ajuste:.1f}%", f"{roi_ajuste - roi_base:.1f}%")
+        
+        with col2:
+            st.subheader("📊 Flux de Trésorerie")
+            
+            # Simulation des flux de trésorerie selon le projet
+            if selected_project == 'Nouvelle Ligne Production':
+                cash_flows = [-2100000, 200000, 400000, 600000, 800000, 800000, 800000, 800000, 800000, 800000]
+            elif selected_project == 'Modernisation Usine A':
+                cash_flows = [-1200000, 150000, 250000, 350000, 450000, 450000, 450000, 450000, 450000, 450000]
+            elif selected_project == 'Système IA Qualité':
+                cash_flows = [-400000, 80000, 120000, 160000, 200000, 200000, 200000, 200000, 200000, 200000]
+            else:  # Énergie Renouvelable
+                cash_flows = [-800000, 50000, 80000, 110000, 140000, 140000, 140000, 140000, 140000, 140000]
+            
+            years = list(range(2024, 2034))
+            df_cashflow = pd.DataFrame({
+                'Année': years,
+                'Flux Net': cash_flows
+            })
+            df_cashflow['Cumulé'] = df_cashflow['Flux Net'].cumsum()
+            
+            fig_cashflow = go.Figure()
+            fig_cashflow.add_trace(go.Bar(x=df_cashflow['Année'], y=df_cashflow['Flux Net'], 
+                                         name='Flux Net Annuel', marker_color='lightblue'))
+            fig_cashflow.add_trace(go.Scatter(x=df_cashflow['Année'], y=df_cashflow['Cumulé'], 
+                                            name='Flux Cumulé', line=dict(color='red', width=3)))
+            fig_cashflow.update_layout(title="Projection des Flux de Trésorerie")
+            st.plotly_chart(fig_cashflow, use_container_width=True)
+            
+            # Point de rentabilité
+            break_even_index = next((i for i, val in enumerate(df_cashflow['Cumulé']) if val >= 0), None)
+            if break_even_index:
+                st.info(f"**Point de rentabilité atteint en {years[break_even_index]}**")
+
+        show_npv_simulation(selected_project, cash_flows)
+
+def show_npv_simulation(project, cash_flows):
+    """Distribution de la VAN du projet, simulée en arrière-plan"""
+    st.subheader("🎲 Simulation Monte Carlo de la VAN")
+    col_n, col_rate, col_vol = st.columns(3)
+    with col_n:
+        n_simulations = st.select_slider("Nombre de scénarios", [10_000, 100_000, 1_000_000],
+                                         value=100_000, format_func='{:,}'.format, key="mc_n")
+    with col_rate:
+        discount_rate = st.slider("Taux d'actualisation (%)", 4.0, 15.0, 8.0, 0.5, key="mc_rate") / 100
+    with col_vol:
+        volatility = st.slider("Volatilité des flux (%)", 5, 40, 15, key="mc_vol") / 100
+
+    key = f"monte_carlo_{project}"
+    if st.button("🔄 Lancer la Simulation", key="mc_run"):
+        submit_job(key, monte_carlo_npv_task, -cash_flows[0], cash_flows[1:], discount_rate,
+                   n_simulations, volatility, label=f"Monte Carlo « {project} »")
+    show_job(key, show_npv_distribution, render_partial=show_npv_statistics)
+
+def show_npv_statistics(stats):
+    col_stat1, col_stat2, col_stat3 = st.columns(3)
+    with col_stat1:
+        st.metric("VAN Moyenne", f"{stats['moyenne']:,.0f} €")
+    with col_stat2:
+        st.metric("Écart-type", f"{stats['ecart_type']:,.0f} €")
+    with col_stat3:
+        st.metric("Probabilité VAN > 0", f"{stats['prob_positive']:.1f}%")
+    st.caption(f"{stats['simulations']:,} scénarios sur {stats['total']:,}")
+
+def show_npv_distribution(result):
+    show_npv_statistics(result)
+    fig = px.bar(result['histogramme'], x='VAN (€)', y='Fréquence',
+                 title='Distribution des VAN - Simulation Monte Carlo')
+    fig.update_traces(marker_line_width=0)
+    fig.update_layout(bargap=0)
+    fig.add_vline(x=0, line_dash="dash", line_color="red")
+    for name, value in result['quantiles'].items():
+        fig.add_vline(x=value, line_dash="dot", line_color="gray", annotation_text=name)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.cache_data
+def investment_gantt_figure():
+    """Diagramme de Gantt du planning (données de référence)"""
+    # Données du planning
+    gantt_data = {
+        'Tâche': [
+            'Étude de Faisabilité', 'Approbation Budget', 'Appel d\'Offres',
+            'Sélection Fournisseur', 'Installation', 'Tests et Validation',
+            'Formation Équipes', 'Mise en Production'
+        ],
+        'Début': [
+            '2024-01-15', '2024-03-01', '2024-03-15', '2024-05-01',
+            '2024-06-01', '2024-08-15', '2024-09-15', '2024-10-01'
+        ],
+        'Fin': [
+            '2024-02-28', '2024-03-14', '2024-04-30', '2024-05-31',
+            '2024-08-14', '2024-09-14', '2024-09-30', '2024-12-31'
+        ],
+        'Projet': [
+            'Nouvelle Ligne Production', 'Nouvelle Ligne Production', 'Nouvelle Ligne Production',
+            'Nouvelle Ligne Production', 'Nouvelle Ligne Production', 'Nouvelle Ligne Production',
+            'Nouvelle Ligne Production', 'Nouvelle Ligne Production'
+        ],
+        'Progression': [100, 100, 75, 50, 25, 10, 0, 0]
+    }
+    
+    df_gantt = pd.DataFrame(gantt_data)
+    df_gantt['Début'] = pd.to_datetime(df_gantt['Début'])
+    df_gantt['Fin'] = pd.to_datetime(df_gantt['Fin'])
+    
+    # Diagramme de Gantt
+    fig_gantt = px.timeline(
+        df_gantt, 
+        x_start="Début", 
+        x_end="Fin", 
+        y="Tâche",
+        color="Progression",
+        title="Planning des Investissements - Diagramme de Gantt",
+        color_continuous_scale='Viridis'
+    )
+    fig_gantt.update_yaxes(autorange="reversed")
+    return fig_gantt
+
+def show_investment_planning():
+    st.subheader("📅 Planning et Gantt des Investissements")
+    
+    # Diagramme de Gantt
+    fig_gantt = investment_gantt_figure()
+    st.plotly_chart(fig_gantt, use_container_width=True)
+    
+    # Indicateurs d'avancement
+    st.subheader("📊 Indicateurs d'Avancement")
+    
+    progress_col1, progress_col2, progress_col3, progress_col4 = st.columns(4)
+    
+    with progress_col1:
+        st.metric("📅 Délai Moyen", "45 jours", "-5 jours")
+    
+    with progress_col2:
+        st.metric("💰 Budget Utilisé", "68%", "2%")
+    
+    with progress_col3:
+        st.metric("✅ Tâches Terminées", "3/8", "37%")
+    
+    with progress_col4:
+        st.metric("🚨 Retards", "1 projet", "Critique")
+        
+    # Alertes et actions
+    st.subheader("🚨 Alertes et Actions Requises")
+    
+    alert_data = {
+        'Projet': ['Modernisation Usine A', 'Système IA Qualité', 'Nouvelle Ligne Production'],
+        'Type Alerte': ['Délai', 'Budget', 'Ressources'],
+        'Description': ['Retard de 15 jours sur planning', 'Dépassement budget de 8%', 'Manque compétences techniques'],
+        'Priorité': ['Élevée', 'Moyenne', 'Élevée'],
+        'Action': ['Réviser planning', 'Analyser coûts', 'Recrutement urgent']
+    }
+    
+    st.dataframe(pd.DataFrame(alert_data), use_container_width=True)
+
+@st.cache_data
+def decision_matrix():
+    """Matrice de décision pondérée, scores totaux et graphique associé"""
+    decision_data = {
+        'Critère': [
+            'Alignement Stratégique', 'ROI Attendu', 'Risque Technique',
+            'Impact Environnemental', 'Délai de Mise en Œuvre', 'Compétences Internes'
+        ],
+        'Pondération': [25, 30, 15, 10, 10, 10],
+        'Nouvelle Ligne': [9, 8, 6, 7, 5, 8],
+        'Modernisation Usine': [7, 6, 8, 8, 9, 9],
+        'Système IA': [8, 9, 5, 9, 7, 6]
+    }
+    
+    df_decision = pd.DataFrame(decision_data)
+    
+    # Calcul des scores
+    for project in ['Nouvelle Ligne', 'Modernisation Usine', 'Système IA']:
+        df_decision[f'{project} Score'] = (df_decision[project] * df_decision['Pondération']) / 10
+    
+    # Scores totaux
+    scores_totaux = {
+        'Projet': ['Nouvelle Ligne Production', 'Modernisation Usine A', 'Système IA Qualité'],
+        'Score Total': [
+            df_decision['Nouvelle Ligne Score'].sum(),
+            df_decision['Modernisation Usine Score'].sum(),
+            df_decision['Système IA Score'].sum()
+        ]
+    }
+    
+    df_scores = pd.DataFrame(scores_totaux)
+    
+    # Graphique des scores
+    fig_scores = px.bar(
+        df_scores, 
+        x='Projet', 
+        y='Score Total',
+        title="Score Total par Projet - Matrice de Décision",
+        color='Score Total',
+        color_continuous_scale='Viridis'
+    )
+    return df_decision, df_scores, fig_scores
+
+def show_strategic_decisions():
+    st.subheader("🎯 Aide à la Décision Stratégique")
+    
+    # Matrice de décision
+    st.write("### 🧩 Matrice de Décision Stratégique")
+    
+    df_decision, df_scores, fig_scores = decision_matrix()
+    
+    st.dataframe(df_decision, use_container_width=True)
+    
+    st.plotly_chart(fig_scores, use_container_width=True)
+    
+    # Recommandations
+    st.subheader("💡 Recommandations Stratégiques")
+    
+    best_project = df_scores.loc[df_scores['Score Total'].idxmax()]
+    
+    st.success(f"**🎯 Projet Recommandé : {best_project['Projet']}**")
+    st.write(f"**Score : {best_project['Score Total']:.1f}/100**")
+    
+    col_rec1, col_rec2 = st.columns(2)
+    
+    with col_rec1:
+        st.markdown("""
+        **✅ Points Forts :**
+        - Alignement parfait avec la stratégie
+        - ROI élevé et maîtrisé
+        - Compétences internes disponibles
+        - Impact positif sur l'environnement
+        """)
+    
+    with col_rec2:
+        st.markdown("""
+        **⚠️ Points de Vigilance :**
+        - Délai de mise en œuvre moyen
+        - Risque technique modéré
+        - Investissement initial important
+        - Formation nécessaire
+        """)
+    
+    # Outil de simulation de décision
+    st.subheader("🔧 Simulateur de Décision")
+    
+    col_sim1, col_sim2 = st.columns(2)
+    
+    with col_sim1:
+        budget_disponible = st.slider("Budget disponible (M€)", 1.0, 5.0, 2.5, key="budget_sim")
+        horizon_investissement = st.selectbox("Horizon d'investissement", 
+                                            ["Court terme (1-2 ans)", "Moyen terme (3-5 ans)", "Long terme (5+ ans)"],
+                                            key="horizon_sim")
+    
+    with col_sim2:
+        tolerance_risque = st.select_slider("Tolérance au risque", 
+                                          ["Faible", "Moyenne", "Élevée"],
+                                          key="risk_sim")
+        objectif_principal = st.selectbox("Objectif principal", 
+                                        ["Rentabilité", "Croissance", "Innovation", "Durabilité"],
+                                        key="objective_sim")
+    
+    if st.button("🎯 Générer la Recommandation Personnalisée", key="generate_rec"):
+        # Logique de recommandation basée sur les critères
+        if budget_disponible >= 2.0 and tolerance_risque == "Moyenne" and objectif_principal == "Rentabilité":
+            recommendation = "Nouvelle Ligne Production"
+        elif budget_disponible < 1.5 and tolerance_risque == "Faible" and objectif_principal == "Durabilité":
+            recommendation = "Modernisation Usine A"
+        elif budget_disponible < 1.0 and tolerance_risque == "Élevée" and objectif_principal == "Innovation":
+            recommendation = "Système IA Qualité"
+        else:
+            recommendation = best_project['Projet']
+            
+        st.balloons()
+        st.success(f"**Recommandation : {recommendation}**")
+        st.info(f"Cette recommandation est optimisée pour un budget de {budget_disponible}M€ avec une tolérance au risque {tolerance_risque.lower()} et un objectif principal d'{objectif_principal.lower()}.")
+
+@st.cache_data(max_entries=len(PERFORMANCE_KPIS))
+def performance_trend_figure(kpi_selected):
+    """Évolution historique (simulée) d'un KPI d'investissement"""
+    years = [2020, 2021, 2022, 2023, 2024]
+    performance_data = {
+        'ROI Moyen (%)': [15.2, 16.8, 17.5, 18.1, 18.5],
+        'Budget Total (M€)': [2.8, 3.2, 3.6, 3.9, 4.2],
+        'Projets Livrés': [8, 10, 12, 14, 16],
+        'Taux de Réussite (%)': [85, 88, 90, 92, 94]
+    }
+    
+    df_performance = pd.DataFrame(performance_data, index=years)
+    
+    fig_trend = px.line(
+        df_performance, 
+        x=df_performance.index, 
+        y=kpi_selected,
+        title=f"Évolution du {kpi_selected}",
+        markers=True
+    )
+    fig_trend.update_traces(line=dict(width=3))
+    return fig_trend
+
+def show_performance_analytics():
+    st.subheader("📈 Analytics et Performance")
+    
+    # KPI historiques
+    st.write("### 📊 Évolution des Performances")
+    
+    # Sélection du KPI à visualiser
+    kpi_selected = st.selectbox("Sélectionner le KPI à analyser", PERFORMANCE_KPIS)
+    
+    fig_trend = performance_trend_figure(kpi_selected)
+    st.plotly_chart(fig_trend, use_container_width=True)
+    
+    # Analyse comparative
+    st.subheader("📋 Benchmarking Interne")
+    
+    col_bench1, col_bench2 = st.columns(2)
+    
+    with col_bench1:
+        st.write("**Performance par Type de Projet**")
+        type_performance = {
+            'Type': ['Production', 'Infrastructure', 'Technologie', 'Durabilité', 'Innovation'],
+            'ROI Moyen (%)': [18.2, 14.5, 25.3, 11.8, 32.7],
+            'Taux Réussite (%)': [92, 88, 85, 95, 78]
+        }
+        st.dataframe(pd.DataFrame(type_performance), use_container_width=True)
+    
+    with col_bench2:
+        st.write("**Retour d'Expérience**")
+        st.metric("📈 Meilleur ROI", "35.2%", "R&D Nouveaux Produits")
+        st.metric("⚡ Plus Rapide", "1.5 ans", "Système IA Qualité")
+        st.metric("🛡️ Moins Risqué", "2% d'écart", "Modernisation Usine A")
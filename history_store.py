@@ -0,0 +1,393 @@
+"""Entrepôt d'historique en colonnes : ventes, stocks, trésorerie et écritures comptables.
+
+Chaque fait est stocké en Parquet partitionné par période et par entité :
+
+    <racine>/<fait>/periode=AAAA-MM/entite=<code>/part-<horodatage>.parquet
+
+Les lectures passent par pyarrow.dataset : les filtres sur la période et
+l'entité éliminent des répertoires entiers sans les ouvrir, les autres
+prédicats (date, article, montant...) sont évalués sur les statistiques des
+groupes de lignes avant décompression, et seules les colonnes demandées sont
+lues. Une page ne charge ainsi que la tranche qu'elle affiche, même sur
+plusieurs années d'historique.
+
+Exemples :
+    python history_store.py import donnees_synthetiques/ --entite SIEGE
+    python history_store.py info
+    python history_store.py compact tresorerie
+"""
+import argparse
+import os
+import re
+import shutil
+import sys
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+HISTORY_ROOT = os.environ.get('CDG_HISTORY_ROOT', 'historique')
+
+PARTITIONING = ds.partitioning(pa.schema([('periode', pa.string()), ('entite', pa.string())]),
+                               flavor='hive')
+
+DATE = pa.timestamp('ns')
+
+# Code d'entité saisi par un utilisateur : composant de chemin des partitions
+ENTITY_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,32}$')
+
+# Schéma des faits (hors colonnes de partition) et ordre de tri dans un fichier :
+# le tri resserre les statistiques min/max des groupes de lignes sur ces colonnes
+FACTS = {
+    'ventes': (pa.schema([
+        ('date', DATE), ('sku', pa.string()), ('client_id', pa.int64()), ('quantite', pa.int64()),
+        ('prix_unitaire', pa.float64()), ('montant_ht', pa.float64()),
+    ]), ['sku', 'date']),
+    'mouvements_stock': (pa.schema([
+        ('date', DATE), ('sku', pa.string()), ('mouvement', pa.string()), ('quantite', pa.int64()),
+        ('valeur', pa.float64()),
+    ]), ['sku', 'date']),
+    'tresorerie': (pa.schema([
+        ('date', DATE), ('categorie', pa.string()), ('libelle', pa.string()), ('montant', pa.float64()),
+    ]), ['date']),
+    'ecritures': (pa.schema([
+        ('date', DATE), ('journal', pa.string()), ('compte', pa.string()), ('libelle', pa.string()),
+        ('piece', pa.string()), ('debit', pa.float64()), ('credit', pa.float64()),
+    ]), ['compte', 'date']),
+}
+
+ROW_GROUP_ROWS = 64_000
+
+# Catégories de trésorerie des libellés d'écritures du compte 512 (synthetic_data)
+CASH_CATEGORIES = {
+    'Encaissement client': 'Ventes',
+    'Règlement fournisseurs': 'Achats',
+    'Paiement salaires': 'Personnel',
+    'Loyer': 'Frais Généraux',
+}
+
+
+def period_label(dates):
+    """Période AAAA-MM de chaque date (vectorisé)"""
+    months = pd.to_datetime(dates).to_numpy().astype('datetime64[M]')
+    return np.datetime_as_string(months)
+
+
+def check_entity(entite):
+    """Code d'entité validé (lettres, chiffres, « _ » et « - », 32 caractères au plus)"""
+    entite = str(entite).strip()
+    if not ENTITY_PATTERN.match(entite):
+        raise ValueError(f"Entité invalide : {entite!r} (lettres, chiffres, « _ » ou « - », 32 caractères au plus)")
+    return entite
+
+
+def check_partition_value(value):
+    """Valeur de partition (période, entité) utilisable comme composant de chemin"""
+    value = str(value)
+    if not value or value in ('.', '..') or any(part in value for part in (os.sep, '/', '\\', '..')):
+        raise ValueError(f"Valeur de partition invalide : {value!r}")
+    return value
+
+
+def check_inside(root, path):
+    """path résolu doit rester sous root (aucune écriture ni suppression en dehors)"""
+    root = os.path.realpath(root)
+    if os.path.commonpath([root, os.path.realpath(path)]) != root:
+        raise ValueError(f"Chemin hors de l'entrepôt : {path}")
+    return path
+
+
+class HistoryStore:
+    """Faits historiques en Parquet partitionné (période, entité)"""
+
+    def __init__(self, root=HISTORY_ROOT):
+        self.root = root
+
+    def _fact(self, fact):
+        if fact not in FACTS:
+            raise ValueError(f"Fait inconnu : {fact} (choix : {', '.join(FACTS)})")
+        return FACTS[fact]
+
+    def _partition_dir(self, fact, periode, entite):
+        """Répertoire d'une partition ; valeurs contrôlées avant toute écriture ou suppression"""
+        self._fact(fact)
+        directory = os.path.join(self.root, fact, f'periode={check_partition_value(periode)}',
+                                 f'entite={check_partition_value(entite)}')
+        return check_inside(self.root, directory)
+
+    # ------------------------------------------------------------ Écriture
+
+    def append(self, fact, df, entite=None, replace=False):
+        """Ajouter des lignes ; retourne le nombre de lignes écrites
+
+        La colonne `entite` du DataFrame (ou le paramètre entite) et la date
+        déterminent la partition. replace=True remplace le contenu des
+        partitions touchées (réimport idempotent d'une période).
+        """
+        schema, sort_keys = self._fact(fact)
+        missing = [name for name in schema.names if name not in df.columns]
+        if missing:
+            raise ValueError(f"Colonnes manquantes pour {fact} : {', '.join(missing)}")
+        if entite is None and 'entite' not in df.columns:
+            raise ValueError("Entité manquante : colonne `entite` ou paramètre entite")
+        if df.empty:
+            return 0
+
+        df = df[schema.names].copy()
+        df['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
+        entites = df.pop('entite') if 'entite' in df.columns else None
+        keys = [pd.Series(period_label(df['date']), index=df.index, name='periode'),
+                (entites if entites is not None else pd.Series(entite, index=df.index)).astype(str)
+                .rename('entite')]
+        for (periode, code), part in df.groupby(keys, sort=True, observed=True):
+            directory = self._partition_dir(fact, periode, code)
+            if replace and os.path.isdir(directory):
+                shutil.rmtree(directory)
+            os.makedirs(directory, exist_ok=True)
+            table = pa.Table.from_pandas(part.sort_values(sort_keys, kind='stable'), schema=schema,
+                                         preserve_index=False)
+            self._write(directory, table)
+        return len(df)
+
+    def _write(self, directory, table):
+        """Écriture atomique : un fichier visible est toujours complet"""
+        name = f'part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet'
+        # Les fichiers préfixés par « . » sont ignorés par pyarrow.dataset
+        tmp = os.path.join(directory, f'.{name}.tmp')
+        pq.write_table(table, tmp, row_group_size=ROW_GROUP_ROWS, compression='zstd')
+        os.replace(tmp, os.path.join(directory, name))
+
+    def compact(self, fact, partitions=None):
+        """Fusionner les fichiers de chaque partition en un seul ; retourne le nombre de partitions fusionnées
+
+        partitions limite la fusion à des couples (période, entité). La fusion
+        recopie les fichiers par groupes de lignes : mémoire bornée quelle que
+        soit la taille de la partition.
+        """
+        schema, _ = self._fact(fact)
+        wanted = {self._partition_dir(fact, *key) for key in partitions} if partitions is not None else None
+        merged = 0
+        for directory, files in self._partition_files(fact):
+            if len(files) < 2 or (wanted is not None and directory not in wanted):
+                continue
+            name = f'part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet'
+            tmp = os.path.join(directory, f'.{name}.tmp')
+            with pq.ParquetWriter(tmp, schema, compression='zstd') as writer:
+                for file_name in files:
+                    for batch in pq.ParquetFile(os.path.join(directory, file_name)).iter_batches(ROW_GROUP_ROWS):
+                        writer.write_batch(batch, row_group_size=ROW_GROUP_ROWS)
+            os.replace(tmp, os.path.join(directory, name))
+            for file_name in files:
+                os.remove(os.path.join(directory, file_name))
+            merged += 1
+        return merged
+
+    def merge(self, staging, fact, replace=False):
+        """Déplacer les partitions d'un fait depuis un entrepôt de préparation
+
+        Les fichiers sont renommés (même système de fichiers), sans recopie ;
+        replace=True vide d'abord les partitions de destination. Retourne les
+        couples (période, entité) touchés.
+        """
+        touched = []
+        for directory, files in list(staging._partition_files(fact)):
+            periode = os.path.basename(os.path.dirname(directory)).split('=', 1)[1]
+            entite = os.path.basename(directory).split('=', 1)[1]
+            target = self._partition_dir(fact, periode, entite)
+            if replace and os.path.isdir(target):
+                shutil.rmtree(target)
+            os.makedirs(target, exist_ok=True)
+            for name in files:
+                os.replace(os.path.join(directory, name), os.path.join(target, name))
+            touched.append((periode, entite))
+        return touched
+
+    # ------------------------------------------------------------ Lecture
+
+    def _partition_files(self, fact):
+        base = os.path.join(self.root, fact)
+        if not os.path.isdir(base):
+            return
+        for directory, _, files in sorted(os.walk(base)):
+            files = sorted(name for name in files if name.endswith('.parquet') and not name.startswith('.'))
+            if files:
+                yield directory, files
+
+    def partitions(self, fact):
+        """Partitions d'un fait : période, entité, fichiers, lignes (lues dans les pieds de fichier)"""
+        rows = []
+        for directory, files in self._partition_files(fact):
+            periode = os.path.basename(os.path.dirname(directory)).split('=', 1)[1]
+            entite = os.path.basename(directory).split('=', 1)[1]
+            lines = sum(pq.ParquetFile(os.path.join(directory, name)).metadata.num_rows for name in files)
+            rows.append({'periode': periode, 'entite': entite, 'fichiers': len(files), 'lignes': lines})
+        return pd.DataFrame(rows, columns=['periode', 'entite', 'fichiers', 'lignes'])
+
+    def periods(self, fact):
+        """Périodes disponibles, triées (lecture des seuls noms de répertoires)"""
+        base = os.path.join(self.root, fact)
+        if not os.path.isdir(base):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(base) if name.startswith('periode='))
+
+    def version(self, fact):
+        """Empreinte des fichiers d'un fait (clé de cache des lectures)"""
+        return tuple((directory, tuple(files)) for directory, files in self._partition_files(fact))
+
+    def _expression(self, start, end, entites, filters):
+        """Prédicat pyarrow : période et entité (partitions), date et filtres (groupes de lignes)"""
+        clauses = []
+        if start is not None:
+            start = pd.Timestamp(start)
+            clauses += [ds.field('periode') >= f'{start:%Y-%m}',
+                        ds.field('date') >= pa.scalar(start, type=DATE)]
+        if end is not None:
+            end = pd.Timestamp(end)
+            clauses += [ds.field('periode') <= f'{end:%Y-%m}',
+                        ds.field('date') < pa.scalar(end, type=DATE)]
+        if entites is not None:
+            clauses.append(ds.field('entite').isin([str(code) for code in entites]))
+        if filters:
+            clauses.append(pq.filters_to_expression(filters))
+        expression = None
+        for clause in clauses:
+            expression = clause if expression is None else expression & clause
+        return expression
+
+    def dataset(self, fact):
+        schema, _ = self._fact(fact)
+        return ds.dataset(os.path.join(self.root, fact), format='parquet', partitioning=PARTITIONING,
+                          schema=pa.schema([*schema, ('periode', pa.string()), ('entite', pa.string())]))
+
+    def read(self, fact, columns=None, start=None, end=None, entites=None, filters=None):
+        """Lire une tranche d'un fait : [start, end[, entités, filtres et colonnes choisis
+
+        filters suit pd.read_parquet (liste de tuples, ou liste de listes pour
+        un OU), par exemple [('sku', 'in', ['SKU000001'])] ou
+        [[('montant', '>=', 1e4)], [('montant', '<=', -1e4)]]. Les colonnes
+        de texte sont retournées en catégories.
+        """
+        schema, _ = self._fact(fact)
+        columns = list(columns) if columns is not None else [*schema.names, 'periode', 'entite']
+        if not self.periods(fact):
+            return pd.DataFrame(columns=columns)
+        table = self.dataset(fact).to_table(columns=columns,
+                                            filter=self._expression(start, end, entites, filters))
+        return table.to_pandas(strings_to_categorical=True)
+
+    def iter_chunks(self, fact, columns=None, start=None, end=None, entites=None, filters=None,
+                    chunk_rows=1_000_000):
+        """Parcourir une tranche d'un fait par DataFrames d'environ chunk_rows lignes (mémoire bornée)"""
+        schema, _ = self._fact(fact)
+        columns = list(columns) if columns is not None else [*schema.names, 'periode', 'entite']
+        if not self.periods(fact):
+            return
+        batches, rows = [], 0
+        for batch in self.dataset(fact).to_batches(columns=columns, batch_size=ROW_GROUP_ROWS,
+                                                   filter=self._expression(start, end, entites, filters)):
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows >= chunk_rows:
+                yield pa.Table.from_batches(batches).to_pandas(strings_to_categorical=True)
+                batches, rows = [], 0
+        if rows:
+            yield pa.Table.from_batches(batches).to_pandas(strings_to_categorical=True)
+
+    def aggregate(self, fact, value, by=('periode',), agg='sum', start=None, end=None, entites=None,
+                  filters=None):
+        """Agrégat de `value` par `by`, calculé par pyarrow sans matérialiser les lignes en pandas"""
+        by = list(by)
+        if not self.periods(fact):
+            return pd.DataFrame(columns=[*by, value])
+        table = self.dataset(fact).to_table(columns=[*by, value],
+                                            filter=self._expression(start, end, entites, filters))
+        result = table.group_by(by).aggregate([(value, agg)]).to_pandas()
+        return result.rename(columns={f'{value}_{agg}': value}).sort_values(by, ignore_index=True)
+
+
+# ---------------------------------------------------------------- Import
+
+def import_synthetic(source, store, entite='SIEGE'):
+    """Importer un jeu synthetic_data (ventes, stocks, trésorerie), un mois à la fois"""
+    import synthetic_data
+
+    articles = synthetic_data.read_table(source, 'articles', columns=['sku', 'cout_unitaire'])
+    cost = articles.set_index('sku')['cout_unitaire']
+    counts = dict.fromkeys(FACTS, 0)
+    months = sorted(name.split('=', 1)[1] for name in os.listdir(os.path.join(source, 'ventes'))
+                    if name.startswith('mois='))
+    for month in months:
+        where = [('mois', '=', month)]
+        ventes = synthetic_data.read_table(source, 'ventes', filters=where)
+        ventes['sku'] = ventes['sku'].astype(str)
+        counts['ventes'] += store.append('ventes', ventes, entite=entite, replace=True)
+
+        # Sorties de stock : lignes vendues ; entrées : réapprovisionnement du début de mois
+        demande = synthetic_data.read_table(source, 'demande_mensuelle', filters=where)
+        demande['sku'] = demande['sku'].astype(str)
+        sorties = pd.DataFrame({'date': ventes['date'], 'sku': ventes['sku'], 'mouvement': 'sortie',
+                                'quantite': -ventes['quantite'].astype('int64')})
+        entrees = pd.DataFrame({'date': pd.Timestamp(f'{month}-01'), 'sku': demande['sku'],
+                                'mouvement': 'entree', 'quantite': demande['quantite'].astype('int64')})
+        mouvements = pd.concat([entrees, sorties], ignore_index=True)
+        mouvements['valeur'] = (mouvements['quantite'] * mouvements['sku'].map(cost)).round(2)
+        counts['mouvements_stock'] += store.append('mouvements_stock', mouvements, entite=entite, replace=True)
+
+        ecritures = synthetic_data.read_table(source, 'ecritures', filters=where + [('compte', '=', '512')])
+        libelle = ecritures['libelle'].astype(str)
+        tresorerie = pd.DataFrame({
+            'date': ecritures['date'],
+            'categorie': libelle.map(CASH_CATEGORIES).fillna('Autres'),
+            'libelle': libelle,
+            'montant': (ecritures['debit'] - ecritures['credit']).round(2),
+        })
+        counts['tresorerie'] += store.append('tresorerie', tresorerie, entite=entite, replace=True)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--root', default=HISTORY_ROOT, help="répertoire de l'entrepôt")
+    commands = parser.add_subparsers(dest='command', required=True)
+    importer = commands.add_parser('import', help="importer un jeu synthetic_data")
+    importer.add_argument('source')
+    importer.add_argument('--entite', default='SIEGE')
+    commands.add_parser('info', help="partitions et volumes par fait")
+    compact = commands.add_parser('compact', help="fusionner les fichiers de chaque partition")
+    compact.add_argument('facts', nargs='*', default=list(FACTS))
+    args = parser.parse_args(argv)
+    if args.command == 'import':
+        try:
+            args.entite = check_entity(args.entite)
+        except ValueError as error:
+            parser.error(str(error))
+
+    store = HistoryStore(args.root)
+    started = time.perf_counter()
+    if args.command == 'import':
+        for fact, rows in import_synthetic(args.source, store, args.entite).items():
+            print(f"{fact:<18} {rows:>12,} lignes")
+    elif args.command == 'compact':
+        for fact in args.facts:
+            print(f"{fact:<18} {store.compact(fact):>6} partitions fusionnées")
+    else:
+        for fact in FACTS:
+            parts = store.partitions(fact)
+            if parts.empty:
+                print(f"{fact:<18} vide")
+                continue
+            print(f"{fact:<18} {parts['lignes'].sum():>12,} lignes, {len(parts)} partitions "
+                  f"({parts['periode'].min()} à {parts['periode'].max()}, "
+                  f"entités : {', '.join(sorted(parts['entite'].unique()))})")
+    print(f"Terminé en {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import json
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from lazy_imports import lazy_import
+from log_store import IntegrationLogStore
+from metrics_store import MetricsStore
+
+# requests n'est chargé qu'à la création du premier connecteur
+connectors = lazy_import('connectors')
+
+
+class IntegrationSystem:
+    """Sous-système d'intégration avancé pour le contrôle de gestion"""
+    
+    def __init__(self):
+        self.connections = {}
+        self.init_database()
+        self.metrics = MetricsStore()
+        self.logs = IntegrationLogStore()
+    
+    def init_database(self):
+        """Initialisation de la base de données des intégrations"""
+        conn = sqlite3.connect('integrations.db')
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS system_connections (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                system_name TEXT NOT NULL,
+                system_type TEXT NOT NULL,
+                connection_status TEXT NOT NULL,
+                last_sync TIMESTAMP,
+                api_endpoint TEXT,
+                config_data TEXT
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS data_flows (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_name TEXT NOT NULL,
+                source_system TEXT NOT NULL,
+                target_system TEXT NOT NULL,
+                frequency TEXT NOT NULL,
+                last_execution TIMESTAMP,
+                success_rate REAL
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    def add_system_connection(self, name, system_type, endpoint, config):
+        """Ajouter une nouvelle connexion système"""
+        conn = sqlite3.connect('integrations.db')
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO system_connections 
+            (system_name, system_type, connection_status, last_sync, api_endpoint, config_data)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (name, system_type, 'Disconnected', None, endpoint, json.dumps(config)))
+        
+        conn.commit()
+        conn.close()
+    
+    def _new_connector(self, system_name, system_type, endpoint, token=None):
+        connector_cls = connectors.CONNECTOR_TYPES.get(system_type, connectors.RestConnector)
+        connector = connector_cls(endpoint, token=token, metrics=self.metrics, logs=self.logs)
+        connector.system_name = system_name
+        return connector
+
+    def get_connector(self, system_name, system_type, endpoint, token=None):
+        """Connecteur REST partagé (pool de connexions réutilisé).
+
+        La clé inclut point d'accès et jeton : une configuration corrigée crée un nouveau
+        connecteur au lieu de réutiliser l'ancien.
+        """
+        key = (system_name, system_type, endpoint, token)
+        if key not in self.connections:
+            self.connections[key] = self._new_connector(system_name, system_type, endpoint, token)
+        return self.connections[key]
+    
+    def execute_flow(self, flow_name, source_system, func, *args, **kwargs):
+        """Exécuter un flux de données en mesurant latence, volume et statut"""
+        try:
+            with self.metrics.timer(source_system, 'flow') as measure:
+                result = func(*args, **kwargs)
+                if isinstance(result, pd.DataFrame):
+                    measure['rows'] = len(result)
+                    measure['bytes'] = int(result.memory_usage(deep=True).sum())
+        except Exception as exc:
+            self.logs.append(source_system, flow_name, 'error', str(exc))
+            raise
+        self.logs.append(source_system, flow_name, 'success', f"{measure['rows']:,} lignes")
+        
+        conn = sqlite3.connect('integrations.db')
+        now = datetime.now().isoformat()
+        updated = conn.execute(
+            'UPDATE data_flows SET last_execution = ? WHERE flow_name = ?',
+            (now, flow_name)
+        ).rowcount
+        if not updated:
+            conn.execute('''
+                INSERT INTO data_flows (flow_name, source_system, target_system, frequency, last_execution)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (flow_name, source_system, 'Contrôle de gestion', 'À la demande', now))
+        conn.commit()
+        conn.close()
+        return result
+
+    def extract(self, system_name, system_type, endpoint, path, token=None):
+        """Extraire une ressource paginée en DataFrame, mesurée et journalisée comme un flux"""
+        connector = self.get_connector(system_name, system_type, endpoint, token)
+        flow_name = f"Extraction {system_name} /{path.lstrip('/')}"
+        return self.execute_flow(flow_name, system_name, connector.fetch_dataframe, path)
+
+    def test_connection(self, system_name, system_type, endpoint, token=None, auth=None):
+        """Tester la connexion à un système avec un connecteur éphémère.
+
+        Les identifiants ne servent qu'à la requête de test : ils ne sont ni conservés dans le
+        sous-système partagé entre sessions, ni posés sur une session réutilisée.
+        """
+        with self._new_connector(system_name, system_type, endpoint, token) as connector:
+            ok, _ = connector.probe(auth=auth)
+        return ok
+
+
+@st.cache_resource
+def get_integration_system():
+    """Sous-système d'intégration partagé par toutes les sessions (connexions SQLite, pools HTTP)"""
+    return IntegrationSystem()
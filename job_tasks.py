@@ -0,0 +1,150 @@
+"""Tâches de calcul longues exécutées en arrière-plan par jobs.JobManager.
+
+Chaque tâche reçoit le contexte du job en premier argument, publie son
+avancement par lots et vérifie les demandes d'annulation entre deux lots.
+Les résultats sont de simples dictionnaires (sérialisables) relus par les pages.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import budget_engines as engines
+import budget_import
+import data_quality
+import report_engine
+import result_cache
+
+# Calcul mémoïsé : cache disque partagé entre sessions et processus
+cached_build_report = result_cache.memoize(report_engine.build_report)
+
+# Tendance mensuelle et choc ponctuel (à mi-horizon) par scénario de ventes
+SALES_SCENARIOS = {
+    "Croissance Accélérée": (0.020, 0.00),
+    "Récession Modérée": (-0.008, 0.00),
+    "Choc Concurrentiel": (0.004, -0.12),
+    "Optimisation Marketing": (0.012, 0.05),
+    "Scénario Personnalisé": (0.006, 0.00),
+}
+
+
+def _summary(values, done, total):
+    """Statistiques d'un tirage de VAN (partiel ou complet)"""
+    return {
+        'simulations': done,
+        'total': total,
+        'moyenne': float(values.mean()),
+        'ecart_type': float(values.std()),
+        'prob_positive': float((values > 0).mean() * 100),
+    }
+
+
+def monte_carlo_npv_task(job, investissement, flux, taux, n_simulations=10000, volatilite=0.15,
+                         seed=None, chunk_size=50_000, bins=60):
+    """Distribution de VAN par lots : statistiques partielles, puis histogramme et quantiles"""
+    n_chunks = -(-n_simulations // chunk_size)
+    # Un flux aléatoire indépendant par lot : résultat identique quel que soit le découpage publié
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    values = []
+    done = 0
+    for chunk_seed in seeds:
+        job.check_cancelled()
+        size = min(chunk_size, n_simulations - done)
+        values.append(engines.monte_carlo_npv(investissement, flux, taux, size, volatilite, seed=chunk_seed))
+        done += size
+        job.progress(done / n_simulations, f"{done:,} / {n_simulations:,} scénarios",
+                     partial=_summary(np.concatenate(values), done, n_simulations))
+    values = np.concatenate(values)
+    counts, edges = np.histogram(values, bins=bins)
+    result = _summary(values, done, n_simulations)
+    result['histogramme'] = pd.DataFrame({'VAN (€)': (edges[:-1] + edges[1:]) / 2, 'Fréquence': counts})
+    result['quantiles'] = {f"P{q}": float(v) for q, v in zip((5, 50, 95), np.percentile(values, [5, 50, 95]))}
+    return result
+
+
+def report_task(job, report_type, releve_tresorerie=None, formats=('xlsx', 'pdf')):
+    """Assembler un rapport puis écrire ses fichiers (octets par format)"""
+    job.progress(0.05, "Assemblage des données")
+    sheets = cached_build_report(report_type, releve_tresorerie=releve_tresorerie)
+    files = {}
+    for i, fmt in enumerate(formats):
+        job.check_cancelled()
+        job.progress(0.2 + 0.8 * i / len(formats), f"Écriture {fmt.upper()}")
+        with open(report_engine.render_report(report_type, fmt, sheets), 'rb') as f:
+            files[fmt] = f.read()
+    return {'rapport': report_type, 'feuilles': sheets, 'fichiers': files}
+
+
+def sales_scenario_task(job, scenario_type, horizon, confidence_level, n_paths=20_000,
+                        history_months=36, seed=0, chunk_size=2_000):
+    """Prévision des ventes par bootstrap des variations mensuelles historiques
+
+    Les trajectoires rééchantillonnent les variations logarithmiques d'un
+    historique de référence (k€), auxquelles s'ajoutent la tendance et le choc
+    du scénario ; les bornes sont les quantiles au niveau de confiance choisi.
+    """
+    rng = np.random.default_rng(seed)
+    months = np.arange(history_months)
+    history = 900 * (1 + 0.01 * months) * (1 + 0.08 * np.sin(2 * np.pi * months / 12))
+    history *= rng.normal(1, 0.03, history_months)
+    returns = np.diff(np.log(history))
+
+    drift, shock = SALES_SCENARIOS.get(scenario_type, SALES_SCENARIOS["Scénario Personnalisé"])
+    steps = np.full(horizon, drift)
+    steps[horizon // 2] += np.log1p(shock)
+    alpha = (100 - confidence_level) / 200
+
+    paths = []
+    done = 0
+    while done < n_paths:
+        job.check_cancelled()
+        size = min(chunk_size, n_paths - done)
+        draws = rng.choice(returns - returns.mean(), size=(size, horizon))
+        paths.append(history[-1] * np.exp(np.cumsum(draws + steps, axis=1)))
+        done += size
+        job.progress(done / n_paths, f"{done:,} / {n_paths:,} trajectoires")
+    paths = np.concatenate(paths)
+
+    forecast = pd.DataFrame({
+        'Mois': [f"Mois {i + 1}" for i in range(horizon)],
+        'Prévision': np.median(paths, axis=0),
+        'Borne inférieure': np.quantile(paths, alpha, axis=0),
+        'Borne supérieure': np.quantile(paths, 1 - alpha, axis=0),
+    })
+    annual = paths[:, :12].sum(axis=1) * 12 / min(horizon, 12)
+    last_year = history[-12:].sum()
+    return {
+        'scenario': scenario_type,
+        'prevision': forecast,
+        'ca_annuel': float(np.median(annual)) * 1000,
+        'croissance': float(np.median(annual) / last_year - 1) * 100,
+        'intervalle': float((np.quantile(annual, 1 - alpha) - np.quantile(annual, alpha))
+                            / 2 / np.median(annual)) * 100,
+    }
+
+
+def import_task(job, path, template=None, entite='SIEGE', annee=None, replace=False, dedupe=True):
+    """Import par blocs d'un fichier téléversé dans l'entrepôt d'historique
+
+    path est la copie du téléversement : elle est supprimée à la fin du job,
+    qu'il aboutisse, échoue ou soit annulé.
+    """
+    def progress(fraction, message):
+        job.check_cancelled()
+        job.progress(0.95 * fraction, message)
+
+    try:
+        return budget_import.import_file(path, template, entite, annee, replace, dedupe=dedupe,
+                                         progress=progress)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def quality_task(job, fact, start=None, end=None, entites=None):
+    """Contrôle qualité par blocs d'une tranche d'un fait de l'entrepôt"""
+    def progress(fraction, message):
+        job.check_cancelled()
+        job.progress(fraction, message)
+
+    return data_quality.validate_store(fact, start, end, entites, progress=progress)
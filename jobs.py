@@ -0,0 +1,287 @@
+"""Exécution en arrière-plan des calculs longs (Monte Carlo, rapports, analyses IA).
+
+Un calcul est soumis à un pool de processus partagé par toutes les sessions ;
+la page garde l'identifiant du job dans st.session_state et n'est plus bloquée :
+l'utilisateur peut changer de page, le calcul continue. L'avancement réel et
+les résultats partiels sont publiés par la tâche via `job.progress(...)` et
+relus par un fragment Streamlit rafraîchi périodiquement (`show_job`). Une
+tâche en attente est annulée immédiatement ; une tâche en cours s'arrête au
+prochain `job.check_cancelled()`. Les résultats terminés restent disponibles
+(historique borné) pour les autres pages via `job_result(clé)`.
+
+Les tâches sont des fonctions de module importables (sérialisées vers le
+processus de calcul) recevant le contexte du job en premier argument :
+
+    def ma_tache(job, n):
+        for i in range(n):
+            job.check_cancelled()
+            ...
+            job.progress((i + 1) / n, f"Étape {i + 1}/{n}", partial=resultat_partiel)
+        return resultat
+"""
+import itertools
+import multiprocessing
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+import streamlit as st
+
+from perf_monitor import current_session_id
+
+# Statuts d'un job
+PENDING = 'en_attente'
+RUNNING = 'en_cours'
+DONE = 'termine'
+CANCELLED = 'annule'
+FAILED = 'erreur'
+
+STATUS_LABELS = {
+    PENDING: "⏳ En attente",
+    RUNNING: "🔄 En cours",
+    DONE: "✅ Terminé",
+    CANCELLED: "⛔ Annulé",
+    FAILED: "❌ Erreur",
+}
+
+# Clé de session_state : {clé du job dans la page: identifiant du job}
+SESSION_KEY = 'jobs'
+
+
+class JobCancelled(Exception):
+    """Levée dans la tâche par check_cancelled() après une demande d'annulation"""
+
+
+class JobContext:
+    """Contexte passé à la tâche dans le processus de calcul"""
+
+    def __init__(self, job_id, progress_state, cancel_flags):
+        self.job_id = job_id
+        self._progress = progress_state
+        self._cancel = cancel_flags
+
+    def progress(self, fraction, message='', partial=None):
+        """Publier l'avancement (0 à 1), un message et un résultat partiel (sérialisable)"""
+        self._progress[self.job_id] = (min(max(float(fraction), 0.0), 1.0), message, partial)
+
+    def cancelled(self):
+        return self._cancel.get(self.job_id, False)
+
+    def check_cancelled(self):
+        if self.cancelled():
+            raise JobCancelled(f"Job {self.job_id} annulé")
+
+
+def _run(func, job_id, progress_state, cancel_flags, args, kwargs):
+    """Point d'entrée du processus de calcul"""
+    return func(JobContext(job_id, progress_state, cancel_flags), *args, **kwargs)
+
+
+@contextmanager
+def _bare_main():
+    """Masquer le module __main__ pendant la création de processus « spawn »
+
+    Un processus « spawn » réexécute le module __main__ du parent ; sous
+    Streamlit, c'est le script de l'application, qui ne doit pas tourner dans
+    les processus de calcul.
+    """
+    main = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        yield
+    finally:
+        sys.modules['__main__'] = main
+
+
+class Job:
+    """Job soumis : future du pool et dernier état connu"""
+
+    def __init__(self, job_id, label, owner, future):
+        self.id = job_id
+        self.label = label
+        self.owner = owner
+        self.future = future
+        self.submitted = time.time()
+        self.finished = None
+        self.fraction = 0.0
+        self.message = ''
+        self.partial = None
+        self.error = None
+
+    @property
+    def status(self):
+        future = self.future
+        if future.cancelled():
+            return CANCELLED
+        if not future.done():
+            return RUNNING if future.running() else PENDING
+        error = future.exception()
+        if isinstance(error, JobCancelled):
+            return CANCELLED
+        return FAILED if error is not None else DONE
+
+    @property
+    def active(self):
+        return not self.future.done()
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.time()) - self.submitted
+
+    def result(self):
+        """Résultat du job terminé (None s'il est en cours, annulé ou en erreur)"""
+        return self.future.result() if self.status == DONE else None
+
+
+class JobManager:
+    """Pool de processus et registre des jobs, partagé par les sessions du serveur"""
+
+    def __init__(self, max_workers=2, max_history=100):
+        # « spawn » : pas de fork d'un serveur multi-threadé
+        context = multiprocessing.get_context('spawn')
+        with _bare_main():
+            self.sync = context.Manager()
+        self.progress_state = self.sync.dict()
+        self.cancel_flags = self.sync.dict()
+        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        self.max_history = max_history
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+
+    def submit(self, func, *args, label='', owner=None, **kwargs):
+        """Soumettre une tâche ; retourne l'identifiant du job"""
+        # Les processus du pool sont créés à la demande, lors d'une soumission
+        with self.lock, _bare_main():
+            job_id = f"job-{next(self.ids)}"
+            future = self.pool.submit(_run, func, job_id, self.progress_state, self.cancel_flags,
+                                      args, kwargs)
+            self.jobs[job_id] = Job(job_id, label or func.__name__, owner, future)
+            self._trim()
+        future.add_done_callback(lambda _: self._finish(job_id))
+        return job_id
+
+    def get(self, job_id):
+        """Job à jour de son dernier avancement publié (None s'il est inconnu ou purgé)"""
+        job = self.jobs.get(job_id)
+        if job is not None and job.active:
+            state = self.progress_state.get(job_id)
+            if state is not None:
+                job.fraction, job.message, job.partial = state
+        return job
+
+    def cancel(self, job_id):
+        """Annuler un job : immédiat s'il est en attente, au prochain point de contrôle sinon"""
+        job = self.jobs.get(job_id)
+        if job is None or not job.active:
+            return
+        if not job.future.cancel():
+            self.cancel_flags[job_id] = True
+
+    def list(self, owner=None):
+        """Jobs (d'une session si owner est donné), du plus récent au plus ancien"""
+        jobs = [self.get(job_id) for job_id in reversed(self.jobs)]
+        return [job for job in jobs if owner is None or job.owner == owner]
+
+    def _finish(self, job_id):
+        """Figer l'état final du job et libérer son état partagé"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        job.finished = time.time()
+        try:
+            error = job.future.exception()
+        except CancelledError:
+            error = None
+        if job.status == DONE:
+            job.fraction, job.message = 1.0, ''
+        elif job.status == FAILED:
+            job.error = f"{type(error).__name__}: {error}"
+        self.progress_state.pop(job_id, None)
+        self.cancel_flags.pop(job_id, None)
+
+    def _trim(self):
+        """Conserver au plus max_history jobs terminés (les plus anciens sont oubliés)"""
+        finished = [job_id for job_id, job in self.jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self.jobs[job_id]
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.sync.shutdown()
+
+
+@st.cache_resource
+def get_job_manager():
+    return JobManager()
+
+
+# ---------------------------------------------------------------- Interface
+
+def submit_job(key, func, *args, label='', **kwargs):
+    """Soumettre une tâche et retenir son job dans la session sous `key`"""
+    job_id = get_job_manager().submit(func, *args, label=label, owner=current_session_id(), **kwargs)
+    st.session_state.setdefault(SESSION_KEY, {})[key] = job_id
+    return job_id
+
+
+def session_job(key):
+    """Job de la session retenu sous `key` (None s'il n'y en a pas)"""
+    job_id = st.session_state.get(SESSION_KEY, {}).get(key)
+    return get_job_manager().get(job_id) if job_id is not None else None
+
+
+def job_result(key):
+    """Résultat du dernier job terminé sous `key`, accessible depuis toutes les pages"""
+    job = session_job(key)
+    return job.result() if job is not None else None
+
+
+def _show_progress(job_id, render_partial):
+    """Avancement d'un job actif ; rerun complet de la page à la fin du job"""
+    job = get_job_manager().get(job_id)
+    if not job.active:
+        st.rerun()
+    st.progress(job.fraction, text=f"{STATUS_LABELS[job.status]} - {job.label} "
+                                   f"({job.elapsed:,.0f} s) {job.message}")
+    st.button("⛔ Annuler", key=f'cancel_{job_id}', on_click=get_job_manager().cancel, args=(job_id,))
+    if render_partial is not None and job.partial is not None:
+        render_partial(job.partial)
+
+
+def show_job(key, render_result, render_partial=None, interval=1.0):
+    """Afficher le job de la session retenu sous `key`
+
+    Job actif : barre d'avancement, bouton d'annulation et résultat partiel,
+    relus toutes les `interval` secondes par un fragment (seul le fragment est
+    réexécuté). Job terminé : render_result(résultat). Retourne le job.
+    """
+    job = session_job(key)
+    if job is None:
+        return None
+    if job.active:
+        st.fragment(_show_progress, run_every=interval)(job.id, render_partial)
+    elif job.status == DONE:
+        render_result(job.result())
+    elif job.status == CANCELLED:
+        st.warning(f"⛔ {job.label} : calcul annulé.")
+    else:
+        st.error(f"❌ {job.label} : le calcul a échoué ({job.error}).")
+    return job
+
+
+def show_session_jobs():
+    """Jobs de la session dans la barre latérale (suivis d'une page à l'autre)"""
+    # Pas de pool démarré pour une session qui n'a encore rien soumis
+    if not st.session_state.get(SESSION_KEY):
+        return
+    jobs = get_job_manager().list(owner=current_session_id())
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("**🧮 Calculs en arrière-plan**")
+    for job in jobs[:5]:
+        progress = f" {job.fraction:.0%}" if job.active else ''
+        st.sidebar.caption(f"{STATUS_LABELS[job.status]}{progress} - {job.label}")
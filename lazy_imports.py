@@ -0,0 +1,37 @@
+"""Imports différés des dépendances lourdes (scipy, seaborn, matplotlib, requests...).
+
+`plt = lazy_import('matplotlib.pyplot')` ne charge rien : le module est importé
+au premier accès à un de ses attributs (plt.subplots, ...). Les pages qui ne
+s'en servent pas ne paient donc pas son coût d'import.
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module importé au premier accès à un attribut"""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = name
+
+    def _load(self):
+        module = importlib.import_module(self._lazy_target)
+        # Les accès suivants trouvent les attributs directement, sans __getattr__
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name):
+    """Module déjà chargé, sinon proxy qui l'importera au premier usage"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -0,0 +1,37 @@
+"""Tuiles de suivi actualisées automatiquement (fragments Streamlit).
+
+Une tuile de suivi (métriques, jauge) est rendue dans un fragment : elle est
+réexécutée seule, toutes les `interval` secondes si l'actualisation
+automatique est activée, sans reconstruire le reste de la page.
+
+    interval = refresh_interval('tresorerie_refresh')
+    live_tiles(show_cash_tiles, interval)
+"""
+from datetime import datetime
+
+import streamlit as st
+
+REFRESH_INTERVALS = {
+    "Désactivée": None,
+    "10 s": 10,
+    "30 s": 30,
+    "1 min": 60,
+    "5 min": 300,
+}
+
+
+def refresh_interval(key, label="🔄 Actualisation automatique"):
+    """Choix de la période d'actualisation des tuiles (None : désactivée)"""
+    choice = st.selectbox(label, list(REFRESH_INTERVALS), key=key)
+    return REFRESH_INTERVALS[choice]
+
+
+def _tiles(render, args, kwargs, interval):
+    render(*args, **kwargs)
+    if interval:
+        st.caption(f"🕒 Actualisé à {datetime.now():%H:%M:%S} (toutes les {interval} s)")
+
+
+def live_tiles(render, interval=None, *args, **kwargs):
+    """Rendre render(*args, **kwargs) dans un fragment, réexécuté toutes les `interval` secondes"""
+    st.fragment(_tiles, run_every=interval)(render, args, kwargs, interval)
@@ -0,0 +1,119 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+DB_PATH = 'monitoring.db'  # partagée avec metrics_store
+
+STATUS_LABELS = {
+    'success': '✅ Succès',
+    'warning': '⚠️ Avertissement',
+    'error': '🔴 Erreur',
+}
+
+
+class IntegrationLogStore:
+    """Journal append-only des intégrations, lu par curseur sur l'identifiant"""
+
+    def __init__(self, db_path=DB_PATH, max_rows=1_000_000, rotate_every=1000):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.rotate_every = rotate_every
+        self.appended = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.init_database()
+
+    def init_database(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        # AUTOINCREMENT garantit des id croissants même après rotation
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS integration_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts TEXT NOT NULL,
+                system_name TEXT NOT NULL,
+                action TEXT NOT NULL,
+                status TEXT NOT NULL,
+                details TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_integration_logs_system
+            ON integration_logs (system_name, id)
+        ''')
+        self.conn.commit()
+
+    def append(self, system, action, status='success', details=''):
+        self.append_many([(system, action, status, details)])
+
+    def append_many(self, events):
+        """Ajouter des événements (system, action, status, details) en une transaction"""
+        ts = datetime.now().isoformat(timespec='seconds')
+        with self.lock:
+            self.conn.executemany(
+                'INSERT INTO integration_logs (ts, system_name, action, status, details) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(ts, *event) for event in events]
+            )
+            self.conn.commit()
+            self.appended += len(events)
+            if self.appended >= self.rotate_every:
+                self.appended = 0
+                self._rotate()
+
+    def _rotate(self):
+        """Conserver les max_rows derniers événements (suppression par plage d'id)"""
+        (last_id,) = self.conn.execute('SELECT COALESCE(MAX(id), 0) FROM integration_logs').fetchone()
+        self.conn.execute('DELETE FROM integration_logs WHERE id <= ?', (last_id - self.max_rows,))
+        self.conn.commit()
+
+    def _query(self, where, params, order, limit):
+        # Connexion partagée entre sessions : lectures et écritures sérialisées par le verrou
+        with self.lock:
+            return pd.read_sql_query(
+                f'SELECT id, ts, system_name, action, status, details FROM integration_logs '
+                f'{where} ORDER BY id {order} LIMIT ?',
+                self.conn, params=(*params, limit)
+            )
+
+    def tail(self, after_id=0, limit=500, system=None):
+        """Événements d'id strictement supérieur au curseur, du plus ancien au plus récent"""
+        if system:
+            return self._query('WHERE system_name = ? AND id > ?', (system, after_id), 'ASC', limit)
+        return self._query('WHERE id > ?', (after_id,), 'ASC', limit)
+
+    def latest(self, n=50, system=None):
+        """Les n derniers événements, du plus récent au plus ancien"""
+        if system:
+            return self._query('WHERE system_name = ?', (system,), 'DESC', n)
+        return self._query('', (), 'DESC', n)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class LogTail:
+    """Fenêtre glissante des N derniers événements, rafraîchie par curseur"""
+
+    def __init__(self, store, size=50):
+        self.store = store
+        self.size = size
+        self.cursor = 0
+        self.frame = None
+
+    def poll(self):
+        if self.frame is None:
+            self.frame = self.store.latest(self.size)
+        else:
+            new = self.store.tail(self.cursor, limit=self.size)
+            if len(new) >= self.size:
+                # Plus d'événements que la fenêtre : relire directement la fin
+                self.frame = self.store.latest(self.size)
+            elif not new.empty:
+                self.frame = pd.concat([new.iloc[::-1], self.frame], ignore_index=True).head(self.size)
+        if not self.frame.empty:
+            self.cursor = int(self.frame['id'].max())
+        return self.frame
@@ -0,0 +1,253 @@
+import math
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Base d'exécution, hors dépôt (integrations.db, suivie par git, ne garde que la configuration)
+DB_PATH = 'monitoring.db'
+
+# Histogramme de latence à pas logarithmique (~5 % d'erreur relative)
+HIST_BASE = 1.1
+ROLLUPS = {
+    'minute': ('metric_rollup_1m', 60),
+    'hour': ('metric_rollup_1h', 3600),
+}
+
+
+def latency_bin(latency_ms):
+    return int(math.floor(math.log(max(latency_ms, 0.01), HIST_BASE)))
+
+
+def bin_value(index):
+    """Valeur représentative (milieu géométrique) d'une classe d'histogramme"""
+    return HIST_BASE ** (index + 0.5)
+
+
+class MetricsStore:
+    """Stockage des mesures d'intégration en séries temporelles pré-agrégées"""
+
+    def __init__(self, db_path=DB_PATH, flush_every=200, flush_interval=5.0,
+                 retention_days=30, purge_interval=3600.0):
+        self.db_path = db_path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.retention_days = retention_days
+        self.purge_interval = purge_interval
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.pending_hist = {}
+        self.pending_events = 0
+        self.last_flush = time.monotonic()
+        self.last_purge = None
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.init_database()
+
+    def init_database(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        for table, _ in ROLLUPS.values():
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    bucket INTEGER NOT NULL,
+                    system_name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    n INTEGER NOT NULL,
+                    errors INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL,
+                    rows INTEGER NOT NULL,
+                    latency_sum REAL NOT NULL,
+                    latency_max REAL NOT NULL,
+                    PRIMARY KEY (bucket, system_name, kind)
+                ) WITHOUT ROWID
+            ''')
+            columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table}_hist)')]
+            if columns and 'kind' not in columns:
+                # Histogrammes d'une version antérieure, sans type d'appel : repris sous kind = ''
+                cursor.execute(f'ALTER TABLE {table}_hist RENAME TO {table}_hist_old')
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table}_hist (
+                    bucket INTEGER NOT NULL,
+                    system_name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    bin INTEGER NOT NULL,
+                    n INTEGER NOT NULL,
+                    PRIMARY KEY (bucket, system_name, kind, bin)
+                ) WITHOUT ROWID
+            ''')
+            if columns and 'kind' not in columns:
+                cursor.execute(f'''
+                    INSERT INTO {table}_hist SELECT bucket, system_name, '', bin, n
+                    FROM {table}_hist_old
+                ''')
+                cursor.execute(f'DROP TABLE {table}_hist_old')
+        self.conn.commit()
+
+    def record(self, system, kind, latency_ms, ok=True, nbytes=0, rows=0, ts=None):
+        """Enregistrer une mesure (agrégée en mémoire puis écrite par lots)"""
+        ts = time.time() if ts is None else ts
+        hist_bin = latency_bin(latency_ms)
+        with self.lock:
+            for table, width in ROLLUPS.values():
+                bucket = int(ts // width) * width
+                key = (table, bucket, system, kind)
+                agg = self.pending.get(key)
+                if agg is None:
+                    agg = self.pending[key] = [0, 0, 0, 0, 0.0, 0.0]
+                agg[0] += 1
+                agg[1] += 0 if ok else 1
+                agg[2] += nbytes
+                agg[3] += rows
+                agg[4] += latency_ms
+                agg[5] = max(agg[5], latency_ms)
+                hist_key = (table, bucket, system, kind, hist_bin)
+                self.pending_hist[hist_key] = self.pending_hist.get(hist_key, 0) + 1
+            self.pending_events += 1
+            due = (self.pending_events >= self.flush_every
+                   or time.monotonic() - self.last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    @contextmanager
+    def timer(self, system, kind):
+        """Chronométrer un bloc ; le dictionnaire produit reçoit bytes/rows"""
+        measure = {'bytes': 0, 'rows': 0}
+        start = time.perf_counter()
+        ok = True
+        try:
+            yield measure
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.record(system, kind, (time.perf_counter() - start) * 1000, ok=ok,
+                        nbytes=measure['bytes'], rows=measure['rows'])
+
+    def flush(self):
+        """Écrire les agrégats en attente et purger périodiquement les buckets expirés.
+
+        La connexion SQLite est partagée entre threads : toutes les écritures se font sous le verrou.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            pending_hist, self.pending_hist = self.pending_hist, {}
+            self.pending_events = 0
+            self.last_flush = now = time.monotonic()
+            if pending:
+                self._write(pending, pending_hist)
+            if self.last_purge is None or now - self.last_purge >= self.purge_interval:
+                self.last_purge = now
+                self._purge(time.time())
+
+    def _write(self, pending, pending_hist):
+        cursor = self.conn.cursor()
+        for (table, bucket, system, kind), agg in pending.items():
+            cursor.execute(f'''
+                INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (bucket, system_name, kind) DO UPDATE SET
+                    n = n + excluded.n,
+                    errors = errors + excluded.errors,
+                    bytes = bytes + excluded.bytes,
+                    rows = rows + excluded.rows,
+                    latency_sum = latency_sum + excluded.latency_sum,
+                    latency_max = MAX(latency_max, excluded.latency_max)
+            ''', (bucket, system, kind, *agg))
+        for (table, bucket, system, kind, hist_bin), n in pending_hist.items():
+            cursor.execute(f'''
+                INSERT INTO {table}_hist VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (bucket, system_name, kind, bin) DO UPDATE SET n = n + excluded.n
+            ''', (bucket, system, kind, hist_bin, n))
+        self.conn.commit()
+
+    def purge(self, now=None):
+        """Supprimer les agrégats minute au-delà de la rétention"""
+        with self.lock:
+            self._purge(time.time() if now is None else now)
+
+    def _purge(self, now):
+        limit = now - self.retention_days * 86400
+        table = ROLLUPS['minute'][0]
+        self.conn.execute(f'DELETE FROM {table} WHERE bucket < ?', (limit,))
+        self.conn.execute(f'DELETE FROM {table}_hist WHERE bucket < ?', (limit,))
+        self.conn.commit()
+
+    def _table_for(self, window_minutes):
+        return ROLLUPS['minute' if window_minutes <= 24 * 60 else 'hour'][0]
+
+    def _read(self, query, params):
+        with self.lock:
+            return pd.read_sql_query(query, self.conn, params=params)
+
+    @staticmethod
+    def _where(since, kind):
+        if kind is None:
+            return 'bucket >= ?', (since,)
+        return 'bucket >= ? AND kind = ?', (since, kind)
+
+    def summary(self, window_minutes=60, now=None, kind=None):
+        """Latence p50/p95/p99, débit et taux de réussite par système sur la fenêtre.
+
+        ``kind`` restreint le calcul à un type d'appel ('probe', 'page', 'flow').
+        """
+        self.flush()
+        now = time.time() if now is None else now
+        table = self._table_for(window_minutes)
+        where, params = self._where(now - window_minutes * 60, kind)
+
+        totals = self._read(f'''
+            SELECT system_name, SUM(n) AS n, SUM(errors) AS errors, SUM(bytes) AS bytes,
+                   SUM(rows) AS rows, SUM(latency_sum) AS latency_sum,
+                   MAX(latency_max) AS latency_max
+            FROM {table} WHERE {where} GROUP BY system_name
+        ''', params)
+        hist = self._read(f'''
+            SELECT system_name, bin, SUM(n) AS n FROM {table}_hist
+            WHERE {where} GROUP BY system_name, bin ORDER BY system_name, bin
+        ''', params)
+
+        columns = ['system_name', 'n', 'success_rate', 'latency_avg', 'p50', 'p95', 'p99',
+                   'latency_max', 'bytes_per_min', 'rows_per_min', 'bytes', 'rows']
+        if totals.empty:
+            return pd.DataFrame(columns=columns)
+
+        quantiles = {}
+        for system, group in hist.groupby('system_name'):
+            cumulative = group['n'].cumsum().to_numpy()
+            bins = group['bin'].to_numpy()
+            total = cumulative[-1]
+            quantiles[system] = [
+                bin_value(bins[min(cumulative.searchsorted(q * total), len(bins) - 1)])
+                for q in (0.50, 0.95, 0.99)
+            ]
+
+        totals['success_rate'] = 100 * (1 - totals['errors'] / totals['n'])
+        totals['latency_avg'] = totals['latency_sum'] / totals['n']
+        for i, name in enumerate(('p50', 'p95', 'p99')):
+            totals[name] = totals['system_name'].map(lambda s: quantiles.get(s, [None] * 3)[i])
+        # Les percentiles d'histogramme sont bornés par le maximum observé
+        for name in ('p50', 'p95', 'p99'):
+            totals[name] = totals[[name, 'latency_max']].min(axis=1)
+        totals['bytes_per_min'] = totals['bytes'] / window_minutes
+        totals['rows_per_min'] = totals['rows'] / window_minutes
+        return totals[columns]
+
+    def timeline(self, window_minutes=60, now=None, kind=None):
+        """Série par bucket : nombre d'appels, latence moyenne, octets"""
+        self.flush()
+        now = time.time() if now is None else now
+        table = self._table_for(window_minutes)
+        where, params = self._where(now - window_minutes * 60, kind)
+        df = self._read(f'''
+            SELECT bucket, system_name, SUM(n) AS n, SUM(latency_sum) / SUM(n) AS latency_avg,
+                   SUM(bytes) AS bytes
+            FROM {table} WHERE {where} GROUP BY bucket, system_name ORDER BY bucket
+        ''', params)
+        df['bucket'] = pd.to_datetime(df['bucket'], unit='s')
+        return df
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,184 @@
+"""Chronométrage des rendus de page et des blocs de calcul, persisté pour l'exploitation.
+
+render_page mesure chaque rendu de page ; dans une page, `with timed("Résolution PL"):`
+mesure un bloc nommé. Chaque mesure porte l'identifiant de la session
+Streamlit et la page courante ; elles sont gardées en mémoire puis écrites
+par lots dans une table SQLite roulante (les max_rows plus récentes), lue par
+la page « ⏱️ Performance ».
+"""
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from lazy_imports import lazy_import
+
+# Seule la page Performance lit les mesures : pandas n'est pas chargé au démarrage
+pd = lazy_import('pandas')
+
+DB_PATH = 'performance.db'
+
+# Nom du « bloc » d'une mesure de rendu de page complet
+PAGE_BLOCK = 'page'
+
+QUANTILES = {'p50': 0.50, 'p90': 0.90, 'p95': 0.95, 'p99': 0.99}
+
+
+class PerfStore:
+    """Table roulante des durées de rendu (session, page, bloc)"""
+
+    def __init__(self, db_path=DB_PATH, max_rows=200_000, flush_every=50, flush_interval=5.0,
+                 rotate_every=1000):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.rotate_every = rotate_every
+        self.written = 0
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.init_database()
+
+    def init_database(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS render_timings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                session_id TEXT NOT NULL,
+                page TEXT NOT NULL,
+                block TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                ok INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_render_timings_ts ON render_timings (ts)')
+        self.conn.commit()
+
+    def record(self, session_id, page, block, duration_ms, ok=True, ts=None):
+        """Enregistrer une mesure (écrite par lots)"""
+        ts = time.time() if ts is None else ts
+        with self.lock:
+            self.pending.append((ts, session_id, page, block, duration_ms, int(ok)))
+            due = (len(self.pending) >= self.flush_every
+                   or time.monotonic() - self.last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, []
+            self.last_flush = time.monotonic()
+            if not pending:
+                return
+            self.conn.executemany(
+                'INSERT INTO render_timings (ts, session_id, page, block, duration_ms, ok) '
+                'VALUES (?, ?, ?, ?, ?, ?)', pending
+            )
+            self.conn.commit()
+            self.written += len(pending)
+            if self.written >= self.rotate_every:
+                self.written = 0
+                self._rotate()
+
+    def _rotate(self):
+        """Conserver les max_rows dernières mesures (suppression par plage d'id)"""
+        (last_id,) = self.conn.execute('SELECT COALESCE(MAX(id), 0) FROM render_timings').fetchone()
+        self.conn.execute('DELETE FROM render_timings WHERE id <= ?', (last_id - self.max_rows,))
+        self.conn.commit()
+
+    def timings(self, window_hours=24, now=None):
+        """Mesures brutes de la fenêtre"""
+        self.flush()
+        now = time.time() if now is None else now
+        df = pd.read_sql_query(
+            'SELECT ts, session_id, page, block, duration_ms, ok FROM render_timings '
+            'WHERE ts >= ? ORDER BY ts', self.conn, params=(now - window_hours * 3600,)
+        )
+        df['ts'] = pd.to_datetime(df['ts'], unit='s')
+        return df
+
+    def percentiles(self, window_hours=24, now=None):
+        """Nombre de mesures, sessions, erreurs et percentiles de durée par page et par bloc"""
+        df = self.timings(window_hours, now)
+        columns = ['page', 'block', 'n', 'sessions', 'errors', *QUANTILES, 'max']
+        if df.empty:
+            return pd.DataFrame(columns=columns)
+        grouped = df.groupby(['page', 'block'])
+        stats = grouped['duration_ms'].quantile(list(QUANTILES.values())).unstack()
+        stats.columns = list(QUANTILES)
+        stats['n'] = grouped.size()
+        stats['sessions'] = grouped['session_id'].nunique()
+        stats['errors'] = grouped['ok'].apply(lambda ok: int((ok == 0).sum()))
+        stats['max'] = grouped['duration_ms'].max()
+        return stats.reset_index()[columns].sort_values('p95', ascending=False, ignore_index=True)
+
+    def timeline(self, window_hours=24, freq='h', block=PAGE_BLOCK, now=None):
+        """p50 et p95 par intervalle de temps et par page pour un bloc"""
+        df = self.timings(window_hours, now)
+        df = df[df['block'] == block]
+        if df.empty:
+            return pd.DataFrame(columns=['ts', 'page', 'p50', 'p95', 'n'])
+        grouped = df.groupby([pd.Grouper(key='ts', freq=freq), 'page'])['duration_ms']
+        return pd.DataFrame({
+            'p50': grouped.quantile(0.50),
+            'p95': grouped.quantile(0.95),
+            'n': grouped.size(),
+        }).reset_index()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+@st.cache_resource
+def get_perf_store():
+    """Table de mesures partagée par toutes les sessions du serveur"""
+    return PerfStore()
+
+
+_current = threading.local()
+
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else 'hors-session'
+
+
+@contextmanager
+def timed(block, page=None):
+    """Chronométrer un bloc nommé de la page courante (utilisable aussi en décorateur)"""
+    page = page or getattr(_current, 'page', '')
+    start = time.perf_counter()
+    ok = True
+    try:
+        yield
+    except Exception:
+        ok = False
+        raise
+    except BaseException:
+        # Rerun ou arrêt demandé par Streamlit : rendu interrompu, non mesuré
+        ok = None
+        raise
+    finally:
+        if ok is not None:
+            get_perf_store().record(current_session_id(), page, block,
+                                    (time.perf_counter() - start) * 1000, ok=ok)
+
+
+@contextmanager
+def timed_page(page):
+    """Chronométrer le rendu complet d'une page ; les blocs imbriqués lui sont rattachés"""
+    previous = getattr(_current, 'page', None)
+    _current.page = page
+    try:
+        with timed(PAGE_BLOCK, page):
+            yield
+    finally:
+        _current.page = previous
@@ -0,0 +1,289 @@
+"""Profilage cProfile à la demande d'un rerun, réservé aux administrateurs.
+
+Un administrateur (paramètre d'URL ?admin=<jeton>, égal à la variable
+d'environnement CDG_ADMIN_TOKEN) demande depuis la barre latérale le profilage
+du prochain rendu de la page courante. Ce rendu est exécuté sous cProfile ; le
+profil est enregistré dans performance.db (table roulante des max_profiles
+derniers) puis affiché sous la page : flamegraph reconstruit à partir des
+piles repliées (collapsed stacks) et tableau des fonctions les plus coûteuses.
+Le profil s'exporte en .prof (pstats, snakeviz) et en piles repliées
+(flamegraph.pl, speedscope).
+"""
+import cProfile
+import marshal
+import os
+import pstats
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+import streamlit as st
+
+from lazy_imports import lazy_import
+from perf_monitor import DB_PATH, current_session_id
+
+pd = lazy_import('pandas')
+go = lazy_import('plotly.graph_objects')
+
+ADMIN_TOKEN_ENV = 'CDG_ADMIN_TOKEN'
+
+# Clés de session_state
+REQUEST_KEY = 'profiler_request'
+LAST_KEY = 'profiler_last'
+
+# Branches du flamegraph plus courtes que cette part du temps total : élaguées
+MIN_FRACTION = 0.001
+MAX_DEPTH = 80
+OTHERS = '(autres)'
+
+
+def is_admin():
+    """Session administrateur : jeton d'URL égal à CDG_ADMIN_TOKEN (désactivé si absent)"""
+    token = os.environ.get(ADMIN_TOKEN_ENV)
+    return bool(token) and st.query_params.get('admin') == token
+
+
+class ProfileStore:
+    """Profils cProfile enregistrés (statistiques pstats sérialisées)"""
+
+    def __init__(self, db_path=DB_PATH, max_profiles=50):
+        self.db_path = db_path
+        self.max_profiles = max_profiles
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.init_database()
+
+    def init_database(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS profiles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                session_id TEXT NOT NULL,
+                page TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                stats BLOB NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def save(self, page, session_id, duration_ms, profile):
+        """Enregistrer un profil ; retourne son identifiant"""
+        profile.create_stats()
+        with self.lock:
+            cursor = self.conn.execute(
+                'INSERT INTO profiles (ts, session_id, page, duration_ms, stats) VALUES (?, ?, ?, ?, ?)',
+                (time.time(), session_id, page, duration_ms, marshal.dumps(profile.stats))
+            )
+            profile_id = cursor.lastrowid
+            self.conn.execute('DELETE FROM profiles WHERE id <= ?', (profile_id - self.max_profiles,))
+            self.conn.commit()
+        return profile_id
+
+    def list(self):
+        """Profils enregistrés, du plus récent au plus ancien"""
+        with self.lock:
+            df = pd.read_sql_query(
+                'SELECT id, ts, session_id, page, duration_ms FROM profiles ORDER BY id DESC', self.conn
+            )
+        df['ts'] = pd.to_datetime(df['ts'], unit='s')
+        return df
+
+    def raw(self, profile_id):
+        """Statistiques sérialisées (format d'un fichier .prof)"""
+        with self.lock:
+            row = self.conn.execute('SELECT stats FROM profiles WHERE id = ?', (profile_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Profil inconnu : {profile_id}")
+        return row[0]
+
+    def load(self, profile_id):
+        stats = pstats.Stats()
+        stats.stats = marshal.loads(self.raw(profile_id))
+        stats.get_top_level_stats()
+        return stats
+
+
+@st.cache_resource
+def get_profile_store():
+    return ProfileStore()
+
+
+# ---------------------------------------------------------------- Analyse
+
+def function_label(func):
+    """Libellé court d'une fonction pstats (fichier, ligne, nom)"""
+    filename, line, name = func
+    if filename == '~':
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    # « ; » sépare les cadres dans le format des piles repliées
+    return label.replace(';', ',')
+
+
+def collapsed_stacks(stats, min_fraction=MIN_FRACTION):
+    """Piles repliées {"racine;appelant;fonction": temps propre (s)}
+
+    cProfile ne garde que les arcs appelant → appelé : le temps cumulé de
+    chaque arc est réparti sur les chemins de l'appelant au prorata, ce qui
+    reconstruit des piles approchées (exactes quand chaque fonction n'a qu'un
+    appelant). Les appels récursifs sont repliés sur leur premier cadre ; les
+    branches sous min_fraction du temps total sont regroupées en « (autres) ».
+    """
+    entries = stats.stats
+    callees = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    threshold = sum(entries[func][3] for func in roots) * min_fraction
+
+    stacks = Counter()
+
+    def walk(func, path, on_path, fraction):
+        _, _, tottime, cumtime, _ = entries[func]
+        path = f"{path};{function_label(func)}" if path else function_label(func)
+        stacks[path] += tottime * fraction
+        if len(on_path) >= MAX_DEPTH:
+            stacks[f"{path};{OTHERS}"] += (cumtime - tottime) * fraction
+            return
+        children = {callee: edge_time * fraction for callee, edge_time in callees[func].items()
+                    if callee not in on_path and entries[callee][3] > 0}
+        # Les temps cumulés des fonctions récursives se recouvrent : les enfants
+        # ne peuvent pas dépasser le temps cumulé hors temps propre du parent
+        requested = sum(children.values())
+        scale = min(1.0, (cumtime - tottime) * fraction / requested) if requested > 0 else 1.0
+        pruned = 0.0
+        for callee, share in children.items():
+            share *= scale
+            if share < threshold:
+                pruned += share
+                continue
+            walk(callee, path, on_path | {callee}, share / entries[callee][3])
+        if pruned:
+            # Appels trop courts pour être lisibles : regroupés sans perdre leur temps
+            stacks[f"{path};{OTHERS}"] += pruned
+
+    for root in roots:
+        if entries[root][3] >= threshold:
+            walk(root, '', {root}, 1.0)
+    return dict(stacks)
+
+
+def collapsed_text(stacks):
+    """Piles repliées au format texte de flamegraph.pl (temps en microsecondes)"""
+    return '\n'.join(f"{path} {round(seconds * 1e6)}"
+                     for path, seconds in sorted(stacks.items()) if seconds > 0) + '\n'
+
+
+def top_functions(stats, n=30, sort='tottime'):
+    """Les n fonctions les plus coûteuses (temps propre ou cumulé)"""
+    rows = [{
+        'Fonction': function_label(func),
+        'Appels': nc,
+        'Temps propre (ms)': tottime * 1000,
+        'Temps cumulé (ms)': cumtime * 1000,
+        'Par appel (ms)': cumtime * 1000 / nc if nc else 0.0,
+    } for func, (_, nc, tottime, cumtime, _) in stats.stats.items()]
+    column = 'Temps propre (ms)' if sort == 'tottime' else 'Temps cumulé (ms)'
+    return pd.DataFrame(rows).sort_values(column, ascending=False, ignore_index=True).head(n)
+
+
+def flamegraph_figure(stacks):
+    """Flamegraph plotly (icicle, racine en haut) construit depuis les piles repliées"""
+    totals = Counter()
+    for path, seconds in stacks.items():
+        # Le temps propre d'un cadre compte dans le temps cumulé de tous ses ancêtres
+        frames = path.split(';')
+        for depth in range(1, len(frames) + 1):
+            totals[';'.join(frames[:depth])] += seconds * 1000
+    paths = list(stacks)
+    fig = go.Figure(go.Icicle(
+        ids=paths,
+        labels=[path.rpartition(';')[2] for path in paths],
+        parents=[path.rpartition(';')[0] for path in paths],
+        values=[totals[path] for path in paths],
+        customdata=[stacks[path] * 1000 for path in paths],
+        branchvalues='total', tiling=dict(orientation='v'), maxdepth=12,
+        hovertemplate='%{label}<br>%{value:,.1f} ms cumulés, %{customdata:,.1f} ms propres<extra></extra>'
+    ))
+    fig.update_layout(margin=dict(t=10, l=0, r=0, b=0), height=600)
+    return fig
+
+
+# ---------------------------------------------------------------- Interface
+
+def show_profiler_controls(page):
+    """Bouton d'administration de la barre latérale : profiler le prochain rendu"""
+    if not is_admin():
+        return
+    st.sidebar.markdown("---")
+    # Le callback s'exécute avant le rerun déclenché par le clic : c'est ce rerun qui est profilé
+    st.sidebar.button("🔬 Profiler le prochain rendu", key='profiler_button',
+                      on_click=st.session_state.__setitem__, args=(REQUEST_KEY, page))
+
+
+def show_profile(profile_id, key):
+    """Flamegraph, fonctions les plus coûteuses et exports d'un profil enregistré"""
+    store = get_profile_store()
+    stats = store.load(profile_id)
+    stacks = collapsed_stacks(stats)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("⏱️ Temps profilé", f"{stats.total_tt * 1000:,.0f} ms")
+    col2.metric("📞 Appels de fonctions", f"{stats.total_calls:,}")
+    col3.metric("🧱 Fonctions", f"{len(stats.stats):,}")
+
+    tab_flame, tab_top = st.tabs(["🔥 Flamegraph", "📋 Top fonctions"])
+    with tab_flame:
+        st.plotly_chart(flamegraph_figure(stacks), use_container_width=True)
+        st.caption("Largeur : temps cumulé ; cliquer un cadre pour zoomer.")
+    with tab_top:
+        col_sort, col_n = st.columns(2)
+        with col_sort:
+            sort = st.radio("Trier par", ['tottime', 'cumtime'], horizontal=True, key=f'{key}_sort',
+                            format_func={'tottime': "Temps propre", 'cumtime': "Temps cumulé"}.get)
+        with col_n:
+            n = st.slider("Nombre de fonctions", 10, 100, 30, step=10, key=f'{key}_n')
+        st.dataframe(top_functions(stats, n, sort), use_container_width=True, hide_index=True,
+                     column_config={column: st.column_config.NumberColumn(format='%.1f')
+                                    for column in ['Temps propre (ms)', 'Temps cumulé (ms)', 'Par appel (ms)']})
+
+    col_prof, col_stacks = st.columns(2)
+    col_prof.download_button("💾 Profil pstats (.prof)", store.raw(profile_id),
+                             file_name=f'profil_{profile_id}.prof', key=f'{key}_prof')
+    col_stacks.download_button("💾 Piles repliées (.txt)", collapsed_text(stacks),
+                               file_name=f'profil_{profile_id}.collapsed.txt', key=f'{key}_stacks')
+
+
+@contextmanager
+def profiled(page):
+    """Exécuter le bloc sous cProfile si un profil de la page a été demandé
+
+    Le dernier profil de la page reste affiché sous celle-ci jusqu'à sa fermeture.
+    """
+    if st.session_state.get(REQUEST_KEY) == page and is_admin():
+        del st.session_state[REQUEST_KEY]
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            # Profil conservé même si le rendu est interrompu (exception, rerun)
+            st.session_state[LAST_KEY] = (page, get_profile_store().save(
+                page, current_session_id(), (time.perf_counter() - start) * 1000, profile))
+    else:
+        yield
+
+    last_page, profile_id = st.session_state.get(LAST_KEY, (None, None))
+    if last_page == page and is_admin():
+        with st.expander(f"🔬 Profil du rendu (n° {profile_id})", expanded=True):
+            st.button("Fermer le profil", key='profiler_close',
+                      on_click=st.session_state.pop, args=(LAST_KEY, None))
+            show_profile(profile_id, key='profiler_last')
@@ -0,0 +1,331 @@
+"""Moteur de génération de rapports (XLSX multi-feuilles et PDF de synthèse).
+
+Les rapports sont assemblés à partir des DataFrames des moteurs budgétaires,
+écrits en flux (mémoire constante) et mis en cache par empreinte de contenu ;
+le cache est borné en taille et en âge (éviction des moins récemment servis).
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import budget_engines as engines
+
+CACHE_DIR = '.report_cache'
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_MAX_AGE = 30 * 24 * 3600  # secondes depuis le dernier accès
+
+# Limite Excel : 1 048 576 lignes par feuille, en-tête compris
+EXCEL_MAX_ROWS = 1_048_575
+WRITE_CHUNK_ROWS = 50_000
+
+MIME_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'pdf': 'application/pdf',
+}
+
+
+# ---------------------------------------------------------------- Assemblage des données
+
+def ecarts_budgetaires(budget, reel, libelles):
+    """Écarts budget / réel en valeur et en pourcentage"""
+    budget = np.asarray(budget, dtype=float)
+    reel = np.asarray(reel, dtype=float)
+    ecart = reel - budget
+    return pd.DataFrame({
+        'Poste': libelles,
+        'Budget': budget,
+        'Réel': reel,
+        'Écart': ecart,
+        'Écart (%)': np.where(budget != 0, ecart / np.where(budget != 0, budget, 1) * 100, np.nan),
+    })
+
+
+def rapport_tresorerie(releve=None, **params):
+    """Budget de trésorerie mensuel ; un relevé existant (budget_tresorerie.csv) est prioritaire"""
+    if releve is not None:
+        df = releve.copy()
+        df['Solde Mensuel'] = df['Encaissements'] - df['Décaissements']
+        df['Trésorerie Cumulée'] = df['Solde Mensuel'].cumsum()
+        return df
+    defaults = {
+        'ca_ht_mensuel': 100.0, 'achats_ht_mensuel': 60.0, 'charges_personnel': 25.0,
+        'charges_externes': 15.0, 'investissements': 50.0, 'tresorerie_initiale': 50.0,
+        'credit_disponible': 100.0,
+    }
+    return engines.cash_budget_frame(**{**defaults, **params})
+
+
+def rapport_stocks(articles):
+    """Politique de stock et classe ABC par article"""
+    policy = engines.inventory_policy(
+        demande_annuelle=articles['demande_annuelle'], cout_unitaire=articles['cout_unitaire'],
+        taux_possession=articles.get('taux_possession', 0.25),
+        cout_commande=articles.get('cout_commande', 200.0),
+        demande_jour=articles['demande_annuelle'] / 360,
+        ecart_type=articles.get('ecart_type', articles['demande_annuelle'] / 360 * 0.2),
+        delai=articles.get('delai', 10), stock_actuel=articles['stock_actuel'],
+        niveau_service=articles.get('niveau_service', 95),
+    )
+    df = articles[['article', 'demande_annuelle', 'cout_unitaire', 'stock_actuel']].copy()
+    df['Valeur Stock'] = df['stock_actuel'] * df['cout_unitaire']
+    df['Classe ABC'] = engines.abc_classification(df['demande_annuelle'] * df['cout_unitaire'])
+    df['EOQ'] = policy['eoq']
+    df['Stock Sécurité'] = policy['stock_securite']
+    df['Point Commande'] = policy['point_commande']
+    df['Risque Rupture'] = policy['risque_rupture']
+    return df
+
+
+def rapport_ventes(historique=None, horizon=6):
+    """Ventes réalisées et prévision par moindres carrés, avec intervalle de confiance"""
+    historique = engines.VENTES_HISTORIQUES if historique is None else list(historique)
+    prevision = engines.trend_forecast(historique, horizon)
+    n = len(historique)
+    return pd.DataFrame({
+        'Période': np.arange(1, n + horizon + 1),
+        'Ventes Réalisées': np.concatenate([historique, np.full(horizon, np.nan)]),
+        'Prévision': np.concatenate([np.full(n, np.nan), prevision['forecast']]),
+        'Borne Basse': np.concatenate([np.full(n, np.nan), prevision['lower']]),
+        'Borne Haute': np.concatenate([np.full(n, np.nan), prevision['upper']]),
+    })
+
+
+def rapport_investissements(projets=None, duree=5, taux=0.10):
+    """VAN, TRI et délai de récupération par projet (flux annuels constants)"""
+    projets = projets_demo() if projets is None else projets
+    budget = projets['Budget (M€)'].to_numpy(dtype=float)
+    flux_annuel = budget * projets['ROI Attendu (%)'].to_numpy(dtype=float) / 100 + budget / duree
+    flux = np.repeat(flux_annuel[:, None], duree, axis=1)
+    df = projets[['Projet', 'Budget (M€)', 'ROI Attendu (%)']].copy()
+    df['Flux Annuel (M€)'] = flux_annuel
+    df['VAN (M€)'] = engines.npv(budget, flux, np.full(len(df), taux))
+    df['TRI (%)'] = engines.irr(budget, flux) * 100
+    df['Récupération (ans)'] = engines.payback(budget, flux)
+    return df
+
+
+def projets_demo():
+    return pd.DataFrame({
+        'Projet': ['Nouvelle Ligne Production', 'Modernisation Usine A', 'Système IA Qualité',
+                   'Énergie Renouvelable', 'R&D Nouveaux Produits', 'Digitalisation Logistique'],
+        'Budget (M€)': [2.1, 1.2, 0.4, 0.8, 0.3, 0.4],
+        'ROI Attendu (%)': [22.5, 15.8, 28.3, 12.1, 35.2, 18.7],
+    })
+
+
+def articles_demo(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'article': [f'A{i:03d}' for i in range(1, n + 1)],
+        'demande_annuelle': rng.lognormal(8, 1, n).round(),
+        'cout_unitaire': rng.uniform(5, 200, n).round(2),
+        'stock_actuel': rng.integers(0, 2000, n),
+    })
+
+
+REPORT_TYPES = (
+    "Rapport Performance Mensuel",
+    "Analyse Écarts Budget",
+    "Tableau de Bord Commercial",
+    "État Trésorerie Détaillé",
+    "Rapport Optimisation Stocks",
+    "Analyse Investissements",
+)
+
+
+def build_report(report_type, releve_tresorerie=None, articles=None):
+    """Feuilles (nom → DataFrame) d'un type de rapport de REPORT_TYPES"""
+    if report_type not in REPORT_TYPES:
+        raise ValueError(f"Type de rapport inconnu : {report_type}")
+    articles = articles_demo() if articles is None else articles
+    tresorerie = rapport_tresorerie(releve_tresorerie)
+    stocks = rapport_stocks(articles)
+    postes = ['Ventes', 'Production', 'Achats', 'Personnel', 'Frais généraux']
+    ecarts = ecarts_budgetaires([2430, 1650, 820, 410, 230], [2800, 1856, 845, 415, 248], postes)
+
+    synthese = pd.DataFrame({
+        'Indicateur': ['Écart ventes (%)', 'Trésorerie finale', 'Trésorerie minimum',
+                       'Articles en risque de rupture', 'Valeur stock classe A'],
+        'Valeur': [
+            ecarts['Écart (%)'].iloc[0],
+            tresorerie['Trésorerie Cumulée'].iloc[-1],
+            tresorerie['Trésorerie Cumulée'].min(),
+            int(stocks['Risque Rupture'].sum()),
+            stocks.loc[stocks['Classe ABC'] == 'A', 'Valeur Stock'].sum(),
+        ],
+    })
+    sheets = {
+        "Rapport Performance Mensuel": {'Synthèse': synthese, 'Écarts': ecarts,
+                                        'Trésorerie': tresorerie, 'Stocks': stocks},
+        "Analyse Écarts Budget": {'Synthèse': synthese, 'Écarts': ecarts},
+        "État Trésorerie Détaillé": {'Synthèse': synthese, 'Trésorerie': tresorerie},
+        "Rapport Optimisation Stocks": {'Synthèse': synthese, 'Stocks': stocks},
+        "Tableau de Bord Commercial": {'Synthèse': synthese, 'Ventes': rapport_ventes(),
+                                       'Écarts': ecarts},
+        "Analyse Investissements": {'Synthèse': synthese,
+                                    'Investissements': rapport_investissements()},
+    }
+    return sheets[report_type]
+
+
+# ---------------------------------------------------------------- Écriture
+
+def content_hash(report_type, fmt, sheets):
+    """Empreinte du contenu : identique pour des données identiques, quel que soit le moment"""
+    h = hashlib.sha256(f'{report_type}|{fmt}'.encode())
+    for name, df in sheets.items():
+        h.update(name.encode())
+        h.update('|'.join(map(str, df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _cell(value):
+    """Valeur écrivable par xlsxwriter (NaN/inf en cellule vide)"""
+    if isinstance(value, (float, np.floating)) and not np.isfinite(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def write_xlsx(sheets, path):
+    """XLSX multi-feuilles en mode mémoire constante (les lignes sont écrites puis libérées)"""
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    header = workbook.add_format({'bold': True, 'bg_color': '#DDEBF7'})
+    number = workbook.add_format({'num_format': '#,##0.00'})
+    try:
+        for name, df in sheets.items():
+            # Découpage en feuilles de suite au-delà de la limite Excel
+            for part, start in enumerate(range(0, max(len(df), 1), EXCEL_MAX_ROWS)):
+                title = name if part == 0 else f'{name} ({part + 1})'
+                sheet = workbook.add_worksheet(title[:31])
+                sheet.write_row(0, 0, [str(c) for c in df.columns], header)
+                numeric = [pd.api.types.is_float_dtype(t) for t in df.dtypes]
+                for i, width in enumerate(df.columns):
+                    sheet.set_column(i, i, max(12, len(str(width)) + 2), number if numeric[i] else None)
+                stop = min(start + EXCEL_MAX_ROWS, len(df))
+                row = 1
+                for chunk_start in range(start, stop, WRITE_CHUNK_ROWS):
+                    chunk = df.iloc[chunk_start:min(chunk_start + WRITE_CHUNK_ROWS, stop)]
+                    for values in chunk.itertuples(index=False, name=None):
+                        sheet.write_row(row, 0, [_cell(v) for v in values])
+                        row += 1
+    finally:
+        workbook.close()
+    return path
+
+
+def write_pdf(sheets, path, title, max_rows=40):
+    """PDF de synthèse : une page par feuille (aperçu tabulaire des premières lignes)"""
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    from figure_service import managed_figure
+
+    with PdfPages(path) as pdf:
+        for name, df in sheets.items():
+            # Figures hors pyplot : rien ne survit à la page, même en cas d'erreur
+            with managed_figure((11.7, 8.3)) as fig:
+                ax = fig.subplots()
+                ax.axis('off')
+                ax.set_title(f'{title} — {name}', fontsize=14, loc='left')
+                preview = df.head(max_rows).copy()
+                for column in preview.select_dtypes('float').columns:
+                    preview[column] = preview[column].map(lambda v: f'{v:,.2f}')
+                table = ax.table(cellText=preview.astype(str).values,
+                                 colLabels=[str(c) for c in preview.columns],
+                                 loc='upper left', cellLoc='right')
+                table.auto_set_font_size(False)
+                table.set_fontsize(7)
+                if len(df) > max_rows:
+                    ax.text(0, 0, f'{max_rows} premières lignes sur {len(df):,}', fontsize=8,
+                            transform=ax.transAxes)
+                pdf.savefig(fig)
+    return path
+
+
+def render_report(report_type, fmt='xlsx', sheets=None, cache_dir=CACHE_DIR):
+    """Générer un rapport (ou le relire depuis le cache) ; retourne le chemin du fichier"""
+    sheets = build_report(report_type) if sheets is None else sheets
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f'{content_hash(report_type, fmt, sheets)}.{fmt}')
+    if os.path.exists(path):
+        try:
+            # Date de modification = dernier accès : sert d'ordre LRU à prune_cache
+            os.utime(path)
+            return path
+        except FileNotFoundError:
+            pass  # évincé entre-temps par un autre processus : on le régénère
+    tmp = f'{path}.{os.getpid()}.tmp'
+    if fmt == 'xlsx':
+        write_xlsx(sheets, tmp)
+    elif fmt == 'pdf':
+        write_pdf(sheets, tmp, report_type)
+    else:
+        raise ValueError(f"Format de rapport non supporté : {fmt}")
+    # Renommage atomique : un fichier du cache est toujours complet
+    os.replace(tmp, path)
+    prune_cache(cache_dir, keep=path)
+    return path
+
+
+def prune_cache(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, max_age=CACHE_MAX_AGE, keep=None):
+    """Supprimer les rapports non servis depuis max_age, puis les plus anciens au-delà de max_bytes
+
+    Retourne le nombre de fichiers supprimés ; `keep` (le rapport qui vient
+    d'être écrit) n'est jamais évincé.
+    """
+    now = time.time()
+    keep = os.path.abspath(keep) if keep is not None else None
+    files = []
+    for entry in os.scandir(cache_dir):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        if entry.is_file():
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for mtime, size, path in files:
+        if os.path.abspath(path) == keep:
+            continue
+        # Fichiers .tmp : écritures en cours, supprimées seulement une fois périmées
+        stale = now - mtime > max_age
+        if not stale and (total <= max_bytes or path.endswith('.tmp')):
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def _render_job(job):
+    return render_report(*job)
+
+
+def render_reports(jobs, workers=None):
+    """Générer plusieurs rapports en parallèle ; jobs = [(type, format, feuilles ou None), ...]"""
+    jobs = [tuple(job) + (None,) * (3 - len(job)) for job in jobs]
+    if workers == 1 or len(jobs) == 1:
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_job, jobs))
+
+
+def report_filename(report_type, fmt):
+    slug = report_type.lower().replace(' ', '_')
+    return f"rapport_{slug}_{datetime.now().strftime('%Y%m%d')}.{fmt}"
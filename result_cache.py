@@ -0,0 +1,278 @@
+"""Cache disque des résultats de calcul, partagé entre sessions et processus.
+
+La clé d'un résultat est l'empreinte SHA-256 de l'identité de la fonction
+(module, nom qualifié, bytecode) et de ses arguments normalisés : tableaux
+numpy, DataFrames et dictionnaires donnent la même clé pour un même contenu.
+Les résultats sont stockés en pickle compressé, un fichier par clé ; un index
+SQLite tient les tailles, dates d'accès et d'expiration (éviction LRU au-delà
+de la taille maximale, TTL) ainsi que les compteurs de hits/misses.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = '.result_cache'
+MAX_BYTES = 256 * 1024 * 1024
+
+
+# ---------------------------------------------------------------- Empreintes
+
+def _feed(h, value):
+    """Alimenter l'empreinte avec une représentation stable et typée de la valeur"""
+    if value is None or isinstance(value, (bool, int, str)):
+        h.update(f'{type(value).__name__}:{value!r};'.encode())
+    elif isinstance(value, float):
+        h.update(f'float:{value.hex()};'.encode())
+    elif isinstance(value, np.generic):
+        _feed(h, value.item())
+    elif isinstance(value, bytes):
+        h.update(b'bytes:%d:' % len(value) + value)
+    elif isinstance(value, np.ndarray):
+        h.update(f'ndarray:{value.dtype.str}:{value.shape};'.encode())
+        if value.dtype == object:
+            for item in value.ravel():
+                _feed(h, item)
+        else:
+            h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, pd.DataFrame):
+        h.update(b'DataFrame:')
+        _feed(h, [str(c) for c in value.columns])
+        _feed(h, [str(t) for t in value.dtypes])
+        h.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        h.update(f'{type(value).__name__}:{value.name!r}:{value.dtype};'.encode())
+        h.update(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+    elif isinstance(value, dict):
+        h.update(f'dict:{len(value)};'.encode())
+        for key in sorted(value, key=repr):
+            _feed(h, key)
+            _feed(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(f'{type(value).__name__}:{len(value)};'.encode())
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, (set, frozenset)):
+        _feed(h, sorted(value, key=repr))
+    else:
+        h.update(f'pickle:{type(value).__qualname__};'.encode())
+        h.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def function_identity(func):
+    """Module, nom qualifié et bytecode : modifier la fonction invalide ses résultats"""
+    code = getattr(func, '__code__', None)
+    return (func.__module__, func.__qualname__,
+            hashlib.sha256(code.co_code).hexdigest() if code else '',
+            repr(code.co_consts) if code else '')
+
+
+def make_key(func, args=(), kwargs=None):
+    h = hashlib.sha256()
+    _feed(h, function_identity(func))
+    _feed(h, tuple(args))
+    _feed(h, kwargs or {})
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------- Cache
+
+class ResultCache:
+    """Cache de résultats sur disque avec éviction LRU, TTL et compteurs partagés"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES, ttl=None, compress_level=1):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compress_level = compress_level
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'),
+                                    timeout=30, check_same_thread=False)
+        self.init_database()
+
+    def init_database(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                func TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                expires REAL
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        cursor.executemany('INSERT OR IGNORE INTO counters VALUES (?, 0)',
+                           [('hits',), ('misses',), ('evictions',)])
+        self.conn.commit()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f'{key}.bin')
+
+    def _count(self, name, n=1):
+        self.conn.execute('UPDATE counters SET value = value + ? WHERE name = ?', (n, name))
+
+    def _drop(self, key):
+        self.conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key):
+        """Retourne (trouvé, valeur)"""
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute('SELECT expires FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None and row[0] is not None and row[0] < now:
+                self._drop(key)
+                row = None
+            value = None
+            if row is not None:
+                try:
+                    with open(self._path(key), 'rb') as f:
+                        value = pickle.loads(zlib.decompress(f.read()))
+                except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+                    # Fichier supprimé ou corrompu par un autre processus : traité comme absent
+                    self._drop(key)
+                    row = None
+            if row is None:
+                self._count('misses')
+            else:
+                self._count('hits')
+                self.conn.execute('UPDATE entries SET accessed = ? WHERE key = ?', (now, key))
+            self.conn.commit()
+        return row is not None, value
+
+    def put(self, key, value, func='', ttl=None):
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                             self.compress_level)
+        if len(blob) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(blob)
+        # Renommage atomique : un lecteur concurrent voit l'ancien fichier ou le nouveau
+        os.replace(tmp, path)
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        with self.lock:
+            self.conn.execute(
+                'INSERT INTO entries (key, func, size, created, accessed, expires) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET size = excluded.size, created = excluded.created, '
+                'accessed = excluded.accessed, expires = excluded.expires',
+                (key, func, len(blob), now, now, now + ttl if ttl else None)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Supprimer les entrées expirées puis les moins récemment utilisées au-delà de max_bytes"""
+        expired = self.conn.execute(
+            'SELECT key FROM entries WHERE expires IS NOT NULL AND expires < ?', (time.time(),)
+        ).fetchall()
+        (total,) = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+        evicted = 0
+        for (key,) in expired:
+            self._drop(key)
+            evicted += 1
+        if total > self.max_bytes:
+            (total,) = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()
+            for key, size in self.conn.execute(
+                    'SELECT key, size FROM entries ORDER BY accessed').fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._drop(key)
+                total -= size
+                evicted += 1
+        if evicted:
+            self._count('evictions', evicted)
+
+    def clear(self):
+        with self.lock:
+            for (key,) in self.conn.execute('SELECT key FROM entries').fetchall():
+                self._drop(key)
+            self.conn.execute('UPDATE counters SET value = 0')
+            self.conn.commit()
+
+    def stats(self):
+        """Compteurs cumulés (tous processus) et occupation du cache"""
+        with self.lock:
+            counters = dict(self.conn.execute('SELECT name, value FROM counters').fetchall())
+            entries, size = self.conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        lookups = counters['hits'] + counters['misses']
+        return {
+            **counters,
+            'hit_rate': counters['hits'] / lookups * 100 if lookups else 0.0,
+            'entries': entries,
+            'bytes': size,
+        }
+
+    def call(self, func, args=(), kwargs=None, ttl=None):
+        """Résultat de func(*args, **kwargs), relu depuis le cache si déjà calculé"""
+        kwargs = kwargs or {}
+        key = make_key(func, args, kwargs)
+        found, value = self.get(key)
+        if not found:
+            value = func(*args, **kwargs)
+            self.put(key, value, func=f'{func.__module__}.{func.__qualname__}', ttl=ttl)
+        return value
+
+    def memoize(self, func=None, ttl=None):
+        """Décorateur : @cache.memoize ou @cache.memoize(ttl=3600)"""
+        if func is None:
+            return lambda f: self.memoize(f, ttl=ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, args, kwargs, ttl=ttl)
+
+        return wrapper
+
+    def close(self):
+        self.conn.close()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """Cache partagé du processus (répertoire CACHE_DIR)"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = ResultCache()
+        return _default
+
+
+def memoize(func=None, ttl=None):
+    """Mémoïser une fonction dans le cache par défaut, créé au premier appel"""
+    if func is None:
+        return lambda f: memoize(f, ttl=ttl)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return default_cache().call(func, args, kwargs, ttl=ttl)
+
+    return wrapper
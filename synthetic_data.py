@@ -0,0 +1,442 @@
+"""Jeu de données d'entreprise synthétique pour les tests de charge et de volume.
+
+Génère, à partir d'une graine, des tables cohérentes entre elles :
+
+    articles             référentiel (prix, coût, saisonnalité, délai, stock)
+    clients              référentiel (segment, région, délai et retard de paiement)
+    machines             parc (atelier, cadence, fiabilité)
+    ventes               lignes de facture (article, quantité, prix remisé)
+    factures             en-têtes : total des lignes, TVA, échéance, date de paiement
+    demande_mensuelle    quantités vendues par article et par mois (somme des ventes)
+    ecritures            écritures comptables équilibrées : ventes, encaissements,
+                         achats, salaires, charges externes et leurs règlements
+    evenements_machines  journal production / panne / maintenance / changement de série
+    tresorerie           relevé mensuel du compte 512 (colonnes de budget_tresorerie.csv)
+    unites               historiques de demande au format d'entrée de budget_batch
+
+Les tables volumineuses sont écrites en Parquet partitionné par mois
+(<table>/mois=AAAA-MM/part-NNNN.parquet), lisibles d'un bloc avec
+pd.read_parquet(<table>) ou read_table(). Chaque mois est tiré d'un générateur
+dérivé de (graine, mois) : le résultat ne dépend ni de l'ordre ni du nombre de
+processus (--workers).
+
+Exemples :
+    python synthetic_data.py -o donnees_synthetiques/ --scale small
+    python synthetic_data.py -o /data/charge --scale large --months 36 --workers 8
+    python synthetic_data.py -o donnees/ --lines 5000000 --seed 42
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+SCALES = {
+    'small': {'lignes': 100_000, 'articles': 500, 'clients': 1_000, 'machines': 10},
+    'medium': {'lignes': 2_000_000, 'articles': 5_000, 'clients': 20_000, 'machines': 50},
+    'large': {'lignes': 20_000_000, 'articles': 50_000, 'clients': 200_000, 'machines': 200},
+}
+
+PARTITIONED_TABLES = ['ventes', 'factures', 'demande_mensuelle', 'ecritures', 'evenements_machines']
+
+TAUX_TVA = 0.20
+LIGNES_PAR_FACTURE = 5
+
+FAMILLES = ['Matières premières', 'Composants', 'Produits finis', 'Pièces détachées', 'Consommables']
+SEGMENTS = {
+    # segment : (poids, délais de paiement possibles, retard moyen en jours, taux d'impayés)
+    'Grand compte': (0.10, [45, 60, 90], 12.0, 0.002),
+    'PME': (0.35, [30, 45, 60], 8.0, 0.010),
+    'TPE': (0.40, [0, 30, 45], 15.0, 0.030),
+    'Particulier': (0.15, [0], 2.0, 0.005),
+}
+REGIONS = ['Île-de-France', 'Auvergne-Rhône-Alpes', 'Nouvelle-Aquitaine', 'Occitanie',
+           'Hauts-de-France', 'Grand Est', 'Bretagne', "Provence-Alpes-Côte d'Azur"]
+ATELIERS = ['Usinage', 'Montage', 'Peinture', 'Conditionnement']
+
+# Événements machine : (probabilité, durée moyenne en minutes)
+EVENEMENTS = {
+    'production': (0.78, 240.0),
+    'changement_serie': (0.14, 40.0),
+    'panne': (0.05, 90.0),
+    'maintenance': (0.03, 240.0),
+}
+
+
+def _rng(seed, *stream):
+    """Générateur indépendant par flux (référentiels, mois n) pour une même graine"""
+    return np.random.default_rng([seed, *stream])
+
+
+def month_starts(start, months):
+    return pd.date_range(pd.Timestamp(start).to_period('M').to_timestamp(), periods=months + 1, freq='MS')
+
+
+# ---------------------------------------------------------------- Référentiels
+
+def make_articles(n, rng):
+    prix = np.round(rng.lognormal(3.5, 0.9, n), 2) + 0.5
+    return pd.DataFrame({
+        'sku': [f'SKU{i:06d}' for i in range(1, n + 1)],
+        'famille': pd.Categorical(rng.choice(FAMILLES, n), categories=FAMILLES),
+        'prix_unitaire': prix,
+        'cout_unitaire': np.round(prix * rng.uniform(0.4, 0.8, n), 2),
+        # Popularité très concentrée : ~20 % des articles font ~80 % des ventes
+        'popularite': rng.pareto(1.2, n) + 0.05,
+        'saisonnalite': rng.uniform(0.0, 0.4, n),
+        'pic_saison': rng.integers(1, 13, n),
+        'tendance_annuelle': rng.normal(0.05, 0.10, n),
+        'delai': rng.integers(5, 31, n),
+        'niveau_service': rng.choice([90, 95, 99], n, p=[0.3, 0.5, 0.2]),
+    })
+
+
+def make_clients(n, rng):
+    names = list(SEGMENTS)
+    segment = rng.choice(len(names), n, p=[SEGMENTS[s][0] for s in names])
+    delai = np.empty(n, dtype=np.int16)
+    retard = np.empty(n)
+    impaye = np.empty(n)
+    for code, name in enumerate(names):
+        mask = segment == code
+        _, delais, retard_moyen, taux = SEGMENTS[name]
+        delai[mask] = rng.choice(delais, mask.sum())
+        retard[mask] = rng.exponential(retard_moyen, mask.sum())
+        impaye[mask] = taux
+    return pd.DataFrame({
+        'client_id': np.arange(1, n + 1, dtype=np.int32),
+        'segment': pd.Categorical.from_codes(segment, names),
+        'region': pd.Categorical(rng.choice(REGIONS, n), categories=REGIONS),
+        'delai_paiement': delai,
+        'retard_moyen': np.round(retard, 1),
+        'taux_impaye': impaye,
+        # Volume d'achat relatif (les grands comptes achètent davantage)
+        'activite': rng.lognormal(0, 1, n) * np.where(segment == 0, 5.0, 1.0),
+    })
+
+
+def make_machines(n, start, rng):
+    return pd.DataFrame({
+        'machine_id': [f'M{i:03d}' for i in range(1, n + 1)],
+        'atelier': pd.Categorical(rng.choice(ATELIERS, n), categories=ATELIERS),
+        'cadence_heure': rng.integers(20, 400, n),
+        'taux_panne': rng.uniform(0.5, 2.0, n),
+        'mise_en_service': pd.Timestamp(start) - pd.to_timedelta(rng.integers(180, 5000, n), unit='D'),
+    })
+
+
+# ---------------------------------------------------------------- Mois
+
+def _month_weights(months, start):
+    """Part du volume de chaque mois : croissance de 8 %/an et pic de fin d'année"""
+    month_of_year = month_starts(start, months)[:-1].month.to_numpy()
+    weights = 1.08 ** (np.arange(months) / 12) * (1 + 0.15 * np.cos(2 * np.pi * (month_of_year - 12) / 12))
+    return weights / weights.sum()
+
+
+def _dates_in_month(rng, n, first, days):
+    """Dates tirées dans le mois, trois fois moins probables le week-end"""
+    day_dates = first.to_datetime64().astype('datetime64[D]') + np.arange(days)
+    weights = np.where(pd.DatetimeIndex(day_dates).dayofweek < 5, 1.0, 0.3)
+    return day_dates[rng.choice(days, n, p=weights / weights.sum())]
+
+
+def _write(root, table, month_label, part, df):
+    directory = os.path.join(root, table, f'mois={month_label}')
+    os.makedirs(directory, exist_ok=True)
+    df.to_parquet(os.path.join(directory, f'part-{part:04d}.parquet'), index=False)
+
+
+def _journal(entry_ids, dates, journal, compte, libelle, debit, credit, piece):
+    n = len(entry_ids)
+    return pd.DataFrame({
+        'ecriture_id': entry_ids,
+        'date': dates,
+        'journal': np.full(n, journal),
+        'compte': np.full(n, compte),
+        'libelle': np.full(n, libelle),
+        'debit': np.round(debit, 2),
+        'credit': np.round(credit, 2),
+        'piece': piece,
+    })
+
+
+def generate_month(m, config, articles, clients, machines):
+    """Générer et écrire les tables partitionnées du mois m ; retourne ses agrégats"""
+    rng = _rng(config['seed'], 1, m)
+    bounds = month_starts(config['start'], config['months'])
+    first, horizon_end = bounds[m], bounds[-1]
+    days = (bounds[m + 1] - first).days
+    label = f'{first:%Y-%m}'
+    root = config['output']
+    counts = {}
+
+    # Factures : client et date ; lignes rattachées au hasard, factures vides écartées
+    n_lines = max(int(round(config['lignes'] * config['month_weights'][m])), 1)
+    n_inv = max(n_lines // LIGNES_PAR_FACTURE, 1)
+    activity = clients['activite'].to_numpy()
+    inv_client = rng.choice(len(clients), n_inv, p=activity / activity.sum())
+    inv_date = _dates_in_month(rng, n_inv, first, days)
+    used, line_inv = np.unique(rng.integers(0, n_inv, n_lines), return_inverse=True)
+    inv_client, inv_date, n_inv = inv_client[used], inv_date[used], len(used)
+    order = np.argsort(line_inv, kind='stable')
+    line_inv = line_inv[order]
+    facture_id = (m + 1) * 10**8 + np.arange(1, n_inv + 1, dtype=np.int64)
+
+    # Lignes : article selon popularité, saisonnalité et tendance propres au mois
+    month_of_year = first.month
+    weight = (articles['popularite'].to_numpy()
+              * (1 + articles['saisonnalite'].to_numpy()
+                 * np.cos(2 * np.pi * (month_of_year - articles['pic_saison'].to_numpy()) / 12))
+              * (1 + articles['tendance_annuelle'].to_numpy()) ** (m / 12))
+    sku = rng.choice(len(articles), n_lines, p=weight / weight.sum())
+    quantite = 1 + rng.poisson(3, n_lines).astype(np.int32)
+    remise = rng.choice([0.0, 0.0, 0.0, 0.05, 0.10], n_lines)
+    prix = articles['prix_unitaire'].to_numpy()[sku] * (1 - remise)
+    montant_ht = np.round(quantite * prix, 2)
+
+    ventes = pd.DataFrame({
+        'facture_id': facture_id[line_inv],
+        'date': inv_date[line_inv],
+        'client_id': clients['client_id'].to_numpy()[inv_client][line_inv],
+        'sku': pd.Categorical.from_codes(sku, articles['sku']),
+        'quantite': quantite,
+        'prix_unitaire': np.round(prix, 2),
+        'remise': remise,
+        'montant_ht': montant_ht,
+    })
+    _write(root, 'ventes', label, m, ventes)
+    counts['ventes'] = len(ventes)
+
+    # En-têtes : totaux des lignes, échéance selon le client, paiement avec retard ou impayé
+    inv_ht = np.round(np.bincount(line_inv, weights=montant_ht, minlength=n_inv), 2)
+    inv_tva = np.round(inv_ht * TAUX_TVA, 2)
+    inv_ttc = inv_ht + inv_tva
+    echeance = inv_date + clients['delai_paiement'].to_numpy()[inv_client].astype('timedelta64[D]')
+    retard = np.round(rng.exponential(clients['retard_moyen'].to_numpy()[inv_client] + 1e-9)
+                      - rng.uniform(0, 5, n_inv)).astype(np.int64)
+    paiement = (echeance + np.maximum(retard, -3).astype('timedelta64[D]')).astype('datetime64[ns]')
+    paiement = np.maximum(paiement, inv_date.astype('datetime64[ns]'))
+    impaye = rng.random(n_inv) < clients['taux_impaye'].to_numpy()[inv_client]
+    # Paiements postérieurs à la fin de l'horizon : facture encore ouverte
+    paiement[impaye | (paiement >= horizon_end.to_datetime64())] = np.datetime64('NaT')
+    factures = pd.DataFrame({
+        'facture_id': facture_id,
+        'client_id': clients['client_id'].to_numpy()[inv_client],
+        'date_facture': inv_date,
+        'montant_ht': inv_ht,
+        'tva': inv_tva,
+        'montant_ttc': inv_ttc,
+        'echeance': echeance,
+        'date_paiement': paiement,
+        'nb_lignes': np.bincount(line_inv, minlength=n_inv).astype(np.int32),
+    })
+    _write(root, 'factures', label, m, factures)
+    counts['factures'] = len(factures)
+
+    # Demande mensuelle : somme exacte des lignes de ventes
+    demande = np.bincount(sku, weights=quantite, minlength=len(articles))
+    ca = np.bincount(sku, weights=montant_ht, minlength=len(articles))
+    sold = np.flatnonzero(demande)
+    _write(root, 'demande_mensuelle', label, m, pd.DataFrame({
+        'sku': pd.Categorical.from_codes(sold, articles['sku']),
+        'quantite': demande[sold].astype(np.int64),
+        'ca_ht': np.round(ca[sold], 2),
+    }))
+    counts['demande_mensuelle'] = len(sold)
+
+    # Écritures : ventes, encaissements, achats, salaires, loyers et règlements
+    cout = float(np.sum(quantite * articles['cout_unitaire'].to_numpy()[sku]))
+    # Charges de structure proportionnées au chiffre d'affaires moyen
+    ca_moyen = inv_ht.sum() / config['month_weights'][m] / config['months']
+    salaires = round(ca_moyen * 0.22 * rng.uniform(0.97, 1.03), 2)
+    loyers = round(ca_moyen * 0.04, 2)
+    fin_mois = (bounds[m + 1] - pd.Timedelta(days=1)).to_datetime64()
+    base_id = (m + 1) * 10**9
+    vente_ids = base_id + np.arange(n_inv)
+    paid = ~np.isnat(paiement)
+    zeros = np.zeros(n_inv)
+    blocks = [
+        _journal(vente_ids, inv_date, 'VE', '411', 'Facture client', inv_ttc, zeros, facture_id),
+        _journal(vente_ids, inv_date, 'VE', '707', 'Facture client', zeros, inv_ht, facture_id),
+        _journal(vente_ids, inv_date, 'VE', '44571', 'Facture client', zeros, inv_tva, facture_id),
+        _journal(base_id + n_inv + np.arange(paid.sum()), paiement[paid], 'BQ', '512',
+                 'Encaissement client', inv_ttc[paid], zeros[paid], facture_id[paid]),
+        _journal(base_id + n_inv + np.arange(paid.sum()), paiement[paid], 'BQ', '411',
+                 'Encaissement client', zeros[paid], inv_ttc[paid], facture_id[paid]),
+    ]
+    other = base_id + 2 * n_inv + np.arange(6)
+    achat_ttc = round(cout * (1 + TAUX_TVA), 2)
+    one = np.zeros(1)
+    reglement_fournisseur = fin_mois + np.timedelta64(45, 'D')
+    for ids, date, journal, lines in [
+        (other[0], fin_mois, 'AC', [('607', 'Achats du mois', cout, 0), ('44566', 'Achats du mois', cout * TAUX_TVA, 0),
+                                    ('401', 'Achats du mois', 0, achat_ttc)]),
+        (other[1], reglement_fournisseur, 'BQ', [('401', 'Règlement fournisseurs', achat_ttc, 0),
+                                                 ('512', 'Règlement fournisseurs', 0, achat_ttc)]),
+        (other[2], fin_mois, 'OD', [('641', 'Salaires', salaires, 0), ('421', 'Salaires', 0, salaires)]),
+        (other[3], fin_mois, 'BQ', [('421', 'Paiement salaires', salaires, 0), ('512', 'Paiement salaires', 0, salaires)]),
+        (other[4], first.to_datetime64(), 'BQ', [('613', 'Loyer', loyers, 0), ('512', 'Loyer', 0, loyers)]),
+    ]:
+        if date >= horizon_end.to_datetime64():
+            continue
+        for compte, libelle, debit, credit in lines:
+            blocks.append(_journal(np.array([ids]), np.array([date]), journal, compte, libelle,
+                                   one + debit, one + credit, np.zeros(1, dtype=np.int64)))
+    ecritures = pd.concat(blocks, ignore_index=True)
+    ecritures['date'] = ecritures['date'].astype('datetime64[ns]')
+    for column in ['journal', 'compte', 'libelle']:
+        ecritures[column] = ecritures[column].astype('category')
+    # Chaque écriture va dans la partition du mois de sa date (paiements des mois suivants)
+    entry_month = pd.Series(np.datetime_as_string(ecritures['date'].to_numpy().astype('datetime64[M]')),
+                            index=ecritures.index)
+    for month_label, part in ecritures.groupby(entry_month, sort=True):
+        _write(root, 'ecritures', month_label, m, part.reset_index(drop=True))
+    counts['ecritures'] = len(ecritures)
+    bank = ecritures[ecritures['compte'] == '512'].groupby(entry_month)[['debit', 'credit']].sum()
+
+    # Journal machines : suite d'événements jusqu'à la fin du mois
+    events = []
+    minutes = days * 24 * 60
+    kinds = list(EVENEMENTS)
+    probabilities = np.array([EVENEMENTS[k][0] for k in kinds])
+    mean_minutes = np.array([EVENEMENTS[k][1] for k in kinds])
+    expected = int(minutes / (probabilities @ mean_minutes) * 1.5) + 10
+    for machine in machines.itertuples():
+        p = probabilities * np.array([1, 1, machine.taux_panne, 1])
+        kind = rng.choice(len(kinds), expected, p=p / p.sum())
+        duree = np.maximum(rng.exponential(mean_minutes[kind]), 1).round()
+        offset = np.concatenate([[0], np.cumsum(duree)[:-1]])
+        keep = offset < minutes
+        kind, duree, offset = kind[keep], np.minimum(duree[keep], minutes - offset[keep]), offset[keep]
+        produit = np.where(kind == 0, machine.cadence_heure * duree / 60 * rng.uniform(0.8, 1.0, len(kind)), 0)
+        events.append(pd.DataFrame({
+            'horodatage': first + pd.to_timedelta(offset, unit='min'),
+            'machine_id': machine.machine_id,
+            'evenement': pd.Categorical.from_codes(kind, kinds),
+            'duree_min': duree.astype(np.int32),
+            'quantite_produite': produit.round().astype(np.int64),
+        }))
+    journal_machines = pd.concat(events, ignore_index=True)
+    journal_machines['machine_id'] = journal_machines['machine_id'].astype('category')
+    _write(root, 'evenements_machines', label, m, journal_machines)
+    counts['evenements_machines'] = len(journal_machines)
+
+    return {'counts': counts, 'demande': demande.astype(np.int64), 'banque': bank}
+
+
+# ---------------------------------------------------------------- Orchestration
+
+def generate(output, scale='small', seed=0, start='2023-01-01', months=24, workers=1, **sizes):
+    """Générer le jeu complet dans `output` ; retourne le manifeste (paramètres, volumes)"""
+    if scale not in SCALES:
+        raise ValueError(f"Échelle inconnue : {scale} (choix : {', '.join(SCALES)})")
+    params = {**SCALES[scale], **{k: v for k, v in sizes.items() if v is not None}}
+    unknown = set(params) - set(SCALES['small'])
+    if unknown:
+        raise ValueError(f"Paramètres inconnus : {', '.join(sorted(unknown))}")
+    started = time.perf_counter()
+    os.makedirs(output, exist_ok=True)
+    for table in PARTITIONED_TABLES:
+        # Une génération remplace entièrement la précédente (partitions comprises)
+        if os.path.isdir(os.path.join(output, table)):
+            for directory, _, files in os.walk(os.path.join(output, table)):
+                for name in files:
+                    if name.endswith('.parquet'):
+                        os.remove(os.path.join(directory, name))
+
+    rng = _rng(seed, 0)
+    articles = make_articles(params['articles'], rng)
+    clients = make_clients(params['clients'], rng)
+    machines = make_machines(params['machines'], start, rng)
+    for name, df in [('articles', articles), ('clients', clients), ('machines', machines)]:
+        df.to_parquet(os.path.join(output, f'{name}.parquet'), index=False)
+
+    config = {'output': output, 'seed': seed, 'start': start, 'months': months,
+              'lignes': params['lignes'], 'month_weights': _month_weights(months, start)}
+    args = (range(months), [config] * months, [articles] * months, [clients] * months, [machines] * months)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate_month, *args))
+    else:
+        results = [generate_month(*a) for a in zip(*args)]
+
+    # Relevé de trésorerie mensuel (compte 512), colonnes de budget_tresorerie.csv
+    bank = pd.concat([r['banque'] for r in results]).groupby(level=0).sum()
+    tresorerie = pd.DataFrame({
+        'Mois': bank.index,
+        'Encaissements': bank['debit'].round(2).to_numpy(),
+        'Décaissements': bank['credit'].round(2).to_numpy(),
+    })
+    tresorerie['Solde Mensuel'] = tresorerie['Encaissements'] - tresorerie['Décaissements']
+    tresorerie.to_parquet(os.path.join(output, 'tresorerie.parquet'), index=False)
+
+    # Unités au format de budget_batch : historique de demande par article
+    history = np.column_stack([r['demande'] for r in results])
+    unites = pd.DataFrame(history, columns=[f'ventes_{i}' for i in range(1, months + 1)])
+    unites.insert(0, 'unite', articles['sku'])
+    unites['prix_unitaire'] = articles['prix_unitaire']
+    unites['cout_unitaire'] = articles['cout_unitaire']
+    unites['delai'] = articles['delai']
+    unites['niveau_service'] = articles['niveau_service']
+    unites['stock_initial'] = np.round(history[:, -1] * rng.uniform(0.2, 1.5, len(articles)))
+    unites.to_parquet(os.path.join(output, 'unites.parquet'), index=False)
+
+    counts = {'articles': len(articles), 'clients': len(clients), 'machines': len(machines)}
+    for table in PARTITIONED_TABLES:
+        counts[table] = sum(r['counts'][table] for r in results)
+    counts.update({'tresorerie': len(tresorerie), 'unites': len(unites)})
+    manifest = {
+        'scale': scale, 'seed': seed, 'start': start, 'months': months, 'params': params,
+        'rows': counts, 'duree_s': round(time.perf_counter() - started, 2),
+    }
+    with open(os.path.join(output, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def read_table(root, table, columns=None, filters=None):
+    """Lire une table générée ; les tables mensuelles portent la colonne `mois`
+
+    filters suit pd.read_parquet, par exemple [('mois', 'in', ['2024-01', '2024-02'])]
+    pour ne lire que quelques partitions.
+    """
+    path = os.path.join(root, table)
+    if table not in PARTITIONED_TABLES:
+        path += '.parquet'
+    return pd.read_parquet(path, columns=columns, filters=filters)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('-o', '--output', default='donnees_synthetiques', help="répertoire de sortie")
+    parser.add_argument('--scale', choices=list(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start', default='2023-01-01', help="premier mois généré")
+    parser.add_argument('--months', type=int, default=24)
+    parser.add_argument('--lines', type=int, help="lignes de ventes (remplace l'échelle)")
+    parser.add_argument('--articles', type=int)
+    parser.add_argument('--clients', type=int)
+    parser.add_argument('--machines', type=int)
+    parser.add_argument('--workers', type=int, default=1, help="nombre de processus (un mois par tâche)")
+    args = parser.parse_args(argv)
+    if args.months < 1:
+        parser.error("--months doit être au moins 1")
+
+    manifest = generate(args.output, args.scale, args.seed, args.start, args.months, args.workers,
+                        lignes=args.lines, articles=args.articles, clients=args.clients,
+                        machines=args.machines)
+    for table, rows in manifest['rows'].items():
+        print(f"{table:<22} {rows:>12,} lignes")
+    print(f"Jeu généré dans {args.output} en {manifest['duree_s']:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())